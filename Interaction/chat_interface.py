@@ -15,6 +15,8 @@ from typing import Dict, Any, Optional
 from pathlib import Path
 
 from Mind.mind import Mind
+from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
+from Mind.Subcortex.request_tracer import request_tracer
 from .chat_manager import ChatManager
 from Mind.FrontalLobe.PrefrontalCortex.system_journeling_manager import SystemJournelingManager
 from config import CONFIG  # Use absolute import
@@ -105,10 +107,16 @@ async def interactive_chat(primary_mind: Mind, secondary_mind: Mind = None):
             
             if user_input.lower() in ("exit", "quit", "menu"):
                 print("\n🔚 Exiting chat session...")
+                # Don't leave the device generating replies nobody will read
+                NeurocorticalBridge.cancel_streams()
                 break
                 
             if not user_input:
                 continue
+            
+            if user_input.lower() == "trace":
+                print_last_trace()
+                continue
                 
             print(f"\n{primary_mind.name}: ", end="", flush=True)
             response = await primary_mind.process_thought(user_input)
@@ -118,6 +126,21 @@ async def interactive_chat(primary_mind: Mind, secondary_mind: Mind = None):
             else:
                 print(f"⚠️ Error: {response.get('message')}")
 
+def print_last_trace():
+    """Show where the last turn's time went and save all spans as a Chrome trace"""
+    request_id = request_tracer.last_request_id
+    if request_id is None:
+        print("\n⏱️  No turns traced yet\n")
+        return
+    
+    print(f"\n⏱️  {request_id}")
+    for name, ms in request_tracer.breakdown(request_id).items():
+        print(f"  {name:<40} {ms:9.1f} ms")
+    
+    trace_path = Path(CONFIG.log_file).with_name("trace.json")
+    request_tracer.export_chrome_trace(str(trace_path))
+    print(f"📄 Chrome trace written to {trace_path} (open in chrome://tracing or ui.perfetto.dev)\n")
+
 def print_chat_header():
     """Print the chat interface header with penguin and dolphin emojis"""
     print("\n" + "=" * 60)
@@ -12,6 +12,7 @@ from typing import Dict, Any, Optional, List
 
 from Mind.mind import Mind
 from Mind.FrontalLobe.PrefrontalCortex.system_journeling_manager import SystemJournelingManager
+from Mind.Subcortex.request_tracer import traced
 from config import CONFIG  # Use absolute import
 from .chat_history import ConversationState
 
@@ -179,13 +180,16 @@ class ChatManager:
             journaling_manager.recordError(f"[ChatManager] Error finding suitable model: {e}")
             return None
     
-    async def send_message(self, message: str, stream: bool = True):
+    @traced("ChatManager.send_message", "chat", request_prefix="chat")
+    async def send_message(self, message: str, stream: bool = True, on_delta=None):
         """
         Send a user message and get response
         
         Args:
             message: The user message
             stream: Whether to stream the response
+            on_delta: Optional callback receiving each text delta as it is generated
+                      (streaming only); the full reply is returned when done
             
         Returns:
             Task or string response or Dict with error info
@@ -202,8 +206,22 @@ class ChatManager:
         self.conversation_state.add_user_message(message)
         
         try:
+            # Live token rendering - consume the Mind's delta stream directly
+            if stream and on_delta:
+                response = ""
+                async for delta in self.mind.stream_inference(message, priority="interactive"):
+                    response += delta
+                    if asyncio.iscoroutinefunction(on_delta):
+                        await on_delta(delta)
+                    else:
+                        on_delta(delta)
+                
+                self.conversation_state.add_assistant_message(response)
+                self.last_response = response
+                return response
+            
             # Process message through Mind's think function
-            response = await self.mind.think(message, stream=stream)
+            response = await self.mind.think(message, stream=stream, priority="interactive")
             
             # If not streaming, store the response in history
             if not stream and isinstance(response, str):
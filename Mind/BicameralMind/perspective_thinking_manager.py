@@ -4,12 +4,13 @@ Bicameral Mind Perspective Manager:
     - Integrates different viewpoints
     - Handles perspective switching
     - Coordinates thought processes
+    - Runs perspectives concurrently within a time budget
 """
 
-from typing import Dict, Any, Optional
-from ...CorpusCallosum.neural_commands import CommandType, LLMCommand
-from ...CorpusCallosum.synaptic_pathways import SynapticPathways
-from ...FrontalLobe.PrefrontalCortex.system_journeling_manager import SystemJournelingManager
+import asyncio
+import time
+from typing import Dict, Any, Optional, List, Callable
+from ..FrontalLobe.PrefrontalCortex.system_journeling_manager import SystemJournelingManager
 
 # Initialize journaling manager
 journaling_manager = SystemJournelingManager()
@@ -29,99 +30,180 @@ class PerspectiveThinkingManager:
         self.current_perspective = "logical"
         journaling_manager.recordInfo("Perspective manager initialized")
 
-    async def process_thought(self, input_text: str) -> str:
+    async def process_thought(self, input_text: str, parallel: bool = False, time_budget: float = None,
+                              minds: List[Any] = None, on_partial: Callable[[str], Any] = None) -> str:
         """
         Process input through multiple perspectives and integrate responses
+        
+        By default the perspectives run one after another. With parallel=True
+        (implied by time_budget or minds) they all start at once: spread
+        round-robin across minds when several are given, otherwise queued on
+        the bridge, which runs them back to back on the device's warm session.
+        Each mind's perspectives run on its own device when the bridge routes
+        across several. A perspective that fails or answers with an error is
+        left out of the integration.
+        
+        Args:
+            input_text: The thought to consider
+            parallel: Start every perspective at once
+            time_budget: Seconds to wait overall; perspectives still running
+                         then are cancelled and left out of the integration
+            minds: Mind instances (anything with llm_inference) to spread perspectives across
+            on_partial: Called (sync or async) with the integration so far each
+                        time another perspective finishes
         """
         journaling_manager.recordScope("PerspectiveThinkingManager.process_thought", input_text=input_text)
+        if parallel or time_budget is not None or minds:
+            return await self._process_parallel(input_text, time_budget, minds, on_partial)
+        
         perspective_responses = {}
         
         for perspective_name, perspective_func in self.perspectives.items():
             journaling_manager.recordDebug(f"Processing through {perspective_name} perspective")
-            response = await perspective_func(input_text)
+            try:
+                response = await perspective_func(input_text)
+            except Exception as e:
+                journaling_manager.recordError(f"{perspective_name} perspective failed: {e}")
+                continue
             perspective_responses[perspective_name] = response
             journaling_manager.recordDebug(f"{perspective_name} perspective response: {response}")
+            await self._emit_partial(on_partial, perspective_responses)
 
         # Log the multi-perspective processing
         journaling_manager.recordInfo(f"Completed multi-perspective analysis for: {input_text}")
 
         return self._integrate_perspectives(perspective_responses)
 
-    async def _logical_perspective(self, input_text: str) -> str:
-        """
-        Process input with logical, structured thinking
+    async def _process_parallel(self, input_text: str, time_budget: float = None,
+                                minds: List[Any] = None, on_partial: Callable[[str], Any] = None) -> str:
+        """Run all perspectives concurrently and integrate those that finish within the budget"""
+        start = time.monotonic()
+        tasks = {}
+        for index, (perspective_name, perspective_func) in enumerate(self.perspectives.items()):
+            mind = minds[index % len(minds)] if minds else None
+            tasks[asyncio.create_task(perspective_func(input_text, mind=mind))] = perspective_name
+        
+        finished = {}
+        pending = set(tasks)
+        try:
+            while pending:
+                remaining = None if time_budget is None else time_budget - (time.monotonic() - start)
+                if remaining is not None and remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    break
+                for task in done:
+                    perspective_name = tasks[task]
+                    try:
+                        finished[perspective_name] = task.result()
+                    except Exception as e:
+                        journaling_manager.recordError(f"{perspective_name} perspective failed: {e}")
+                        continue
+                    journaling_manager.recordDebug(
+                        f"{perspective_name} perspective finished after {time.monotonic() - start:.2f}s"
+                    )
+                    await self._emit_partial(on_partial, finished)
+        finally:
+            # Cancelling stops the device generating answers nobody will integrate
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        missed = [tasks[task] for task in pending]
+        if missed:
+            journaling_manager.recordInfo(
+                f"Time budget of {time_budget:.1f}s left out: {', '.join(missed)}"
+            )
+        journaling_manager.recordInfo(
+            f"Completed {len(finished)}/{len(tasks)} perspectives in {time.monotonic() - start:.2f}s for: {input_text}"
+        )
+        
+        # Keep the usual perspective order regardless of finishing order
+        ordered = {name: finished[name] for name in self.perspectives if name in finished}
+        return self._integrate_perspectives(ordered)
+    
+    async def _emit_partial(self, on_partial: Optional[Callable[[str], Any]], responses: Dict[str, str]) -> None:
+        """Hand the integration of the perspectives finished so far to on_partial"""
+        if on_partial is None:
+            return
+        ordered = {name: responses[name] for name in self.perspectives if name in responses}
+        try:
+            result = on_partial(self._integrate_perspectives(ordered))
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception as e:
+            journaling_manager.recordError(f"Error in partial integration callback: {e}")
+    
+    async def _think(self, prompt: str, temperature: float, mind: Any = None) -> str:
         """
-        journaling_manager.recordScope("PerspectiveThinkingManager._logical_perspective", input_text=input_text)
+        Run one perspective prompt on the given mind, or through the bridge
         
+        Raises:
+            RuntimeError: The mind or device answered with an error or nothing at all
+        """
         # Use NeurocorticalBridge instead of direct SynapticPathways call
         from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
         
-        # Create a think command for logical perspective
+        if mind is not None:
+            with NeurocorticalBridge.routing_session(self._mind_session(mind)):
+                response = await mind.llm_inference(prompt, stream=False, temperature=temperature)
+            # Mind.llm_inference reports failures as "Error: ..." text
+            if not isinstance(response, str) or not response.strip() or response.startswith("Error:"):
+                raise RuntimeError(f"no answer from mind: {response!r}")
+            return response
+        
         response = await NeurocorticalBridge.execute_operation(
             operation="think",
             data={
-                "prompt": f"Analyze this logically: {input_text}",
-                "temperature": 0.3
+                "prompt": prompt,
+                "temperature": temperature
             }
         )
+        if not isinstance(response, dict) or response.get("status") != "ok":
+            message = response.get("message") if isinstance(response, dict) else response
+            raise RuntimeError(f"think failed: {message}")
         return response.get("response", "")
+    
+    @staticmethod
+    def _mind_session(mind: Any) -> str:
+        """Routing session for one mind, pinned to its own device when the bridge has one"""
+        from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
+        
+        mind_id = getattr(mind, "mind_id", None)
+        session = f"perspectives:{mind_id or id(mind)}"
+        if mind_id:
+            NeurocorticalBridge.pin_session(session, mind_id)
+        return session
 
-    async def _creative_perspective(self, input_text: str) -> str:
+    async def _logical_perspective(self, input_text: str, mind: Any = None) -> str:
+        """
+        Process input with logical, structured thinking
+        """
+        journaling_manager.recordScope("PerspectiveThinkingManager._logical_perspective", input_text=input_text)
+        return await self._think(f"Analyze this logically: {input_text}", 0.3, mind)
+    
+    async def _creative_perspective(self, input_text: str, mind: Any = None) -> str:
         """
         Process input with creative, lateral thinking
         """
         journaling_manager.recordScope("PerspectiveThinkingManager._creative_perspective", input_text=input_text)
-        
-        # Use NeurocorticalBridge instead of direct SynapticPathways call
-        from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
-        
-        # Create a think command for creative perspective
-        response = await NeurocorticalBridge.execute_operation(
-            operation="think",
-            data={
-                "prompt": f"Think creatively about: {input_text}",
-                "temperature": 0.8
-            }
-        )
-        return response.get("response", "")
+        return await self._think(f"Think creatively about: {input_text}", 0.8, mind)
 
-    async def _emotional_perspective(self, input_text: str) -> str:
+    async def _emotional_perspective(self, input_text: str, mind: Any = None) -> str:
         """
         Process input with emotional intelligence
         """
         journaling_manager.recordScope("PerspectiveThinkingManager._emotional_perspective", input_text=input_text)
-        
-        # Use NeurocorticalBridge instead of direct SynapticPathways call
-        from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
-        
-        # Create a think command for emotional perspective
-        response = await NeurocorticalBridge.execute_operation(
-            operation="think",
-            data={
-                "prompt": f"Consider the emotional aspects of: {input_text}",
-                "temperature": 0.6
-            }
-        )
-        return response.get("response", "")
+        return await self._think(f"Consider the emotional aspects of: {input_text}", 0.6, mind)
 
-    async def _intuitive_perspective(self, input_text: str) -> str:
+    async def _intuitive_perspective(self, input_text: str, mind: Any = None) -> str:
         """
         Process input with intuitive thinking
         """
         journaling_manager.recordScope("PerspectiveThinkingManager._intuitive_perspective", input_text=input_text)
-        
-        # Use NeurocorticalBridge instead of direct SynapticPathways call
-        from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
-        
-        # Create a think command for intuitive perspective
-        response = await NeurocorticalBridge.execute_operation(
-            operation="think",
-            data={
-                "prompt": f"Consider this from an intuitive perspective: {input_text}",
-                "temperature": 0.7
-            }
-        )
-        return response.get("response", "")
+        return await self._think(f"Consider this from an intuitive perspective: {input_text}", 0.7, mind)
 
     def _integrate_perspectives(self, responses: Dict[str, str]) -> str:
         """
@@ -126,7 +126,9 @@ class AudioAutomation:
                     prompt=asr_response.get("text", ""),
                     stream=True
                 )
-                llm_response = await NeurocorticalBridge.execute(llm_command)
+                # Someone is waiting to hear the answer - jump ahead of background prompts
+                with NeurocorticalBridge.inference_priority("interactive"):
+                    llm_response = await NeurocorticalBridge.execute(llm_command)
                 
                 if llm_response.get("status") == "ok" and llm_response.get("delta", ""):
                     # Convert response to speech
@@ -48,7 +48,8 @@ from Mind.Subcortex.api_commands import (
     SystemCommand,
     AudioCommand  # Just import AudioCommand instead of individual audio commands
 )
-from Mind.Subcortex.transport_layer import get_transport, ConnectionError, CommandError, run_adb_command
+from Mind.Subcortex.transport_layer import get_transport, ConnectionError, CommandError, run_adb_command, open_adb_pipe, close_adb_pipe
+from Mind.Subcortex.frame_decoder import NDJSONFrameDecoder, FrameTooLargeError
 
 # Initialize journaling manager
 journaling_manager = SystemJournelingManager(CONFIG.log_level)
@@ -76,9 +77,12 @@ class SynapticPathways:
     welcome_message = ""
     _connection_type = None
     _serial_port = None
-    _response_buffer = ""
+    _response_decoder: Optional[NDJSONFrameDecoder] = None
     _response_callback = None
     _response_thread = None
+    _adb_reader: Optional[subprocess.Popen] = None
+    # Guards _adb_reader and _stop_thread so a stopping reader can't reopen the pipe
+    _adb_reader_lock = threading.RLock()
     _stop_thread = False
     current_hw_info = {}
     hw_info_timestamp = None
@@ -393,58 +397,80 @@ class SynapticPathways:
     @classmethod
     def _stop_response_thread(cls):
         """Stop the response reading thread"""
-        cls._stop_thread = True
+        # Ending the ADB pipe or cancelling the serial read unblocks a waiting reader
+        with cls._adb_reader_lock:
+            cls._stop_thread = True
+            cls._close_adb_reader()
+        if cls._serial_connection and hasattr(cls._serial_connection, "cancel_read"):
+            cls._serial_connection.cancel_read()
         if cls._response_thread:
             cls._response_thread.join()
 
     @classmethod
     def _read_responses(cls):
         """Continuously read responses from the serial port"""
+        cls._response_decoder = NDJSONFrameDecoder(on_invalid=lambda raw: journaling_manager.recordError(
+            f"Error decoding JSON: {raw!r}"
+        ))
         while not cls._stop_thread:
             if cls._connection_type == "serial" and cls._serial_connection and cls._serial_connection.is_open:
                 try:
-                    if cls._serial_connection.in_waiting:
-                        char = cls._serial_connection.read().decode('utf-8')
-                        cls._response_buffer += char
-                        
-                        # Check for complete JSON response
-                        if char == '\n' and cls._response_buffer.strip():
-                            try:
-                                response = json.loads(cls._response_buffer.strip())
-                                if cls._response_callback:
-                                    cls._response_callback(response.get('data', ''))
-                            except json.JSONDecodeError:
-                                journaling_manager.recordError(f"Error decoding JSON: {cls._response_buffer}")
-                            finally:
-                                cls._response_buffer = ""
+                    # Blocking bulk read - returns as soon as anything arrives, no polling delay
+                    data = cls._serial_connection.read(cls._serial_connection.in_waiting or 1)
+                    if data:
+                        cls._deliver_responses(data)
+                    continue
                 except Exception as e:
                     journaling_manager.recordError(f"Error reading from serial: {e}")
             elif cls._connection_type == "adb":
                 try:
-                    # Read one character at a time using ADB
-                    read_result = subprocess.run(
-                        ["adb", "shell", f"dd if={cls._serial_port} bs=1 count=1 iflag=nonblock 2>/dev/null"],
-                        capture_output=True,
-                        text=True
-                    )
+                    # One persistent `adb shell cat` pipe, read in bulk; blocks until data arrives
+                    with cls._adb_reader_lock:
+                        if cls._stop_thread:
+                            break
+                        if cls._adb_reader is None or cls._adb_reader.poll() is not None:
+                            cls._close_adb_reader()
+                            cls._adb_reader = open_adb_pipe(["shell", f"cat {cls._serial_port}"])
+                        reader = cls._adb_reader
                     
-                    if read_result.returncode == 0 and read_result.stdout:
-                        char = read_result.stdout
-                        cls._response_buffer += char
-                        
-                        # Check for complete JSON response
-                        if char == '\n' and cls._response_buffer.strip():
-                            try:
-                                response = json.loads(cls._response_buffer.strip())
-                                if cls._response_callback:
-                                    cls._response_callback(response.get('data', ''))
-                            except json.JSONDecodeError:
-                                journaling_manager.recordError(f"Error decoding JSON: {cls._response_buffer}")
-                            finally:
-                                cls._response_buffer = ""
+                    data = reader.stdout.read1(64 * 1024)
+                    if data:
+                        cls._deliver_responses(data)
+                        continue
+                    
+                    # Pipe ended (device gone or reader stopped) - back off before reopening
+                    cls._close_adb_reader()
+                    if not cls._stop_thread:
+                        journaling_manager.recordError("ADB reader pipe closed, reopening")
+                        time.sleep(0.5)
+                    continue
                 except Exception as e:
-                    journaling_manager.recordError(f"Error reading from ADB: {e}")
+                    cls._close_adb_reader()
+                    if not cls._stop_thread:
+                        journaling_manager.recordError(f"Error reading from ADB: {e}")
+                        time.sleep(0.5)
+                    continue
             time.sleep(0.01)
+        cls._close_adb_reader()
+
+    @classmethod
+    def _close_adb_reader(cls) -> None:
+        """Terminate the persistent ADB reader pipe if one is running"""
+        with cls._adb_reader_lock:
+            reader, cls._adb_reader = cls._adb_reader, None
+            close_adb_pipe(reader)
+
+    @classmethod
+    def _deliver_responses(cls, data: bytes) -> None:
+        """Feed raw bytes to the frame decoder and pass each complete response's data on"""
+        try:
+            responses = cls._response_decoder.feed(data)
+        except FrameTooLargeError as e:
+            journaling_manager.recordError(f"Error decoding JSON: {e}")
+            return
+        for response in responses:
+            if cls._response_callback:
+                cls._response_callback(response.get('data', '') if isinstance(response, dict) else response)
 
     @classmethod
     def update_hardware_info(cls, hw_data: Dict[str, Any]) -> None:
@@ -885,25 +911,29 @@ class SynapticPathways:
         Create an LLM stream visualization task that can be updated manually
         
         Returns:
-            The DisplayVisualTask instance that can be updated with update_stream()
+            Handle of the DisplayVisualTask, updated with update_stream(), or
+            None when the task system has no display support
         """
         # Import here to avoid circular imports
         from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
         
-        # Use NeurocorticalBridge.execute instead of accessing BasalGanglia directly
-        return NeurocorticalBridge.execute("create_llm_stream", {
-            "highlight_keywords": highlight_keywords,
-            "keywords": keywords,
-            "show_tokens": show_tokens
-        })
+        # Go through the bridge's shared task system instead of BasalGanglia directly
+        bg = NeurocorticalBridge.get_basal_ganglia()
+        if not hasattr(bg, "display_llm_stream"):
+            return None
+        return bg.display_llm_stream(
+            highlight_keywords=highlight_keywords,
+            keywords=keywords,
+            show_tokens=show_tokens
+        )
 
     @classmethod
     async def think_with_stream_visualization(cls, prompt: str, 
                                             highlight_keywords: bool = False,
                                             keywords: list = None,
-                                            show_tokens: bool = False) -> Dict[str, Any]:
+                                            show_tokens: bool = False) -> str:
         """
-        Use BasalGanglia to perform a thinking task with LLM and visualize the streaming output
+        Perform a thinking task with LLM and visualize each streamed delta as it arrives
         
         Args:
             prompt: The prompt to send to the LLM
@@ -912,7 +942,7 @@ class SynapticPathways:
             show_tokens: Whether to show token statistics
         
         Returns:
-            The final LLM response
+            The final LLM response, or an error message if thinking failed
         """
         journaling_manager.recordInfo(f"Initiating thinking task with stream visualization: {prompt[:50]}...")
         
@@ -930,38 +960,30 @@ class SynapticPathways:
                 keywords = [word for word in words if word.lower() not in common_words][:5]
                 journaling_manager.recordInfo(f"Extracted keywords: {keywords}")
             
-            # Create visualization task through execute
-            visual_task = await NeurocorticalBridge.execute("create_llm_stream", {
-                "highlight_keywords": highlight_keywords,
-                "keywords": keywords,
-                "show_tokens": show_tokens
-            })
-            
-            # Thinking task through execute
-            task = await NeurocorticalBridge.execute("think", {
-                "prompt": prompt
-            }, stream=True)
+            # Create visualization task; it highlights keywords and shows token stats
+            visual_task = cls.create_llm_stream_visualization(
+                highlight_keywords=highlight_keywords,
+                keywords=keywords,
+                show_tokens=show_tokens
+            )
             
-            # Continuously update visualization as we get results
+            # Feed the visualization each delta as soon as the bridge parses it from the stream
             result = ""
-            while task.active or not task.has_completed():
-                if hasattr(task, 'result') and task.result:
-                    # Update result and visualization if there's new content
-                    if isinstance(task.result, str) and task.result != result:
-                        result = task.result
-                        # Update the visual task with new content
+            try:
+                async for delta in NeurocorticalBridge.stream_operation("think", {"prompt": prompt}):
+                    result += delta
+                    if visual_task is not None:
                         visual_task.update_stream(result)
-            
-            await asyncio.sleep(0.1)
-            
-            # Mark visualization as complete
-            visual_task.update_stream(task.result, is_complete=True)
+            finally:
+                # Mark visualization as complete, even if the stream failed part-way
+                if visual_task is not None:
+                    visual_task.update_stream(result, is_complete=True)
             
             # Return final thinking result
-            return task.result
+            return result
         except Exception as e:
             journaling_manager.recordError(f"Error in thinking task with visualization: {e}")
-            return {"error": str(e)}
+            return f"Error: {e}"
 
     @classmethod
     def get_ui_mode(cls) -> str:
@@ -5,10 +5,26 @@ A psychologically inspired logging (journaling) system that supports four levels
 ERROR, INFO, DEBUG, and SCOPE.
 
 'SCOPE' logs every method call (with parameters) plus all lower-level messages.
+
+Messages are only formatted when their level is enabled: wrap anything
+expensive to build in a lambda instead of passing the f-string itself.
+
+    journaling_manager.recordDebug(lambda: f"Sending {json.dumps(command)}")
+
+Enabled lines are echoed to the console straight away, so they stay in order
+with print() output and input() prompts. For CONFIG.log_file they also go into
+a bounded ring buffer that a background thread writes out in batches, so the
+caller never waits on disk.
 """
 
+import atexit
+import os
+import sys
+import threading
+import time
+from collections import deque
 from enum import Enum
-from typing import Union, Any
+from typing import Union, Any, Callable, List, Optional
 
 class SystemJournelingLevel(Enum):
     """
@@ -31,11 +47,135 @@ class SystemJournelingLevel(Enum):
             valid_levels = [level.name for level in cls]
             raise ValueError(f"Invalid log level: {level_str}. Must be one of {valid_levels}")
 
+# Level values as plain ints for the per-call enabled check
+_ERROR = SystemJournelingLevel.ERROR.value
+_INFO = SystemJournelingLevel.INFO.value
+_DEBUG = SystemJournelingLevel.DEBUG.value
+_SCOPE = SystemJournelingLevel.SCOPE.value
+
+
+class JournalSink:
+    """
+    Console echo plus a bounded ring buffer of journal lines for the log file
+    
+    Console writes happen in the calling thread. The file is written by a
+    background thread; when it falls behind, the oldest lines are dropped (and
+    counted) rather than blocking the code that is logging.
+    """
+    
+    def __init__(self, capacity: int = 4096, log_file: Optional[str] = None, console: bool = True):
+        self._lines = deque(maxlen=max(1, capacity))
+        self._lock = threading.Lock()
+        self._console_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._file = None
+        self.log_file = log_file
+        self.console = console
+        self.dropped = 0
+        self.written = 0
+    
+    def configure(self, log_file: Optional[str] = None, console: Optional[bool] = None,
+                  capacity: Optional[int] = None) -> None:
+        """Change the log file, console echo or buffer size"""
+        self.flush()
+        with self._write_lock:
+            if log_file != self.log_file:
+                self._close_file()
+                self.log_file = log_file
+            if console is not None:
+                self.console = console
+            if capacity is not None:
+                with self._lock:
+                    self._lines = deque(self._lines, maxlen=max(1, capacity))
+    
+    def emit(self, line: str) -> None:
+        """Echo a line to the console and queue it for the file writer thread"""
+        if self.console:
+            # Same stream and buffering as print(), so the two never reorder
+            with self._console_lock:
+                try:
+                    sys.stdout.write(line + "\n")
+                except (OSError, ValueError):
+                    pass
+        with self._lock:
+            if len(self._lines) == self._lines.maxlen:
+                self.dropped += 1
+            self._lines.append(line)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="journal-sink", daemon=True)
+                self._thread.start()
+        self._wake.set()
+    
+    def _drain(self) -> List[str]:
+        with self._lock:
+            batch = list(self._lines)
+            self._lines.clear()
+            dropped, self.dropped = self.dropped, 0
+        if dropped:
+            batch.insert(0, f"[SYSTEM] 🧠 {dropped} journal lines dropped (writer fell behind)")
+        return batch
+    
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write everything buffered so far to the log file (called by the writer thread, or at exit)"""
+        with self._write_lock:
+            batch = self._drain()
+            if not batch:
+                return
+            if self.log_file:
+                self._write_file(batch)
+            self.written += len(batch)
+    
+    def _write_file(self, batch: List[str]) -> None:
+        try:
+            if self._file is None:
+                os.makedirs(os.path.dirname(os.path.abspath(self.log_file)), exist_ok=True)
+                self._file = open(self.log_file, "a", encoding="utf-8")
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S")
+            self._file.write("".join(f"{stamp} {line}\n" for line in batch))
+            self._file.flush()
+        except OSError as e:
+            sys.stderr.write(f"[SYSTEM] 🧠 Cannot write journal to {self.log_file}: {e}\n")
+            self._close_file()
+            self.log_file = None
+    
+    def _close_file(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+
+
+# One sink shared by every SystemJournelingManager
+_sink = JournalSink()
+atexit.register(_sink.flush)
+
+
 class SystemJournelingManager:
     """
     A psychology-inspired journaling manager that provides multi-level logging.
     """
 
+    @staticmethod
+    def configureSink(log_file: Optional[str] = None, console: Optional[bool] = None,
+                      capacity: Optional[int] = None) -> None:
+        """Set where journal lines are written (shared by all managers)"""
+        _sink.configure(log_file=log_file, console=console, capacity=capacity)
+    
+    @staticmethod
+    def flush() -> None:
+        """Write buffered journal lines now"""
+        _sink.flush()
+    
     def __init__(self, level: Union[str, SystemJournelingLevel] = SystemJournelingLevel.ERROR):
         """
         Initialize with a chosen journaling level.
@@ -72,6 +212,30 @@ class SystemJournelingManager:
             print("SCOPE", end=" ")
         print("\n")
 
+    @property
+    def currentLevel(self) -> SystemJournelingLevel:
+        return self._currentLevel
+    
+    @currentLevel.setter
+    def currentLevel(self, level: SystemJournelingLevel) -> None:
+        self._currentLevel = level
+        self._threshold = level.value
+    
+    def isEnabledFor(self, level: SystemJournelingLevel) -> bool:
+        """True if messages at level would be recorded - use to skip building expensive log data"""
+        return self._threshold >= level.value
+    
+    def _record(self, prefix: str, message: Union[str, Callable[[], Any]], args: tuple) -> None:
+        """Format an enabled message and hand it to the sink"""
+        try:
+            if callable(message):
+                message = message()
+            elif args:
+                message = message % args
+        except Exception as e:
+            message = f"{message!r} {args!r} (journal formatting failed: {e})"
+        _sink.emit(f"{prefix}  {message}")
+    
     def setLevel(self, newLevel: Union[str, SystemJournelingLevel]) -> None:
         """
         Update the journaling level at runtime.
@@ -93,43 +257,49 @@ class SystemJournelingManager:
         """
         return self.currentLevel
 
-    def recordError(self, message: str, exc_info: bool = False) -> None:
+    def recordError(self, message: Union[str, Callable[[], Any]], *args: Any, exc_info: bool = False) -> None:
         """
         Record an error message if current level is >= ERROR.
         
         Args:
-            message: The error message to record
+            message: The error message to record (or a callable returning it)
+            args: %-style arguments for message
             exc_info: If True, include exception info in the message
         """
-        if self.currentLevel.value >= SystemJournelingLevel.ERROR.value:
+        if self._threshold >= _ERROR:
+            self._record("[ERROR] ✖", message, args)
             if exc_info:
                 import traceback
-                print(f"[ERROR] ✖  {message}")
-                print(traceback.format_exc())
-            else:
-                print(f"[ERROR] ✖  {message}")
+                _sink.emit(traceback.format_exc().rstrip())
 
-    def recordInfo(self, message: str) -> None:
+    def recordWarning(self, message: Union[str, Callable[[], Any]], *args: Any) -> None:
+        """
+        Record a warning; warnings are shown at every level, like errors.
+        """
+        if self._threshold >= _ERROR:
+            self._record("[WARN]  ⚠", message, args)
+    
+    def recordInfo(self, message: Union[str, Callable[[], Any]], *args: Any) -> None:
         """
         Record an informational message if current level is >= INFO.
         """
-        if self.currentLevel.value >= SystemJournelingLevel.INFO.value:
-            print(f"[INFO]  ℹ  {message}")
+        if self._threshold >= _INFO:
+            self._record("[INFO]  ℹ", message, args)
 
-    def recordDebug(self, message: str) -> None:
+    def recordDebug(self, message: Union[str, Callable[[], Any]], *args: Any) -> None:
         """
         Record a debug message if current level is >= DEBUG.
         """
-        if self.currentLevel.value >= SystemJournelingLevel.DEBUG.value:
-            print(f"[DEBUG] ⚙  {message}")
+        if self._threshold >= _DEBUG:
+            self._record("[DEBUG] ⚙", message, args)
 
     def recordScope(self, methodName: str, *args: Any, **kwargs: Any) -> None:
         """
         Record a scope-level method call if current level is >= SCOPE.
         Displays the method name and parameters for deeper psychological insight.
         """
-        if self.currentLevel.value >= SystemJournelingLevel.SCOPE.value:
-            print(f"[SCOPE] ⚗  Method: {methodName}, Args: {args}, Kwargs: {kwargs}")
+        if self._threshold >= _SCOPE:
+            _sink.emit(f"[SCOPE] ⚗  Method: {methodName}, Args: {args}, Kwargs: {kwargs}")
 
 
 # Example usage (remove or edit this when integrating):
@@ -4,7 +4,6 @@ Game of Life - An interactive cellular automaton that also visualizes typed inpu
 
 import random
 import asyncio
-import time
 from PIL import Image, ImageDraw, ImageFont
 from Mind.GameCortex.base_module import BaseModule
 
@@ -66,12 +65,13 @@ class InteractiveGameOfLife(BaseModule):
         self.cursor_pos = (32, 32)  # Current cursor position for pattern insertion
         self.text_cursor = 0  # Position in text visualization
         self.insertion_delay = 0.2  # Seconds between character insertions
-        self.last_insert_time = 0
+        self.insert_elapsed = 0.0  # Game time since the last character insertion
         self.waiting_for_input = True
         
         # Game settings
         self.is_paused = False
         self.speed = 10  # Updates per second
+        self.step_elapsed = 0.0  # Game time since the last simulation step
         self.color_scheme = "DEFAULT"
         self.input_mode = "DIRECT"  # DIRECT or BUFFER mode
         
@@ -94,23 +94,20 @@ class InteractiveGameOfLife(BaseModule):
         if not self.running:
             return
             
-        current_time = time.time()
-        
-        # Only update at the specified speed when not paused
+        # Step the simulation at the specified speed when not paused, using
+        # game time so it runs the same however fast frames are drawn
         if not self.is_paused:
-            # Update simulation based on the speed setting
-            if hasattr(self, 'last_update_time'):
-                time_since_update = current_time - self.last_update_time
-                if time_since_update > 1.0 / self.speed:
-                    self._update_simulation()
-                    self.last_update_time = current_time
-            else:
-                self.last_update_time = current_time
+            self.step_elapsed += dt
+            step = 1.0 / self.speed
+            while self.step_elapsed >= step:
+                self._update_simulation()
+                self.step_elapsed -= step
                 
         # Process any waiting characters from buffer in BUFFER mode
-        if self.input_mode == "BUFFER" and self.buffer and current_time - self.last_insert_time > self.insertion_delay:
+        self.insert_elapsed += dt
+        if self.input_mode == "BUFFER" and self.buffer and self.insert_elapsed > self.insertion_delay:
             self._process_next_character()
-            self.last_insert_time = current_time
+            self.insert_elapsed = 0.0
             
     def draw(self):
         """Draw the current state to the display."""
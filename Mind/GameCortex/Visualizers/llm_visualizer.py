@@ -10,6 +10,7 @@ import asyncio
 from PIL import Image, ImageDraw, ImageFont
 from Mind.GameCortex.base_module import BaseModule
 from Mind.FrontalLobe.PrefrontalCortex.system_journeling_manager import SystemJournelingManager
+from Mind.Subcortex.request_tracer import traced
 
 # Initialize journaling manager
 journaling_manager = SystemJournelingManager()
@@ -300,14 +301,22 @@ class TextVisualizer(BaseModule):
         else:
             return color
     
-    async def _get_llm_input(self):
-        """Try to get input from LLM if connected."""
+    async def _stream_llm_input(self, max_chars=200):
+        """
+        Stream LLM output straight into the visualization as it is generated
+        
+        Args:
+            max_chars: Stop visualizing after this many characters
+            
+        Returns:
+            The text that was visualized, or None if nothing arrived
+        """
         if not self.has_llm:
             return None
             
         try:
-            # Try to use SynapticPathways to get LLM output
-            from Mind.CorpusCallosum.synaptic_pathways import SynapticPathways
+            # Deltas arrive token by token from the bridge's stream
+            from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
             
             # Generate a prompt for the LLM
             prompts = [
@@ -319,16 +328,33 @@ class TextVisualizer(BaseModule):
             ]
             prompt = random.choice(prompts)
             
-            # Try to get response from LLM
-            response = await SynapticPathways.send_text_request(prompt)
-            if response and "response" in response:
-                return response["response"]
-            return None
+            # Ambient prompts queue behind chat and voice so they never delay a reply
+            llm_text = ""
+            stream = NeurocorticalBridge.stream_operation("think", {"prompt": prompt, "priority": "background"})
+            try:
+                async for delta in stream:
+                    if not self.running or self.input_mode != "LLM":
+                        break
+                        
+                    # Truncate very long responses
+                    delta = delta[:max_chars - len(llm_text)]
+                    llm_text += delta
+                    self.visualization_text += delta
+                    
+                    if len(llm_text) >= max_chars:
+                        self.visualization_text += "..."
+                        break
+            finally:
+                # Stop the generation now rather than whenever the generator is collected
+                await stream.aclose()
+                    
+            return llm_text or None
         except Exception as e:
             journaling_manager.recordError(f"Error getting LLM input: {e}")
             self.has_llm = False  # Disable LLM mode on error
             return None
     
+    @traced("TextVisualizer.draw", "render")
     def draw(self):
         """Draw the current visualization to the display."""
         if not self.running or not self.layout_manager:
@@ -422,16 +448,11 @@ class TextVisualizer(BaseModule):
         print("[TextVisualizer] Starting LLM input loop...")
         
         while self.running and self.input_mode == "LLM":
-            # Get input from LLM
-            llm_text = await self._get_llm_input()
+            # Get input from LLM - characters are queued for visualization as they stream in
+            llm_text = await self._stream_llm_input()
             
             if llm_text:
-                # Truncate very long responses
-                if len(llm_text) > 200:
-                    llm_text = llm_text[:200] + "..."
-                    
                 print(f"[TextVisualizer] LLM generated: {llm_text}")
-                self.visualization_text += llm_text
             
             # Wait before getting more input
             await asyncio.sleep(10)  # 10 seconds between LLM inputs
@@ -11,10 +11,11 @@ import os
 import importlib
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 
 # Import the actual BaseModule
 from .base_module import BaseModule
+from .game_runtime import GameRuntime
 from Mind.OccipitalLobe.visual_layout_manager import VisualLayoutManager
 from Mind.OccipitalLobe.VisualCortex.primary_area import PrimaryVisualArea
 from rgbmatrix import RGBMatrix
@@ -52,6 +53,8 @@ class GameManager:
         self.game_directory = Path(game_directory)
         self.available_games: Dict[str, Type[BaseModule]] = {}
         self.active_game: Optional[BaseModule] = None
+        self.runtime: Optional[GameRuntime] = None
+        self.last_runtime_stats: Optional[Dict[str, Any]] = None
         self.discover_games()
         
     def discover_games(self) -> None:
@@ -165,8 +168,43 @@ class GameManager:
             self.logger.error(f"Game not found: {game_name}")
             return None
             
+    async def run_active_game(self,
+                              present: Optional[Callable] = None,
+                              fps: Optional[float] = None,
+                              max_frames: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Drives the active game with a fixed-timestep GameRuntime until it stops.
+
+        Args:
+            present: Pushes each drawn frame to the display, e.g.
+                lambda: layout_manager.update_display(rotate_degrees=270)
+            fps: Frame rate, defaults to CONFIG.visual_fps
+            max_frames: Stop after this many frames
+
+        Returns:
+            The runtime's frame stats, or None if no game is active
+        """
+        if not self.active_game:
+            self.logger.warning("No active game to run.")
+            return None
+        self.runtime = GameRuntime(self.active_game, present=present, fps=fps)
+        try:
+            self.last_runtime_stats = await self.runtime.run(max_frames=max_frames)
+        finally:
+            self.runtime = None
+        return self.last_runtime_stats
+
+    def post_input(self, event) -> None:
+        """Queues an input event for the running game."""
+        if self.runtime:
+            self.runtime.post_input(event)
+        elif self.active_game:
+            self.active_game.handle_input(event)
+
     def stop_active_game(self) -> None:
         """Stops the currently running game."""
+        if self.runtime:
+            self.runtime.stop()
         if self.active_game:
             game_name = self.active_game.__class__.__name__
             try:
@@ -0,0 +1,253 @@
+"""
+Game Runtime - Drives a BaseModule at a steady frame rate.
+
+- update(dt) always gets the same fixed step (1 / CONFIG.visual_fps), called as
+  many times as wall-clock time requires, so game speed doesn't depend on how
+  fast frames render
+- draw() and the present hook run at most once per frame and are skipped when
+  the loop is behind schedule, so a slow panel push costs frames, not game time
+- Input posted from any thread is queued and handed to handle_input() at the
+  start of the next frame
+- Per-frame update/draw/present timings and dropped-frame counts in stats()
+"""
+
+import asyncio
+import inspect
+import logging
+import queue
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from config import CONFIG
+from .base_module import BaseModule
+
+# Frames kept for the rolling timing figures
+TIMING_WINDOW = 120
+
+# Slack when comparing accumulated time to the step, so float rounding doesn't
+# turn an exactly-on-time frame into zero updates followed by two
+STEP_TOLERANCE = 1e-6
+
+
+class PhaseTimer:
+    """Rolling per-frame timings for one phase of the frame (update, draw or present)"""
+
+    def __init__(self, window: int = TIMING_WINDOW):
+        self._samples = deque(maxlen=window)
+        self.max_ms = 0.0
+
+    def record(self, seconds: float) -> None:
+        ms = seconds * 1000
+        self._samples.append(ms)
+        self.max_ms = max(self.max_ms, ms)
+
+    def snapshot(self) -> Dict[str, float]:
+        samples = self._samples
+        return {
+            "last_ms": round(samples[-1], 3) if samples else 0.0,
+            "mean_ms": round(sum(samples) / len(samples), 3) if samples else 0.0,
+            "window_max_ms": round(max(samples), 3) if samples else 0.0,
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class GameRuntime:
+    """Fixed-timestep loop for one BaseModule"""
+
+    def __init__(self,
+                 game: BaseModule,
+                 present: Optional[Callable[[], Union[None, Awaitable[None]]]] = None,
+                 fps: Optional[float] = None,
+                 max_updates_per_frame: int = 5,
+                 max_skipped_draws: int = 5,
+                 clock: Callable[[], float] = time.perf_counter,
+                 sleep: Callable[[float], Awaitable[None]] = asyncio.sleep):
+        """
+        Args:
+            game: Initialized module to drive (launch_game's return value)
+            present: Pushes the drawn frame to the display, e.g.
+                lambda: layout_manager.update_display(rotate_degrees=270).
+                May be a coroutine function. Defaults to the game's
+                layout_manager.update_display()
+            fps: Frames per second, defaults to CONFIG.visual_fps
+            max_updates_per_frame: Catch-up updates allowed in one frame; time
+                beyond that is dropped instead of stalling the loop
+            max_skipped_draws: Consecutive late frames allowed to skip draw()
+                before one is drawn anyway
+            clock: Monotonic clock in seconds
+            sleep: Coroutine used to wait for the next frame
+        """
+        self.logger = logging.getLogger(__name__)
+        self.game = game
+        if present is None:
+            present = getattr(getattr(game, "layout_manager", None), "update_display", None)
+        self.present = present
+        self.fps = float(fps or CONFIG.visual_fps)
+        self.dt = 1.0 / self.fps
+        self.max_updates_per_frame = max(1, max_updates_per_frame)
+        self.max_skipped_draws = max(0, max_skipped_draws)
+        self._clock = clock
+        self._sleep = sleep
+        self._inputs: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self.running = False
+        self._reset_stats()
+
+    def _reset_stats(self) -> None:
+        self.frames = 0
+        self.updates = 0
+        self.draws = 0
+        self.dropped_frames = 0   # frames whose draw was skipped
+        self.dropped_updates = 0  # fixed steps discarded past max_updates_per_frame
+        self.input_events = 0
+        self.input_errors = 0
+        self.update_timer = PhaseTimer()
+        self.draw_timer = PhaseTimer()
+        self.present_timer = PhaseTimer()
+        self.frame_timer = PhaseTimer()
+        self._started_at: Optional[float] = None
+        self._stopped_at: Optional[float] = None
+
+    def post_input(self, event: Any) -> None:
+        """Queue an input event for handle_input(); safe to call from any thread"""
+        self._inputs.put(event)
+
+    def stop(self) -> None:
+        """Finish the current frame and leave run()"""
+        self.running = False
+
+    def _dispatch_input(self) -> None:
+        while True:
+            try:
+                event = self._inputs.get_nowait()
+            except queue.Empty:
+                return
+            self.input_events += 1
+            try:
+                self.game.handle_input(event)
+            except Exception as e:
+                self.input_errors += 1
+                self.logger.error(f"Error handling input in {self.game.__class__.__name__}: {e}", exc_info=True)
+
+    async def _render(self) -> None:
+        start = self._clock()
+        self.game.draw()
+        drawn = self._clock()
+        self.draw_timer.record(drawn - start)
+        if self.present is not None:
+            result = self.present()
+            if inspect.isawaitable(result):
+                await result
+            self.present_timer.record(self._clock() - drawn)
+        self.draws += 1
+
+    async def run(self, max_frames: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Drive the game until stop(), game.running going False, or max_frames
+
+        Returns:
+            stats() for the run
+        """
+        self._reset_stats()
+        self.running = True
+        clock = self._clock
+        previous = self._started_at = clock()
+        next_frame = previous + self.dt
+        accumulator = 0.0
+        skipped_in_a_row = 0
+        self.logger.info(f"Running {self.game.__class__.__name__} at {self.fps:g} fps")
+
+        try:
+            while self.running and getattr(self.game, "running", True):
+                frame_start = clock()
+                accumulator += frame_start - previous
+                previous = frame_start
+
+                self._dispatch_input()
+
+                steps = 0
+                step_due = self.dt - STEP_TOLERANCE
+                while accumulator >= step_due and steps < self.max_updates_per_frame:
+                    self.game.update(self.dt)
+                    accumulator -= self.dt
+                    steps += 1
+                if accumulator >= step_due:
+                    # Too far behind to catch up: let game time slip rather than spiral
+                    dropped = int((accumulator + STEP_TOLERANCE) / self.dt)
+                    self.dropped_updates += dropped
+                    accumulator -= dropped * self.dt
+                self.updates += steps
+                updated = clock()
+                self.update_timer.record(updated - frame_start)
+
+                # Late for the next frame already: skip the draw, but never for long
+                if updated > next_frame and skipped_in_a_row < self.max_skipped_draws:
+                    self.dropped_frames += 1
+                    skipped_in_a_row += 1
+                else:
+                    await self._render()
+                    skipped_in_a_row = 0
+
+                self.frames += 1
+                self.frame_timer.record(clock() - frame_start)
+                if max_frames is not None and self.frames >= max_frames:
+                    break
+
+                now = clock()
+                if now < next_frame:
+                    await self._sleep(next_frame - now)
+                else:
+                    # Yield so input and other tasks still get a turn
+                    await self._sleep(0)
+                    if now - next_frame > self.dt * self.max_updates_per_frame:
+                        # Long stall (debugger, blocked present): re-anchor the schedule
+                        next_frame = now
+                next_frame += self.dt
+        finally:
+            self.running = False
+            self._stopped_at = clock()
+
+        stats = self.stats()
+        self.logger.info(
+            f"{self.game.__class__.__name__} ran {stats['frames']} frames at {stats['actual_fps']} fps, "
+            f"{stats['dropped_frames']} dropped"
+        )
+        return stats
+
+    def stats(self) -> Dict[str, Any]:
+        """Frame counts and per-phase timings for the current or last run"""
+        elapsed = 0.0
+        if self._started_at is not None:
+            elapsed = (self._stopped_at if self._stopped_at is not None else self._clock()) - self._started_at
+        return {
+            "game": self.game.__class__.__name__,
+            "target_fps": self.fps,
+            "actual_fps": round(self.draws / elapsed, 2) if elapsed > 0 else 0.0,
+            "frames": self.frames,
+            "draws": self.draws,
+            "updates": self.updates,
+            "dropped_frames": self.dropped_frames,
+            "dropped_updates": self.dropped_updates,
+            "input_events": self.input_events,
+            "input_errors": self.input_errors,
+            "update": self.update_timer.snapshot(),
+            "draw": self.draw_timer.snapshot(),
+            "present": self.present_timer.snapshot(),
+            "frame": self.frame_timer.snapshot(),
+        }
+
+
+def format_frame_stats(stats: Dict[str, Any]) -> List[str]:
+    """Plain-text lines summarizing a GameRuntime.stats()"""
+    lines = [
+        f"  {stats['game']}: {stats['actual_fps']:g}/{stats['target_fps']:g} fps, "
+        f"{stats['frames']} frames, {stats['dropped_frames']} dropped frames, "
+        f"{stats['dropped_updates']} dropped updates"
+    ]
+    for phase in ("update", "draw", "present", "frame"):
+        timing = stats[phase]
+        lines.append(
+            f"  {phase:<8} mean {timing['mean_ms']:>7.2f} ms  "
+            f"recent max {timing['window_max_ms']:>7.2f} ms  max {timing['max_ms']:>7.2f} ms"
+        )
+    return lines
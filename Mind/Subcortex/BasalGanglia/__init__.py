@@ -5,6 +5,7 @@ This module provides task scheduling and coordination for all cognitive processe
 """
 
 from .task_manager import BasalGanglia
+from .task_scheduler import TaskScheduler
 from .basal_ganglia_integration import BasalGangliaIntegration
 
-__all__ = ['BasalGanglia', 'BasalGangliaIntegration'] 
\ No newline at end of file
+__all__ = ['BasalGanglia', 'BasalGangliaIntegration', 'TaskScheduler'] 
\ No newline at end of file
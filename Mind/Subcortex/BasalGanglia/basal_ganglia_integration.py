@@ -5,6 +5,7 @@ import time
 import traceback
 
 from Mind.Subcortex.BasalGanglia.task_manager import BasalGanglia
+from Mind.Subcortex.BasalGanglia.task_scheduler import TaskHandle
 from Mind.Subcortex.BasalGanglia.tasks.think_task import ThinkTask
 from Mind.Subcortex.BasalGanglia.tasks.system_command_task import SystemCommandTask
 from Mind.Subcortex.BasalGanglia.tasks.display_visual_task import DisplayVisualTask
@@ -26,22 +27,19 @@ class BasalGangliaIntegration:
         self._task_history = []  # Keep track of completed tasks
         self._max_tasks = 10  # Maximum number of active tasks
         self._max_history = 20  # Maximum number of tasks to keep in history
-        self._last_cleanup = time.time()  # Track when we last cleaned up
-        self._cleanup_interval = 60  # Clean up every minute
+        self._last_cleanup = time.time()  # Track when a finished task was last removed
+        self._hung_task_timeout = 600  # Cancel tasks still running after 10 minutes
         self._running = True
         
         # Log initialization
         journaling_manager.recordInfo("[BasalGanglia] 🚀 Initializing BasalGanglia task system")
         
+        # Start the scheduler; it sleeps until a task is due or submitted
+        self.basal_ganglia = BasalGanglia()
+        self.basal_ganglia.start()
+        
         # Create core tasks
         self._create_core_tasks()
-        
-        # Start task loop
-        self._task_loop = asyncio.create_task(self.task_loop())
-        journaling_manager.recordInfo("[BasalGanglia] 🔄 Task loop started")
-        
-        # Start cleanup task
-        asyncio.create_task(self._background_cleanup())
     
     def _create_core_tasks(self):
         """Create and register core tasks."""
@@ -65,8 +63,10 @@ class BasalGangliaIntegration:
             journaling_manager.recordError(f"[BasalGanglia] Stack trace: {traceback.format_exc()}")
     
     def add_task(self, task):
-        """Add a task to the basal ganglia."""
+        """Add a task to the basal ganglia; periodic tasks are scheduled right away."""
         self._tasks[task.name] = task
+        if task.interval is not None:
+            self.basal_ganglia.register_task(task)
         journaling_manager.recordInfo(f"[BasalGanglia] ➕ Added task: {task.name}")
     
     def get_task(self, task_name):
@@ -92,115 +92,74 @@ class BasalGangliaIntegration:
         """Get the model management task."""
         return self.get_task("ModelManagementTask")
     
-    async def task_loop(self):
-        """Main task execution loop."""
-        last_execution = {}
-        
-        while self._running:
-            try:
-                current_time = time.time()
-                
-                # Process tasks
-                for task in sorted(self._tasks.values(), key=lambda t: t.priority):
-                    if not task.active:
-                        continue
-                    
-                    # Set appropriate intervals
-                    interval = 1.0
-                    if "HardwareInfoTask" in task.name:
-                        interval = 60.0  # Once per minute
-                    elif "ModelManagementTask" in task.name:
-                        interval = 120.0  # Every 2 minutes
-                    elif "SystemCommandTask" in task.name:
-                        interval = 0.1  # Systems commands run immediately
-                    
-                    # Check if it's time to run
-                    last_time = last_execution.get(task.name, 0)
-                    if current_time - last_time >= interval:
-                        try:
-                            await task.execute()
-                            last_execution[task.name] = current_time
-                        except Exception as e:
-                            journaling_manager.recordError(f"[BasalGanglia] ❌ Error executing {task.name}: {e}")
-                
-                # Sleep to prevent CPU spinning
-                await asyncio.sleep(0.5)
-                
-            except Exception as e:
-                journaling_manager.recordError(f"[BasalGanglia] ❌ Error in task loop: {e}")
-                await asyncio.sleep(1)
-    
     def shutdown(self):
         """Shutdown the basal ganglia task system."""
         self._running = False
-        if hasattr(self, '_task_loop'):
-            self._task_loop.cancel()
+        self.basal_ganglia.stop()
         journaling_manager.recordInfo("[BasalGanglia] 🛑 Task system shutdown")
 
-    async def _background_cleanup(self):
-        """Background task to periodically clean up stale tasks."""
-        while True:
-            try:
-                # Only clean up every cleanup_interval seconds
-                await asyncio.sleep(self._cleanup_interval)
-                
-                # Don't hold reference to this function in the tasks dict
-                self._cleanup_tasks()
-            except Exception as e:
-                journaling_manager.recordError(f"Error in background cleanup: {e}")
-                # Continue running even if there's an error
+    def _submit(self, task) -> TaskHandle:
+        """Schedule a task and track it until done, cancelling it if it hangs."""
+        if not getattr(task, "id", None):
+            task.id = f"{type(task).__name__}_{id(task)}_{int(time.time())}"
+        return self._track(task.id, self.basal_ganglia.register_task(task))
     
-    def _cleanup_tasks(self):
-        """Clean up completed and stale tasks."""
-        current_time = time.time()
-        
-        # Track tasks to remove
-        tasks_to_remove = []
+    def _track(self, task_id: str, handle: TaskHandle) -> TaskHandle:
+        """Keep a submitted task in _tasks until its handle completes."""
+        self._tasks[task_id] = handle.task
+        loop = self.basal_ganglia.scheduler.loop or asyncio.get_running_loop()
         
-        # Check each task
-        for task_id, task in self._tasks.items():
-            # 1. Task is inactive and completed - can be removed
-            if not task.active and task.has_completed():
-                tasks_to_remove.append(task_id)
-                
-            # 2. Task is inactive for too long - can be removed
-            elif not task.active and hasattr(task, 'creation_time'):
-                age = current_time - task.creation_time
-                if age > 300:  # 5 minutes
-                    tasks_to_remove.append(task_id)
+        def watch():
+            hung_timer = loop.call_later(self._hung_task_timeout, self._cancel_hung_task, task_id, handle)
             
-            # 3. Task has been active for too long - likely hung
-            elif task.active and hasattr(task, 'creation_time'):
-                age = current_time - task.creation_time
-                if age > 600:  # 10 minutes
-                    # Force stop the task
-                    journaling_manager.recordWarning(f"Force-stopping hung task: {task.name} (ID: {task_id})")
-                    task.stop()
-                    tasks_to_remove.append(task_id)
+            def finished(done: TaskHandle):
+                hung_timer.cancel()
+                self._on_task_finished(task_id, done)
+            
+            handle.add_done_callback(finished)
         
-        # Remove the tasks and add to history
-        for task_id in tasks_to_remove:
-            if task_id in self._tasks:
-                task = self._tasks[task_id]
-                # Add to history
-                self._task_history.append({
-                    "id": task_id,
-                    "name": task.name if hasattr(task, "name") else "Unknown",
-                    "removed_at": current_time
-                })
-                # Remove from active tasks
-                del self._tasks[task_id]
+        # Submitting is thread-safe, so arm the timer on the scheduler's loop
+        try:
+            on_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            watch()
+        else:
+            loop.call_soon_threadsafe(watch)
+        return handle
+    
+    def _cancel_hung_task(self, task_id: str, handle: TaskHandle):
+        """Cancel a task that has been running for too long."""
+        journaling_manager.recordWarning(f"Cancelling hung task: {handle.task.name} (ID: {task_id})")
+        handle.cancel()
+    
+    def _on_task_finished(self, task_id: str, handle: TaskHandle):
+        """Move a finished task from _tasks into the history."""
+        task = self._tasks.pop(task_id, None)
+        if task is None:
+            return
+        
+        if handle.cancelled():
+            status = "cancelled"
+        elif handle.exception() is not None:
+            status = "error"
+        else:
+            status = "ok"
+        
+        self._last_cleanup = time.time()
+        self._task_history.append({
+            "id": task_id,
+            "name": task.name if hasattr(task, "name") else "Unknown",
+            "status": status,
+            "removed_at": self._last_cleanup
+        })
         
         # Trim history if needed
         if len(self._task_history) > self._max_history:
             self._task_history = self._task_history[-self._max_history:]
         
-        # Update last cleanup time
-        self._last_cleanup = current_time
-        
-        # Log cleanup
-        if tasks_to_remove:
-            journaling_manager.recordInfo(f"Cleaned up {len(tasks_to_remove)} tasks. {len(self._tasks)} active tasks remaining.")
+        journaling_manager.recordDebug(f"[BasalGanglia] Task {task_id} finished ({status}). {len(self._tasks)} tasks remaining.")
     
     def get_task_count(self):
         """Return the current number of active tasks."""
@@ -222,11 +181,13 @@ class BasalGangliaIntegration:
             "inactive": inactive_count,
             "total": len(self._tasks),
             "history": len(self._task_history),
-            "last_cleanup": self._last_cleanup
+            "last_cleanup": self._last_cleanup,
+            "scheduler": self.basal_ganglia.scheduler.stats(),
+            "metrics": self.basal_ganglia.scheduler.metrics.snapshot()
         }
     
-    def think(self, prompt, stream=False, priority=5):
-        """Register a thinking task and return it."""
+    def think(self, prompt, stream=False, priority=5) -> Optional[TaskHandle]:
+        """Register a thinking task and return an awaitable handle for it."""
         # Import these at the method level to avoid circular imports
         from Mind.Subcortex.BasalGanglia.tasks.think_task import ThinkTask
         import time
@@ -246,15 +207,9 @@ class BasalGangliaIntegration:
         # Add the ID to the task
         task.id = unique_id
         
-        # Schedule the task
-        self._tasks[task.id] = task
+        # Schedule the task; submitting wakes the scheduler immediately
         task.active = True
-        
-        # FIX: Don't call _execute_task which doesn't exist
-        # Instead, just create a task with execute directly
-        asyncio.create_task(task.execute())
-        
-        return task
+        return self._submit(task)
 
     async def _execute_think_task(self, task):
         """Execute a thinking task asynchronously."""
@@ -276,17 +231,18 @@ class BasalGangliaIntegration:
             task.active = False
     
     def system_command(self, command_type: str, data: Dict[str, Any] = None, 
-                      priority: int = 1) -> SystemCommandTask:
+                      priority: int = 1) -> TaskHandle:
         """Create and register a SystemCommandTask for system operations"""
         journaling_manager.recordScope("[BasalGanglia] Creating SystemCommandTask", command_type=command_type)
         task = SystemCommandTask(command_type=command_type, data=data, priority=priority)
-        self.basal_ganglia.register_task(task)
+        task.active = True
+        handle = self._submit(task)
         journaling_manager.recordInfo(f"[BasalGanglia] Registered SystemCommandTask: {command_type}")
-        return task
+        return handle
         
     def display_visual(self, content: str = None, display_type: str = "text", 
                       visualization_type: str = None, visualization_params: dict = None,
-                      priority: int = 2) -> DisplayVisualTask:
+                      priority: int = 2) -> TaskHandle:
         """Create and register a DisplayVisualTask for visual output"""
         journaling_manager.recordScope("[BasalGanglia] Creating DisplayVisualTask", 
                                     display_type=display_type, visualization_type=visualization_type)
@@ -297,14 +253,14 @@ class BasalGangliaIntegration:
             visualization_params=visualization_params,
             priority=priority
         )
-        self.basal_ganglia.register_task(task)
+        handle = self._submit(task)
         
         if visualization_type:
             journaling_manager.recordInfo(f"[BasalGanglia] Registered DisplayVisualTask with visualization: {visualization_type}")
         else:
             journaling_manager.recordInfo(f"[BasalGanglia] Registered DisplayVisualTask with type: {display_type}")
         
-        return task
+        return handle
         
     def get_pending_tasks(self) -> int:
         """Get count of pending tasks"""
@@ -317,7 +273,7 @@ class BasalGangliaIntegration:
                               height: int = 64,
                               wrap: bool = True,
                               color_mode: str = "grayscale",
-                              priority: int = 2) -> DisplayVisualTask:
+                              priority: int = 2) -> TaskHandle:
         """Create and register an LLM token-to-pixel grid visualization task"""
         journaling_manager.recordScope("[BasalGanglia] Creating LLM pixel grid visualization", 
                                     width=width, height=height, color_mode=color_mode)
@@ -333,15 +289,15 @@ class BasalGangliaIntegration:
             stream_mode=True,  # This is a streaming task
             priority=priority
         )
-        self.basal_ganglia.register_task(task)
+        handle = self._submit(task)
         journaling_manager.recordInfo(f"[BasalGanglia] Registered LLM pixel grid visualization task ({width}x{height})")
-        return task
+        return handle
 
     def display_llm_stream(self, initial_content: str = "", 
                           highlight_keywords: bool = False,
                           keywords: list = None,
                           show_tokens: bool = False,
-                          priority: int = 2) -> DisplayVisualTask:
+                          priority: int = 2) -> TaskHandle:
         """Create and register an LLM stream visualization task"""
         journaling_manager.recordScope("[BasalGanglia] Creating LLM stream visualization")
         task = DisplayVisualTask(
@@ -355,9 +311,9 @@ class BasalGangliaIntegration:
             stream_mode=True,  # Important: This is a streaming task
             priority=priority
         )
-        self.basal_ganglia.register_task(task)
+        handle = self._submit(task)
         journaling_manager.recordInfo("[BasalGanglia] Registered LLM stream visualization task")
-        return task
+        return handle
 
     def initialize_communication(self, connection_type: str) -> bool:
         """Initialize the communication task with specified connection type"""
@@ -366,7 +322,7 @@ class BasalGangliaIntegration:
         return asyncio.run(comm_task.initialize(connection_type))
 
     def register_cortex_communication_task(self, source_cortex: str, target_cortex: str, 
-                                         data: dict, priority: int = 2) -> 'CortexCommunicationTask':
+                                         data: dict, priority: int = 2) -> TaskHandle:
         """
         Register a task for inter-cortex communication
         
@@ -377,7 +333,7 @@ class BasalGangliaIntegration:
             priority: Task priority
             
         Returns:
-            The registered task
+            Awaitable handle for the registered task
         """
         from Mind.Subcortex.BasalGanglia.tasks.cortex_communication_task import CortexCommunicationTask
         
@@ -388,6 +344,6 @@ class BasalGangliaIntegration:
             priority=priority
         )
         
-        self.basal_ganglia.register_task(task)
+        handle = self._submit(task)
         journaling_manager.recordInfo(f"[BasalGanglia] Registered cortex communication task: {source_cortex} → {target_cortex}")
-        return task 
\ No newline at end of file
+        return handle 
\ No newline at end of file
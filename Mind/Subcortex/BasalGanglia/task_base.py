@@ -1,7 +1,9 @@
 # PenphinMind/Mind/Subcortex/BasalGanglia/task_base.py
 
 from abc import ABC, abstractmethod
-from typing import Optional, Any
+from typing import Optional, Any, FrozenSet, Iterable
+
+from .task_types import TASK_RESOURCE_MAP, TaskResource
 
 class NeuralTask(ABC):
     """
@@ -10,6 +12,12 @@ class NeuralTask(ABC):
     Symbolically represents a neural intent or behavior unit with a lifecycle.
     """
 
+    # Seconds between runs for periodic tasks; None runs once per submission
+    interval: Optional[float] = None
+
+    # Resources the task needs; None uses the defaults for its task_type
+    resources: Optional[Iterable[TaskResource]] = None
+    
     def __init__(self, name: str, priority: int = 1):
         self.name = name
         self.priority = priority  # Lower number = higher priority
@@ -42,6 +50,12 @@ class NeuralTask(ABC):
         """Return whether the task has fully finished."""
         return self._has_run
 
+    def required_resources(self) -> FrozenSet[TaskResource]:
+        """Resources the scheduler must hand this task before it can run."""
+        if self.resources is not None:
+            return frozenset(self.resources)
+        return TASK_RESOURCE_MAP.get(getattr(self, "task_type", None), frozenset())
+    
     def describe(self) -> str:
         """Return a descriptive string of the task for logging."""
         return f"{self.name} (Priority: {self.priority}, Active: {self.active})"
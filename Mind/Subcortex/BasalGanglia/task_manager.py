@@ -1,10 +1,10 @@
 # Mind/Subcortex/BasalGanglia/task_manager.py
 
 import time
-import threading
 import logging
 
 from .task_base import NeuralTask
+from .task_scheduler import TaskHandle, TaskScheduler
 
 class BasalGanglia:
     """
@@ -14,58 +14,46 @@ class BasalGanglia:
 
     def __init__(self):
         self.task_queue: list[NeuralTask] = []
-        self.running = False
-        self.lock = threading.Lock()
+        self.scheduler = TaskScheduler(on_task_done=self._on_task_done)
         self.log = logging.getLogger("BasalGanglia")
 
-    def register_task(self, task: NeuralTask):
-        """
-        Add a new task to the queue and sort by priority.
-        """
-        with self.lock:
-            self.task_queue.append(task)
-            self.task_queue.sort(key=lambda t: t.priority)
-            self.log.info(f"[BasalGanglia] Registered task: {task.describe()}")
+    @property
+    def running(self) -> bool:
+        return self.scheduler.running
 
-    def run_cycle(self):
+    def register_task(self, task: NeuralTask, delay: float = 0.0) -> TaskHandle:
         """
-        One execution cycle: run all active tasks by order of priority.
+        Add a new task and wake the scheduler to run it.
+        Returns an awaitable handle for the submission.
         """
-        with self.lock:
-            # Clean up stale tasks BEFORE running the cycle
-            self._clean_stale_tasks()
-            
-            for task in self.task_queue:
-                if task.active:
-                    self.log.info(f"[BasalGanglia] Running: {task.describe()}")
-                    try:
-                        task.run()
-                    except Exception as e:
-                        self.log.error(f"[BasalGanglia] Task failed: {task.name} - {e}")
+        self._clean_stale_tasks()
+        if task not in self.task_queue:
+            self.task_queue.append(task)
+        handle = self.scheduler.submit(task, delay)
+        self.log.info(f"[BasalGanglia] Registered task: {task.describe()}")
+        return handle
 
-    def start(self, interval: float = 0.1):
+    def start(self):
         """
-        Begin the continuous execution loop.
+        Begin scheduling on the running event loop.
         """
         if self.running:
             return
-
-        def loop():
-            self.running = True
-            self.log.info("[BasalGanglia] Task loop started.")
-            while self.running:
-                self.run_cycle()
-                time.sleep(interval)
-            self.log.info("[BasalGanglia] Task loop stopped.")
-
-        thread = threading.Thread(target=loop, daemon=True)
-        thread.start()
+        self.scheduler.start()
+        self.log.info("[BasalGanglia] Task scheduler started.")
 
     def stop(self):
         """
-        Gracefully stop the loop.
+        Gracefully stop the scheduler.
         """
-        self.running = False
+        self.scheduler.stop()
+        self.log.info("[BasalGanglia] Task scheduler stopped.")
+
+    def _on_task_done(self, task: NeuralTask):
+        """Drop finished one-shot tasks as soon as they complete."""
+        if task.has_completed() and task in self.task_queue:
+            self.task_queue.remove(task)
+            self.log.info(f"Removing completed task: {task.name}")
 
     def _clean_stale_tasks(self):
         """Remove stale or completed tasks from the task list."""
@@ -0,0 +1,176 @@
+# Mind/Subcortex/BasalGanglia/task_metrics.py
+
+"""
+Task Metrics:
+- Per task type: queue wait, run time, failures, executions per minute and
+  peak concurrency
+- Constant memory however long the session runs: latencies go into fixed
+  histogram buckets and the rate into a 60-slot ring of per-second counts
+"""
+
+import bisect
+import threading
+import time
+from typing import Any, Dict, List
+
+from .task_base import NeuralTask
+
+# Upper bucket bounds in milliseconds; the last bucket catches everything slower
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000, 60000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram"""
+
+    def __init__(self, bounds_ms=LATENCY_BUCKETS_MS):
+        self.bounds_ms = tuple(bounds_ms)
+        self.counts = [0] * (len(self.bounds_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, seconds: float) -> None:
+        ms = max(0.0, seconds * 1000)
+        self.counts[bisect.bisect_left(self.bounds_ms, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of samples (max for the overflow bucket)"""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return float(self.bounds_ms[index]) if index < len(self.bounds_ms) else self.max_ms
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class RateCounter:
+    """Events in the last window seconds, kept in one slot per second"""
+
+    def __init__(self, window: int = 60):
+        self.window = window
+        self._seconds = [-1] * window
+        self._counts = [0] * window
+
+    def add(self, now: float = None) -> None:
+        second = int(time.monotonic() if now is None else now)
+        slot = second % self.window
+        if self._seconds[slot] != second:
+            self._seconds[slot] = second
+            self._counts[slot] = 0
+        self._counts[slot] += 1
+
+    def total(self, now: float = None) -> int:
+        second = int(time.monotonic() if now is None else now)
+        return sum(count for slot_second, count in zip(self._seconds, self._counts)
+                   if second - slot_second < self.window)
+
+
+class TaskTypeMetrics:
+    """Counters and histograms for one task type"""
+
+    def __init__(self):
+        self.queue_wait = LatencyHistogram()
+        self.run_time = LatencyHistogram()
+        self.executions = 0
+        self.failures = 0
+        self.cancellations = 0
+        self.running = 0
+        self.max_concurrency = 0
+        self.per_minute = RateCounter(60)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "executions": self.executions,
+            "failures": self.failures,
+            "cancellations": self.cancellations,
+            "executions_per_minute": self.per_minute.total(),
+            "running": self.running,
+            "max_concurrency": self.max_concurrency,
+            "queue_wait": self.queue_wait.snapshot(),
+            "run_time": self.run_time.snapshot(),
+        }
+
+
+class TaskMetrics:
+    """Task metrics keyed by TaskType name (task name for tasks without a type)"""
+
+    def __init__(self):
+        self._types: Dict[str, TaskTypeMetrics] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(task: NeuralTask) -> str:
+        task_type = getattr(task, "task_type", None)
+        return getattr(task_type, "name", None) or task.name
+
+    def _metrics(self, task: NeuralTask) -> TaskTypeMetrics:
+        key = self.key(task)
+        metrics = self._types.get(key)
+        if metrics is None:
+            metrics = self._types[key] = TaskTypeMetrics()
+        return metrics
+
+    def started(self, task: NeuralTask, queue_wait: float) -> None:
+        """Record a run starting queue_wait seconds after it was due"""
+        with self._lock:
+            metrics = self._metrics(task)
+            metrics.queue_wait.record(queue_wait)
+            metrics.running += 1
+            metrics.max_concurrency = max(metrics.max_concurrency, metrics.running)
+
+    def finished(self, task: NeuralTask, run_time: float, failed: bool = False, cancelled: bool = False) -> None:
+        """Record a run ending after run_time seconds"""
+        with self._lock:
+            metrics = self._metrics(task)
+            metrics.running = max(0, metrics.running - 1)
+            metrics.run_time.record(run_time)
+            metrics.executions += 1
+            metrics.per_minute.add()
+            if failed:
+                metrics.failures += 1
+            if cancelled:
+                metrics.cancellations += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Metrics per task type, busiest (most total run time) first"""
+        with self._lock:
+            items = sorted(self._types.items(), key=lambda item: -item[1].run_time.total_ms)
+            return {key: metrics.snapshot() for key, metrics in items}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._types.clear()
+
+
+def format_metrics_table(snapshot: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Rows of a plain-text table for a TaskMetrics.snapshot()"""
+    rows = [f"  {'Task type':<22} {'runs':>6} {'/min':>5} {'fail':>5} {'peak':>5} "
+            f"{'wait p50/p95 ms':>16} {'run p50/p95 ms':>16} {'run total s':>12}"]
+    for key, metrics in snapshot.items():
+        wait, run = metrics["queue_wait"], metrics["run_time"]
+        total_s = run["mean_ms"] * run["count"] / 1000
+        rows.append(
+            f"  {key:<22} {metrics['executions']:>6} {metrics['executions_per_minute']:>5} "
+            f"{metrics['failures']:>5} {metrics['max_concurrency']:>5} "
+            f"{wait['p50_ms']:>7g}/{wait['p95_ms']:<8g} {run['p50_ms']:>7g}/{run['p95_ms']:<8g} {total_s:>12.1f}"
+        )
+    return rows
+
+
+# Shared across BasalGanglia instances so a whole session's load is in one place
+task_metrics = TaskMetrics()
@@ -0,0 +1,431 @@
+# Mind/Subcortex/BasalGanglia/task_scheduler.py
+
+"""
+Task Scheduler:
+- One asyncio loop over a heap of (next due time, priority, sequence, task)
+- Sleeps until the earliest due task or until something is submitted, so an
+  idle system never wakes up and a new task starts on the next loop iteration
+- Periodic tasks declare their own interval (NeuralTask.interval) and are
+  re-queued after each run; one-shot tasks run once per submission
+- Each run is its own asyncio task, so a long think never holds up a refresh
+- submit() returns a TaskHandle: await it for the task's result instead of
+  polling has_completed()
+- Tasks declare resource tokens (llm, display, audio_out, audio_in, gpio) and
+  only start when theirs are free; waiting tasks age toward higher priority,
+  and holders inherit the priority of the tasks waiting on them
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from Mind.FrontalLobe.PrefrontalCortex.system_journeling_manager import SystemJournelingManager
+from Mind.Subcortex.inference_scheduler import InferencePriority, set_inference_priority
+from .task_base import NeuralTask
+from .task_metrics import TaskMetrics, task_metrics
+from .task_types import TaskResource
+
+# Initialize journaling manager
+journaling_manager = SystemJournelingManager()
+
+
+class TaskHandle:
+    """
+    Awaitable handle for one submission of a NeuralTask
+
+    Resolves with what the task's run returned, with the exception it raised,
+    or as cancelled. A periodic task's handle resolves when it leaves the
+    schedule (deactivated or cancelled). Other attributes fall through to the
+    task, so code that used the returned task keeps working.
+    """
+
+    def __init__(self, task: NeuralTask, future: asyncio.Future, scheduler: "TaskScheduler"):
+        self.task = task
+        self._future = future
+        self._scheduler = scheduler
+        # Errors are already journaled by the scheduler; don't warn again if nobody awaits
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+    def __await__(self):
+        # Shielded so a cancelled waiter doesn't cancel the task for everyone else
+        return asyncio.shield(self._future).__await__()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.task, name)
+
+    def __repr__(self) -> str:
+        state = "cancelled" if self.cancelled() else "done" if self.done() else "pending"
+        return f"<TaskHandle {self.task.name} {state}>"
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def cancelled(self) -> bool:
+        return self._future.cancelled()
+
+    def result(self) -> Any:
+        """The task's result; raises its exception, CancelledError, or InvalidStateError if still pending"""
+        return self._future.result()
+
+    def exception(self) -> Optional[BaseException]:
+        return self._future.exception()
+
+    def cancel(self) -> bool:
+        """Cancel the task: drop it from the queue and cancel its run if one is in progress"""
+        if self._future.done():
+            return False
+        self._scheduler.cancel(self.task)
+        return self._future.cancel()
+
+    def add_done_callback(self, callback: Callable[["TaskHandle"], Any]) -> None:
+        """Call callback(handle) once the submission completes (right away if it already has)"""
+        self._future.add_done_callback(lambda _: callback(self))
+
+
+class TaskScheduler:
+    """Event-driven scheduler for NeuralTasks"""
+
+    def __init__(self, on_task_done: Callable[[NeuralTask], None] = None, aging_interval: float = 5.0,
+                 metrics: TaskMetrics = None):
+        """
+        Args:
+            on_task_done: Called with each task after a run finishes
+            aging_interval: Seconds a task waits for resources per priority level it gains
+            metrics: Where run timings are recorded (defaults to the shared task_metrics)
+        """
+        self.on_task_done = on_task_done
+        self.metrics = metrics if metrics is not None else task_metrics
+        self.aging_interval = aging_interval
+        self._heap = []
+        self._seq = itertools.count()
+        self._queued: Dict[int, int] = {}  # id(task) -> sequence of its live heap entry
+        self._running: Dict[int, asyncio.Task] = {}
+        self._rerun = set()  # ids of tasks that came due again while still running
+        self._waiting: Dict[int, List[TaskHandle]] = {}    # handles for runs not started yet (periodic: lifetime)
+        self._in_flight: Dict[int, List[TaskHandle]] = {}  # handles for the run in progress
+        self._ready: Dict[int, Tuple[NeuralTask, float, int]] = {}  # due, waiting for resources: (task, due, seq)
+        self._ready_since: Dict[int, float] = {}
+        self._holders: Dict[TaskResource, NeuralTask] = {}
+        self._inherited: Dict[int, int] = {}  # id(holder) -> priority inherited from its waiters
+        self._contexts: Dict[int, contextvars.Context] = {}  # context of each run in progress
+        self._resource_blocked = set()  # ids of ready tasks already counted as waiting for resources
+        self._wakeup: Optional[asyncio.Event] = None
+        self._sleep_until: Optional[float] = None  # When the loop next wakes on its own (None: never)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._loop_task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.wakeups = 0
+        self.resource_waits = 0
+
+    @property
+    def running(self) -> bool:
+        return self._loop_task is not None and not self._loop_task.done()
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """Event loop the scheduler was started on (None until start())"""
+        return self._loop
+
+    def start(self) -> None:
+        """Start the scheduler loop on the running event loop"""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._wakeup = asyncio.Event()
+        self._loop_task = self._loop.create_task(self._run())
+        journaling_manager.recordInfo("[TaskScheduler] 🔄 Scheduler started")
+
+    def stop(self) -> None:
+        """Stop the loop and cancel runs in progress"""
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            self._loop_task = None
+        for run in list(self._running.values()):
+            run.cancel()
+        for handles in list(self._waiting.values()):
+            self._settle(handles, cancelled=True)
+        self._waiting.clear()
+        self._ready.clear()
+        self._ready_since.clear()
+        self._resource_blocked.clear()
+        self._holders.clear()
+        self._inherited.clear()
+        journaling_manager.recordInfo("[TaskScheduler] 🛑 Scheduler stopped")
+
+    def submit(self, task: NeuralTask, delay: float = 0.0) -> TaskHandle:
+        """
+        Queue a task to run after delay seconds
+
+        Submitting a task that is already queued moves it to the new due time.
+        Safe to call from other threads (await the handle on the scheduler's loop).
+
+        Returns:
+            TaskHandle for this submission
+        """
+        loop = self._loop or asyncio.get_running_loop()
+        handle = TaskHandle(task, loop.create_future(), self)
+        due = time.monotonic() + delay
+        if self._loop is not None and loop.is_running() and threading.get_ident() != self._loop_thread:
+            loop.call_soon_threadsafe(self._enqueue, task, due, handle)
+        else:
+            self._enqueue(task, due, handle)
+        return handle
+
+    def cancel(self, task: NeuralTask) -> bool:
+        """Drop a queued task and cancel its run if one is in progress"""
+        queued = self._queued.pop(id(task), None) is not None
+        ready = self._ready.pop(id(task), None) is not None
+        self._ready_since.pop(id(task), None)
+        self._resource_blocked.discard(id(task))
+        self._rerun.discard(id(task))
+        self._settle(self._waiting.pop(id(task), []), cancelled=True)
+        run = self._running.get(id(task))
+        if run is not None:
+            # Its in-flight handles are settled when the run unwinds
+            run.cancel()
+        else:
+            self._release(task)
+        return queued or ready or run is not None
+
+    def is_queued(self, task: NeuralTask) -> bool:
+        return id(task) in self._queued or id(task) in self._ready or id(task) in self._running
+
+    def next_due_in(self) -> Optional[float]:
+        """Seconds until the earliest queued task is due (None when idle)"""
+        self._drop_stale()
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - time.monotonic())
+
+    def effective_priority(self, task: NeuralTask, now: float = None) -> int:
+        """
+        Priority the scheduler currently gives a task (lower = more urgent)
+
+        A task waiting for resources gains one level per aging_interval so
+        background work is never starved, and a task holding resources takes
+        on the priority of the most urgent task waiting for them.
+        """
+        priority = task.priority
+        since = self._ready_since.get(id(task))
+        if since is not None and self.aging_interval > 0:
+            now = time.monotonic() if now is None else now
+            priority -= int((now - since) / self.aging_interval)
+        inherited = self._inherited.get(id(task))
+        return priority if inherited is None else min(priority, inherited)
+
+    def holders(self) -> Dict[str, str]:
+        """Resource name -> name of the task holding it"""
+        return {resource.value: task.name for resource, task in self._holders.items()}
+
+    def _enqueue(self, task: NeuralTask, due: float, handle: TaskHandle) -> None:
+        if handle.done():
+            return
+        self._waiting.setdefault(id(task), []).append(handle)
+        self._push(task, due)
+
+    def _push(self, task: NeuralTask, due: float) -> None:
+        seq = next(self._seq)
+        # Older entries for the same task become stale and are skipped when popped
+        self._queued[id(task)] = seq
+        heapq.heappush(self._heap, (due, task.priority, seq, task))
+        # Only interrupt the loop's sleep if this task is due before it would wake anyway
+        if self._wakeup is not None and (self._sleep_until is None or due < self._sleep_until):
+            self._wakeup.set()
+
+    def _drop_stale(self) -> None:
+        while self._heap and self._queued.get(id(self._heap[0][3])) != self._heap[0][2]:
+            heapq.heappop(self._heap)
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            delay = self.next_due_in()
+            if delay is None or delay > 0:
+                self._sleep_until = None if delay is None else time.monotonic() + delay
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                self._sleep_until = time.monotonic()
+                self.wakeups += 1
+                continue
+
+            # Everything that is due joins the ready set; _admit starts what it can
+            now = time.monotonic()
+            while self._heap and self._heap[0][0] <= now:
+                due, _, seq, task = heapq.heappop(self._heap)
+                if self._queued.get(id(task)) != seq:
+                    continue
+                del self._queued[id(task)]
+                if id(task) in self._running:
+                    # Still busy from the last run; start again once it finishes
+                    self._rerun.add(id(task))
+                elif not task.active:
+                    # Deactivated before it came due: it leaves the schedule
+                    self._leave(task)
+                elif id(task) not in self._ready:
+                    self._ready[id(task)] = (task, due, seq)
+                    self._ready_since[id(task)] = now
+            self._admit()
+
+    def _admit(self) -> None:
+        """
+        Start ready tasks whose resources are free, most urgent first
+
+        A task that has to wait reserves its resources, so less urgent tasks
+        behind it can't keep taking them, and lends its priority to the holders.
+        """
+        if not self._ready:
+            return
+        now = time.monotonic()
+        reserved = set()
+        order = sorted(self._ready.values(), key=lambda item: (self.effective_priority(item[0], now), item[2]))
+        for task, due, _ in order:
+            if not task.active:
+                del self._ready[id(task)]
+                self._ready_since.pop(id(task), None)
+                self._resource_blocked.discard(id(task))
+                self._leave(task)
+                continue
+            needs = task.required_resources()
+            held = {resource for resource in needs if self._holders.get(resource) is task}
+            blocked = {resource for resource in needs - held if resource in self._holders or resource in reserved}
+            if blocked:
+                priority = self.effective_priority(task, now)
+                for resource in blocked & self._holders.keys():
+                    self._inherit(self._holders[resource], priority)
+                reserved |= needs
+                if id(task) not in self._resource_blocked:
+                    self._resource_blocked.add(id(task))
+                    self.resource_waits += 1
+                    journaling_manager.recordDebug(
+                        lambda: f"[TaskScheduler] {task.name} waiting for "
+                                f"{', '.join(sorted(resource.value for resource in blocked))}"
+                    )
+                continue
+            del self._ready[id(task)]
+            self._ready_since.pop(id(task), None)
+            self._resource_blocked.discard(id(task))
+            for resource in needs:
+                self._holders[resource] = task
+            self._start(task, due, now)
+
+    def _inherit(self, holder: NeuralTask, priority: int) -> None:
+        if priority >= self.effective_priority(holder):
+            return
+        self._inherited[id(holder)] = priority
+        journaling_manager.recordDebug(lambda: f"[TaskScheduler] {holder.name} inherits priority {priority}")
+        context = self._contexts.get(id(holder))
+        if context is not None and TaskResource.LLM in holder.required_resources():
+            # Inference requests it makes from here on queue at the boosted priority
+            context.run(set_inference_priority, self._inference_priority(priority))
+
+    @staticmethod
+    def _inference_priority(priority: int) -> InferencePriority:
+        if priority <= 2:
+            return InferencePriority.INTERACTIVE
+        if priority <= 5:
+            return InferencePriority.NORMAL
+        return InferencePriority.BACKGROUND
+
+    def _start(self, task: NeuralTask, due: float, now: float) -> None:
+        if task.interval is None:
+            self._in_flight[id(task)] = self._waiting.pop(id(task), [])
+        else:
+            # Book the next run now, keeping to the cadence unless we fell behind
+            self._push(task, max(due + task.interval, now))
+        context = contextvars.copy_context()
+        if TaskResource.LLM in task.required_resources():
+            context.run(set_inference_priority, self._inference_priority(self.effective_priority(task, now)))
+        self._contexts[id(task)] = context
+        self.metrics.started(task, max(0.0, now - due))
+        self._running[id(task)] = self._loop.create_task(self._execute(task), context=context)
+
+    def _release(self, task: NeuralTask) -> None:
+        """Give back the resources a task holds and let waiting tasks in"""
+        self._inherited.pop(id(task), None)
+        released = [resource for resource, holder in self._holders.items() if holder is task]
+        for resource in released:
+            del self._holders[resource]
+        if released and self._ready and self._loop is not None:
+            self._loop.call_soon(self._admit)
+
+    def _leave(self, task: NeuralTask) -> None:
+        """A periodic or deactivated task drops out of the schedule"""
+        self._settle(self._waiting.pop(id(task), []), result=task.result)
+        self._release(task)
+
+    async def _execute(self, task: NeuralTask) -> None:
+        result = error = None
+        cancelled = False
+        started = time.monotonic()
+        try:
+            if asyncio.iscoroutinefunction(getattr(task, "execute", None)):
+                result = await task.execute()
+            else:
+                result = task.run()
+            if result is not None:
+                task.result = result
+            self.runs += 1
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        except Exception as e:
+            error = e
+            journaling_manager.recordError(f"[TaskScheduler] ❌ Error executing {task.name}: {e}")
+        finally:
+            self.metrics.finished(task, time.monotonic() - started, failed=error is not None, cancelled=cancelled)
+            self._running.pop(id(task), None)
+            self._contexts.pop(id(task), None)
+            self._finish(task, result, error, cancelled)
+
+    def _finish(self, task: NeuralTask, result: Any, error: Optional[BaseException], cancelled: bool) -> None:
+        if id(task) in self._rerun:
+            self._rerun.discard(id(task))
+            self._push(task, time.monotonic())
+        elif task.interval is None and id(task) not in self._queued:
+            task.stop()
+        elif task.interval is not None and (cancelled or not task.active):
+            self._queued.pop(id(task), None)
+            self._settle(self._waiting.pop(id(task), []), result=task.result, cancelled=cancelled)
+        # One-shot runs give their resources back; periodic tasks keep them until they leave
+        if task.interval is None or cancelled or not task.active:
+            self._release(task)
+        self._settle(self._in_flight.pop(id(task), []), result, error, cancelled)
+        if self.on_task_done is not None:
+            try:
+                self.on_task_done(task)
+            except Exception as e:
+                journaling_manager.recordError(f"[TaskScheduler] Error in task done callback: {e}")
+
+    @staticmethod
+    def _settle(handles: List[TaskHandle], result: Any = None, error: BaseException = None,
+                cancelled: bool = False) -> None:
+        for handle in handles:
+            future = handle._future
+            if future.done():
+                continue
+            if cancelled:
+                future.cancel()
+            elif error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued": len(self._queued),
+            "waiting_for_resources": len(self._ready),
+            "running": len(self._running),
+            "runs": self.runs,
+            "wakeups": self.wakeups,
+            "resource_waits": self.resource_waits,
+            "resources": self.holders(),
+            "next_due_in": self.next_due_in(),
+        }
@@ -29,6 +29,16 @@ class TaskCategory(Enum):
     COMMUNICATION = auto()   # Hardware communication tasks
     META = auto()            # Internal state, idle, logging
 
+class TaskResource(Enum):
+    """
+    Shared devices a task needs exclusive use of while it runs.
+    """
+    LLM = "llm"                # The AX630C inference engine
+    DISPLAY = "display"        # LED matrix / visual output
+    AUDIO_OUT = "audio_out"    # Speaker
+    AUDIO_IN = "audio_in"      # Microphone
+    GPIO = "gpio"              # Pins driven by motor/sensor tasks
+
 # Optional: tag mapping
 TASK_CATEGORY_MAP = {
     TaskType.THINKING: TaskCategory.COGNITIVE,
@@ -39,3 +49,11 @@ TASK_CATEGORY_MAP = {
     TaskType.MEMORY: TaskCategory.COGNITIVE,
     TaskType.COMMUNICATION: TaskCategory.COGNITIVE,
 }
+
+# Resources each task type needs unless the task declares its own
+TASK_RESOURCE_MAP = {
+    TaskType.THINKING: frozenset({TaskResource.LLM}),
+    TaskType.DISPLAY_VISUAL: frozenset({TaskResource.DISPLAY}),
+    TaskType.SPEECH: frozenset({TaskResource.AUDIO_OUT}),
+    TaskType.LISTEN: frozenset({TaskResource.AUDIO_IN}),
+}
@@ -31,6 +31,8 @@ class DisplayVisualTask(NeuralTask):
         self.visualization_type = visualization_type
         self.visualization_params = visualization_params or {}
         self.stream_mode = stream_mode
+        # Streaming visualizations redraw on the old 10Hz task cadence while active
+        self.interval = 0.1 if stream_mode else None
         self.active = True
         self.complete = False
         self.stream_buffer = ""
@@ -42,6 +44,18 @@ class DisplayVisualTask(NeuralTask):
         
         journaling_manager.recordInfo(f"[BasalGanglia] Created DisplayVisualTask: {visualization_type or display_type}")
         
+    def update_stream(self, content: str, is_complete: bool = False):
+        """
+        Replace the streamed content shown by a stream_mode visualization
+        
+        Args:
+            content: Everything streamed so far (not just the latest delta)
+            is_complete: The stream has ended; the task stops after drawing it
+        """
+        self.content = content or ""
+        if is_complete:
+            self.complete = True
+        
     def run(self):
         """Execute the display task"""
         self.status = "running"
@@ -15,9 +15,12 @@ journaling_manager = SystemJournelingManager()
 class HardwareInfoTask(NeuralTask):
     """Task to fetch and monitor hardware information"""
     
+    interval = 60.0  # Refresh once per minute
+    
     def __init__(self, priority=5):
         """Initialize hardware info task with default values."""
         super().__init__("HardwareInfoTask", priority)
+        self.task_type = TaskType.HARDWARE_INFO
         # Initialize with shared cache values if available
         from Mind.CorpusCallosum.synaptic_pathways import SynapticPathways
         self.hardware_info = SynapticPathways.current_hw_info.copy() if hasattr(SynapticPathways, 'current_hw_info') else {
@@ -26,56 +29,26 @@ class HardwareInfoTask(NeuralTask):
             "temperature": "N/A",
             "timestamp": 0
         }
-        self.last_refresh_time = 0  # Initialize to 0 to force immediate refresh
-        self.refresh_interval = 60.0  # Refresh once per minute
+        self.last_refresh_time = 0
         self.active = True
         
-        # Schedule immediate initial refresh
-        self._schedule_immediate_refresh()
-        
-        journaling_manager.recordInfo("[HardwareInfoTask] Initialized, scheduled immediate refresh")
+        # The scheduler runs the first refresh as soon as the task is registered
+        journaling_manager.recordInfo("[HardwareInfoTask] Initialized")
         
-    def _schedule_immediate_refresh(self):
-        """Schedule immediate refresh"""
-        asyncio.create_task(self._initial_refresh())
+    async def execute(self):
+        """Refresh hardware info; the scheduler calls this every interval seconds."""
+        journaling_manager.recordInfo("[HardwareInfoTask] 🔄 Performing background refresh")
         
-    async def _initial_refresh(self):
-        """Perform immediate hardware info refresh"""
         try:
-            # Small delay to ensure other systems are ready
-            await asyncio.sleep(0.5)
-            
-            # Refresh hardware info
-            journaling_manager.recordInfo("[HardwareInfoTask] 🐬 Performing initial refresh")
             await self._refresh_hardware_info()
             self.last_refresh_time = time.time()
+            journaling_manager.recordInfo(f"[HardwareInfoTask] ✅ Background refresh completed: {self.hardware_info}")
             
-            # Update SynapticPathways shared cache
+            # Make sure to update the shared cache 
             from Mind.CorpusCallosum.synaptic_pathways import SynapticPathways
             SynapticPathways.current_hw_info = self.hardware_info.copy()
-            
-            journaling_manager.recordInfo(f"[HardwareInfoTask] Initial refresh completed: {self.hardware_info}")
         except Exception as e:
-            journaling_manager.recordError(f"[HardwareInfoTask] Error in initial refresh: {e}")
-        
-    async def execute(self):
-        """Background task to update hardware info every minute."""
-        current_time = time.time()
-        
-        # Check if it's time for a refresh
-        if current_time - self.last_refresh_time >= self.refresh_interval:
-            journaling_manager.recordInfo("[HardwareInfoTask] 🔄 Performing background refresh")
-            
-            try:
-                await self._refresh_hardware_info()
-                self.last_refresh_time = current_time
-                journaling_manager.recordInfo(f"[HardwareInfoTask] ✅ Background refresh completed: {self.hardware_info}")
-                
-                # Make sure to update the shared cache 
-                from Mind.CorpusCallosum.synaptic_pathways import SynapticPathways
-                SynapticPathways.current_hw_info = self.hardware_info.copy()
-            except Exception as e:
-                journaling_manager.recordError(f"[HardwareInfoTask] ❌ Background refresh error: {e}")
+            journaling_manager.recordError(f"[HardwareInfoTask] ❌ Background refresh error: {e}")
         
         # Return current info without logging every time
         return self.hardware_info
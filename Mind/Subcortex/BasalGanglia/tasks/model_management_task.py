@@ -21,6 +21,8 @@ journaling_manager = SystemJournelingManager()
 class ModelManagementTask(NeuralTask):
     """Task to manage LLM models"""
     
+    interval = 120.0  # Check model status every 2 minutes
+    
     def __init__(self, priority: int = 4):
         """
         Initialize a model management task
@@ -5,7 +5,7 @@ import logging
 import asyncio
 import time
 from Mind.Subcortex.BasalGanglia.tasks.communication_task import CommunicationTask
-from Mind.Subcortex.BasalGanglia.commands.system_command import SystemCommand
+from Mind.Subcortex.api_commands import SystemCommand
 from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
 
 # Initialize journaling manager
@@ -14,16 +14,17 @@ journaling_manager = SystemJournelingManager()
 class SystemCommandTask(NeuralTask):
     """Task to handle system command operations"""
     
-    def __init__(self, priority=3, command_type=None):
+    def __init__(self, priority=3, command_type=None, data=None):
         """Initialize the system command task.
         
         Args:
             priority: Task priority (lower numbers = higher priority)
             command_type: Type of system command (can be set later)
+            data: Command data
         """
         super().__init__("SystemCommandTask", priority)
         self.command = command_type  # Store command_type as command
-        self.data = None
+        self.data = data
         self.result = None
         self.completed = False
         self.active = False  # Start as inactive
@@ -21,7 +21,8 @@ journaling_manager = SystemJournelingManager()
 class ThinkTask(NeuralTask):
     """Task to perform deep thought with LLM."""
     
-    def __init__(self, prompt: str, system_message: str = None, model_name: str = None, stream: bool = False):
+    def __init__(self, prompt: str, system_message: str = None, model_name: str = None, stream: bool = False,
+                 priority: int = 5):
         """Initialize the thinking task with a prompt.
         
         Args:
@@ -29,8 +30,9 @@ class ThinkTask(NeuralTask):
             system_message: The system message to send to the model
             model_name: The name of the model to use
             stream: Whether to stream the response
+            priority: Task priority (lower = higher priority)
         """
-        super().__init__("ThinkTask")
+        super().__init__("ThinkTask", priority)
         self.prompt = prompt
         # Use provided system_message or fall back to CONFIG.persona
         self.system_message = system_message or CONFIG.persona
@@ -119,8 +121,9 @@ class ThinkTask(NeuralTask):
                 journaling_manager.recordWarning("[ThinkTask] Stream requested but no model specified")
                 self.model_name = CONFIG.minds[self.mind_id]["llm"]["default_model"]
             
-            # Schedule the execute coroutine to run in the event loop
-            asyncio.create_task(self.execute())
+            # Schedule the execute coroutine and keep hold of it so it isn't dropped
+            self._execution = asyncio.get_running_loop().create_task(self.execute())
+            self._execution.add_done_callback(self._on_executed)
             
             journaling_manager.recordDebug(f"[ThinkTask] Task scheduled for execution with prompt: {self.prompt[:50]}...")
             
@@ -128,3 +131,15 @@ class ThinkTask(NeuralTask):
             self.status = "error"
             journaling_manager.recordError(f"[ThinkTask] Error in run: {e}")
             self.active = False
+    
+    def _on_executed(self, execution: asyncio.Task):
+        """Store the result of a run() execution and mark the task complete"""
+        if execution.cancelled():
+            self.status = "cancelled"
+        elif execution.exception() is not None:
+            self.status = "error"
+            self.result = {"status": "error", "message": str(execution.exception())}
+        else:
+            self.status = "completed"
+            self.result = execution.result()
+        self.stop()
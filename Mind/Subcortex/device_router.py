@@ -0,0 +1,356 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Device Router:
+- One transport per mind/device from minds_config.json
+- Stateless requests go to the healthy device with the fewest outstanding requests
+- Conversation sessions stay pinned to one device, and move when it drops
+- llm.XXXX work_ids always go to the device that set them up; the router hands
+  them out as llm.XXXX@<device> so two devices' work_ids never collide
+- A device whose connection fails is marked down and retried after a cool-off;
+  timeouts and rejected commands are returned to the caller without touching
+  the device's health
+"""
+
+import asyncio
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from Mind.FrontalLobe.PrefrontalCortex.system_journeling_manager import SystemJournelingManager
+from .transport_layer import TransportError
+
+# Initialize journaling manager
+journaling_manager = SystemJournelingManager()
+
+# Transports report connection-level failures with this error code
+TRANSPORT_ERROR_CODE = -1
+
+_current_session = contextvars.ContextVar("routing_session", default=None)
+
+
+def current_session() -> Optional[str]:
+    """Conversation session requests from the current context are pinned to"""
+    return _current_session.get()
+
+
+@contextmanager
+def routing_session(session_id: Optional[str]):
+    """
+    Pin requests made inside the block to one device
+
+    Usage:
+        with routing_session("chat-42"):
+            await NeurocorticalBridge.execute_operation("think", {"prompt": "Hi"})
+    """
+    token = _current_session.set(session_id)
+    try:
+        yield
+    finally:
+        _current_session.reset(token)
+
+
+class RoutedDevice:
+    """A device behind the router and its load/health bookkeeping"""
+
+    def __init__(self, name: str, transport: Any):
+        self.name = name
+        self.transport = transport
+        self.outstanding = 0
+        self.served = 0
+        self.failures = 0
+        self.healthy = True
+        self.down_since: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "healthy": self.healthy,
+            "outstanding": self.outstanding,
+            "served": self.served,
+            "failures": self.failures,
+            "last_error": self.last_error,
+        }
+
+
+class DeviceRouter:
+    """Routes commands across several devices"""
+
+    def __init__(self, retry_after: float = 10.0, on_device_lost: Callable[[str, List[str]], None] = None):
+        """
+        Args:
+            retry_after: Seconds before a device marked down is tried again
+            on_device_lost: Called with (device name, work_ids it owned) when a device is marked down
+        """
+        self.devices: Dict[str, RoutedDevice] = {}
+        self.retry_after = retry_after
+        self.on_device_lost = on_device_lost
+        self._owners: Dict[str, str] = {}  # llm.XXXX@device work_id -> device name
+        self._pins: Dict[str, str] = {}    # session id -> device name
+        self.failovers = 0
+
+    @classmethod
+    def from_minds_config(cls, mind_ids: List[str] = None, connection_type: str = None, **kwargs) -> "DeviceRouter":
+        """Build a router with one transport per mind in minds_config.json"""
+        from Mind.mind_config import load_minds_config
+        from .transport_layer import get_transport
+
+        minds = load_minds_config().get("minds", {})
+        router = cls(**kwargs)
+        for mind_id in mind_ids or list(minds):
+            connection = dict(minds.get(mind_id, {}).get("connection", {}))
+            if connection.get("ip") in (None, "auto") or connection.get("port") in (None, "auto"):
+                journaling_manager.recordWarning(f"[DeviceRouter] Skipping {mind_id}: no fixed ip/port")
+                continue
+            # Each transport must stay on its own device rather than discover another one
+            connection["discover"] = False
+            router.add_device(mind_id, get_transport(connection_type or connection.get("type", "tcp"), connection))
+        return router
+
+    def add_device(self, name: str, transport: Any) -> RoutedDevice:
+        device = RoutedDevice(name, transport)
+        self.devices[name] = device
+        return device
+
+    async def connect_all(self) -> Dict[str, bool]:
+        """Connect every device concurrently; devices that fail start out marked down"""
+        names = list(self.devices)
+
+        async def connect(device: RoutedDevice) -> bool:
+            try:
+                return bool(await device.transport.connect())
+            except Exception as e:
+                device.last_error = str(e)
+                return False
+
+        results = await asyncio.gather(*(connect(self.devices[name]) for name in names))
+        for name, ok in zip(names, results):
+            if not ok:
+                self.mark_down(self.devices[name], self.devices[name].last_error or "connect failed")
+        journaling_manager.recordInfo(
+            f"[DeviceRouter] 🔀 {sum(results)}/{len(names)} devices connected: "
+            + ", ".join(name for name, ok in zip(names, results) if ok)
+        )
+        return dict(zip(names, results))
+
+    def _available(self, device: RoutedDevice) -> bool:
+        if device.healthy:
+            return True
+        # Half-open: let one request through after the cool-off to see if it came back
+        return device.down_since is not None and time.monotonic() - device.down_since >= self.retry_after
+
+    def select(self, command: Dict[str, Any], session: str = None, exclude=()) -> Optional[RoutedDevice]:
+        """
+        Pick the device for a command
+
+        Owned work_ids go to their owner; a pinned session goes to its device
+        while that is available; everything else to the available device with
+        the fewest outstanding requests (ties broken by fewest served).
+        """
+        owner = self.split_work_id(command.get("work_id") if isinstance(command, dict) else None)[1]
+        if owner is not None:
+            device = self.devices.get(owner)
+            return device if device is not None and owner not in exclude and self._available(device) else None
+
+        if session is not None:
+            pinned = self.devices.get(self._pins.get(session))
+            if pinned is not None and pinned.name not in exclude and self._available(pinned):
+                return pinned
+
+        candidates = [d for d in self.devices.values() if d.name not in exclude and self._available(d)]
+        if not candidates:
+            return None
+        device = min(candidates, key=lambda d: (d.outstanding, d.served))
+        if session is not None:
+            if self._pins.get(session) not in (None, device.name):
+                journaling_manager.recordInfo(f"[DeviceRouter] Session {session} moved to {device.name}")
+            self._pins[session] = device.name
+        return device
+
+    def pin(self, session: str, name: str) -> bool:
+        """Keep session on the named device; False if the router has no such device"""
+        if name not in self.devices:
+            return False
+        self._pins[session] = name
+        return True
+
+    def pinned(self, session: Optional[str]) -> Optional[str]:
+        """Device the session is pinned to, if any"""
+        return self._pins.get(session) if session is not None else None
+
+    def reserve(self, command: Dict[str, Any], session: str = None, exclude=()) -> Optional[RoutedDevice]:
+        """select() and count the request as outstanding until release()"""
+        device = self.select(command, session, exclude)
+        if device is not None:
+            device.outstanding += 1
+        return device
+
+    def release(self, device: RoutedDevice) -> None:
+        device.outstanding = max(0, device.outstanding - 1)
+
+    @staticmethod
+    def split_work_id(work_id: Any):
+        """'llm.1001@penphin' -> ('llm.1001', 'penphin'); unrouted ids -> (work_id, None)"""
+        if isinstance(work_id, str) and "@" in work_id:
+            local, _, device = work_id.rpartition("@")
+            return local, device
+        return work_id, None
+
+    async def transmit(self, device: RoutedDevice, command: Dict[str, Any], stream_callback=None) -> Dict[str, Any]:
+        """
+        Send a command to one device, marking it down if its connection fails
+
+        Transports answer timeouts and rejected commands with the same error
+        code as dropped connections; only the connection going away (or
+        failing to open) counts against the device.
+        """
+        transport = device.transport
+        routed_id = command.get("work_id")
+        local_id = self.split_work_id(routed_id)[0]
+        if local_id != routed_id:
+            command = dict(command, work_id=local_id)
+        connection_failed = False
+        try:
+            if not transport.connected and not await transport.connect():
+                connection_failed = True
+                response = {"error": {"code": TRANSPORT_ERROR_CODE, "message": f"{device.name} is not reachable"}}
+            elif stream_callback is not None and hasattr(transport, "stream"):
+                response = await transport.stream(command, stream_callback)
+            else:
+                response = await transport.transmit(command)
+        except asyncio.TimeoutError as e:
+            # TimeoutError is an OSError, but a slow reply says nothing about the link
+            response = {"error": {"code": TRANSPORT_ERROR_CODE, "message": f"Timeout: {e}"}}
+        except (TransportError, ConnectionError, OSError) as e:
+            connection_failed = True
+            response = {"error": {"code": TRANSPORT_ERROR_CODE, "message": f"Transport error: {e}"}}
+
+        if connection_failed or (self.is_transport_failure(response) and not transport.connected):
+            self.mark_down(device, response["error"].get("message", "transport error"))
+            return response
+        if self.is_transport_failure(response):
+            journaling_manager.recordWarning(
+                f"[DeviceRouter] {device.name} failed a request: {response['error'].get('message')}"
+            )
+            return response
+
+        device.served += 1
+        if not device.healthy:
+            journaling_manager.recordInfo(f"[DeviceRouter] ✅ {device.name} is back")
+            device.healthy = True
+            device.down_since = None
+        return self._track_work_ids(device, command, routed_id, response)
+
+    async def send(self, command: Dict[str, Any], stream_callback=None, session: str = None,
+                   transmit: Callable[[RoutedDevice, Dict[str, Any], Any], Awaitable[Dict[str, Any]]] = None
+                   ) -> Dict[str, Any]:
+        """
+        Route a command, failing over to another device when the chosen one drops
+
+        Args:
+            command: Command dict
+            stream_callback: Called with each stream chunk
+            session: Conversation session to keep on one device
+            transmit: Coroutine function (device, command, callback) used instead
+                of transmit(), e.g. to wait for an inference slot on the device first
+        """
+        transmit = transmit or self.transmit
+        tried = set()
+        while True:
+            device = self.reserve(command, session, exclude=tried)
+            if device is None:
+                return {"error": {"code": TRANSPORT_ERROR_CODE, "message": "No healthy device available"}}
+            delivered = []
+
+            async def counting_callback(chunk):
+                delivered.append(True)
+                await stream_callback(chunk)
+
+            try:
+                response = await transmit(device, command, counting_callback if stream_callback else None)
+            finally:
+                self.release(device)
+
+            # Only a device that was just marked down is worth failing over from
+            if (not self.is_transport_failure(response) or device.healthy
+                    or not self.can_fail_over(command, bool(delivered))):
+                return response
+            tried.add(device.name)
+            self.failovers += 1
+            journaling_manager.recordWarning(f"[DeviceRouter] Failing over from {device.name}")
+
+    def can_fail_over(self, command: Dict[str, Any], delivered: bool) -> bool:
+        """
+        Whether a failed command may be retried on another device
+
+        Not once stream chunks were delivered (the caller would see them twice),
+        and not for work_ids that only exist on the device that failed.
+        """
+        work_id = command.get("work_id") if isinstance(command, dict) else None
+        return not delivered and self.split_work_id(work_id)[1] is None
+
+    @staticmethod
+    def is_transport_failure(response: Any) -> bool:
+        error = response.get("error") if isinstance(response, dict) else None
+        return isinstance(error, dict) and error.get("code") == TRANSPORT_ERROR_CODE
+
+    def _track_work_ids(self, device: RoutedDevice, command: Dict[str, Any], routed_id: Any,
+                        response: Dict[str, Any]) -> Dict[str, Any]:
+        """Hand out device work_ids as llm.XXXX@device and remember which device owns them"""
+        if not isinstance(response, dict):
+            return response
+        error = response.get("error")
+        ok = isinstance(error, dict) and error.get("code") == 0
+        action = command.get("action")
+        work_id = response.get("work_id")
+
+        if routed_id != command.get("work_id") and work_id == command.get("work_id"):
+            response = dict(response, work_id=routed_id)
+        elif action == "setup" and isinstance(work_id, str) and "." in work_id and ok:
+            routed = f"{work_id}@{device.name}"
+            self._owners[routed] = device.name
+            response = dict(response, work_id=routed)
+
+        if ok and action == "exit":
+            self._owners.pop(routed_id, None)
+        elif ok and routed_id == "sys" and action in ("reset", "reboot"):
+            for routed in [w for w, owner in self._owners.items() if owner == device.name]:
+                del self._owners[routed]
+        return response
+
+    def mark_down(self, device: RoutedDevice, reason: str) -> None:
+        """Take a device out of rotation and drop the work_ids it owned"""
+        device.failures += 1
+        device.last_error = reason
+        device.down_since = time.monotonic()
+        if device.healthy:
+            journaling_manager.recordWarning(f"[DeviceRouter] ⚠️ {device.name} marked down: {reason}")
+        device.healthy = False
+
+        lost = [work_id for work_id, owner in self._owners.items() if owner == device.name]
+        for work_id in lost:
+            del self._owners[work_id]
+        if lost and self.on_device_lost is not None:
+            try:
+                self.on_device_lost(device.name, lost)
+            except Exception as e:
+                journaling_manager.recordError(f"[DeviceRouter] Error in device lost callback: {e}")
+
+    def owner_of(self, work_id: str) -> Optional[str]:
+        return self.split_work_id(work_id)[1]
+
+    async def close(self) -> None:
+        for device in self.devices.values():
+            try:
+                await device.transport.disconnect()
+            except Exception as e:
+                journaling_manager.recordError(f"[DeviceRouter] Error disconnecting {device.name}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "devices": {name: device.stats() for name, device in self.devices.items()},
+            "sessions": dict(self._pins),
+            "work_ids": dict(self._owners),
+            "failovers": self.failovers,
+        }
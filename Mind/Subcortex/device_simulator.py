@@ -0,0 +1,371 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+AX630C Device Simulator:
+- Local stand-in for the M5Stack LLM module on a plain Linux box
+- Speaks the same JSON-lines protocol over TCP (sys / llm / audio units)
+- Streams inference deltas with configurable per-token latency and jitter
+- Can drop connections to exercise reconnect and error paths
+- Serves any number of concurrent sessions
+
+Run it and point a mind's connection (ip/port) at it:
+    python -m Mind.Subcortex.device_simulator --port 10001 --token-latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Dict, Any, List, Optional
+
+from Mind.FrontalLobe.PrefrontalCortex.system_journeling_manager import SystemJournelingManager
+
+# Initialize journaling manager
+journaling_manager = SystemJournelingManager()
+
+# Models reported by lsmode, in the same shape the real module uses
+DEFAULT_MODELS = [
+    {"mode": "qwen2.5-0.5b", "type": "llm", "capabilities": ["text_generation", "chat"]},
+    {"mode": "qwen2.5-0.5b-prefill", "type": "llm", "capabilities": ["text_generation", "chat"]},
+    {"mode": "deepseek-r1-1.5b", "type": "llm", "capabilities": ["text_generation", "chat"]},
+    {"mode": "melotts-en-us", "type": "tts", "capabilities": ["tts", "English"]},
+    {"mode": "sherpa-ncnn-streaming-zipformer-20M-2023-02-17", "type": "asr", "capabilities": ["Automatic_Speech_Recognition", "English"]},
+]
+
+# Filler used to pad generated replies up to the requested token count
+FILLER_WORDS = "the penphin swims through colors of light and thinks in gentle waves".split()
+
+
+class DeviceSimulator:
+    """Simulated AX630C LLM module serving the JSON-lines API over TCP"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 10001,
+                 token_latency: float = 0.05, jitter: float = 0.0,
+                 drop_rate: float = 0.0, reply_tokens: int = 24,
+                 setup_latency: float = 0.0, models: List[Dict[str, Any]] = None,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            host: Interface to listen on
+            port: TCP port (0 picks a free port)
+            token_latency: Seconds between streamed tokens
+            jitter: Random extra latency per token, up to this many seconds
+            drop_rate: Probability (0-1) that a request kills its connection unanswered
+            reply_tokens: Tokens generated per inference (capped by max_token_len)
+            setup_latency: Seconds an llm setup takes (model load time)
+            models: Models reported by lsmode
+            seed: Seed for jitter and drops, for repeatable runs
+        """
+        self.host = host
+        self.port = port
+        self.token_latency = token_latency
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self.reply_tokens = reply_tokens
+        self.setup_latency = setup_latency
+        self.models = models or DEFAULT_MODELS
+        self._random = random.Random(seed)
+        self._server = None
+        self._next_work_id = 1001
+        self._llm_units: Dict[str, Dict[str, Any]] = {}
+        self._generations: Dict[str, asyncio.Task] = {}
+        self._started_at = time.time()
+
+        # Counters for tests and benchmarks
+        self.stats = {
+            "connections_opened": 0,
+            "active_connections": 0,
+            "connections_dropped": 0,
+            "requests": {},
+        }
+
+    async def start(self) -> "DeviceSimulator":
+        """Start listening; the bound port is available as self.port"""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        journaling_manager.recordInfo(f"[DeviceSimulator] 🐧 Listening on {self.host}:{self.port}")
+        return self
+
+    async def stop(self) -> None:
+        """Stop listening and abort running generations"""
+        for task in list(self._generations.values()):
+            task.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        journaling_manager.recordInfo("[DeviceSimulator] Stopped")
+
+    async def __aenter__(self) -> "DeviceSimulator":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def serve_forever(self) -> None:
+        """Run until cancelled"""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    # ------------------------------------------------------------------
+    # Connection handling
+    # ------------------------------------------------------------------
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one client connection; requests on it are handled concurrently"""
+        self.stats["connections_opened"] += 1
+        self.stats["active_connections"] += 1
+        write_lock = asyncio.Lock()
+        pending = set()
+
+        async def send(response: Dict[str, Any]) -> None:
+            async with write_lock:
+                if writer.is_closing():
+                    return
+                writer.write((json.dumps(response) + "\n").encode())
+                await writer.drain()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError:
+                    await send(self._response({}, code=-2, message="json format error"))
+                    continue
+
+                action = request.get("action", "")
+                self.stats["requests"][action] = self.stats["requests"].get(action, 0) + 1
+
+                if self.drop_rate and self._random.random() < self.drop_rate:
+                    journaling_manager.recordDebug(f"[DeviceSimulator] Dropping connection on '{action}'")
+                    self.stats["connections_dropped"] += 1
+                    writer.transport.abort()
+                    break
+
+                task = asyncio.create_task(self._handle_request(request, send))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            for task in pending:
+                task.cancel()
+            self.stats["active_connections"] -= 1
+            if not writer.is_closing():
+                writer.close()
+
+    async def _handle_request(self, request: Dict[str, Any], send) -> None:
+        """Route a request to its unit handler"""
+        try:
+            work_id = str(request.get("work_id", ""))
+            if work_id == "sys":
+                await self._handle_sys(request, send)
+            elif work_id == "llm" or work_id.startswith("llm."):
+                await self._handle_llm(request, send)
+            elif work_id == "audio" or work_id.startswith("audio."):
+                await send(self._response(request, data="None"))
+            else:
+                await send(self._response(request, code=-6, message="Unit does not exist"))
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            journaling_manager.recordError(f"[DeviceSimulator] Error handling request: {e}")
+            await send(self._response(request, code=-9, message=f"Unit call failed: {e}"))
+
+    def _response(self, request: Dict[str, Any], data: Any = "None", code: int = 0,
+                  message: str = "", work_id: str = None, object_type: str = "None") -> Dict[str, Any]:
+        """Build a response in the device's envelope format"""
+        return {
+            "created": int(time.time()),
+            "data": data,
+            "error": {"code": code, "message": message},
+            "object": object_type,
+            "request_id": request.get("request_id", ""),
+            "work_id": work_id or request.get("work_id", ""),
+        }
+
+    # ------------------------------------------------------------------
+    # sys unit
+    # ------------------------------------------------------------------
+
+    async def _handle_sys(self, request: Dict[str, Any], send) -> None:
+        action = request.get("action")
+
+        if action == "ping":
+            await send(self._response(request))
+        elif action == "hwinfo":
+            await send(self._response(request, object_type="sys.hwinfo", data={
+                "cpu_loadavg": self._random.randint(5, 40),
+                "mem": self._random.randint(20, 60),
+                "temperature": 46350 + self._random.randint(-500, 500),
+                "eth_info": [{"name": "eth0", "ip": self.host, "speed": "1000M"}],
+                "uptime": int(time.time() - self._started_at),
+            }))
+        elif action == "lsmode":
+            await send(self._response(request, object_type="sys.lsmode", data=self.models))
+        elif action in ("reset", "reboot"):
+            # Both free every llm unit on the real module
+            for task in list(self._generations.values()):
+                task.cancel()
+            self._llm_units.clear()
+            await send(self._response(request))
+        elif action == "setup" and str(request.get("object", "")).startswith("audio"):
+            await send(self._response(request))
+        else:
+            await send(self._response(request, code=-3, message="sys action match error"))
+
+    # ------------------------------------------------------------------
+    # llm unit
+    # ------------------------------------------------------------------
+
+    async def _handle_llm(self, request: Dict[str, Any], send) -> None:
+        action = request.get("action")
+        work_id = request.get("work_id")
+
+        if action == "setup":
+            await self._llm_setup(request, send)
+        elif action == "inference":
+            if work_id != "llm" and work_id not in self._llm_units:
+                await send(self._response(request, code=-6, message="Unit does not exist"))
+                return
+            generation = asyncio.current_task()
+            self._generations[work_id] = generation
+            try:
+                await self._llm_inference(request, send)
+            finally:
+                if self._generations.get(work_id) is generation:
+                    del self._generations[work_id]
+        elif action in ("pause", "exit"):
+            generation = self._generations.pop(work_id, None)
+            if generation is not None:
+                generation.cancel()
+            if action == "exit":
+                if self._llm_units.pop(work_id, None) is None and work_id != "llm":
+                    await send(self._response(request, code=-19, message="Unit resource release failed"))
+                    return
+            await send(self._response(request))
+        elif action == "taskinfo":
+            if work_id == "llm":
+                await send(self._response(request, object_type="llm.tasklist", data=list(self._llm_units)))
+            elif work_id in self._llm_units:
+                await send(self._response(request, object_type="llm.taskinfo", data=self._llm_units[work_id]))
+            else:
+                await send(self._response(request, code=-6, message="Unit does not exist"))
+        else:
+            await send(self._response(request, code=-7, message="Unknown operation"))
+
+    async def _llm_setup(self, request: Dict[str, Any], send) -> None:
+        """Allocate an llm.XXXX work_id for a model"""
+        # Setup parameters arrive either at the top level or nested under data
+        params = dict(request.get("data")) if isinstance(request.get("data"), dict) else {}
+        params.update({k: v for k, v in request.items() if k not in ("request_id", "work_id", "action", "object", "data")})
+        model = params.get("model")
+        known = {m["mode"] for m in self.models if m.get("type") == "llm"}
+        if model not in known:
+            await send(self._response(request, code=-5, message="Model loading failed"))
+            return
+
+        if self.setup_latency:
+            await asyncio.sleep(self.setup_latency)
+
+        work_id = f"llm.{self._next_work_id}"
+        self._next_work_id += 1
+        self._llm_units[work_id] = {
+            "model": model,
+            "response_format": params.get("response_format", "llm.utf-8"),
+            "max_token_len": int(params.get("max_token_len", 127)),
+            "prompt": params.get("prompt", ""),
+        }
+        await send(self._response(request, work_id=work_id))
+
+    def _generate_tokens(self, prompt: str, max_tokens: int) -> List[str]:
+        """Produce a deterministic reply for a prompt, one list entry per token"""
+        words = ["Simulated", "reply", "to:"] + prompt.split()
+        count = min(self.reply_tokens, max_tokens)
+        while len(words) < count:
+            words.append(FILLER_WORDS[len(words) % len(FILLER_WORDS)])
+        words = words[:count]
+        return [word if i == 0 else " " + word for i, word in enumerate(words)]
+
+    async def _token_delay(self) -> None:
+        delay = self.token_latency
+        if self.jitter:
+            delay += self._random.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _llm_inference(self, request: Dict[str, Any], send) -> None:
+        """Generate a reply, streamed as deltas or sent whole"""
+        data = request.get("data")
+        stream = str(request.get("object", "")).endswith(".stream") or isinstance(data, dict)
+        prompt = data.get("delta", "") if isinstance(data, dict) else str(data or "")
+        unit = self._llm_units.get(request.get("work_id"), {})
+        tokens = self._generate_tokens(prompt, unit.get("max_token_len", 127))
+
+        if not stream:
+            for _ in tokens:
+                await self._token_delay()
+            await send(self._response(request, object_type="llm.utf-8", data="".join(tokens)))
+            return
+
+        index = 0
+        try:
+            for index, token in enumerate(tokens):
+                await self._token_delay()
+                await send(self._response(request, object_type="llm.utf-8.stream", data={
+                    "delta": token,
+                    "index": index,
+                    "finish": index == len(tokens) - 1,
+                }))
+        except asyncio.CancelledError:
+            # Paused or exited mid-generation - close the stream cleanly
+            await send(self._response(request, object_type="llm.utf-8.stream", data={
+                "delta": "",
+                "index": index + 1,
+                "finish": True,
+            }))
+            raise
+
+
+async def main(argv: List[str] = None) -> None:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Local AX630C LLM module simulator")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=10001, help="TCP port (default 10001)")
+    parser.add_argument("--token-latency", type=float, default=0.05, help="Seconds between streamed tokens")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Max random extra seconds per token")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Probability a request drops its connection")
+    parser.add_argument("--reply-tokens", type=int, default=24, help="Tokens generated per inference")
+    parser.add_argument("--setup-latency", type=float, default=0.0, help="Seconds an llm setup takes")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for repeatable runs")
+    args = parser.parse_args(argv)
+
+    simulator = DeviceSimulator(
+        host=args.host,
+        port=args.port,
+        token_latency=args.token_latency,
+        jitter=args.jitter,
+        drop_rate=args.drop_rate,
+        reply_tokens=args.reply_tokens,
+        setup_latency=args.setup_latency,
+        seed=args.seed,
+    )
+    await simulator.start()
+    print(f"🐧 AX630C simulator listening on {simulator.host}:{simulator.port} (Ctrl+C to stop)")
+    await simulator.serve_forever()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Endpoint Discovery:
+- Races ping probes against every candidate device endpoint at once
+- Optional bounded sweep of the local /24 subnet
+- Remembers the last working endpoint (with a TTL) so the next startup tries it first
+"""
+
+import asyncio
+import ipaddress
+import json
+import socket
+import time
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from config import CONFIG
+from Mind.FrontalLobe.PrefrontalCortex.system_journeling_manager import SystemJournelingManager
+
+# Initialize journaling manager
+journaling_manager = SystemJournelingManager()
+
+Endpoint = Tuple[str, int]
+
+PING_COMMAND = {"request_id": "discovery", "work_id": "sys", "action": "ping"}
+
+
+async def ping_endpoint(ip: str, port: int, timeout: float = 1.5,
+                        command: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+    """
+    Send a sys ping to ip:port on a short-lived connection of its own
+
+    Never touches the shared device sessions, so probing cannot disturb
+    requests in flight on them.
+
+    Returns:
+        Dict: The response, or None if nothing parseable arrived within timeout
+    """
+    writer = None
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), timeout)
+        writer.write((json.dumps(command or PING_COMMAND) + "\n").encode())
+        await writer.drain()
+        line = await asyncio.wait_for(reader.readline(), timeout)
+        response = json.loads(line) if line.strip() else None
+        return response if isinstance(response, dict) else None
+    except (asyncio.TimeoutError, OSError, ValueError):
+        return None
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+async def probe_endpoint(ip: str, port: int, timeout: float = 1.5) -> bool:
+    """Return True if ip:port answers a sys ping with error code 0 within timeout"""
+    response = await ping_endpoint(ip, port, timeout)
+    error = response.get("error", {}) if response is not None else {}
+    return isinstance(error, dict) and error.get("code") == 0
+
+
+async def race_endpoints(candidates: Iterable[Endpoint], timeout: float = 1.5,
+                         max_concurrency: int = 64) -> Optional[Endpoint]:
+    """
+    Probe all candidates concurrently and return the first that answers
+
+    Candidates are started in order, so with a concurrency limit the earlier
+    (more likely) endpoints get probed first. Remaining probes are cancelled
+    as soon as one succeeds.
+    """
+    unique = list(dict.fromkeys((ip, int(port)) for ip, port in candidates))
+    if not unique:
+        return None
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def probe(endpoint: Endpoint) -> Optional[Endpoint]:
+        async with semaphore:
+            if await probe_endpoint(endpoint[0], endpoint[1], timeout):
+                return endpoint
+        return None
+
+    start = time.monotonic()
+    tasks = [asyncio.create_task(probe(endpoint)) for endpoint in unique]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            endpoint = await finished
+            if endpoint is not None:
+                journaling_manager.recordInfo(
+                    f"[EndpointDiscovery] 🔍 {endpoint[0]}:{endpoint[1]} answered first "
+                    f"({time.monotonic() - start:.2f}s, {len(unique)} candidates)"
+                )
+                return endpoint
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    journaling_manager.recordInfo(f"[EndpointDiscovery] No endpoint answered out of {len(unique)} candidates")
+    return None
+
+
+def local_ipv4() -> Optional[str]:
+    """Best guess at this machine's LAN address (no packets are sent)"""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("10.255.255.255", 1))
+            ip = s.getsockname()[0]
+        return None if ip.startswith("127.") else ip
+    except OSError:
+        return None
+
+
+def subnet_candidates(local_ip: Optional[str], port: int, limit: int = 254) -> List[Endpoint]:
+    """Hosts of local_ip's /24, nearest addresses first, excluding local_ip itself"""
+    if not local_ip:
+        return []
+    try:
+        network = ipaddress.ip_network(f"{local_ip}/24", strict=False)
+    except ValueError:
+        return []
+    own = ipaddress.ip_address(local_ip)
+    hosts = [host for host in network.hosts() if host != own]
+    hosts.sort(key=lambda host: abs(int(host) - int(own)))
+    return [(str(host), port) for host in hosts[:limit]]
+
+
+class EndpointCache:
+    """Last working device endpoint, persisted as JSON with a time-to-live"""
+
+    def __init__(self, path: str = None, ttl: float = None):
+        settings = getattr(CONFIG, "discovery", {})
+        self.path = Path(path or settings.get("cache_file", "cache/last_endpoint.json"))
+        self.ttl = ttl if ttl is not None else settings.get("cache_ttl", 24 * 60 * 60)
+
+    def load(self) -> Optional[Endpoint]:
+        """The cached endpoint, or None if missing, unreadable or expired"""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            if time.time() - data.get("saved_at", 0) > self.ttl:
+                return None
+            return data["ip"], int(data["port"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, ip: str, port: int) -> None:
+        """Remember ip:port as the endpoint to try first next time"""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump({"ip": ip, "port": int(port), "saved_at": time.time()}, f)
+        except OSError as e:
+            journaling_manager.recordError(f"[EndpointDiscovery] Could not save endpoint cache: {e}")
+
+    def clear(self) -> None:
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+
+async def discover_endpoint(candidates: Iterable[Endpoint], port: int,
+                            cache: EndpointCache = None,
+                            settings: Dict[str, Any] = None,
+                            use_cache: bool = True) -> Optional[Endpoint]:
+    """
+    Find a live device endpoint
+
+    The cached endpoint (if still fresh, and use_cache is set) is raced together
+    with the candidates; if none of them answer and the subnet sweep is
+    enabled, the local /24 is raced next. The winner is written back to the cache.
+    """
+    settings = {**getattr(CONFIG, "discovery", {}), **(settings or {})}
+    timeout = settings.get("probe_timeout", 1.5)
+    concurrency = settings.get("max_concurrency", 64)
+    cache = cache or EndpointCache()
+
+    known = list(candidates)
+    cached = cache.load() if use_cache else None
+    if cached:
+        known.insert(0, cached)
+
+    winner = await race_endpoints(known, timeout, concurrency)
+    if winner is None and settings.get("subnet_sweep"):
+        journaling_manager.recordInfo("[EndpointDiscovery] Sweeping local subnet...")
+        winner = await race_endpoints(subnet_candidates(local_ipv4(), port), timeout, concurrency)
+
+    if winner is not None:
+        cache.save(*winner)
+    return winner
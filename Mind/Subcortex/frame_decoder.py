@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Frame Decoder:
+- Incremental decoder for the device's newline-delimited JSON responses
+- Keeps received bytes in one growable buffer tracked by read/write offsets
+- Consumed frames only advance the read offset; the buffer is compacted
+  occasionally instead of re-slicing the remainder after every line
+- Shared by the Serial, WiFi and ADB transports and SynapticPathways
+"""
+
+import json
+from typing import Any, Callable, List, Optional
+
+from Mind.FrontalLobe.PrefrontalCortex.system_journeling_manager import SystemJournelingManager
+
+# Initialize journaling manager
+journaling_manager = SystemJournelingManager()
+
+
+class FrameTooLargeError(ValueError):
+    """Raised when a single frame grows past the decoder's max_frame_size"""
+    pass
+
+
+class NDJSONFrameDecoder:
+    """
+    Incremental newline-delimited JSON decoder
+
+    Bytes go in through feed() - or through writable()/commit() for readers that
+    can fill a buffer in place (socket.recv_into, serial readinto) - and complete
+    JSON values come out. Partial lines stay buffered until their newline arrives,
+    so multi-byte UTF-8 characters split across reads decode correctly.
+    """
+
+    def __init__(self, initial_size: int = 64 * 1024, max_frame_size: int = 4 * 1024 * 1024,
+                 on_invalid: Optional[Callable[[bytes], None]] = None):
+        """
+        Args:
+            initial_size: Starting buffer capacity in bytes
+            max_frame_size: Largest single line accepted before the buffer is discarded
+            on_invalid: Called with the raw bytes of any line that is not valid JSON
+                        (shell echo on the serial console, for example)
+        """
+        self._buffer = bytearray(initial_size)
+        self._view = memoryview(self._buffer)
+        self._read = 0       # Start of unconsumed data
+        self._write = 0      # End of received data
+        self._scan = 0       # Where the next newline search starts
+        self.max_frame_size = max_frame_size
+        self.on_invalid = on_invalid
+        self.frames_decoded = 0
+        self.invalid_frames = 0
+        self.compactions = 0
+
+    @property
+    def pending(self) -> int:
+        """Bytes received but not yet part of a complete frame"""
+        return self._write - self._read
+
+    def reset(self) -> None:
+        """Discard any buffered partial frame"""
+        self._read = self._write = self._scan = 0
+
+    def writable(self, min_size: int = 4096) -> memoryview:
+        """
+        Free space at the write offset, at least min_size bytes
+
+        Fill it in place and call commit() with the number of bytes written;
+        the view must not be kept past that call.
+        """
+        self._reserve(min_size)
+        return self._view[self._write:]
+
+    def commit(self, count: int) -> List[Any]:
+        """Account for count bytes written into writable() and decode what completed"""
+        self._write += count
+        return self._drain()
+
+    def feed(self, data: bytes) -> List[Any]:
+        """Append received bytes and return every JSON frame they completed"""
+        size = len(data)
+        if not size:
+            return []
+        self._reserve(size)
+        self._view[self._write:self._write + size] = data
+        self._write += size
+        return self._drain()
+
+    def _reserve(self, size: int) -> None:
+        """Make room for size more bytes, compacting before growing"""
+        if len(self._buffer) - self._write >= size:
+            return
+
+        # Compact: move the unconsumed tail to the front
+        pending = self._write - self._read
+        if self._read:
+            self._view[:pending] = self._view[self._read:self._write]
+            self._scan -= self._read
+            self._read = 0
+            self._write = pending
+            self.compactions += 1
+        if len(self._buffer) - self._write >= size:
+            return
+
+        # Still no room - grow geometrically
+        capacity = len(self._buffer)
+        while capacity - self._write < size:
+            capacity *= 2
+        self._view.release()
+        self._buffer.extend(bytes(capacity - len(self._buffer)))
+        self._view = memoryview(self._buffer)
+
+    def _drain(self) -> List[Any]:
+        """Decode every complete line between the read and write offsets"""
+        frames = []
+        buffer = self._buffer
+        while True:
+            newline = buffer.find(b"\n", self._scan, self._write)
+            if newline < 0:
+                self._scan = self._write
+                if self._write - self._read > self.max_frame_size:
+                    dropped = self._write - self._read
+                    self.reset()
+                    raise FrameTooLargeError(f"Frame exceeded {self.max_frame_size} bytes ({dropped} buffered)")
+                break
+
+            start = self._read
+            self._read = self._scan = newline + 1
+            # json.loads needs bytes, so each frame is copied exactly once here
+            raw = self._view[start:newline].tobytes()
+            if not raw.strip():
+                continue
+            try:
+                frames.append(json.loads(raw))
+                self.frames_decoded += 1
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                self.invalid_frames += 1
+                if self.on_invalid:
+                    self.on_invalid(raw)
+                else:
+                    journaling_manager.recordDebug(f"[NDJSONFrameDecoder] Skipping non-JSON line: {raw[:200]!r}")
+
+        # Nothing left over - rewind for free instead of compacting later
+        if self._read == self._write:
+            self._read = self._write = self._scan = 0
+        return frames
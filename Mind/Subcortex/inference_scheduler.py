@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Inference Scheduler:
+- Orders llm inference requests by priority (interactive > normal > background)
+- Per-device concurrency limits (the AX630C runs one inference at a time)
+- Bounded queue per priority - a full queue rejects instead of piling up
+- Records how long each request waited for its slot
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import time
+from collections import Counter, deque
+from contextlib import asynccontextmanager, contextmanager
+from enum import IntEnum
+from typing import Any, Dict, Hashable, List, Optional
+
+from Mind.FrontalLobe.PrefrontalCortex.system_journeling_manager import SystemJournelingManager
+
+# Initialize journaling manager
+journaling_manager = SystemJournelingManager()
+
+
+class InferencePriority(IntEnum):
+    """Lower value is served first"""
+    INTERACTIVE = 0  # A person is waiting on the reply (chat, voice)
+    NORMAL = 1
+    BACKGROUND = 2   # Ambient generation (visualizer prompts)
+
+    @classmethod
+    def parse(cls, value: Any) -> "InferencePriority":
+        """Accept a member, its name ("background") or its value"""
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            try:
+                return cls[value.strip().upper()]
+            except KeyError:
+                raise ValueError(f"Unknown inference priority: {value}")
+        return cls(value)
+
+
+class InferenceQueueFull(Exception):
+    """Raised when a priority's queue for a device is already at its limit"""
+
+
+_current_priority = contextvars.ContextVar("inference_priority", default=InferencePriority.NORMAL)
+
+
+def current_priority() -> InferencePriority:
+    """Priority for inference requests made from the current context"""
+    return _current_priority.get()
+
+
+def set_inference_priority(priority: Any) -> None:
+    """Set the priority for the rest of the current context, e.g. a task's own context"""
+    _current_priority.set(InferencePriority.parse(priority))
+
+
+@contextmanager
+def inference_priority(priority: Any):
+    """
+    Run inference requests made inside the block at the given priority
+    (None keeps the surrounding priority)
+
+    Usage:
+        with inference_priority("interactive"):
+            await NeurocorticalBridge.execute(think_command)
+    """
+    if priority is None:
+        yield
+        return
+    token = _current_priority.set(InferencePriority.parse(priority))
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+class _DeviceQueue:
+    """Slots and waiters for one device"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self.waiters: List[Any] = []  # heap of (priority, sequence, future)
+        self.queued = Counter()
+
+
+class InferenceScheduler:
+    """Priority queue of inference slots, one queue per device"""
+
+    DEFAULT_QUEUE_LIMITS = {
+        InferencePriority.INTERACTIVE: 8,
+        InferencePriority.NORMAL: 16,
+        InferencePriority.BACKGROUND: 2
+    }
+
+    def __init__(self, max_concurrency: int = 1, queue_limits: Dict[InferencePriority, int] = None,
+                 slow_wait: float = 2.0, history: int = 256):
+        """
+        Args:
+            max_concurrency: Inferences a device runs at once unless set_concurrency() says otherwise
+            queue_limits: Waiting requests allowed per priority and device
+            slow_wait: Queue waits longer than this many seconds are logged as warnings
+            history: Recent waits kept per priority for percentiles
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.queue_limits = {**self.DEFAULT_QUEUE_LIMITS, **(queue_limits or {})}
+        self.slow_wait = slow_wait
+        self._devices: Dict[Hashable, _DeviceQueue] = {}
+        self._sequence = itertools.count()
+        self._waits = {priority: deque(maxlen=history) for priority in InferencePriority}
+        self._served = Counter()
+        self._rejected = Counter()
+        self._max_wait = {priority: 0.0 for priority in InferencePriority}
+
+    def _device(self, device: Hashable) -> _DeviceQueue:
+        queue = self._devices.get(device)
+        if queue is None:
+            queue = self._devices[device] = _DeviceQueue(self.max_concurrency)
+        return queue
+
+    def set_concurrency(self, device: Hashable, limit: int) -> None:
+        """Change how many inferences device may run at once"""
+        queue = self._device(device)
+        queue.limit = max(1, limit)
+        self._grant(queue)
+
+    def _grant(self, queue: _DeviceQueue) -> None:
+        """Hand free slots to the highest priority (then oldest) waiters"""
+        while queue.active < queue.limit and queue.waiters:
+            priority, _, future = heapq.heappop(queue.waiters)
+            if future.done():
+                # Waiter was cancelled; its queued count was already dropped
+                continue
+            queue.queued[priority] -= 1
+            queue.active += 1
+            future.set_result(None)
+
+    async def acquire(self, device: Hashable, priority: Any = None) -> float:
+        """
+        Wait for an inference slot on device
+
+        Returns:
+            float: Seconds spent queued
+
+        Raises:
+            InferenceQueueFull: If priority's queue for device is full
+        """
+        priority = current_priority() if priority is None else InferencePriority.parse(priority)
+        queue = self._device(device)
+        start = time.monotonic()
+
+        if queue.active < queue.limit and not any(queue.queued.values()):
+            queue.active += 1
+        else:
+            limit = self.queue_limits.get(priority)
+            if limit is not None and queue.queued[priority] >= limit:
+                self._rejected[priority] += 1
+                raise InferenceQueueFull(
+                    f"{priority.name.lower()} inference queue for {device} is full ({limit} waiting)"
+                )
+
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(queue.waiters, (priority, next(self._sequence), future))
+            queue.queued[priority] += 1
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    queue.queued[priority] -= 1
+                else:
+                    # The slot was granted just as we were cancelled - pass it on
+                    self.release(device)
+                raise
+
+        wait = time.monotonic() - start
+        self._served[priority] += 1
+        self._waits[priority].append(wait)
+        self._max_wait[priority] = max(self._max_wait[priority], wait)
+        if wait > self.slow_wait:
+            journaling_manager.recordWarning(
+                f"[InferenceScheduler] ⏳ {priority.name.lower()} inference waited {wait:.2f}s for {device}"
+            )
+        return wait
+
+    def release(self, device: Hashable) -> None:
+        """Return a slot taken by acquire()"""
+        queue = self._device(device)
+        queue.active = max(0, queue.active - 1)
+        self._grant(queue)
+
+    @asynccontextmanager
+    async def slot(self, device: Hashable, priority: Any = None):
+        """Hold an inference slot for the duration of the block; yields the queue wait"""
+        wait = await self.acquire(device, priority)
+        try:
+            yield wait
+        finally:
+            self.release(device)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth per device plus served/rejected counts and waits per priority"""
+        priorities = {}
+        for priority in InferencePriority:
+            waits = sorted(self._waits[priority])
+            priorities[priority.name.lower()] = {
+                "served": self._served[priority],
+                "rejected": self._rejected[priority],
+                "mean_wait": round(sum(waits) / len(waits), 4) if waits else 0.0,
+                "p95_wait": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))], 4) if waits else 0.0,
+                "max_wait": round(self._max_wait[priority], 4)
+            }
+
+        devices = {}
+        for device, queue in self._devices.items():
+            devices[str(device)] = {
+                "active": queue.active,
+                "limit": queue.limit,
+                "queued": {priority.name.lower(): queue.queued[priority] for priority in InferencePriority}
+            }
+        return {"priorities": priorities, "devices": devices}
+
+    def queued(self, device: Optional[Hashable] = None) -> int:
+        """Requests waiting for a slot on device (or on any device)"""
+        if device is None:
+            queues = list(self._devices.values())
+        else:
+            queues = [self._devices[device]] if device in self._devices else []
+        return sum(sum(queue.queued.values()) for queue in queues)
@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+LLM Session Pool:
+- Keeps several llm.XXXX work_ids set up on the device at once
+- Keyed by (model, persona, temperature) so switching minds or personas
+  reuses a warm session instead of paying for another llm setup; with a
+  device router the device is part of the key too
+- Least recently used session is exited when the pool is full; sessions
+  with an inference in flight (leased) are passed over, or exited only once
+  their last lease is released
+- Listeners hear about every evicted work_id so holders can drop it
+- Concurrent requests for the same key share one setup
+"""
+
+import asyncio
+import inspect
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from Mind.FrontalLobe.PrefrontalCortex.system_journeling_manager import SystemJournelingManager
+
+# Initialize journaling manager
+journaling_manager = SystemJournelingManager()
+
+SessionKey = Tuple[str, str, Optional[float], Optional[str]]
+
+
+class LLMSessionPool:
+    """LRU pool of llm work_ids"""
+
+    def __init__(self, max_sessions: int = 3):
+        self.max_sessions = max(1, max_sessions)
+        self._sessions: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+        self._leases: Dict[str, int] = {}  # work_id -> inferences in flight
+        self._deferred: Dict[str, Optional[Callable[[str], Awaitable[Any]]]] = {}  # evicted while leased
+        self._teardowns = set()
+        self._listeners: List[Any] = []
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(model: str, persona: str = None, temperature: float = None, device: str = None) -> SessionKey:
+        return (model, persona or "", None if temperature is None else float(temperature), device)
+
+    async def acquire(self, key: Hashable, setup: Callable[[Hashable], Awaitable[Optional[str]]],
+                      teardown: Callable[[str], Awaitable[Any]] = None) -> Optional[str]:
+        """
+        Return a warm work_id for key, setting one up if needed
+
+        Args:
+            key: Session key (see make_key)
+            setup: Coroutine function key -> work_id (None on failure)
+            teardown: Coroutine function called with each work_id evicted to make room
+
+        Returns:
+            The work_id, or None if setup failed
+        """
+        work_id = self._sessions.get(key)
+        if work_id is not None:
+            self._sessions.move_to_end(key)
+            self.hits += 1
+            return work_id
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            work_id = await setup(key)
+            future.set_result(work_id)
+        except BaseException as e:
+            future.set_exception(e)
+            # Waiters see the failure; nobody else needs to retrieve it
+            future.exception()
+            raise
+        finally:
+            del self._pending[key]
+
+        if work_id:
+            await self.add(key, work_id, teardown)
+        return work_id
+
+    async def add(self, key: Hashable, work_id: str, teardown: Callable[[str], Awaitable[Any]] = None) -> None:
+        """
+        Register a work_id that was set up elsewhere, evicting LRU sessions beyond max_sessions
+        
+        Idle sessions are evicted first. When every older session is leased,
+        the least recently used one leaves the pool now and is exited once its
+        last lease is released.
+        """
+        replaced = self._sessions.pop(key, None)
+        self._sessions[key] = work_id
+        evicted = [replaced] if replaced and replaced != work_id else []
+        while len(self._sessions) > self.max_sessions:
+            older = [k for k in self._sessions if k != key]
+            victim = next((k for k in older if not self.is_leased(self._sessions[k])), older[0])
+            evicted.append(self._sessions.pop(victim))
+
+        for old_work_id in evicted:
+            self.evictions += 1
+            self._notify_evicted(old_work_id)
+            if self.is_leased(old_work_id):
+                journaling_manager.recordInfo(f"[LLMSessionPool] ♻️ Evicting {old_work_id} once its inference finishes")
+                self._deferred[old_work_id] = teardown
+                continue
+            journaling_manager.recordInfo(f"[LLMSessionPool] ♻️ Evicting {old_work_id}")
+            await self._teardown(old_work_id, teardown)
+    
+    async def _teardown(self, work_id: str, teardown: Optional[Callable[[str], Awaitable[Any]]]) -> None:
+        if teardown is None:
+            return
+        try:
+            await teardown(work_id)
+        except Exception as e:
+            journaling_manager.recordError(f"[LLMSessionPool] Error exiting {work_id}: {e}")
+    
+    def is_leased(self, work_id: str) -> bool:
+        return self._leases.get(work_id, 0) > 0
+    
+    def retain(self, work_id: str) -> None:
+        """Mark work_id busy (an inference is using it) so eviction passes it over"""
+        self._leases[work_id] = self._leases.get(work_id, 0) + 1
+    
+    def release(self, work_id: str) -> None:
+        """End one retain(); a session evicted meanwhile is exited after the last one"""
+        count = self._leases.get(work_id, 0) - 1
+        if count > 0:
+            self._leases[work_id] = count
+            return
+        self._leases.pop(work_id, None)
+        if work_id in self._deferred:
+            teardown = self._deferred.pop(work_id)
+            journaling_manager.recordInfo(f"[LLMSessionPool] ♻️ Exiting deferred {work_id}")
+            task = asyncio.ensure_future(self._teardown(work_id, teardown))
+            self._teardowns.add(task)
+            task.add_done_callback(self._teardowns.discard)
+    
+    @contextmanager
+    def lease(self, work_id: str):
+        """retain() work_id for the body of a with block"""
+        self.retain(work_id)
+        try:
+            yield work_id
+        finally:
+            self.release(work_id)
+    
+    def add_eviction_listener(self, callback: Callable[[str], Any]) -> None:
+        """
+        Call callback(work_id) for every session evicted from the pool
+        
+        Bound methods are held weakly, so a listener doesn't keep its object alive.
+        """
+        self._listeners.append(weakref.WeakMethod(callback) if inspect.ismethod(callback) else callback)
+    
+    def _notify_evicted(self, work_id: str) -> None:
+        for listener in list(self._listeners):
+            callback = listener() if isinstance(listener, weakref.WeakMethod) else listener
+            if callback is None:
+                self._listeners.remove(listener)
+                continue
+            try:
+                callback(work_id)
+            except Exception as e:
+                journaling_manager.recordError(f"[LLMSessionPool] Error in eviction listener: {e}")
+
+    def discard(self, work_id: str = None) -> None:
+        """
+        Forget one work_id, or every session when work_id is None
+
+        Use after the device dropped the sessions itself (reset, reboot) - no exit is sent.
+        """
+        if work_id is None:
+            self._sessions.clear()
+            self._deferred.clear()
+            return
+        self._deferred.pop(work_id, None)
+        for key, value in list(self._sessions.items()):
+            if value == work_id:
+                del self._sessions[key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._sessions
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "sessions": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "work_ids": list(self._sessions.values()),
+            "leased": {work_id: count for work_id, count in self._leases.items() if count},
+            "deferred_exits": list(self._deferred),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
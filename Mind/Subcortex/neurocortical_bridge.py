@@ -6,6 +6,7 @@ either directly or through the BasalGanglia task system, depending on their natu
 """
 
 import asyncio
+import copy
 import time
 import json
 import traceback
@@ -22,10 +23,60 @@ from Mind.Subcortex.api_commands import (
     AudioCommand,
     CommandFactory
 )
+from Mind.Subcortex.response_cache import ResponseCache
+from Mind.Subcortex.llm_session_pool import LLMSessionPool
+from Mind.Subcortex.device_router import DeviceRouter, RoutedDevice, current_session, routing_session
+from Mind.Subcortex.request_tracer import request_tracer, traced
+from config import CONFIG
+from Mind.Subcortex.inference_scheduler import (
+    InferenceScheduler,
+    InferencePriority,
+    InferenceQueueFull,
+    current_priority,
+    inference_priority
+)
 
 # Initialize journaling manager
 journaling_manager = SystemJournelingManager()
 
+class StreamHandle:
+    """
+    Handle for a streamed operation running in the background
+    
+    Await the handle for the full response text, or cancel() to stop it.
+    """
+    
+    def __init__(self, task: asyncio.Task):
+        self._task = task
+        self.text = ""  # Text received so far
+    
+    def __await__(self):
+        return self._task.__await__()
+    
+    def cancel(self) -> bool:
+        """
+        Stop the stream
+        
+        The stream is closed at once and the device is told to stop generating,
+        so the next inference doesn't queue behind the abandoned one. Awaiting
+        the handle afterwards raises CancelledError; done callbacks run right away.
+        """
+        return self._task.cancel()
+    
+    def cancelled(self) -> bool:
+        return self._task.cancelled()
+    
+    def done(self) -> bool:
+        return self._task.done()
+    
+    def result(self) -> str:
+        """Full response text (only valid once done)"""
+        return self._task.result()
+    
+    def add_done_callback(self, fn: Callable[["StreamHandle"], None]) -> None:
+        """Call fn(handle) when the stream finishes, fails or is cancelled"""
+        self._task.add_done_callback(lambda _task: fn(self))
+
 class NeurocorticalBridge:
     """Bridge between direct API calls and the task system"""
     
@@ -54,10 +105,46 @@ class NeurocorticalBridge:
         "kws": (CommandType.AUDIO, "kws")
     }
     
+    # Idempotent queries answered from cache for this many seconds
+    CACHE_TTLS = {
+        "list_models": 30.0,
+        "hardware_info": 2.0,
+        "get_model": 10.0
+    }
+    
+    # Operations that change what the cached queries would return
+    CACHE_INVALIDATING_OPERATIONS = {"setup_llm", "set_model", "reset_system", "reboot"}
+    
+    # sys actions that only read device state - concurrent identical ones share one request
+    READ_ONLY_SYS_ACTIONS = {"ping", "hwinfo", "lsmode", "get_model"}
+    
+    # The AX630C runs one llm inference at a time; others queue by priority
+    INFERENCE_CONCURRENCY = 1
+    
     # Class variables for hardware transport management
     _transport = None
     _connection_type = None
     _initialized = False
+    _response_cache = ResponseCache()
+    _in_flight: Dict[Any, asyncio.Future] = {}
+    _coalesced_requests = 0
+    _inference_scheduler = InferenceScheduler(max_concurrency=INFERENCE_CONCURRENCY)
+    _active_streams = set()
+    _stop_tasks = set()
+    
+    # llm work_ids kept set up at once, keyed by (model, persona, temperature)
+    LLM_SESSION_POOL_SIZE = 3
+    _session_pool = LLMSessionPool(max_sessions=LLM_SESSION_POOL_SIZE)
+    
+    # Action that stops an llm generation without tearing down its work_id
+    STOP_ACTION = "pause"
+    STOP_TIMEOUT = 2.0
+    
+    # Set by initialize_router() to spread requests over several minds' devices
+    _router: Optional[DeviceRouter] = None
+    
+    # One task system for every bridge operation, created on first use
+    _basal_ganglia = None
     
     @classmethod
     async def create_llm_pixel_grid(cls, width: int = 64, height: int = 64, color_mode: str = "rgb") -> Dict[str, Any]:
@@ -142,12 +229,14 @@ class NeurocorticalBridge:
         raise TypeError(error_msg)
     
     @classmethod
+    @traced("NeurocorticalBridge.execute_operation", "bridge")
     async def execute_operation(cls, operation: str, data: Dict[str, Any] = None, use_task: bool = None, stream: bool = False):
         """
         Execute a cognitive operation
         
         This is the main entry point for executing operations through the bridge.
         It will determine whether to use task system or direct execution.
+        Idempotent queries in CACHE_TTLS are served from the response cache.
         
         Args:
             operation: The operation to execute (mapped through OPERATION_MAP)
@@ -158,6 +247,161 @@ class NeurocorticalBridge:
         Returns:
             Dict[str, Any]: Operation result
         """
+        # data["priority"] ("interactive", "normal", "background") ranks think requests
+        if data and "priority" in data:
+            data = dict(data)
+            with inference_priority(data.pop("priority")):
+                return await cls.execute_operation(operation, data, use_task, stream)
+        
+        # Model setup, reset and reboot make cached answers stale - before and after
+        if operation in cls.CACHE_INVALIDATING_OPERATIONS:
+            cls.invalidate_cache()
+            try:
+                return await cls._dispatch_operation(operation, data, use_task, stream)
+            finally:
+                cls.invalidate_cache()
+        
+        ttl = cls.CACHE_TTLS.get(operation)
+        if not ttl or stream:
+            return await cls._dispatch_operation(operation, data, use_task, stream)
+        
+        # With a router the answer depends on the device, which only a routing session fixes in advance
+        key = cls._device_scoped_key(operation)
+        if key is None:
+            return await cls._dispatch_operation(operation, data, use_task, stream)
+        
+        cached = cls._response_cache.get(key)
+        if cached is not None:
+            journaling_manager.recordDebug(f"[NeurocorticalBridge] Cache hit for {operation}")
+            return cached
+        
+        generation = cls._response_cache.generation
+        result = await cls._dispatch_operation(operation, data, use_task, stream)
+        if isinstance(result, dict) and result.get("status") == "ok":
+            cls._response_cache.put(key, result, ttl, generation)
+        return result
+    
+    @classmethod
+    def invalidate_cache(cls, operation: str = None) -> None:
+        """Drop cached responses (all of them when operation is None)"""
+        cls._response_cache.invalidate(operation)
+    
+    @classmethod
+    def get_cache_stats(cls) -> Dict[str, Any]:
+        """Hit/miss counters for the response cache, plus requests coalesced in flight"""
+        stats = cls._response_cache.stats()
+        stats["coalesced"] = cls._coalesced_requests
+        stats["in_flight"] = len(cls._in_flight)
+        return stats
+    
+    @classmethod
+    def inference_priority(cls, priority: Union[InferencePriority, str]):
+        """
+        Context manager: inference requests made inside it queue at this priority
+        
+        Usage:
+            with NeurocorticalBridge.inference_priority("interactive"):
+                await NeurocorticalBridge.execute(think_command)
+        """
+        return inference_priority(priority)
+    
+    @classmethod
+    def get_inference_stats(cls) -> Dict[str, Any]:
+        """Queue depth per device and queue wait per priority for llm inference"""
+        return cls._inference_scheduler.stats()
+    
+    @classmethod
+    async def get_llm_session(cls, model: str, persona: str = None, temperature: float = None) -> Optional[str]:
+        """
+        Return a warm llm work_id for (model, persona, temperature)
+        
+        Reuses a pooled work_id when one exists; otherwise runs llm setup and adds
+        the new work_id to the pool, exiting the least recently used session if
+        the pool is full.
+        
+        Returns:
+            str: work_id such as "llm.1003", or None if setup failed
+        """
+        key = LLMSessionPool.make_key(model, persona, temperature, cls._session_device())
+        return await cls._session_pool.acquire(key, cls._setup_pooled_session, cls._exit_llm_session)
+    
+    @classmethod
+    async def register_llm_session(cls, work_id: str, model: str, persona: str = None,
+                                   temperature: float = None) -> None:
+        """Add a work_id set up outside the pool (e.g. by set_model) so it can be reused"""
+        key = LLMSessionPool.make_key(model, persona, temperature, cls._session_device())
+        await cls._session_pool.add(key, work_id, cls._exit_llm_session)
+    
+    @classmethod
+    def add_llm_session_listener(cls, callback: Callable[[str], Any]) -> None:
+        """Call callback(work_id) whenever the session pool evicts a work_id"""
+        cls._session_pool.add_eviction_listener(callback)
+    
+    @classmethod
+    def get_session_pool_stats(cls) -> Dict[str, Any]:
+        """Warm work_ids plus hit/miss/eviction counters for the llm session pool"""
+        return cls._session_pool.stats()
+    
+    @classmethod
+    async def _setup_pooled_session(cls, key) -> Optional[str]:
+        """Run llm setup for a pool key and return the new work_id"""
+        model, persona, temperature, _ = key
+        setup_command = cls.create_llm_setup_command(model, persona=persona or None)
+        if temperature is not None:
+            setup_command["temperature"] = temperature
+        
+        start = time.monotonic()
+        response = await cls._send_to_hardware(setup_command)
+        error = response.get("error") if isinstance(response, dict) else None
+        work_id = response.get("work_id") if isinstance(response, dict) else None
+        if not isinstance(error, dict) or error.get("code") != 0 or not isinstance(work_id, str):
+            journaling_manager.recordError(f"[NeurocorticalBridge] LLM session setup failed for {model}: {error or response}")
+            return None
+        
+        journaling_manager.recordInfo(
+            f"[NeurocorticalBridge] 🔥 Warmed {work_id} for {model} ({time.monotonic() - start:.2f}s)"
+        )
+        cls.invalidate_cache()
+        return work_id
+    
+    @classmethod
+    async def _exit_llm_session(cls, work_id: str) -> Dict[str, Any]:
+        """Release an llm work_id on the device"""
+        cls.invalidate_cache()
+        return await cls._send_to_hardware({
+            "request_id": f"exit_{int(time.time() * 1000)}",
+            "work_id": work_id,
+            "action": "exit"
+        })
+    
+    @classmethod
+    async def _single_flight(cls, key: Any, request: Callable[[], Any]) -> Any:
+        """
+        Run request() once for all concurrent callers with the same key
+        
+        The first caller starts the request; callers arriving while it is in flight
+        await the same future. Each caller gets its own copy of the result, and a
+        cancelled caller doesn't cancel the request for the others.
+        """
+        loop = asyncio.get_running_loop()
+        future = cls._in_flight.get(key)
+        if future is not None and not future.done() and future.get_loop() is loop:
+            cls._coalesced_requests += 1
+            journaling_manager.recordDebug(f"[NeurocorticalBridge] Joining in-flight request: {key}")
+        else:
+            future = asyncio.ensure_future(request())
+            cls._in_flight[key] = future
+            
+            def forget(done_future, key=key):
+                if cls._in_flight.get(key) is done_future:
+                    del cls._in_flight[key]
+            future.add_done_callback(forget)
+        
+        return copy.deepcopy(await asyncio.shield(future))
+    
+    @classmethod
+    async def _dispatch_operation(cls, operation: str, data: Dict[str, Any] = None, use_task: bool = None, stream: bool = False):
+        """Route an operation to direct transport or the task system (uncached)"""
         try:
             journaling_manager.recordInfo(f"Execute operation: {operation}")
             
@@ -241,13 +485,15 @@ class NeurocorticalBridge:
                 
                 # Extract model name and persona
                 model_name = data.get("model", "")
-                persona = data.get("prompt", "")
+                persona = data.get("prompt", data.get("persona", ""))
                 
                 # Create setup command
                 setup_command = CommandFactory.create_llm_setup_command(
                     model_name=model_name,
                     persona=persona
                 )
+                if data.get("temperature") is not None:
+                    setup_command["data"]["temperature"] = data["temperature"]
                 
                 # Send directly through hardware transport
                 setup_result = await cls._send_to_hardware(setup_command)
@@ -270,13 +516,23 @@ class NeurocorticalBridge:
                             "message": f"API Error: {error_message}",
                             "response": setup_result
                         }
-            
-            # Fallback response
-            return {
+                
+                # Fallback response
+                return {
                     "status": "error",
                     "message": "Failed to set model, unexpected response format"
                 }
             
+            # Streaming think keeps the caller's work_id, which create_command drops
+            if stream and operation == "think":
+                journaling_manager.recordInfo(f"Using direct execution for streaming think operation")
+                data = data or {}
+                return await cls._handle_llm_stream(cls.create_llm_inference_command(
+                    data.get("prompt", ""),
+                    stream=True,
+                    work_id=data.get("work_id")
+                ))
+            
             # Create a command dict with the right format using helper function
             command = create_command(command_type, command_name, data)
             
@@ -333,6 +589,174 @@ class NeurocorticalBridge:
             journaling_manager.recordError(f"Stream handling error: {e}")
             return {"status": "error", "message": str(e)}
 
+    @classmethod
+    def _extract_stream_delta(cls, chunk: Any) -> str:
+        """
+        Extract the text carried by a single streamed response chunk
+        
+        Handles both the delta object format and plain string data.
+        """
+        if isinstance(chunk, str):
+            return chunk
+        if not isinstance(chunk, dict):
+            return ""
+        data = chunk.get("data")
+        if isinstance(data, str):
+            return data
+        if isinstance(data, dict):
+            return data.get("delta", "") or ""
+        return ""
+    
+    @classmethod
+    async def stream_operation(cls, operation: str, data: Dict[str, Any] = None, max_pending: int = 0):
+        """
+        Stream a cognitive operation, yielding text deltas as they are parsed
+        
+        Each delta is yielded as soon as the transport hands the chunk over,
+        so the first token reaches the caller while the device is still
+        generating the rest.
+        
+        Usage:
+            async for delta in NeurocorticalBridge.stream_operation("think", {"prompt": "Hello"}):
+                print(delta, end="", flush=True)
+        
+        Args:
+            operation: The operation to stream (currently only "think")
+            data: Operation data - prompt, plus optional work_id, request_id and
+                  priority ("interactive", "normal" or "background")
+            max_pending: Deltas buffered ahead of a slow consumer before the
+                         transport read pauses (0 = unbounded)
+        
+        Yields:
+            str: Text deltas in generation order
+        
+        Raises:
+            ValueError: If the operation does not support streaming
+            CommandError: If the device or transport reports an error
+        """
+        from .transport_layer import CommandError
+        
+        if operation != "think":
+            raise ValueError(f"Streaming not supported for operation: {operation}")
+        
+        data = data or {}
+        priority = InferencePriority.parse(data["priority"]) if data.get("priority") is not None else current_priority()
+        stream_command = cls.create_llm_inference_command(
+            data.get("prompt", ""),
+            request_id=data.get("request_id"),
+            stream=True,
+            work_id=data.get("work_id")
+        )
+        
+        journaling_manager.recordDebug("=== STREAM COMMAND JSON ===")
+        journaling_manager.recordDebug(lambda: json.dumps(stream_command, indent=2))
+        
+        delta_queue = asyncio.Queue(maxsize=max_pending)
+        end_of_stream = object()
+        device_errors = []
+        
+        async def handle_stream_chunk(chunk):
+            error = chunk.get("error") if isinstance(chunk, dict) else None
+            if isinstance(error, dict) and error.get("code", 0) != 0:
+                device_errors.append(error.get("message", "Unknown error"))
+                return
+            delta = cls._extract_stream_delta(chunk)
+            if delta:
+                await delta_queue.put(delta)
+        
+        async def pump():
+            # _send_to_hardware reports failures as error dicts, so the end
+            # marker is always queued unless the consumer cancelled us
+            result = await cls._send_to_hardware(stream_command, stream_callback=handle_stream_chunk, priority=priority)
+            await delta_queue.put(end_of_stream)
+            return result
+        
+        pump_task = asyncio.create_task(pump())
+        delivered = 0
+        try:
+            while True:
+                delta = await delta_queue.get()
+                if delta is end_of_stream:
+                    break
+                delivered += 1
+                yield delta
+            
+            result = await pump_task
+            error = result.get("error") if isinstance(result, dict) else None
+            if isinstance(error, dict) and error.get("code", 0) != 0:
+                device_errors.append(error.get("message", "Unknown error"))
+            elif not delivered:
+                # Transports without stream() return the whole reply from transmit()
+                delta = cls._extract_stream_delta(result)
+                if delta:
+                    yield delta
+            
+            if device_errors:
+                raise CommandError(f"Stream failed: {device_errors[0]}")
+        finally:
+            if not pump_task.done():
+                pump_task.cancel()
+                try:
+                    await pump_task
+                except (asyncio.CancelledError, Exception):
+                    pass
+    
+    @classmethod
+    def start_stream_operation(cls, operation: str, data: Dict[str, Any] = None, callback=None,
+                               max_pending: int = 32) -> "StreamHandle":
+        """
+        Start a streamed operation in the background, feeding deltas to a callback
+        
+        The callback (sync or async) is called once per delta from a single
+        generation. Async callbacks are awaited before the next delta is taken,
+        and at most max_pending deltas are buffered, so a slow consumer slows
+        the stream down instead of piling up text.
+        
+        Args:
+            operation: The operation to stream (currently only "think")
+            data: Operation data - prompt, plus optional work_id, request_id and priority
+            callback: Called with each text delta
+            max_pending: Deltas buffered ahead of the callback
+        
+        Returns:
+            StreamHandle: Await for the full response text, or cancel() to stop
+        """
+        async def consume():
+            response_text = ""
+            async for delta in cls.stream_operation(operation, data, max_pending=max_pending):
+                response_text += delta
+                handle.text = response_text
+                if callback:
+                    try:
+                        if asyncio.iscoroutinefunction(callback):
+                            await callback(delta)
+                        else:
+                            callback(delta)
+                    except Exception as e:
+                        journaling_manager.recordError(f"Error in external callback: {e}")
+            return response_text
+        
+        handle = StreamHandle(asyncio.create_task(consume()))
+        cls._active_streams.add(handle)
+        handle.add_done_callback(cls._active_streams.discard)
+        return handle
+    
+    @classmethod
+    def cancel_streams(cls) -> int:
+        """
+        Cancel every stream started with start_stream_operation (Ctrl-C, leaving chat)
+        
+        Returns:
+            int: Number of streams cancelled
+        """
+        cancelled = 0
+        for handle in list(cls._active_streams):
+            if handle.cancel():
+                cancelled += 1
+        if cancelled:
+            journaling_manager.recordInfo(f"[NeurocorticalBridge] 🛑 Cancelled {cancelled} stream(s)")
+        return cancelled
+    
     @classmethod
     async def _handle_llm_stream(cls, command: Union[Dict[str, Any], BaseCommand], callback=None) -> Dict[str, Any]:
         """
@@ -346,119 +770,56 @@ class NeurocorticalBridge:
             Dict with status and collected response
         """
         try:
-            # Get the prompt from the command
+            # Get the prompt and work_id from the command
             prompt = ""
             if isinstance(command, dict):
-                # If data is a string, it's the prompt (non-streaming format)
-                if isinstance(command.get("data"), str):
-                    prompt = command.get("data", "")
-                # If data is a dict, look for prompt or delta
-                elif isinstance(command.get("data"), dict):
-                    prompt = command.get("data", {}).get("prompt", 
-                            command.get("data", {}).get("delta", ""))
+                data = command.get("data")
+                work_id = command.get("work_id")
             else:
                 # Command object
                 data = getattr(command, "data", None)
-                if isinstance(data, str):
-                    prompt = data
-                elif isinstance(data, dict):
-                    prompt = data.get("prompt", data.get("delta", ""))
+                work_id = getattr(command, "work_id", None)
+            
+            # If data is a string, it's the prompt (non-streaming format)
+            if isinstance(data, str):
+                prompt = data
+            # If data is a dict, look for prompt or delta
+            elif isinstance(data, dict):
+                prompt = data.get("prompt", data.get("delta", ""))
                 
             journaling_manager.recordDebug("=== LLM STREAM REQUEST ===")
             journaling_manager.recordDebug(f"Prompt (first 100 chars): {prompt[:100]}...")
             
-            # First, create a proper stream command
-            stream_command = cls.create_llm_inference_command(prompt, stream=True)
-            
-            # Log the structured stream command
-            journaling_manager.recordDebug("=== STREAM COMMAND JSON ===")
-            journaling_manager.recordDebug(json.dumps(stream_command, indent=2))
-            
-            # Initialize response stream
+            # Collect deltas as they arrive from the stream
             responses = []
-            response_text = ""
             
-            # Get an asyncio queue for collecting streaming responses
-            stream_queue = asyncio.Queue()
-            
-            # Create a callback to handle streaming responses
-            async def handle_stream_chunk(chunk):
-                try:
-                    # Log the chunk with truncation for large responses
-                    chunk_log = json.dumps(chunk)
-                    if len(chunk_log) > 500:
-                        journaling_manager.recordDebug(f"Stream chunk received (truncated): {chunk_log[:500]}...")
-                    else:
-                        journaling_manager.recordDebug(f"Stream chunk received: {chunk_log}")
-                    
-                    # Extract text from the chunk
-                    chunk_text = ""
-                    
-                    # For API that returns proper objects with data field
-                    if isinstance(chunk, dict) and "data" in chunk:
-                        data = chunk["data"]
-                        
-                        # Handle both string and object data formats
-                        if isinstance(data, str):
-                            chunk_text = data
-                            await stream_queue.put(data)
-                        elif isinstance(data, dict) and "delta" in data:
-                            # Newer API with delta field
-                            delta = data.get("delta", "")
-                            if delta:
-                                chunk_text = delta
-                                await stream_queue.put(delta)
-                                
-                            # Check for finish flag
-                            if data.get("finish", False):
-                                # Signal completion
-                                await stream_queue.put(None)
+            async def collect(delta):
+                responses.append(delta)
+                
+                # If an external callback was provided, call it with the chunk text
+                if callback:
+                    if asyncio.iscoroutinefunction(callback):
+                        await callback(delta)
                     else:
-                        # For simple API that just returns text
-                        if isinstance(chunk, str):
-                            chunk_text = chunk
-                            await stream_queue.put(chunk)
-                    
-                    # If an external callback was provided, call it with the chunk text
-                    if callback and chunk_text:
-                        try:
-                            # Call the external callback with the text
-                            if asyncio.iscoroutinefunction(callback):
-                                await callback(chunk_text)
-                            else:
-                                callback(chunk_text)
-                        except Exception as e:
-                            journaling_manager.recordError(f"Error in external callback: {e}")
-                except Exception as e:
-                    journaling_manager.recordError(f"Error processing stream chunk: {e}")
+                        callback(delta)
             
-            # Setup transport streaming - the callback will add chunks to the queue
-            stream_result = await cls._send_to_hardware(stream_command, stream_callback=handle_stream_chunk)
-            
-            # Process all streaming chunks until complete
-            while True:
-                try:
-                    # Wait for a chunk, but with timeout to prevent hanging indefinitely
-                    chunk = await asyncio.wait_for(stream_queue.get(), timeout=15.0)
-                    
-                    # None signals end of stream
-                    if chunk is None:
-                        journaling_manager.recordDebug("Stream complete (received None chunk)")
-                        break
-                        
-                    # Add chunk to response text
-                    response_text += chunk
-                    responses.append(chunk)
-                    
-                    # Log length for debug
-                    journaling_manager.recordDebug(f"Current response length: {len(response_text)} chars, {len(responses)} chunks")
-                    
-                except asyncio.TimeoutError:
-                    journaling_manager.recordWarning("Stream timeout waiting for data")
-                    break
-                except Exception as e:
-                    journaling_manager.recordError(f"Error processing stream chunk: {e}")
-                    break
+            # Run as a registered handle so cancel_streams() can abort it
+            handle = cls.start_stream_operation("think", {"prompt": prompt, "work_id": work_id}, callback=collect)
+            try:
+                # Shielded, so a cancelled handle means cancel_streams() stopped it, not our caller
+                response_text = await asyncio.shield(handle)
+            except asyncio.CancelledError:
+                # Task.cancelling() (3.11+) also catches our caller cancelling in the same tick
+                cancelling = getattr(asyncio.current_task(), "cancelling", None)
+                if not handle.cancelled() or (cancelling is not None and cancelling()):
+                    handle.cancel()
+                    raise
+                journaling_manager.recordInfo(f"[NeurocorticalBridge] Stream cancelled after {len(responses)} chunks")
+                return {
+                    "status": "cancelled",
+                    "response": "".join(responses),
+                    "chunks": responses
+                }
             
             # Log the final response
             journaling_manager.recordDebug(f"Final response length: {len(response_text)} chars")
@@ -573,14 +934,14 @@ class NeurocorticalBridge:
                 
                 # Log the inference command payload
                 journaling_manager.recordDebug("=== INFERENCE COMMAND JSON ===")
-                journaling_manager.recordDebug(json.dumps(safe_command, indent=2))
+                journaling_manager.recordDebug(lambda: json.dumps(safe_command, indent=2))
                 
                 # Execute directly through transport
                 result = await cls._send_to_hardware(safe_command)
                 
                 # Log the inference result
                 journaling_manager.recordDebug("=== INFERENCE RESULT JSON ===")
-                journaling_manager.recordDebug(json.dumps(result, indent=2))
+                journaling_manager.recordDebug(lambda: json.dumps(result, indent=2))
                 
                 # Process result
                 if result and isinstance(result, dict):
@@ -701,7 +1062,10 @@ class NeurocorticalBridge:
             prompt = command.data.get("delta", "")
             if prompt:
                 stream_mode = command.stream if hasattr(command, "stream") else stream
-                return bg.think(prompt=prompt, stream=stream_mode)
+                handle = bg.think(prompt=prompt, stream=stream_mode)
+                if handle is None:
+                    return {"status": "error", "message": "Task system is full"}
+                return await handle
             
             comm_task = bg.get_communication_task()
             return await comm_task.send_command(command)
@@ -716,12 +1080,9 @@ class NeurocorticalBridge:
         bg = cls.get_basal_ganglia()
         system_task = bg.system_command(command_type, data)
         
-        # Wait for task to complete (this is a blocking operation)
-        while system_task.active or not system_task.has_completed():
-            await asyncio.sleep(0.1)
-        
-        # Return task result
-        return system_task.result if system_task.result is not None else {"error": "Task completed with no result"}
+        # Wait for the task to complete
+        result = await system_task
+        return result if result is not None else {"error": "Task completed with no result"}
     
     @classmethod
     async def _handle_audio_command(cls, command: AudioCommand) -> Dict[str, Any]:
@@ -874,6 +1235,12 @@ class NeurocorticalBridge:
             if not comm_task:
                 return {"status": "error", "message": "Communication task not available"}
                 
+            key = cls._device_scoped_key("get_model")
+            cached = cls._response_cache.get(key) if key is not None else None
+            if cached is not None:
+                return cached
+            generation = cls._response_cache.generation
+            
             # Create get model command
             get_model_command = {
                 "request_id": f"get_model_{int(time.time())}",
@@ -881,12 +1248,19 @@ class NeurocorticalBridge:
                 "action": "get_model"
             }
             
-            # Send command directly through comm task
-            response = await comm_task.send_command(get_model_command)
+            # Send command directly through comm task, shared with concurrent callers
+            flight_key = cls._device_scoped_key(("sys", "get_model"))
+            if flight_key is None:
+                response = await comm_task.send_command(get_model_command)
+            else:
+                response = await cls._single_flight(flight_key, lambda: comm_task.send_command(get_model_command))
             
             # Process response
             if response and isinstance(response, dict):
-                return {"status": "ok", "model": response.get("data", "")}
+                result = {"status": "ok", "model": response.get("data", "")}
+                if key is not None:
+                    cls._response_cache.put(key, result, cls.CACHE_TTLS["get_model"], generation)
+                return result
             else:
                 return {"status": "error", "message": "Invalid response format"}
                 
@@ -947,6 +1321,7 @@ class NeurocorticalBridge:
         """Set model directly without using the task system"""
         try:
             journaling_manager.recordDebug(f"[NeurocorticalBridge._direct_set_model] Setting model to {model_name}")
+            cls.invalidate_cache()
             
             # Get local reference to BasalGanglia
             from Mind.CorpusCallosum.synaptic_pathways import SynapticPathways
@@ -1015,6 +1390,9 @@ class NeurocorticalBridge:
             Dict with status and response
         """
         journaling_manager.recordDebug("[NeurocorticalBridge._direct_reset_system] ⚡ Creating reset command...")
+        cls.invalidate_cache()
+        # A reset drops every llm unit on the device
+        cls._session_pool.discard()
         
         try:
             # Create properly formatted reset command per API spec
@@ -1153,17 +1531,33 @@ class NeurocorticalBridge:
     @classmethod
     def get_basal_ganglia(cls):
         """
-        Get BasalGanglia instance or create a minimal one if unable to import
+        Get the shared BasalGanglia instance or create a minimal one if unable to import
 
-        This is used to maintain compatibility when BasalGanglia is not available
+        Every caller gets the same integration, so one scheduler sees all tasks
+        competing for the llm and display, and the periodic core tasks are
+        registered once. It is rebuilt if the event loop it ran on has gone.
+        The minimal fallback keeps callers working when BasalGanglia is not available.
         """
         try:
             # Import here to avoid circular imports
             from Mind.Subcortex.BasalGanglia.basal_ganglia_integration import BasalGangliaIntegration
-            # Create instance if needed
-            bg_integration = BasalGangliaIntegration()
+            
+            bg_integration = cls._basal_ganglia
+            if bg_integration is not None:
+                loop = bg_integration.basal_ganglia.scheduler.loop
+                try:
+                    current_loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    current_loop = None
+                if loop is None or current_loop is None or loop is current_loop:
+                    return bg_integration
+                journaling_manager.recordInfo("Event loop changed, restarting BasalGanglia")
+                if not loop.is_closed():
+                    bg_integration.shutdown()
+            
+            cls._basal_ganglia = BasalGangliaIntegration()
             journaling_manager.recordInfo("Using actual BasalGanglia")
-            return bg_integration
+            return cls._basal_ganglia
         except ImportError:
             # Create a minimal implementation with only essential functionality
             class MinimalBasalGanglia:
@@ -1233,6 +1627,10 @@ class NeurocorticalBridge:
         """
         Initialize the system with the specified connection type
         
+        With CONFIG.routing["enabled"] requests are routed across every
+        configured mind's device instead, falling back to a single transport
+        if none of them connect.
+        
         Args:
             connection_type: Type of connection to use (serial, tcp, adb)
             
@@ -1244,6 +1642,12 @@ class NeurocorticalBridge:
             if connection_type is None:
                 connection_type = "tcp"  # Default to TCP
             
+            if CONFIG.routing.get("enabled"):
+                journaling_manager.recordInfo("🔀 Routing across configured devices...")
+                if await cls.initialize_router(CONFIG.routing.get("minds"), connection_type):
+                    return True
+                journaling_manager.recordWarning("No routed device connected, falling back to a single transport")
+            
             journaling_manager.recordInfo(f"🔍 Setting connection mode to {connection_type}...")
             
             # Use _initialize_transport, which will get connection details from the mind configuration
@@ -1268,6 +1672,108 @@ class NeurocorticalBridge:
             cls._initialized = False
             return False
 
+    @classmethod
+    async def initialize_router(cls, mind_ids: List[str] = None, connection_type: str = None) -> bool:
+        """
+        Connect to every configured mind's device and route requests across them
+        
+        Stateless requests go to the healthy device with the fewest outstanding
+        requests, requests made inside routing_session() stay on one device, and
+        llm work_ids always go back to the device that set them up.
+        
+        Args:
+            mind_ids: Minds from minds_config.json to use (default: all with a fixed ip/port)
+            connection_type: Transport type for every device (default: each mind's own)
+        
+        Returns:
+            bool: True if at least one device connected
+        """
+        router = DeviceRouter.from_minds_config(
+            mind_ids, connection_type,
+            retry_after=CONFIG.routing.get("retry_after", 10.0),
+            on_device_lost=cls._forget_lost_sessions
+        )
+        if not router.devices:
+            journaling_manager.recordError("[NeurocorticalBridge] No minds with fixed connection settings to route to")
+            return False
+        
+        connected = await router.connect_all()
+        if not any(connected.values()):
+            await router.close()
+            return False
+        
+        if cls._router is not None:
+            await cls._router.close()
+        cls._router = router
+        cls._connection_type = connection_type or cls._connection_type or "tcp"
+        cls._initialized = True
+        cls._session_pool.discard()
+        cls.invalidate_cache()
+        return True
+    
+    @classmethod
+    def routing_session(cls, session_id: Optional[str]):
+        """
+        Context manager: keep requests made inside it on one device
+        
+        Usage:
+            with NeurocorticalBridge.routing_session(conversation_id):
+                await NeurocorticalBridge.execute_operation("think", {"prompt": text})
+        """
+        return routing_session(session_id)
+    
+    @classmethod
+    def pin_session(cls, session_id: str, device: str) -> bool:
+        """
+        Send a routing session's requests to one device, e.g. a mind's own
+        
+        Returns:
+            bool: False without a router or if it has no such device
+        """
+        return cls._router is not None and cls._router.pin(session_id, device)
+    
+    @classmethod
+    def _session_device(cls) -> Optional[str]:
+        """
+        Device the current routing session is pinned to, pinning it now if needed
+        
+        Returns None without a router or outside a routing session.
+        """
+        session = current_session()
+        if cls._router is None or session is None:
+            return None
+        device = cls._router.pinned(session)
+        if device is None:
+            selected = cls._router.select({}, session)
+            device = selected.name if selected is not None else None
+        return device
+    
+    @classmethod
+    def _device_scoped_key(cls, key: Any) -> Any:
+        """
+        Cache / single-flight key for a request to whichever device it will reach
+        
+        Returns key itself without a router, (key, device) inside a routing
+        session, and None when the router will pick the device per request -
+        such answers must not be cached or shared.
+        """
+        if cls._router is None:
+            return key
+        device = cls._session_device()
+        return (key, device) if device is not None else None
+    
+    @classmethod
+    def get_router_stats(cls) -> Dict[str, Any]:
+        """Health, outstanding requests and pinned sessions per device (empty without a router)"""
+        return cls._router.stats() if cls._router is not None else {}
+    
+    @classmethod
+    def _forget_lost_sessions(cls, device: str, work_ids: List[str]) -> None:
+        """Drop pooled work_ids that lived on a device the router marked down"""
+        for work_id in work_ids:
+            cls._session_pool.discard(work_id)
+        journaling_manager.recordWarning(f"[NeurocorticalBridge] Lost {len(work_ids)} llm session(s) on {device}")
+    
     @classmethod
     async def _initialize_transport(cls, transport_type: str = None) -> bool:
         """Initialize transport layer for hardware communication
@@ -1381,7 +1887,10 @@ class NeurocorticalBridge:
                 bg = cls.get_basal_ganglia()
                 prompt = command.get("data", {}).get("delta", "")
                 if prompt:
-                    return await bg.think(prompt=prompt, stream=False)
+                    handle = bg.think(prompt=prompt, stream=False)
+                    if handle is None:
+                        return {"status": "error", "message": "Task system is full"}
+                    return await handle
                 
                 # Direct transmission to hardware
                 return await cls._send_to_hardware(command)
@@ -1431,13 +1940,175 @@ class NeurocorticalBridge:
         return cls._transport
         
     @classmethod
-    async def _send_to_hardware(cls, command: Union[Dict[str, Any], str], stream_callback=None) -> Dict[str, Any]:
-        """Send a command directly to hardware transport layer"""
+    async def _send_to_hardware(cls, command: Union[Dict[str, Any], str], stream_callback=None,
+                                priority: Union[InferencePriority, str] = None) -> Dict[str, Any]:
+        """Send a command directly to hardware transport layer
+        
+        Identical read-only sys commands (ping, hwinfo, lsmode, get_model) sent
+        concurrently share a single request to the device. llm inference waits
+        for a slot from the inference scheduler, highest priority first; priority
+        defaults to the one set with inference_priority().
+        """
+        fields = command if isinstance(command, dict) else {}
+        with request_tracer.span(
+            "NeurocorticalBridge._send_to_hardware", "bridge",
+            action=fields.get("action"), work_id=fields.get("work_id"),
+            device_request_id=fields.get("request_id"), stream=stream_callback is not None
+        ):
+            read_only = (
+                stream_callback is None
+                and isinstance(command, dict)
+                and command.get("work_id") == "sys"
+                and command.get("action") in cls.READ_ONLY_SYS_ACTIONS
+            )
+            flight_key = cls._device_scoped_key(
+                ("sys", command["action"], json.dumps(command.get("data"), sort_keys=True))
+            ) if read_only else None
+            if flight_key is not None:
+                return await cls._single_flight(flight_key, lambda: cls._transmit_to_hardware(command))
+            if cls._is_inference_command(command):
+                return await cls._scheduled_inference(command, stream_callback, priority)
+            return await cls._transmit_to_hardware(command, stream_callback)
+    
+    @classmethod
+    def _is_inference_command(cls, command: Union[Dict[str, Any], BaseCommand, str]) -> bool:
+        if isinstance(command, dict):
+            work_id, action = command.get("work_id"), command.get("action")
+        else:
+            work_id, action = getattr(command, "work_id", None), getattr(command, "action", None)
+        return isinstance(work_id, str) and work_id.startswith("llm") and action == "inference"
+    
+    @classmethod
+    def _inference_device_key(cls) -> str:
+        """Identifies the device behind the current transport for per-device limits"""
+        transport = cls._transport
+        address = getattr(transport, "ip", None) or getattr(transport, "port", None)
+        return f"{cls._connection_type or 'tcp'}:{address or 'default'}"
+    
+    @classmethod
+    async def _scheduled_inference(cls, command: Union[Dict[str, Any], BaseCommand], stream_callback=None,
+                                   priority: Union[InferencePriority, str] = None) -> Dict[str, Any]:
+        """Transmit an llm inference once the device has a free inference slot
+        
+        With a router the device is picked first, so requests queued for a slot
+        count towards that device's outstanding requests.
+        """
+        if cls._router is None:
+            return await cls._inference_on_device(command, stream_callback, priority, cls._inference_device_key())
+        
+        async def transmit(route: RoutedDevice, routed_command, callback):
+            return await cls._inference_on_device(routed_command, callback, priority, f"router:{route.name}", route)
+        
+        return await cls._router.send(cls._to_dict_safely(command), stream_callback, current_session(), transmit)
+    
+    @classmethod
+    async def _inference_on_device(cls, command: Union[Dict[str, Any], BaseCommand], stream_callback,
+                                   priority: Union[InferencePriority, str], device: str,
+                                   route: RoutedDevice = None) -> Dict[str, Any]:
+        """Hold one of device's inference slots while the inference runs"""
+        try:
+            with request_tracer.span("InferenceScheduler.acquire", "bridge", device=device):
+                queue_wait = await cls._inference_scheduler.acquire(device, priority)
+        except InferenceQueueFull as e:
+            journaling_manager.recordWarning(f"[NeurocorticalBridge] Inference rejected: {e}")
+            return {"error": {"code": -1, "message": f"Inference queue full: {e}"}}
+        
+        if queue_wait > 0.01:
+            journaling_manager.recordDebug(f"[NeurocorticalBridge] Inference queued {queue_wait:.3f}s on {device}")
+        # Lease the work_id so the session pool won't exit it mid-generation
+        work_id = command.get("work_id") if isinstance(command, dict) else getattr(command, "work_id", "llm")
+        cls._session_pool.retain(work_id)
+        release_slot = True
+        try:
+            return await cls._transmit_to_hardware(command, stream_callback, route)
+        except asyncio.CancelledError:
+            # The caller gave up but the device is still generating - stop it in
+            # the background and keep the slot and lease until it has stopped
+            release_slot = False
+            stop_task = asyncio.ensure_future(cls._stop_generation(command, device, route))
+            cls._stop_tasks.add(stop_task)
+            stop_task.add_done_callback(cls._stop_tasks.discard)
+            raise
+        finally:
+            if release_slot:
+                cls._session_pool.release(work_id)
+                cls._inference_scheduler.release(device)
+    
+    @classmethod
+    async def _stop_generation(cls, command: Union[Dict[str, Any], BaseCommand], device: str,
+                               route: RoutedDevice = None) -> None:
+        """Tell the device to stop an abandoned inference, then free its slot
+        
+        The slot is only freed once the reply carrying the stop's own
+        request_id arrives. Frames from the abandoned stream (its closing
+        finish chunk comes before the pause reply) are drained and ignored,
+        so they can't reach the next inference on the slot.
+        """
+        work_id = command.get("work_id") if isinstance(command, dict) else getattr(command, "work_id", "llm")
+        stream_id = command.get("request_id") if isinstance(command, dict) else getattr(command, "request_id", None)
+        stop_command = {
+            "request_id": f"stop_{int(time.time() * 1000)}",
+            "work_id": work_id or "llm",
+            "action": cls.STOP_ACTION
+        }
+        try:
+            journaling_manager.recordInfo(f"[NeurocorticalBridge] 🛑 Stopping generation on {stop_command['work_id']}")
+            result = await asyncio.wait_for(cls._await_stop_reply(stop_command, stream_id, route), cls.STOP_TIMEOUT)
+            error = result.get("error") if isinstance(result, dict) else None
+            if isinstance(error, dict) and error.get("code", 0) != 0:
+                journaling_manager.recordWarning(f"[NeurocorticalBridge] Stop not acknowledged: {error.get('message')}")
+        except asyncio.TimeoutError:
+            journaling_manager.recordWarning(f"[NeurocorticalBridge] No reply to stop after {cls.STOP_TIMEOUT:.1f}s")
+        except Exception as e:
+            journaling_manager.recordError(f"[NeurocorticalBridge] Error stopping generation: {e}")
+        finally:
+            cls._session_pool.release(work_id)
+            cls._inference_scheduler.release(device)
+    
+    @classmethod
+    async def _await_stop_reply(cls, stop_command: Dict[str, Any], stream_id: Any,
+                                route: RoutedDevice = None) -> Dict[str, Any]:
+        """Send the stop until the reply matching its request_id comes back
+        
+        Transports that read replies in order (serial, ADB) hand back the
+        abandoned stream's leftover frames first; each one is dropped and the
+        stop re-sent (pausing an idle unit is harmless) until its own reply
+        is read. Replies without a request_id are transport-level errors and
+        are returned as they are.
+        """
+        stale = 0
+        while True:
+            result = await cls._transmit_to_hardware(stop_command, route=route)
+            reply_id = result.get("request_id") if isinstance(result, dict) else None
+            if reply_id in (None, "", stop_command["request_id"]):
+                if stale:
+                    journaling_manager.recordDebug(
+                        f"[NeurocorticalBridge] Drained {stale} stale frames before the stop reply"
+                    )
+                return result
+            stale += 1
+            if reply_id != stream_id:
+                journaling_manager.recordDebug(f"[NeurocorticalBridge] Ignoring frame for {reply_id} while stopping")
+    
+    @classmethod
+    async def _transmit_to_hardware(cls, command: Union[Dict[str, Any], str], stream_callback=None,
+                                    route: RoutedDevice = None) -> Dict[str, Any]:
+        """Send a command to the hardware transport (no coalescing)
+        
+        With a router the command goes to route, or to the device the router
+        picks for it.
+        """
         try:
             # Basic validation
             if command is None:
                 journaling_manager.recordError("Cannot send None command to hardware")
                 return {"error": {"code": -1, "message": "Invalid command (None)"}}
+            
+            if cls._router is not None:
+                safe_command = cls._to_dict_safely(command)
+                if route is not None:
+                    return await cls._router.transmit(route, safe_command, stream_callback)
+                return await cls._router.send(safe_command, stream_callback, current_session())
                 
             # Make sure we have a transport
             transport = cls._get_transport()
@@ -1478,12 +2149,8 @@ class NeurocorticalBridge:
             # Convert BaseCommand to dict if needed
             safe_command = cls._to_dict_safely(command)
             
-            # Log the command (truncated for large commands)
-            log_cmd = json.dumps(safe_command)
-            if len(log_cmd) > 500:
-                journaling_manager.recordDebug(f"Sending command (truncated): {log_cmd[:500]}...")
-            else:
-                journaling_manager.recordDebug(f"Sending command: {log_cmd}")
+            # Log the command (truncated for large commands) - only serialized when DEBUG is on
+            journaling_manager.recordDebug(lambda: f"Sending command: {cls._truncate_for_log(safe_command, 500)}")
             
             # Transmit command through transport
             try:
@@ -1503,15 +2170,13 @@ class NeurocorticalBridge:
                 
                 # Special verbose logging for LLM inference responses
                 if isinstance(command, dict) and command.get("work_id") == "llm" and command.get("action") == "inference":
-                    print("\n=== LLM INFERENCE RESPONSE ===")
-                    print(json.dumps(response, indent=2))
-                    print("===============================\n")
+                    journaling_manager.recordDebug(
+                        lambda: f"=== LLM INFERENCE RESPONSE ===\n{json.dumps(response, indent=2)}"
+                    )
                 
                 # Log response (truncate if too large)
                 if not stream_callback:  # Don't log the response for streaming commands as it's handled by the callback
-                    resp_str = json.dumps(response) if response else "None"
-                    log_resp = resp_str[:200] + "..." if len(resp_str) > 200 else resp_str
-                    journaling_manager.recordInfo(f"Received from hardware: {log_resp}")
+                    journaling_manager.recordInfo(lambda: f"Received from hardware: {cls._truncate_for_log(response, 200)}")
                 
                 return response or {"error": {"code": -1, "message": "Empty response from hardware"}}
             except Exception as e:
@@ -1533,6 +2198,12 @@ class NeurocorticalBridge:
                 }
             }
 
+    @staticmethod
+    def _truncate_for_log(value: Any, limit: int) -> str:
+        """JSON for a log line, cut to limit characters"""
+        text = json.dumps(value) if value else "None"
+        return text if len(text) <= limit else f"{text[:limit]}..."
+
     @classmethod
     async def cleanup(cls) -> None:
         """Clean up resources before shutdown
@@ -1540,6 +2211,19 @@ class NeurocorticalBridge:
         This replaces functionality previously in SynapticPathways
         """
         try:
+            if cls._basal_ganglia is not None:
+                journaling_manager.recordInfo("Shutting down BasalGanglia task system...")
+                try:
+                    cls._basal_ganglia.shutdown()
+                except Exception as e:
+                    journaling_manager.recordError(f"Error shutting down BasalGanglia: {e}")
+                cls._basal_ganglia = None
+            
+            if cls._router is not None:
+                journaling_manager.recordInfo("Disconnecting routed devices...")
+                await cls._router.close()
+                cls._router = None
+            
             # Clean up transport
             if cls._transport:
                 journaling_manager.recordInfo(f"Cleaning up {cls._connection_type} transport...")
@@ -1687,7 +2371,7 @@ class NeurocorticalBridge:
         }
         
         # Log the command for debugging
-        journaling_manager.recordDebug(f"LLM setup command created: {json.dumps(setup_command)}")
+        journaling_manager.recordDebug(lambda: f"LLM setup command created: {json.dumps(setup_command)}")
         
         return setup_command
     
@@ -1748,7 +2432,7 @@ class NeurocorticalBridge:
             base_command["data"] = prompt
         
         # Log the final command structure for debugging
-        journaling_manager.recordDebug(f"Created command: {json.dumps(base_command)}")
+        journaling_manager.recordDebug(lambda: f"Created command: {json.dumps(base_command)}")
         
         return base_command
     
@@ -1769,6 +2453,8 @@ class NeurocorticalBridge:
         
         if should_print_debug:
             print(f"\n[NeurocorticalBridge._direct_reboot] ⚡ Creating reboot command...")
+        cls.invalidate_cache()
+        cls._session_pool.discard()
         
         try:
             # Create properly formatted reboot command per API spec
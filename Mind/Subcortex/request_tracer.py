@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Request Tracer:
+- Spans keyed by request_id for Mind, bridge, transport and render work
+- The current request travels with the asyncio context, so spans opened in
+  awaited coroutines and spawned tasks land on the same request
+- Finished spans go to a fixed-size ring buffer (old ones fall off)
+- Exportable as Chrome trace-event JSON (chrome://tracing, ui.perfetto.dev),
+  one track per request
+
+Usage:
+    with request_tracer.request("chat-turn"):
+        with request_tracer.span("Mind.think", "mind"):
+            ...
+    request_tracer.export_chrome_trace("logs/trace.json")
+"""
+
+import asyncio
+import contextvars
+import functools
+import itertools
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+_current_request = contextvars.ContextVar("trace_request", default=None)
+
+# Track name for spans recorded outside any request (connects, render loop)
+BACKGROUND = "background"
+
+
+def _now_us() -> float:
+    return time.perf_counter() * 1_000_000
+
+
+class RequestTracer:
+    """In-memory span recorder"""
+
+    def __init__(self, capacity: int = 8192, enabled: bool = True):
+        self.enabled = enabled
+        self._events = deque(maxlen=max(1, capacity))
+        self._ids = itertools.count(1)
+        self.last_request_id: Optional[str] = None
+
+    def current_request_id(self) -> Optional[str]:
+        return _current_request.get()
+
+    @contextmanager
+    def request(self, request_id: str = None, prefix: str = "req"):
+        """
+        Make spans inside the block belong to one request
+
+        Nested calls keep the outer request, so Mind.think and the bridge
+        call it makes share a track. Yields the active request_id.
+        """
+        active = _current_request.get()
+        if active is not None:
+            yield active
+            return
+        request_id = request_id or f"{prefix}-{next(self._ids)}"
+        self.last_request_id = str(request_id)
+        token = _current_request.set(str(request_id))
+        try:
+            yield str(request_id)
+        finally:
+            _current_request.reset(token)
+
+    @contextmanager
+    def span(self, name: str, category: str = "mind", **args: Any):
+        """
+        Time the body of a with block
+
+        Args passed as keywords (and any added to the yielded dict) are kept
+        with the span. Exceptions are recorded as args["error"].
+        """
+        if not self.enabled:
+            yield args
+            return
+        start = _now_us()
+        try:
+            yield args
+        except BaseException as e:
+            args["error"] = type(e).__name__
+            raise
+        finally:
+            self._events.append({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start,
+                "dur": _now_us() - start,
+                "request_id": _current_request.get() or BACKGROUND,
+                "args": args,
+            })
+
+    def instant(self, name: str, category: str = "mind", **args: Any) -> None:
+        """Record a point in time (e.g. first byte received)"""
+        if not self.enabled:
+            return
+        self._events.append({
+            "name": name,
+            "cat": category,
+            "ph": "i",
+            "ts": _now_us(),
+            "request_id": _current_request.get() or BACKGROUND,
+            "args": args,
+        })
+
+    def spans(self, request_id: str = None) -> List[Dict[str, Any]]:
+        """Recorded events, oldest first, optionally for one request only"""
+        events = list(self._events)
+        if request_id is None:
+            return events
+        return [event for event in events if event["request_id"] == request_id]
+
+    def breakdown(self, request_id: str) -> Dict[str, float]:
+        """Total milliseconds per span name for one request, longest first"""
+        totals: Dict[str, float] = {}
+        for event in self.spans(request_id):
+            if event["ph"] == "X":
+                totals[event["name"]] = totals.get(event["name"], 0.0) + event["dur"] / 1000
+        return {name: round(ms, 3) for name, ms in sorted(totals.items(), key=lambda item: -item[1])}
+
+    def clear(self) -> None:
+        self._events.clear()
+
+    def export_chrome_trace(self, path: str = None) -> Dict[str, Any]:
+        """
+        Build a Chrome trace-event document, one thread track per request
+
+        Args:
+            path: Also write the JSON to this file
+
+        Returns:
+            Dict with "traceEvents" ready for json.dump
+        """
+        pid = os.getpid()
+        tids: Dict[str, int] = {}
+        trace_events = []
+        for event in self._events:
+            tid = tids.setdefault(event["request_id"], len(tids) + 1)
+            exported = {key: value for key, value in event.items() if key != "request_id"}
+            exported.update(pid=pid, tid=tid, args=dict(event["args"], request_id=event["request_id"]))
+            if event["ph"] == "i":
+                exported["s"] = "t"
+            trace_events.append(exported)
+
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": request_id}}
+            for request_id, tid in tids.items()
+        ]
+        metadata.append({"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "PenphinMind"}})
+        document = {"traceEvents": metadata + trace_events, "displayTimeUnit": "ms"}
+
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(document, f, default=str)
+        return document
+
+
+# Shared tracer used by Mind, the bridge and the transports
+request_tracer = RequestTracer()
+
+
+def traced(name: str, category: str = "mind", request_prefix: str = None):
+    """
+    Decorator: run a function inside a span on the shared tracer
+
+    With request_prefix the call also starts a request when none is active,
+    so e.g. each Mind.think outside a chat turn gets its own track.
+    """
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if request_prefix is None:
+                    with request_tracer.span(name, category):
+                        return await func(*args, **kwargs)
+                with request_tracer.request(prefix=request_prefix), request_tracer.span(name, category):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with request_tracer.span(name, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
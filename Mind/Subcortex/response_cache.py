@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Response Cache:
+- Short-lived cache for idempotent device queries (lsmode, hwinfo, get_model)
+- Per-key time-to-live
+- Generation counter so a response that was in flight while the cache was
+  invalidated (model setup, reset, reboot) is never stored as fresh
+- Hit/miss counters for diagnostics
+"""
+
+import copy
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class ResponseCache:
+    """TTL cache keyed by operation name, or (operation, device) when routing"""
+
+    def __init__(self):
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Return a copy of the cached value, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if time.monotonic() < expires_at:
+                self.hits += 1
+                return copy.deepcopy(value)
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: Any, value: Any, ttl: float, generation: int = None) -> None:
+        """
+        Store value for ttl seconds
+
+        Args:
+            generation: The cache generation when the request was sent; if the
+                        cache was invalidated since then the value is dropped
+        """
+        if ttl <= 0 or (generation is not None and generation != self.generation):
+            return
+        self._entries[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+
+    def invalidate(self, key: Any = None) -> None:
+        """Drop one entry (and its per-device copies), or everything (and start a new generation) when key is None"""
+        if key is not None:
+            for cached_key in [k for k in self._entries if k == key or (isinstance(k, tuple) and k[0] == key)]:
+                del self._entries[cached_key]
+            return
+        self._entries.clear()
+        self.generation += 1
+        self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": len(self._entries),
+            "invalidations": self.invalidations,
+        }
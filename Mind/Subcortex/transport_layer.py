@@ -9,7 +9,6 @@ Transport Layer Abstraction:
 
 import asyncio
 import json
-import logging
 import os
 import platform
 import socket
@@ -17,23 +16,23 @@ import subprocess
 import time
 import traceback
 import re
+import signal
+import threading
+from collections import deque
 from typing import Dict, Any, List, Optional, Union
 import paramiko
 import serial
 import serial.tools.list_ports
 
 from config import CONFIG
-from Mind.FrontalLobe.PrefrontalCortex.system_journeling_manager import SystemJournelingManager
+from Mind.FrontalLobe.PrefrontalCortex.system_journeling_manager import SystemJournelingManager, SystemJournelingLevel
+from Mind.Subcortex.frame_decoder import NDJSONFrameDecoder, FrameTooLargeError
+from Mind.Subcortex.endpoint_discovery import EndpointCache, discover_endpoint, ping_endpoint, probe_endpoint
+from Mind.Subcortex.request_tracer import request_tracer, traced
 
 # Initialize journaling manager
 journaling_manager = SystemJournelingManager()
 
-# Add recordWarning method to match usage
-def recordWarning(self, message):
-    """Log a warning message"""
-    logging.warning(message)
-SystemJournelingManager.recordWarning = recordWarning
-
 # Add these at the module level, right after the imports and journaling manager
 _direct_adb_failed = False  # Flag to remember if direct ADB call has failed
 _adb_executable_path = None  # Cache the working executable path
@@ -84,6 +83,10 @@ class BaseTransport:
             data: JSON data as dict or string
             transport_type: Optional transport type identifier
         """
+        # Skip the formatting entirely unless DEBUG lines would be recorded
+        if not journaling_manager.isEnabledFor(SystemJournelingLevel.DEBUG):
+            return
+        
         if not transport_type:
             transport_type = self.__class__.__name__
         
@@ -112,6 +115,91 @@ class BaseTransport:
             journaling_manager.recordDebug(f"{arrow}{line}")
         journaling_manager.recordDebug("=" * len(header))
 
+class SerialIOEngine:
+    """
+    Dedicated reader thread for a serial connection
+    
+    Blocks in bulk reads (whatever is waiting, or one byte) instead of polling,
+    decodes JSON lines with the shared frame decoder and hands each complete
+    frame to the event loop with call_soon_threadsafe.
+    """
+    
+    def __init__(self, connection, on_frame, loop: asyncio.AbstractEventLoop = None, on_line=None):
+        """
+        Args:
+            connection: An open serial.Serial (or serial_for_url) instance
+            on_frame: Called with each decoded JSON frame
+            loop: Event loop to call on_frame in; None calls it on the reader thread
+            on_line: Called with raw bytes of non-JSON lines (shell echo and prompts)
+        """
+        self._connection = connection
+        self._on_frame = on_frame
+        self._on_line = on_line
+        self._loop = loop
+        self._decoder = NDJSONFrameDecoder(on_invalid=self._deliver_line)
+        self._thread = None
+        self._running = False
+        self.bytes_read = 0
+    
+    @property
+    def running(self) -> bool:
+        return self._running and self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> None:
+        """Start the reader thread"""
+        if self.running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._read_loop, name="SerialIOEngine", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the reader thread, interrupting a blocked read where supported"""
+        self._running = False
+        try:
+            if hasattr(self._connection, "cancel_read"):
+                self._connection.cancel_read()
+        except Exception as e:
+            journaling_manager.recordDebug(f"[SerialIOEngine] cancel_read failed: {e}")
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+    
+    def _read_loop(self) -> None:
+        while self._running:
+            try:
+                # Blocks until at least one byte arrives (or the port timeout expires)
+                data = self._connection.read(self._connection.in_waiting or 1)
+            except Exception as e:
+                if self._running:
+                    journaling_manager.recordError(f"[SerialIOEngine] Read error: {e}")
+                break
+            if not data:
+                continue
+            self.bytes_read += len(data)
+            try:
+                frames = self._decoder.feed(data)
+            except FrameTooLargeError as e:
+                journaling_manager.recordError(f"[SerialIOEngine] {e}")
+                continue
+            for frame in frames:
+                self._deliver(self._on_frame, frame)
+        self._running = False
+    
+    def _deliver_line(self, raw: bytes) -> None:
+        if self._on_line:
+            self._deliver(self._on_line, raw)
+    
+    def _deliver(self, callback, value) -> None:
+        if self._loop is None:
+            callback(value)
+            return
+        try:
+            self._loop.call_soon_threadsafe(callback, value)
+        except RuntimeError:
+            # Loop already closed - nobody is waiting any more
+            self._running = False
+
 class SerialTransport(BaseTransport):
     """Serial communication transport layer"""
     
@@ -122,6 +210,8 @@ class SerialTransport(BaseTransport):
         self.port = str(CONFIG.llm_service["port"])  # 10001
         self._tunnel_active = False
         self.serial_settings = CONFIG.serial_settings
+        self._io_engine = None
+        self._waiters = deque()  # Futures for in-flight commands, answered in order
     
     def is_available(self) -> bool:
         """Check if serial connection is available"""
@@ -248,6 +338,7 @@ class SerialTransport(BaseTransport):
             journaling_manager.recordError(f">>> STACK TRACE: {traceback.format_exc()}")
             return False
 
+    @traced("SerialTransport.connect", "transport")
     async def connect(self) -> bool:
         """Connect to serial and setup tunnel"""
         try:
@@ -275,6 +366,7 @@ class SerialTransport(BaseTransport):
                 journaling_manager.recordError(">>> FAILED TO SETUP TUNNEL")
                 return False
 
+            self._start_io_engine()
             self.endpoint = f"127.0.0.1:{self.port}"
             self.connected = True
             return True
@@ -303,37 +395,29 @@ class SerialTransport(BaseTransport):
             cmd = f"echo '{json_data.strip()}' | nc localhost {self.port}\n"
             journaling_manager.recordInfo(f">>> SENDING THROUGH TUNNEL: {cmd.strip()}")
             
-            self._serial_connection.write(cmd.encode())
-            self._serial_connection.flush()
-            
-            # Read response
-            buffer = ""
-            start_time = time.time()
+            if self._io_engine is None or not self._io_engine.running:
+                self._start_io_engine()
             
-            while (time.time() - start_time) < 5.0:
-                if self._serial_connection.in_waiting:
-                    char = self._serial_connection.read().decode()
-                    buffer += char
-                    journaling_manager.recordInfo(f">>> RECEIVED: {char!r}")
-                    
-                    if char == '\n':
-                        # Log the raw response before parsing
-                        journaling_manager.recordInfo("🔤 NETWORK RAW RESPONSE (SERIAL):")
-                        journaling_manager.recordInfo(f"  {buffer.strip()}")
-                        
-                        try:
-                            response = json.loads(buffer.strip())
-                            journaling_manager.recordInfo(f">>> VALID JSON: {response}")
-                            
-                            # Log the received response
-                            self._log_transport_json("RECEIVE", response, "SerialTransport")
-                            
-                            return response
-                        except json.JSONDecodeError:
-                            journaling_manager.recordInfo(f">>> INVALID JSON: {buffer.strip()!r}")
-                            buffer = ""
-                            continue
-                await asyncio.sleep(0.1)
+            # Register before writing so a fast reply can't be missed
+            response_future = asyncio.get_running_loop().create_future()
+            self._waiters.append(response_future)
+            try:
+                self._serial_connection.write(cmd.encode())
+                self._serial_connection.flush()
+                
+                # The reader thread resolves the future as soon as the JSON line is complete
+                response = await asyncio.wait_for(response_future, timeout=5.0)
+                journaling_manager.recordInfo(f">>> VALID JSON: {response}")
+                
+                # Log the received response
+                self._log_transport_json("RECEIVE", response, "SerialTransport")
+                
+                return response
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                if response_future in self._waiters:
+                    self._waiters.remove(response_future)
             
             journaling_manager.recordError(">>> NO RESPONSE (timeout)")
             raise CommandError("No valid response received")
@@ -342,9 +426,40 @@ class SerialTransport(BaseTransport):
             journaling_manager.recordError(f">>> TRANSMISSION ERROR: {e}")
             raise CommandError(f"Command transmission failed: {e}")
 
+    def _start_io_engine(self) -> None:
+        """Start the background reader that feeds responses to waiting commands"""
+        if self._io_engine is not None:
+            self._io_engine.stop()
+        self._io_engine = SerialIOEngine(
+            self._serial_connection,
+            self._on_serial_frame,
+            loop=asyncio.get_running_loop(),
+            on_line=lambda raw: journaling_manager.recordInfo(f">>> INVALID JSON: {raw.strip()!r}")
+        )
+        self._io_engine.start()
+    
+    def _on_serial_frame(self, frame: Any) -> None:
+        """Answer the oldest waiting command (runs on the event loop)"""
+        journaling_manager.recordInfo("🔤 NETWORK RAW RESPONSE (SERIAL):")
+        journaling_manager.recordInfo(lambda: f"  {json.dumps(frame)}")
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(frame)
+                return
+        journaling_manager.recordDebug(f">>> UNSOLICITED RESPONSE: {frame}")
+    
     async def disconnect(self) -> None:
         """Clean up tunnel and connection"""
         try:
+            if self._io_engine is not None:
+                self._io_engine.stop()
+                self._io_engine = None
+            for future in self._waiters:
+                if not future.done():
+                    future.set_exception(ConnectionError("Serial connection closed"))
+            self._waiters.clear()
+            
             if self._tunnel_active:
                 journaling_manager.recordInfo(">>> CLEANING UP TUNNEL")
                 self._serial_connection.write(b"pkill -f 'nc -l'\n")
@@ -359,11 +474,316 @@ class SerialTransport(BaseTransport):
         except Exception as e:
             journaling_manager.recordError(f">>> DISCONNECT ERROR: {e}")
 
+# How long a finished request's wire id keeps late frames from being misrouted
+RELEASED_ID_TTL = 60.0
+RELEASED_ID_LIMIT = 1024
+
+
+class DeviceSession:
+    """
+    Long-lived asyncio connection to a single device endpoint.
+
+    Many callers share one TCP connection. A background reader demultiplexes
+    the incoming JSON lines by request_id, resolving the future of a plain
+    request or feeding the queue of an active stream.
+    """
+
+    def __init__(self, ip: str, port: int, connect_timeout: float = 10.0):
+        self.ip = ip
+        self.port = int(port)
+        self.connect_timeout = connect_timeout
+        self.connections_opened = 0
+        self._reader = None
+        self._writer = None
+        self._reader_task = None
+        self._loop = None
+        self._connect_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._streams: Dict[str, asyncio.Queue] = {}
+        self._request_ids: Dict[str, str] = {}  # wire request_id -> caller request_id
+        # Recently finished wire ids -> release time; late frames carrying them
+        # (tail of a cancelled stream, reply after a timeout) are dropped
+        self._released: Dict[str, float] = {}
+        self._sequence = 0
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """Event loop the session is bound to (None until first open)"""
+        return self._loop
+
+    @property
+    def is_open(self) -> bool:
+        """Check if the underlying connection is usable"""
+        return (
+            self._writer is not None
+            and not self._writer.is_closing()
+            and self._reader_task is not None
+            and not self._reader_task.done()
+        )
+
+    async def open(self) -> None:
+        """Open the connection if it is not already open"""
+        if self.is_open:
+            return
+        async with self._connect_lock:
+            if self.is_open:
+                return
+            journaling_manager.recordInfo(f"[DeviceSession] 🔌 Opening persistent connection to {self.ip}:{self.port}")
+            with request_tracer.span("transport.connect", "transport", endpoint=f"{self.ip}:{self.port}"):
+                self._reader, self._writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.ip, self.port),
+                    timeout=self.connect_timeout
+                )
+            self._loop = asyncio.get_running_loop()
+            self.connections_opened += 1
+            self._reader_task = asyncio.create_task(self._read_loop())
+
+    async def close(self) -> None:
+        """Close the connection and fail anything still waiting on it"""
+        if self._reader_task is not None and not self._reader_task.done():
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._reader_task = None
+        self._close_writer()
+        self._fail_outstanding("Session closed")
+
+    async def request(self, command: Dict[str, Any], timeout: float = 15.0) -> Dict[str, Any]:
+        """
+        Send a command and wait for the response carrying its request_id
+
+        Raises:
+            asyncio.TimeoutError: If no response arrives in time
+            ConnectionError: If the connection drops while waiting
+        """
+        await self.open()
+        wire_id = self._claim_request_id(command)
+        future = self._loop.create_future()
+        self._pending[wire_id] = future
+        try:
+            with request_tracer.span("transport.send", "transport", request_id=wire_id):
+                await self._send(command, wire_id)
+            response = await asyncio.wait_for(future, timeout)
+            request_tracer.instant("transport.first_byte", "transport", request_id=wire_id)
+            return response
+        finally:
+            self._pending.pop(wire_id, None)
+            self._release(wire_id)
+
+    async def stream(self, command: Dict[str, Any], callback, idle_timeout: float = 20.0) -> int:
+        """
+        Send a command and feed every chunk tagged with its request_id to callback
+
+        The stream ends on a finish flag, an error response or when no chunk
+        arrives for idle_timeout seconds.
+
+        Returns:
+            int: Number of chunks passed to the callback
+        """
+        await self.open()
+        wire_id = self._claim_request_id(command)
+        queue = asyncio.Queue()
+        self._streams[wire_id] = queue
+        chunks = 0
+        try:
+            with request_tracer.span("transport.send", "transport", request_id=wire_id):
+                await self._send(command, wire_id)
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), idle_timeout)
+                except asyncio.TimeoutError:
+                    journaling_manager.recordWarning(f"Stream timeout after {idle_timeout:.1f}s without data")
+                    break
+                if isinstance(message, Exception):
+                    raise message
+                chunks += 1
+                if chunks == 1:
+                    request_tracer.instant("transport.first_byte", "transport", request_id=wire_id)
+                await callback(message)
+                if self._is_final_chunk(message):
+                    request_tracer.instant("transport.last_byte", "transport", request_id=wire_id, chunks=chunks)
+                    break
+        finally:
+            self._streams.pop(wire_id, None)
+            self._release(wire_id)
+        return chunks
+
+    def _claim_request_id(self, command: Dict[str, Any]) -> str:
+        """Reserve a unique on-the-wire request_id for a command"""
+        caller_id = str(command.get("request_id") or "")
+        wire_id = caller_id
+        # Callers often reuse ids ("001", whole-second timestamps), so suffix
+        # any id that is in flight or was released too recently to reuse
+        self._expire_released()
+        while not wire_id or wire_id in self._request_ids or wire_id in self._released:
+            self._sequence += 1
+            wire_id = f"{caller_id or 'req'}-{self._sequence}"
+        self._request_ids[wire_id] = caller_id
+        return wire_id
+
+    def _release(self, wire_id: str) -> None:
+        """Stop routing a wire id, remembering it for RELEASED_ID_TTL seconds"""
+        if self._request_ids.pop(wire_id, None) is not None:
+            self._released[wire_id] = time.monotonic()
+            self._expire_released()
+    
+    def _expire_released(self) -> None:
+        cutoff = time.monotonic() - RELEASED_ID_TTL
+        # Insertion order is release order, so expired ids are at the front
+        while self._released:
+            oldest, released_at = next(iter(self._released.items()))
+            if released_at > cutoff and len(self._released) <= RELEASED_ID_LIMIT:
+                break
+            del self._released[oldest]
+    
+    async def _send(self, command: Dict[str, Any], wire_id: str) -> None:
+        """Write a single JSON line to the device"""
+        payload = dict(command)
+        payload["request_id"] = wire_id
+        data = (json.dumps(payload) + "\n").encode()
+        async with self._write_lock:
+            if self._writer is None or self._writer.is_closing():
+                raise ConnectionError(f"Connection to {self.ip}:{self.port} is closed")
+            self._writer.write(data)
+            await self._writer.drain()
+
+    async def _read_loop(self) -> None:
+        """Read JSON lines from the device and route them to waiters"""
+        reason = "Connection closed by device"
+        decoder = NDJSONFrameDecoder(on_invalid=lambda raw: journaling_manager.recordError(
+            f"[DeviceSession] Failed to parse response as JSON: {raw[:200]!r}"
+        ))
+        try:
+            while True:
+                data = await self._reader.read(64 * 1024)
+                if not data:
+                    break
+                try:
+                    messages = decoder.feed(data)
+                except FrameTooLargeError as e:
+                    journaling_manager.recordError(f"[DeviceSession] {e}")
+                    continue
+                for message in messages:
+                    self._dispatch(message)
+        except asyncio.CancelledError:
+            reason = "Session closed"
+            raise
+        except Exception as e:
+            reason = f"Connection error: {e}"
+            journaling_manager.recordError(f"[DeviceSession] Reader error on {self.ip}:{self.port}: {e}")
+        finally:
+            self._close_writer()
+            self._fail_outstanding(reason)
+
+    def _dispatch(self, message: Any) -> None:
+        """Deliver a response to the request or stream that owns it"""
+        wire_id = str(message.get("request_id") or "") if isinstance(message, dict) else ""
+        if wire_id not in self._request_ids:
+            if wire_id in self._released:
+                journaling_manager.recordDebug(f"[DeviceSession] Dropping late frame for finished request {wire_id}")
+                return
+            # A frame without any request_id goes to the only outstanding
+            # request when that is unambiguous; unknown ids are never guessed
+            if wire_id or len(self._request_ids) != 1:
+                journaling_manager.recordDebug(f"[DeviceSession] Dropping unmatched response: {str(message)[:200]}")
+                return
+            wire_id = next(iter(self._request_ids))
+
+        caller_id = self._request_ids[wire_id]
+        if isinstance(message, dict) and caller_id and caller_id != wire_id:
+            message = dict(message, request_id=caller_id)
+
+        if wire_id in self._streams:
+            self._streams[wire_id].put_nowait(message)
+            return
+        future = self._pending.get(wire_id)
+        if future is not None and not future.done():
+            future.set_result(message)
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            except Exception:
+                pass
+        self._writer = None
+
+    def _fail_outstanding(self, reason: str) -> None:
+        """Fail every waiter so no caller hangs on a dead connection"""
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError(reason))
+        for queue in self._streams.values():
+            queue.put_nowait(ConnectionError(reason))
+
+    @staticmethod
+    def _is_final_chunk(message: Any) -> bool:
+        """Check if a streamed message ends the stream"""
+        if not isinstance(message, dict):
+            return False
+        data = message.get("data")
+        if isinstance(data, dict) and data.get("finish", False):
+            return True
+        # A plain string reply means the model answered without streaming
+        if isinstance(data, str) and data:
+            return True
+        error = message.get("error")
+        return isinstance(error, dict) and error.get("code", 0) != 0
+
+
+# One shared session per (ip, port) so every transport instance for a device
+# reuses the same connection
+_device_sessions: Dict[tuple, DeviceSession] = {}
+
+
+def get_device_session(ip: str, port: int) -> DeviceSession:
+    """Get the shared session for a device, creating it for the running loop if needed"""
+    key = (ip, int(port))
+    session = _device_sessions.get(key)
+    if session is None or (session.loop is not None and session.loop is not asyncio.get_running_loop()):
+        session = DeviceSession(ip, port)
+        _device_sessions[key] = session
+    return session
+
+
+def _parse_command(command: Union[Dict[str, Any], str]) -> Dict[str, Any]:
+    """Normalise a command given as dict or JSON string into a dict"""
+    if isinstance(command, dict):
+        return command
+    return json.loads(command.strip())
+
+
+def _json_preview(value: Any, limit: int = 200) -> str:
+    """JSON for a log line, cut to limit characters"""
+    text = json.dumps(value)
+    return text if len(text) <= limit else text[:limit] + "..."
+
 class WiFiTransport(BaseTransport):
     """TCP communication transport layer"""
     
-    def __init__(self, ip=None, port=None, timeout=10):
+    # Common LLM device endpoints to try when the configured ones don't answer
+    COMMON_ENDPOINTS = [
+        ("192.168.1.100", 10001),  # Common IP for M5Stack
+        ("192.168.1.101", 10001),
+        ("10.0.0.82", 10001),
+        ("192.168.0.100", 10001),
+        ("192.168.0.101", 10001),
+        ("127.0.0.1", 10001),      # Localhost - useful if port forwarding is used
+    ]
+    
+    def __init__(self, ip=None, port=None, timeout=10, discover=True):
         super().__init__()
+        self._endpoint_cache = EndpointCache()
+        self._discover_on_connect = False
+        # False keeps connect() on the configured endpoint (one transport per device)
+        self.discover = discover
+        # A concrete ip/port handed in by the caller is never swapped for a discovered one
+        self._explicit_endpoint = (
+            ip is not None and port is not None and str(ip).lower() != "auto" and str(port).lower() != "auto"
+        )
         
         # Use provided connection parameters or get from mind-specific configuration
         if ip is not None and port is not None:
@@ -397,18 +817,16 @@ class WiFiTransport(BaseTransport):
                 journaling_manager.recordWarning("Using default connection settings")
                 journaling_manager.recordWarning(f"IP: {self.ip}, Port: {self.port}, Timeout: {self.timeout}")
         
-        # Handle 'auto' values
+        # Handle 'auto' values - probing happens concurrently in connect(), not here
         if self.ip == "auto" or str(self.ip).lower() == "auto":
-            journaling_manager.recordInfo("IP set to 'auto', trying to discover a valid IP address")
-            # Try common local IPs
-            discovered_ip = self._discover_local_ip()
-            if discovered_ip:
-                journaling_manager.recordInfo(f"Discovered IP: {discovered_ip}")
-                self.ip = discovered_ip
+            cached = self._endpoint_cache.load()
+            if cached:
+                journaling_manager.recordInfo(f"IP set to 'auto', starting from last working endpoint {cached[0]}")
+                self.ip = cached[0]
             else:
-                # Fallback to localhost
-                journaling_manager.recordInfo("Failed to discover IP, falling back to localhost")
+                journaling_manager.recordInfo("IP set to 'auto', will discover a valid IP address on connect")
                 self.ip = "127.0.0.1"
+                self._discover_on_connect = True
         
         if self.port == "auto" or str(self.port).lower() == "auto":
             journaling_manager.recordInfo("Port set to 'auto', using default port 10001")
@@ -421,76 +839,25 @@ class WiFiTransport(BaseTransport):
                 journaling_manager.recordWarning(f"Invalid port value: {self.port}, using default 10001")
                 self.port = 10001
     
-    def _discover_local_ip(self):
-        """Attempt to discover a valid IP address for the LLM service"""
-        journaling_manager.recordInfo("Attempting to discover a valid IP address...")
-        
-        # First, collect all IPs from minds_config.json
+    def _candidate_endpoints(self) -> List[tuple]:
+        """Endpoints worth probing: every mind in minds_config.json, then common device IPs"""
+        candidates = []
         try:
             from Mind.mind_config import load_minds_config
-            minds_config = load_minds_config()
-            minds = minds_config.get("minds", {})
-            
-            config_ips = []
-            # Collect IPs from all minds in config
+            minds = load_minds_config().get("minds", {})
             for mind_id, mind_data in minds.items():
                 connection = mind_data.get("connection", {})
                 ip = connection.get("ip")
+                port = connection.get("port", self.port)
                 if ip and ip != "auto":
-                    config_ips.append(ip)
-                    journaling_manager.recordInfo(f"Found IP in minds_config.json: {ip} (from mind: {mind_id})")
-            
-            # Try each IP from the config first
-            for ip in config_ips:
-                try:
-                    journaling_manager.recordInfo(f"Trying IP from minds_config.json: {ip}")
-                    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                        s.settimeout(1.0)  # Quick timeout for checking
-                        result = s.connect_ex((ip, self.port))
-                        if result == 0:
-                            journaling_manager.recordInfo(f"Successfully connected to {ip}:{self.port}")
-                            return ip
-                except Exception as e:
-                    journaling_manager.recordWarning(f"Error checking {ip}: {e}")
-        
-        except Exception as e:
-            journaling_manager.recordWarning(f"Error getting IPs from minds_config.json: {e}")
-        
-        # List of common local IPs to try as fallback
-        common_ips = [
-            "192.168.1.100",  # Common IP for M5Stack
-            "192.168.1.101",
-            "10.0.0.82",
-            "192.168.0.100", 
-            "192.168.0.101"
-        ]
-        
-        # Try to connect to each IP with the port
-        journaling_manager.recordInfo("Trying common IPs as fallback...")
-        for ip in common_ips:
-            try:
-                journaling_manager.recordInfo(f"Trying common IP: {ip}")
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.settimeout(1.0)  # Quick timeout for checking
-                    result = s.connect_ex((ip, self.port))
-                    if result == 0:
-                        journaling_manager.recordInfo(f"Successfully connected to {ip}:{self.port}")
-                        return ip
-            except Exception as e:
-                journaling_manager.recordWarning(f"Error checking {ip}: {e}")
-        
-        # Try to get local IP addresses
-        try:
-            import socket
-            hostname = socket.gethostname()
-            local_ip = socket.gethostbyname(hostname)
-            journaling_manager.recordInfo(f"Local hostname: {hostname}, IP: {local_ip}")
-            if local_ip != "127.0.0.1":
-                return local_ip
+                    port = self.port if port == "auto" else int(port)
+                    candidates.append((ip, port))
+                    journaling_manager.recordInfo(f"Found device in minds_config.json: {ip}:{port} (from mind: {mind_id})")
         except Exception as e:
-            journaling_manager.recordWarning(f"Error getting local IP: {e}")
+            journaling_manager.recordWarning(f"Error getting devices from minds_config.json: {e}")
         
-        return None
+        candidates.extend(self.COMMON_ENDPOINTS)
+        return candidates
     
     def is_available(self) -> bool:
         """Check if TCP connection is available"""
@@ -501,100 +868,65 @@ class WiFiTransport(BaseTransport):
         except Exception:
             return False
     
+    @traced("WiFiTransport.connect", "transport")
     async def connect(self) -> bool:
-        """Find LLM service port and connect with IP discovery"""
+        """
+        Find LLM service port and connect with IP discovery
+        
+        The configured endpoint is probed first, then the remembered one; other
+        minds' devices and common endpoints are only raced once both fail, so a
+        mind doesn't end up on another mind's device that happened to answer
+        faster. An ip/port passed to the constructor is never replaced.
+        Discovered endpoints are remembered for next startup.
+        """
         try:
+            if self.discover and not self._explicit_endpoint:
+                winner = await self._find_endpoint()
+                if winner:
+                    self.ip, self.port = winner
+                else:
+                    print(f"❌ No endpoint answered, last tried {self.ip}:{self.port}")
+                    return await self._try_adb_discovery()
+            
             # Show clearly what IP we're trying to connect to
             journaling_manager.recordInfo(f"🔌 Attempting TCP connection to {self.ip}:{self.port}...")
             print(f"\n🔌 Attempting TCP connection to {self.ip}:{self.port}...")
             
             # Try direct connection with current IP
             initial_connection = False
-            try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.settimeout(5.0)  # Increased timeout for more reliability
-                    journaling_manager.recordInfo(f"Testing socket connection to {self.ip}:{self.port}...")
-                    s.connect((self.ip, self.port))
-                    
-                    # Try a ping to verify LLM service using exact API format
-                    ping_command = {
-                        "request_id": "001",  # Use consistent ID from API spec 
-                        "work_id": "sys",     # Exact format from API spec
-                        "action": "ping"      # Simple ping operation
-                    }
-                    
-                    # Log the ping command
-                    journaling_manager.recordInfo(f"Sending ping command: {json.dumps(ping_command)}")
-                    
-                    # Send ping with newline terminator
-                    json_data = json.dumps(ping_command) + "\n"
-                    s.sendall(json_data.encode())
-                    
-                    # Read response in a more robust way - accumulate all data until timeout
-                    buffer = bytearray()
-                    s.settimeout(5.0)
+            journaling_manager.recordInfo(f"Testing connection to {self.ip}:{self.port}...")
+            response_data = await self._ping_endpoint(self.ip, self.port, timeout=5.0)
+            
+            if response_data is not None:
+                journaling_manager.recordInfo(f"Parsed JSON response: {json.dumps(response_data, indent=2)}")
+                
+                # Check for success in error code
+                if "error" in response_data and isinstance(response_data["error"], dict):
+                    error_code = response_data["error"].get("code", -1)
                     
-                    try:
-                        while True:
-                            chunk = s.recv(4096)
-                            if not chunk:
-                                break
-                            buffer.extend(chunk)
-                            if b'\n' in chunk:  # Stop at newline
-                                break
-                    except socket.timeout:
-                        # Timeout is ok if we got any data
-                        if buffer:
-                            journaling_manager.recordInfo("Socket timeout but received data")
-                        else:
-                            journaling_manager.recordInfo("Socket timeout with no data")
-                            
-                    # Parse response if we have any data
-                    if buffer:
-                        response_str = buffer.decode().strip()
-                        journaling_manager.recordInfo(f"Received raw response: {response_str}")
+                    if error_code == 0:
+                        # Success! Connection established
+                        initial_connection = True
+                        self.endpoint = f"{self.ip}:{self.port}"
+                        self.connected = True
+                        journaling_manager.recordInfo(f"✅ TCP connection to {self.ip}:{self.port} successful!")
+                        print(f"✅ TCP connection to {self.ip}:{self.port} successful!")
                         
-                        try:
-                            response_data = json.loads(response_str)
-                            journaling_manager.recordInfo(f"Parsed JSON response: {json.dumps(response_data, indent=2)}")
-                            
-                            # Check for success in error code
-                            if "error" in response_data and isinstance(response_data["error"], dict):
-                                error_code = response_data["error"].get("code", -1)
-                                
-                                if error_code == 0:
-                                    # Success! Connection established
-                                    initial_connection = True
-                                    self.endpoint = f"{self.ip}:{self.port}"
-                                    self.connected = True
-                                    journaling_manager.recordInfo(f"✅ TCP connection to {self.ip}:{self.port} successful!")
-                                    print(f"✅ TCP connection to {self.ip}:{self.port} successful!")
-                                    
-                                    # Try to update the mind config with this successful IP and port
-                                    self._update_mind_config_with_connection()
-                            
-                                    return True
-                                else:
-                                    journaling_manager.recordError(f"Ping error code {error_code}: {response_data['error'].get('message', 'Unknown error')}")
-                            else:
-                                journaling_manager.recordError(f"Unexpected response format - missing error field: {response_data}")
-                        except json.JSONDecodeError:
-                            journaling_manager.recordError(f"Failed to parse response as JSON: {response_str!r}")
+                        # Try to update the mind config with this successful IP and port
+                        self._update_mind_config_with_connection()
+                        if self.discover and not self._explicit_endpoint:
+                            self._endpoint_cache.save(self.ip, self.port)
+                
+                        return True
                     else:
-                        journaling_manager.recordError("Empty response from ping")
-                        
-            except socket.timeout:
-                journaling_manager.recordError(f"Socket timeout connecting to {self.ip}:{self.port}")
-                print(f"❌ Socket timeout connecting to {self.ip}:{self.port}")
-            except socket.error as e:
-                journaling_manager.recordError(f"Socket error connecting to {self.ip}:{self.port}: {e}")
-                print(f"❌ Socket error connecting to {self.ip}:{self.port}: {e}")
-            except Exception as e:
-                journaling_manager.recordError(f"Error establishing TCP connection: {e}")
-                print(f"❌ Error establishing TCP connection: {e}")
+                        journaling_manager.recordError(f"Ping error code {error_code}: {response_data['error'].get('message', 'Unknown error')}")
+                else:
+                    journaling_manager.recordError(f"Unexpected response format - missing error field: {response_data}")
+            else:
+                print(f"❌ No ping response from {self.ip}:{self.port}")
                 
             # If the initial connection failed, try alternatives from known_devices list
-            if not initial_connection:
+            if not initial_connection and self.discover and not self._explicit_endpoint:
                 return await self._try_alternative_connections()
             
             return False
@@ -604,6 +936,47 @@ class WiFiTransport(BaseTransport):
             import traceback
             journaling_manager.recordError(f"Connection error trace: {traceback.format_exc()}")
             return False
+    
+    async def _find_endpoint(self) -> Optional[tuple]:
+        """Configured endpoint, else the remembered one, else the first other candidate to answer"""
+        timeout = CONFIG.discovery["probe_timeout"]
+        if self._discover_on_connect:
+            # 'auto' with nothing remembered has no configured endpoint worth probing first
+            self._discover_on_connect = False
+            return await discover_endpoint(self._candidate_endpoints(), self.port, self._endpoint_cache)
+        
+        configured = (self.ip, int(self.port))
+        if await probe_endpoint(configured[0], configured[1], timeout):
+            return configured
+        cached = self._endpoint_cache.load()
+        if cached and cached != configured and await probe_endpoint(cached[0], cached[1], timeout):
+            journaling_manager.recordInfo(f"Configured endpoint {configured[0]}:{configured[1]} is silent, using remembered {cached[0]}:{cached[1]}")
+            return cached
+        
+        others = [endpoint for endpoint in self._candidate_endpoints() if endpoint not in (configured, cached)]
+        return await discover_endpoint(others, self.port, self._endpoint_cache, use_cache=False)
+
+    async def _ping_endpoint(self, ip: str, port: int, timeout: float = 3.0) -> Optional[Dict[str, Any]]:
+        """
+        Ping an endpoint on a short-lived connection of its own
+        
+        The shared session for the endpoint is left alone, so a failed ping
+        cannot fail requests or streams already running on it.
+        
+        Returns:
+            Dict: The ping response, or None if the endpoint did not answer
+        """
+        ping_command = {
+            "request_id": "001",  # Use consistent ID from API spec 
+            "work_id": "sys",     # Exact format from API spec
+            "action": "ping"      # Simple ping operation
+        }
+        journaling_manager.recordInfo(f"Sending ping command to {ip}:{port}: {json.dumps(ping_command)}")
+        
+        response = await ping_endpoint(ip, port, timeout, ping_command)
+        if response is None:
+            journaling_manager.recordError(f"No ping response from {ip}:{port} within {timeout}s")
+        return response
 
     def _update_mind_config_with_connection(self):
         """Update the mind configuration with successful connection details"""
@@ -633,144 +1006,21 @@ class WiFiTransport(BaseTransport):
         """Try alternative connection methods if initial connection failed"""
         journaling_manager.recordInfo("Initial connection failed, trying alternative methods...")
         
-        # First, try IPs from minds_config.json
+        # Race every known endpoint (minds_config.json, then common device IPs) at once
+        candidates = [endpoint for endpoint in self._candidate_endpoints() if endpoint != (self.ip, self.port)]
+        print(f"🔄 Probing {len(candidates)} alternative endpoints...")
         try:
-            from Mind.mind_config import load_minds_config
-            minds_config = load_minds_config()
-            minds = minds_config.get("minds", {})
-            
-            # Create device list from minds_config.json
-            config_devices = []
-            for mind_id, mind_data in minds.items():
-                connection = mind_data.get("connection", {})
-                ip = connection.get("ip")
-                port = connection.get("port")
-                
-                # Only add non-auto values
-                if ip and ip != "auto" and port and port != "auto":
-                    device = {"ip": ip, "port": int(port) if isinstance(port, str) else port}
-                    config_devices.append(device)
-                    journaling_manager.recordInfo(f"Found device in minds_config.json: {ip}:{port} (from mind: {mind_id})")
-            
-            # Try each device from config first
-            for device in config_devices:
-                # Skip if we already tried this IP/port
-                if device["ip"] == self.ip and device["port"] == self.port:
-                    continue
-                    
-                try:
-                    journaling_manager.recordInfo(f"Trying alternative connection from config: {device['ip']}:{device['port']}...")
-                    print(f"🔄 Trying alternative connection from config: {device['ip']}:{device['port']}...")
-                    
-                    # Update IP and port
-                    self.ip = device["ip"]
-                    self.port = device["port"]
-                    
-                    # Try to connect
-                    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                        s.settimeout(2.0)  # Quick timeout for alternatives
-                        result = s.connect_ex((self.ip, self.port))
-                        if result == 0:
-                            journaling_manager.recordInfo(f"Alternative connection successful to {self.ip}:{self.port}")
-                            print(f"✅ Alternative connection successful to {self.ip}:{self.port}")
-                        
-                            # Send ping to verify
-                            ping_command = {"request_id": "001", "work_id": "sys", "action": "ping"}
-                            json_data = json.dumps(ping_command) + "\n"
-                            s.sendall(json_data.encode())
-                            
-                            # Read response
-                            buffer = bytearray()
-                            s.settimeout(3.0)
-                            try:
-                                while True:
-                                    chunk = s.recv(4096)
-                                    if not chunk:
-                                        break
-                                    buffer.extend(chunk)
-                                    if b'\n' in chunk:
-                                        break
-                            except socket.timeout:
-                                pass
-                            
-                            # Check if we got a valid response
-                            if buffer:
-                                self.endpoint = f"{self.ip}:{self.port}"
-                                self.connected = True
-                                
-                                # Try to update the mind config with this successful IP and port
-                                self._update_mind_config_with_connection()
-                                
-                                return True
-                except Exception as e:
-                    journaling_manager.recordWarning(f"Alternative connection error: {e}")
+            winner = await discover_endpoint(candidates, self.port, self._endpoint_cache)
+            if winner and await self._try_alternative_device({"ip": winner[0], "port": winner[1]}):
+                return True
         except Exception as e:
-            journaling_manager.recordWarning(f"Error getting devices from minds_config.json: {e}")
-        
-        # List of common LLM device IPs to try as fallback
-        known_devices = [
-            {"ip": "192.168.1.100", "port": 10001},  # Common IP for M5Stack
-            {"ip": "192.168.1.101", "port": 10001},
-            {"ip": "10.0.0.82", "port": 10001},
-            {"ip": "192.168.0.100", "port": 10001},
-            {"ip": "127.0.0.1", "port": 10001},      # Localhost - useful if port forwarding is used
-        ]
-        
-        # Try each known device
-        journaling_manager.recordInfo("Trying common devices as fallback...")
-        for device in known_devices:
-            # Skip if we already tried this IP/port
-            if device["ip"] == self.ip and device["port"] == self.port:
-                continue
-            
-            try:
-                journaling_manager.recordInfo(f"Trying common device: {device['ip']}:{device['port']}...")
-                print(f"🔄 Trying alternative connection: {device['ip']}:{device['port']}...")
-                
-                # Update IP and port
-                self.ip = device["ip"]
-                self.port = device["port"]
-                
-                # Try to connect
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.settimeout(2.0)  # Quick timeout for alternatives
-                    result = s.connect_ex((self.ip, self.port))
-                    if result == 0:
-                        journaling_manager.recordInfo(f"Alternative connection successful to {self.ip}:{self.port}")
-                        print(f"✅ Alternative connection successful to {self.ip}:{self.port}")
-                        
-                        # Send ping to verify
-                        ping_command = {"request_id": "001", "work_id": "sys", "action": "ping"}
-                        json_data = json.dumps(ping_command) + "\n"
-                        s.sendall(json_data.encode())
-                        
-                        # Read response
-                        buffer = bytearray()
-                        s.settimeout(3.0)
-                        try:
-                            while True:
-                                chunk = s.recv(4096)
-                                if not chunk:
-                                    break
-                                buffer.extend(chunk)
-                                if b'\n' in chunk:
-                                    break
-                        except socket.timeout:
-                            pass
-                        
-                        # Check if we got a valid response
-                        if buffer:
-                            self.endpoint = f"{self.ip}:{self.port}"
-                            self.connected = True
-                        
-                            # Try to update the mind config with this successful IP and port
-                            self._update_mind_config_with_connection()
-                            
-                            return True
-            except Exception as e:
-                journaling_manager.recordWarning(f"Alternative connection error: {e}")
+            journaling_manager.recordWarning(f"Endpoint discovery error: {e}")
         
         # If all alternatives fail, try ADB IP discovery if appropriate
+        return await self._try_adb_discovery()
+    
+    async def _try_adb_discovery(self) -> bool:
+        """Last resort: ask the device for its IP over ADB and connect to that"""
         try:
             # Check if adb is available
             import shutil
@@ -778,31 +1028,45 @@ class WiFiTransport(BaseTransport):
                 journaling_manager.recordInfo("Trying ADB for IP discovery...")
                 print("🔄 Trying ADB for IP discovery...")
                 
-                ip_from_adb = self._get_ip_from_adb()
+                # ADB shells out and waits, so keep it off the event loop
+                ip_from_adb = await asyncio.to_thread(self._get_ip_from_adb)
                 if ip_from_adb:
-                    self.ip = ip_from_adb
-                    journaling_manager.recordInfo(f"Using ADB-discovered IP: {self.ip}")
-                    print(f"🔍 Using ADB-discovered IP: {self.ip}")
+                    journaling_manager.recordInfo(f"Using ADB-discovered IP: {ip_from_adb}")
+                    print(f"🔍 Using ADB-discovered IP: {ip_from_adb}")
                     
                     # Try connecting with the new IP
-                    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                        s.settimeout(3.0)
-                        result = s.connect_ex((self.ip, self.port))
-                        if result == 0:
-                            self.endpoint = f"{self.ip}:{self.port}"
-                            self.connected = True
-                            
-                            # Try to update the mind config with this successful IP and port
-                            self._update_mind_config_with_connection()
-                            
-                            return True
+                    if await self._try_alternative_device({"ip": ip_from_adb, "port": self.port}):
+                        return True
         except Exception as e:
             journaling_manager.recordWarning(f"ADB discovery error: {e}")
         
-            # All connection attempts failed
-            journaling_manager.recordError("All connection attempts failed")
-            print("❌ All connection attempts failed")
-            self.connected = False
+        # All connection attempts failed
+        journaling_manager.recordError("All connection attempts failed")
+        print("❌ All connection attempts failed")
+        self.connected = False
+        return False
+    
+    async def _try_alternative_device(self, device: Dict[str, Any]) -> bool:
+        """Ping an alternative device and adopt it as the endpoint if it answers"""
+        try:
+            response_data = await self._ping_endpoint(device["ip"], device["port"], timeout=3.0)
+            if response_data is None:
+                return False
+            
+            # Update IP and port
+            self.ip = device["ip"]
+            self.port = device["port"]
+            self.endpoint = f"{self.ip}:{self.port}"
+            self.connected = True
+            journaling_manager.recordInfo(f"Alternative connection successful to {self.ip}:{self.port}")
+            print(f"✅ Alternative connection successful to {self.ip}:{self.port}")
+            
+            # Remember it for next startup and update the mind config
+            self._endpoint_cache.save(self.ip, self.port)
+            self._update_mind_config_with_connection()
+            return True
+        except Exception as e:
+            journaling_manager.recordWarning(f"Alternative connection error: {e}")
             return False
     
     async def _discover_ip_via_adb(self) -> Optional[str]:
@@ -874,127 +1138,87 @@ class WiFiTransport(BaseTransport):
             if 'adb_transport' in locals() and adb_transport:
                 await adb_transport.disconnect()
     
+    def _get_session(self) -> DeviceSession:
+        """Get the persistent session for the current endpoint"""
+        return get_device_session(self.ip, self.port)
+    
+    async def _ensure_connected(self, purpose: str) -> Optional[Dict[str, Any]]:
+        """Reconnect if needed, returning an error response on failure"""
+        if self.connected:
+            return None
+        journaling_manager.recordError(f"Attempting to {purpose} but not connected")
+        try:
+            # Attempt to reconnect
+            if await self.connect():
+                return None
+            return {
+                "error": {
+                    "code": -1,
+                    "message": f"Failed to connect for {purpose}"
+                }
+            }
+        except Exception as e:
+            journaling_manager.recordError(f"Error reconnecting for {purpose}: {e}")
+            return {
+                "error": {
+                    "code": -1,
+                    "message": f"Reconnection error: {str(e)}"
+                }
+            }
+    
     async def disconnect(self) -> None:
         """Close TCP connection"""
-        # Socket connections are closed after each transmission
+        session = _device_sessions.get((self.ip, self.port))
+        if session is not None:
+            await session.close()
         self.connected = False
         journaling_manager.recordInfo("TCP connection closed")
     
     async def transmit(self, command: Union[Dict[str, Any], str]) -> Dict[str, Any]:
-        """Transmit command to device over TCP and get response"""
-        if not self.connected:
-            journaling_manager.recordError("Attempting to transmit but not connected")
-            try:
-                # Attempt to reconnect
-                reconnect_result = await self.connect()
-                if not reconnect_result:
-                    return {
-                        "error": {
-                            "code": -1,
-                            "message": "Failed to connect for transmission"
-                        }
-                    }
-            except Exception as e:
-                journaling_manager.recordError(f"Error reconnecting for transmission: {e}")
-                return {
-                    "error": {
-                        "code": -1,
-                        "message": f"Reconnection error: {str(e)}"
-                    }
-                }
+        """Transmit command to device over the shared TCP session and get response"""
+        error_response = await self._ensure_connected("transmission")
+        if error_response:
+            return error_response
         
         try:
-            # Convert command to string if it's a dict
-            if isinstance(command, dict):
-                command_str = json.dumps(command) + "\n"
-            else:
-                # Ensure string command ends with newline
-                command_str = command if command.endswith("\n") else command + "\n"
+            command_data = _parse_command(command)
             
             # Debug log showing truncated command
-            cmd_log = command_str[:200] + "..." if len(command_str) > 200 else command_str
-            journaling_manager.recordInfo(f"📤 Transmitting: {cmd_log}")
+            journaling_manager.recordInfo(lambda: f"📤 Transmitting: {_json_preview(command_data)}")
             
-            # Create fresh socket for this transmission
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(10.0)  # Longer timeout for potentially complex operations
-                
-                # Connect and send
-                try:
-                    ip, port = self.ip, self.port
-                    journaling_manager.recordInfo(f"Connecting to {ip}:{port} for transmission")
-                    s.connect((ip, port))
-                    
-                    # Send command
-                    s.sendall(command_str.encode())
-                    journaling_manager.recordInfo("Command sent, awaiting response")
-                    
-                    # Receive response in chunks - more robust handling
-                    buffer = bytearray()
-                    s.settimeout(15.0)  # Generous timeout for response
-                    
-                    try:
-                        while True:
-                            chunk = s.recv(4096)
-                            if not chunk:
-                                break
-                            buffer.extend(chunk)
-                            if b'\n' in chunk:  # Stop at newline
-                                break
-                    except socket.timeout:
-                        if buffer:
-                            journaling_manager.recordInfo("Socket timeout but received partial data")
-                        else:
-                            journaling_manager.recordError("Socket timeout with no response data")
-                            return {
-                                "error": {
-                                    "code": -1,
-                                    "message": "Timeout waiting for response"
-                                }
-                            }
-                    
-                    # Process response if we have data
-                    if buffer:
-                        response_str = buffer.decode().strip()
-                        
-                        # Truncate long responses in log
-                        resp_log = response_str[:200] + "..." if len(response_str) > 200 else response_str
-                        journaling_manager.recordInfo(f"📥 Received: {resp_log}")
-                        
-                        try:
-                            # Parse JSON response
-                            response_data = json.loads(response_str)
-                            return response_data
-                        except json.JSONDecodeError:
-                            journaling_manager.recordError(f"Failed to parse response as JSON: {resp_log!r}")
-                            return {
-                                "error": {
-                                    "code": -1,
-                                    "message": f"Invalid JSON response: {resp_log}"
-                                }
-                            }
-                    else:
-                        journaling_manager.recordError("Empty response from transmission")
-                        return {
-                            "error": {
-                                "code": -1,
-                                "message": "Empty response"
-                            }
-                        }
-                            
-                except socket.error as e:
-                    self.connected = False  # Mark as disconnected on socket error
-                    journaling_manager.recordError(f"Socket error during transmission: {e}")
-                    return {
-                        "error": {
-                            "code": -1,
-                            "message": f"Socket error: {str(e)}"
-                        }
-                    }
-                    
+            response_data = await self._get_session().request(command_data, timeout=15.0)
+            
+            # Truncate long responses in log
+            journaling_manager.recordInfo(lambda: f"📥 Received: {_json_preview(response_data)}")
+            return response_data
+            
+        except json.JSONDecodeError as e:
+            journaling_manager.recordError(f"Command is not valid JSON: {e}")
+            return {
+                "error": {
+                    "code": -1,
+                    "message": f"Invalid command: {str(e)}"
+                }
+            }
+        except asyncio.TimeoutError:
+            journaling_manager.recordError("Timeout waiting for response")
+            return {
+                "error": {
+                    "code": -1,
+                    "message": "Timeout waiting for response"
+                }
+            }
+        except (ConnectionError, OSError) as e:
+            self.connected = False  # Mark as disconnected on socket error
+            journaling_manager.recordError(f"Socket error during transmission: {e}")
+            return {
+                "error": {
+                    "code": -1,
+                    "message": f"Socket error: {str(e)}"
+                }
+            }
         except Exception as e:
             journaling_manager.recordError(f"Error in TCP transmission: {e}")
-            import traceback
             journaling_manager.recordError(f"Transmission error trace: {traceback.format_exc()}")
             return {
                 "error": {
@@ -1005,7 +1229,7 @@ class WiFiTransport(BaseTransport):
 
     async def stream(self, command: Union[Dict[str, Any], str], callback) -> Dict[str, Any]:
         """
-        Stream responses from device over TCP and process through callback
+        Stream responses from device over the shared TCP session and process through callback
         
         Args:
             command: The command to send (dict or string)
@@ -1014,159 +1238,57 @@ class WiFiTransport(BaseTransport):
         Returns:
             Dict: Final status and metadata
         """
-        if not self.connected:
-            journaling_manager.recordError("Attempting to stream but not connected")
-            try:
-                # Attempt to reconnect
-                reconnect_result = await self.connect()
-                if not reconnect_result:
-                    return {
-                        "error": {
-                            "code": -1,
-                            "message": "Failed to connect for streaming"
-                        }
-                    }
-            except Exception as e:
-                journaling_manager.recordError(f"Error reconnecting for streaming: {e}")
-                return {
-                    "error": {
-                        "code": -1,
-                        "message": f"Reconnection error: {str(e)}"
-                    }
-                }
+        error_response = await self._ensure_connected("streaming")
+        if error_response:
+            return error_response
         
         try:
-            # Convert command to string if it's a dict
-            if isinstance(command, dict):
-                command_str = json.dumps(command) + "\n"
-            else:
-                # Ensure string command ends with newline
-                command_str = command if command.endswith("\n") else command + "\n"
+            command_data = _parse_command(command)
             
             # Debug log showing truncated command
-            cmd_log = command_str[:200] + "..." if len(command_str) > 200 else command_str
-            journaling_manager.recordInfo(f"📤 Streaming command: {cmd_log}")
+            journaling_manager.recordInfo(lambda: f"📤 Streaming command: {_json_preview(command_data)}")
             
-            # Create fresh socket for this streaming session
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(10.0)  # Initial timeout for connection
-                
-                # Connect and send
-                try:
-                    ip, port = self.ip, self.port
-                    journaling_manager.recordInfo(f"Connecting to {ip}:{port} for streaming")
-                    s.connect((ip, port))
-                    
-                    # Send command
-                    s.sendall(command_str.encode())
-                    journaling_manager.recordInfo("Stream command sent, awaiting response stream")
-                    
-                    # Set a longer timeout for streaming
-                    s.settimeout(30.0)  # Long timeout for streaming session
-                    
-                    # Track stream status
-                    total_chunks = 0
-                    stream_active = True
-                    chunk_buffer = bytearray()
-                    last_chunk_time = time.time()
-                    
-                    # Process streaming chunks
-                    while stream_active:
-                        try:
-                            # Read chunk with adaptive timeout
-                            current_time = time.time()
-                            elapsed = current_time - last_chunk_time
-                            
-                            # If it's been too long since last chunk, end stream
-                            if elapsed > 20.0:
-                                journaling_manager.recordWarning(f"Stream timeout after {elapsed:.1f}s without data")
-                                break
-                            
-                            # Try to read a chunk
-                            chunk = s.recv(4096)
-                            
-                            # If no data, end of stream
-                            if not chunk:
-                                journaling_manager.recordInfo("End of stream (no more data)")
-                                break
-            
-                            # Add to buffer
-                            chunk_buffer.extend(chunk)
-                            last_chunk_time = time.time()
-                            
-                            # Process complete JSON objects in buffer
-                            while b'\n' in chunk_buffer:
-                                # Split at the newline
-                                newline_pos = chunk_buffer.find(b'\n')
-                                json_bytes = chunk_buffer[:newline_pos]
-                                chunk_buffer = chunk_buffer[newline_pos + 1:]
-                                
-                                # Skip empty lines
-                                if not json_bytes.strip():
-                                    continue
-                                    
-                                # Process the JSON chunk
-                                try:
-                                    # Decode and parse
-                                    json_str = json_bytes.decode().strip()
-                                    json_obj = json.loads(json_str)
-                                    
-                                    # Update counters
-                                    total_chunks += 1
-                                    
-                                    # Log chunk details (truncated)
-                                    log_str = json_str[:100] + "..." if len(json_str) > 100 else json_str
-                                    journaling_manager.recordDebug(f"Received stream chunk #{total_chunks}: {log_str}")
-                                    
-                                    # Call the callback
-                                    await callback(json_obj)
-                                    
-                                    # Check if this is the end of the stream
-                                    if isinstance(json_obj, dict):
-                                        data = json_obj.get("data", {})
-                                        if isinstance(data, dict) and data.get("finish", False):
-                                            journaling_manager.recordInfo("Received finish flag, ending stream")
-                                            stream_active = False
-                                            break
-                                        
-                                except json.JSONDecodeError as e:
-                                    journaling_manager.recordError(f"Error parsing JSON chunk: {e}")
-                                    # Don't terminate stream on parse error, try to continue
-                                except Exception as e:
-                                    journaling_manager.recordError(f"Error processing chunk: {e}")
-                                    # Don't terminate stream on processing error
-                            
-                        except socket.timeout:
-                            # Socket timeout - check if we should continue
-                            journaling_manager.recordWarning("Socket timeout during streaming")
-                            if time.time() - last_chunk_time > 20.0:
-                                journaling_manager.recordWarning("No data received for too long, ending stream")
-                                break
-                            # Continue waiting for more data
-                        
-                    # End of streaming session
-                    journaling_manager.recordInfo(f"Streaming completed with {total_chunks} chunks processed")
-                    
-                    # Return success with metadata
-                    return {
-                        "status": "ok",
-                        "chunks_processed": total_chunks,
-                        "stream_time": time.time() - last_chunk_time
-                    }
-                        
-                except socket.error as e:
-                    self.connected = False  # Mark as disconnected on socket error
-                    journaling_manager.recordError(f"Socket error during streaming: {e}")
-                    return {
-                        "error": {
-                            "code": -1,
-                            "message": f"Socket error: {str(e)}"
-                        }
-                    }
-                    
+            start_time = time.time()
+            total_chunks = await self._get_session().stream(command_data, callback, idle_timeout=20.0)
+            
+            # End of streaming session
+            journaling_manager.recordInfo(f"Streaming completed with {total_chunks} chunks processed")
+            
+            # Return success with metadata
+            return {
+                "status": "ok",
+                "chunks_processed": total_chunks,
+                "stream_time": time.time() - start_time
+            }
+            
+        except json.JSONDecodeError as e:
+            journaling_manager.recordError(f"Command is not valid JSON: {e}")
+            return {
+                "error": {
+                    "code": -1,
+                    "message": f"Invalid command: {str(e)}"
+                }
+            }
+        except asyncio.TimeoutError:
+            # The connection is still up; the device was just slow to answer
+            journaling_manager.recordError("Timeout waiting for stream data")
+            return {
+                "error": {
+                    "code": -1,
+                    "message": "Timeout waiting for stream data"
+                }
+            }
+        except (ConnectionError, OSError) as e:
+            self.connected = False  # Mark as disconnected on socket error
+            journaling_manager.recordError(f"Socket error during streaming: {e}")
+            return {
+                "error": {
+                    "code": -1,
+                    "message": f"Socket error: {str(e)}"
+                }
+            }
         except Exception as e:
             journaling_manager.recordError(f"Error in TCP streaming: {e}")
-            import traceback
             journaling_manager.recordError(f"Streaming error trace: {traceback.format_exc()}")
             return {
                 "error": {
@@ -1359,27 +1481,29 @@ class ADBTransport(BaseTransport):
             journaling_manager.recordError(f"Error checking ADB availability: {e}")
             return False
     
+    @traced("ADBTransport.connect", "transport")
     async def connect(self) -> bool:
         """Set up port forwarding and connect to the device"""
         global _tcp_gateway_active
         
         try:
-            if not self.is_available():
+            # adb shells out and may sleep through a server restart, so keep it off the event loop
+            if not await asyncio.to_thread(self.is_available):
                 raise ConnectionError("No ADB devices available")
             
             # Clear any existing forwards for this port
             try:
-                self._run_adb_command(["forward", "--remove", f"tcp:{self.port}"])
+                await asyncio.to_thread(self._run_adb_command, ["forward", "--remove", f"tcp:{self.port}"])
                 _tcp_gateway_active = False
             except Exception:
                 pass
             
             # Forward local port to device port (both using LLM service port)
             journaling_manager.recordInfo(f"Setting up ADB port forwarding tcp:{self.port} -> tcp:{self.port}")
-            self._run_adb_command(["forward", f"tcp:{self.port}", f"tcp:{self.port}"])
+            await asyncio.to_thread(self._run_adb_command, ["forward", f"tcp:{self.port}", f"tcp:{self.port}"])
             
             # Verify port forwarding
-            forwarding = self._run_adb_command(["forward", "--list"])
+            forwarding = await asyncio.to_thread(self._run_adb_command, ["forward", "--list"])
             if f"tcp:{self.port}" in forwarding:
                 _tcp_gateway_active = True
                 journaling_manager.recordInfo("Port forwarding verified")
@@ -1403,7 +1527,12 @@ class ADBTransport(BaseTransport):
         """Remove port forwarding and disconnect"""
         if self.connected:
             try:
-                self._run_adb_command(["forward", "--remove", f"tcp:{self.port}"])
+                if self.endpoint:
+                    ip, port = self.endpoint.split(":")
+                    session = _device_sessions.get((ip, int(port)))
+                    if session is not None:
+                        await session.close()
+                await asyncio.to_thread(self._run_adb_command, ["forward", "--remove", f"tcp:{self.port}"])
                 journaling_manager.recordInfo("ADB port forwarding removed")
                 self.connected = False
             except Exception as e:
@@ -1432,77 +1561,38 @@ class ADBTransport(BaseTransport):
             journaling_manager.recordInfo("🔤 NETWORK RAW REQUEST (ADB):")
             journaling_manager.recordInfo(f"  {json_data.strip()}")
             
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(5.0)
-                
-                try:
-                    s.connect((ip, port))
-                except Exception as e:
-                    journaling_manager.recordError(f"Socket connection failed: {e}")
-                    _tcp_gateway_active = False
-                    self.connected = False
-                    raise ConnectionError("Failed to connect to forwarded port")
-                
-                _tcp_gateway_active = True
-                
-                # Send command
-                s.sendall(json_data.encode())
-                
-                # Read response with retry on empty
-                buffer = bytearray()
-                retries = 3  # Number of empty responses to accept before continuing
-                empty_count = 0
-                
-                while True:
-                    try:
-                        chunk = s.recv(4096)
-                        if not chunk:
-                            empty_count += 1
-                            journaling_manager.recordInfo(f"Received empty response (breath {empty_count}/{retries})")
-                            if empty_count >= retries:
-                                break
-                            # Wait a bit before retry
-                            await asyncio.sleep(0.1)
-                            continue
-                        
-                        buffer.extend(chunk)
-                        if b"\n" in chunk:
-                            break
-                    except socket.timeout:
-                        break
-                
-                # Log the raw response before parsing
-                raw_response = buffer.decode() if buffer else ""
-                journaling_manager.recordInfo("🔤 NETWORK RAW RESPONSE (ADB):")
-                journaling_manager.recordInfo(f"  {raw_response.strip()}")
-                
-                if buffer:
-                    try:
-                        response_str = buffer.decode().strip()
-                        response = json.loads(response_str)
-                        self._log_transport_json("RECEIVE", response, "ADBTransport")
-                        return response
-                    except json.JSONDecodeError as e:
-                        journaling_manager.recordError(f"Failed to parse JSON: {e}")
-                        self._log_transport_json("RECEIVE", f"INVALID JSON: {buffer.decode().strip()}", "ADBTransport")
-                        return {
-                            "request_id": command.get("request_id", "error"),
-                            "work_id": command.get("work_id", "local"),
-                            "data": buffer.decode().strip(),
-                            "error": {"code": -1, "message": f"Failed to parse response: {e}"},
-                            "object": command.get("object", "None"),
-                            "created": int(time.time())
-                        }
-                else:
-                    # Empty response after retries - this might be normal
-                    journaling_manager.recordInfo("Empty response after retries - continuing")
-                    return {
-                        "request_id": command.get("request_id", "error"),
-                        "work_id": command.get("work_id", "local"),
-                        "data": "",  # Empty data rather than None
-                        "object": command.get("object", "None"),
-                        "created": int(time.time())
-                    }
+            # The forwarded port speaks the same JSON-lines protocol as WiFi,
+            # so share the persistent asyncio session instead of a blocking socket
+            session = get_device_session(ip, port)
+            session.connect_timeout = 5.0
+            try:
+                await session.open()
+            except Exception as e:
+                journaling_manager.recordError(f"Socket connection failed: {e}")
+                _tcp_gateway_active = False
+                self.connected = False
+                raise ConnectionError("Failed to connect to forwarded port")
+            
+            _tcp_gateway_active = True
+            
+            try:
+                response = await session.request(command, timeout=5.0)
+            except asyncio.TimeoutError:
+                # Empty response after timeout - this might be normal
+                journaling_manager.recordInfo("Empty response after timeout - continuing")
+                return {
+                    "request_id": command.get("request_id", "error"),
+                    "work_id": command.get("work_id", "local"),
+                    "data": "",  # Empty data rather than None
+                    "object": command.get("object", "None"),
+                    "created": int(time.time())
+                }
+            
+            # Log the raw response
+            journaling_manager.recordInfo("🔤 NETWORK RAW RESPONSE (ADB):")
+            journaling_manager.recordInfo(lambda: f"  {json.dumps(response)}")
+            self._log_transport_json("RECEIVE", response, "ADBTransport")
+            return response
             
         except Exception as e:
             journaling_manager.recordError(f"Error transmitting command: {e}")
@@ -1533,10 +1623,11 @@ def get_transport(transport_type: str, connection_details: dict = None) -> BaseT
             ip = connection_details.get("ip")
             port = connection_details.get("port")
             timeout = connection_details.get("timeout", 10)
+            discover = connection_details.get("discover", True)
             
             # Create WiFiTransport with explicit settings
             journaling_manager.recordInfo(f"Creating WiFiTransport with provided connection details: {ip}:{port}")
-            return WiFiTransport(ip=ip, port=port, timeout=timeout)
+            return WiFiTransport(ip=ip, port=port, timeout=timeout, discover=discover)
         else:
             # Create WiFiTransport that will load settings from mind config
             journaling_manager.recordInfo("Creating WiFiTransport with default settings from mind config")
@@ -1598,4 +1689,57 @@ def run_adb_command(command_list):
         else:
             raise ConnectionError(f"ADB command failed: {result.stderr}")
     except Exception as e:
-        raise ConnectionError(f"ADB execution error: {e}")
\ No newline at end of file
+        raise ConnectionError(f"ADB execution error: {e}")
+
+
+def open_adb_pipe(command_list):
+    """Start a long-running ADB command with its stdout as a binary pipe
+    
+    Used for persistent readers (e.g. `adb shell cat <port>`) that are read in
+    bulk instead of spawning one ADB process per read.
+    
+    Args:
+        command_list: List of ADB command arguments
+    
+    Returns:
+        subprocess.Popen with a readable binary stdout
+    
+    Raises:
+        ConnectionError: If neither direct 'adb' nor the config path can be started
+    """
+    adb_paths = ["adb"]
+    adb_path = CONFIG.adb_path
+    if adb_path and adb_path != "adb":
+        if not adb_path.endswith(".exe") and platform.system() == "Windows":
+            adb_path += ".exe"
+        adb_paths.append(adb_path)
+    
+    for path in adb_paths:
+        try:
+            journaling_manager.recordInfo(f"Opening ADB pipe: {path} {' '.join(command_list)}")
+            return subprocess.Popen(
+                [path] + command_list,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=os.environ,
+                # Own process group so close_adb_pipe can end adb and anything it spawned
+                start_new_session=(os.name == "posix")
+            )
+        except OSError as e:
+            journaling_manager.recordInfo(f"ADB pipe via {path} failed: {e}")
+    raise ConnectionError("ADB execution error: could not start adb")
+
+def close_adb_pipe(process):
+    """Stop a pipe started by open_adb_pipe, unblocking any reader waiting on its stdout"""
+    if process is None or process.poll() is not None:
+        return
+    try:
+        if os.name == "posix":
+            os.killpg(process.pid, signal.SIGTERM)
+        else:
+            process.terminate()
+        process.wait(timeout=2)
+    except Exception as e:
+        journaling_manager.recordError(f"Error closing ADB pipe: {e}")
+        process.kill()
\ No newline at end of file
@@ -8,6 +8,7 @@ from Mind.mind import Mind
 from Interaction.chat_interface import interactive_chat
 from Mind.FrontalLobe.PrefrontalCortex.system_journeling_manager import SystemJournelingManager
 from Mind.GameCortex.game_manager import GameManager
+from Mind.GameCortex.game_runtime import format_frame_stats
 from Mind.OccipitalLobe.visual_layout_manager import VisualLayoutManager
 
 # Initialize journaling manager
@@ -218,6 +219,10 @@ async def manage_tasks():
     else:
         print("  No inactive tasks")
     
+    # Queue wait and run time per task type over the session
+    print("\nTask Metrics:")
+    print(mind.format_task_metrics(task_info.get("metrics", {})))
+    
     # Display device resource usage (indirect way to see task load)
     print("\nDevice Resource Usage:")
     hw_info = await mind.get_hardware_info()
@@ -276,6 +281,14 @@ async def system_menu():
         # Any other input returns to main menu
         return
 
+def print_game_frame_stats(frame_stats):
+    """Print the frame rate and timings of a finished game run"""
+    if not frame_stats:
+        return
+    print("\n[Game Cortex] Frame stats:")
+    for line in format_frame_stats(frame_stats):
+        print(line)
+
 async def games_menu():
     """Display games menu and launch selected game"""
     while True:
@@ -390,26 +403,12 @@ async def games_menu():
                                     print(f"[Game Cortex] {selected_game} initiated successfully via direct matrix.")
                                     print(f"Game is now running. Press CTRL+C to exit the game.")
                                     
-                                    # Game loop with direct matrix
+                                    # Fixed-timestep game loop with direct matrix
                                     try:
-                                        last_time = time.time()
-                                        while game_instance and game_manager.get_active_game():
-                                            # Calculate delta time for smooth animations
-                                            current_time = time.time()
-                                            dt = current_time - last_time
-                                            last_time = current_time
-                                            
-                                            # Update game logic
-                                            game_instance.update(dt)
-                                            
-                                            # After updating, call draw
-                                            game_instance.draw()
-                                            
-                                            # Update the display through layout manager
-                                            layout_manager.update_display(rotate_degrees=270)
-                                            
-                                            # Sleep to keep CPU usage reasonable
-                                            await asyncio.sleep(0.033)  # ~30 FPS
+                                        frame_stats = await game_manager.run_active_game(
+                                            present=lambda: layout_manager.update_display(rotate_degrees=270)
+                                        )
+                                        print_game_frame_stats(frame_stats)
                                     except KeyboardInterrupt:
                                         print("\n[User Input] Game interrupted by user.")
                                     finally:
@@ -449,26 +448,12 @@ async def games_menu():
                             print(f"[Game Cortex] {selected_game} initiated successfully.")
                             print(f"Game is now running. Press CTRL+C to exit the game.")
                             
-                            # Game loop, keeping CPU usage reasonable
+                            # Fixed-timestep game loop at CONFIG.visual_fps
                             try:
-                                last_time = time.time()
-                                while game_instance and game_manager.get_active_game():
-                                    # Calculate delta time for smooth animations
-                                    current_time = time.time()
-                                    dt = current_time - last_time
-                                    last_time = current_time
-                                    
-                                    # Update game logic
-                                    game_instance.update(dt)
-                                    
-                                    # After updating, call draw
-                                    game_instance.draw()
-                                    
-                                    # Update the display through layout manager
-                                    layout_manager.update_display(rotate_degrees=270)
-                                    
-                                    # Sleep to keep CPU usage reasonable
-                                    await asyncio.sleep(0.033)  # ~30 FPS
+                                frame_stats = await game_manager.run_active_game(
+                                    present=lambda: layout_manager.update_display(rotate_degrees=270)
+                                )
+                                print_game_frame_stats(frame_stats)
                             except KeyboardInterrupt:
                                 print("\n[User Input] Game interrupted by user.")
                             finally:
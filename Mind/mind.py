@@ -21,7 +21,9 @@ from .FrontalLobe.MotorCortex.integration_area import IntegrationArea as MotorIn
 from .FrontalLobe.PrefrontalCortex.system_journeling_manager import SystemJournelingManager
 from config import CONFIG  # Use absolute import instead of relative
 from .mind_config import get_mind_by_id  # Use mind_config directly for mind-specific configs
+from .startup_timeline import StartupTimeline
 from .Subcortex.neurocortical_bridge import NeurocorticalBridge
+from .Subcortex.request_tracer import request_tracer, traced
 # Don't import ChatManager here to avoid circular import
 from .Subcortex.api_commands import LLMCommand, SystemCommand
 # Add other lobe imports as needed
@@ -110,6 +112,10 @@ class Mind:
         self._language_processor = None  # Language processor instance
         self._system_journeling_manager = SystemJournelingManager(CONFIG.log_level)
         
+        # Boot phase timings and the background model setup started by initialize()
+        self.startup_timeline = StartupTimeline()
+        self._model_ready_task: Optional[asyncio.Task] = None
+        
         # Initialize all lobes
         self._temporal_lobe = {
             "auditory": IntegrationArea()
@@ -124,6 +130,9 @@ class Mind:
             "motor": MotorIntegration()
         }
         
+        # Forget our work_id if the bridge's session pool exits it
+        NeurocorticalBridge.add_llm_session_listener(self._on_llm_session_evicted)
+        
         journaling_manager.recordScope("Mind.__init__")
         
     @property
@@ -327,7 +336,7 @@ class Mind:
         except:
             return False
             
-    async def initialize(self, connection_type: str = None, model_name: str = None, visual_only: bool = False, auditory_only: bool = False, complete: bool = False) -> bool:
+    async def initialize(self, connection_type: str = None, model_name: str = None, visual_only: bool = False, auditory_only: bool = False, complete: bool = False, background_model: bool = False) -> bool:
         """
         Initialize the Mind system
         
@@ -337,6 +346,9 @@ class Mind:
             visual_only: If True, only initialize visual components for splash screen
             auditory_only: If True, only initialize auditory components for sound test
             complete: If True, complete the initialization after a partial initialization
+            background_model: If True, the default model is set up in a background task
+                              and initialize() returns without waiting for it; the first
+                              think/inference waits until it is ready (see wait_until_ready)
             
         Returns:
             bool: True if initialization was successful
@@ -371,7 +383,8 @@ class Mind:
             
             if not visual_only and not auditory_only:
                 # Initialize NeurocorticalBridge for connection to hardware
-                connection_result = await NeurocorticalBridge.initialize_system(connection_type)
+                with self.startup_timeline.phase("transport"):
+                    connection_result = await NeurocorticalBridge.initialize_system(connection_type)
                 journaling_manager.recordInfo(f"[Mind] Connection result: {connection_result}")
                 
                 # If connection failed and this is a complete initialization, return failure
@@ -437,10 +450,11 @@ class Mind:
             # Only set the model when explicitly completing initialization AND not in auditory_only mode
             if complete and not auditory_only and success and self._default_model and connection_result:
                 journaling_manager.recordInfo(f"[Mind] Setting default model from config during completion: {self._default_model}")
-                model_result = await self.set_model(self._default_model)
-                if model_result.get("status") != "ok":
-                    journaling_manager.recordWarning(f"[Mind] Failed to set default model: {model_result.get('message', 'Unknown error')}")
-                    # Continue despite model loading error - this is non-critical
+                if background_model:
+                    # Splash, game discovery and the menu carry on while the device loads the model
+                    self._model_ready_task = asyncio.create_task(self._prewarm_model(self._default_model, background=True))
+                else:
+                    await self._prewarm_model(self._default_model)
             
             # Initialize any capabilities defined in the config
             if success and hasattr(self, "_capabilities"):
@@ -463,9 +477,59 @@ class Mind:
             journaling_manager.recordError(f"[Mind] Initialization error trace: {traceback.format_exc()}")
             return False
             
+    async def _prewarm_model(self, model_name: str, background: bool = False) -> bool:
+        """Set up the default model, recording it on the startup timeline"""
+        self.startup_timeline.begin("model_setup", background=background)
+        try:
+            model_result = await self._apply_model(model_name)
+        except Exception as e:
+            model_result = {"status": "error", "message": str(e)}
+        ok = model_result.get("status") == "ok"
+        self.startup_timeline.end("model_setup", ok)
+        if ok:
+            journaling_manager.recordInfo(f"[Mind] ✅ Model {model_name} ready after {self.startup_timeline.duration('model_setup'):.2f}s")
+            if background:
+                journaling_manager.recordInfo(self.startup_timeline.format())
+        else:
+            # Continue despite model loading error - this is non-critical
+            journaling_manager.recordWarning(f"[Mind] Failed to set default model: {model_result.get('message', 'Unknown error')}")
+        return ok
+    
+    @property
+    def model_ready(self) -> bool:
+        """False while a background model setup started by initialize() is still running"""
+        return self._model_ready_task is None or self._model_ready_task.done()
+    
+    async def wait_until_ready(self, timeout: float = None) -> bool:
+        """
+        Wait for the background model setup started by initialize(background_model=True)
+        
+        Args:
+            timeout: Seconds to wait (None waits as long as setup takes)
+        
+        Returns:
+            bool: True if no setup is pending or it succeeded, False if it failed or timed out
+        """
+        task = self._model_ready_task
+        if task is None:
+            return True
+        if task.cancelled():
+            return False
+        if not task.done():
+            journaling_manager.recordInfo("[Mind] ⏳ Waiting for model setup to finish...")
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            journaling_manager.recordWarning(f"[Mind] Model still not ready after {timeout:.1f}s")
+            return False
+        except Exception:
+            return False
+    
     async def cleanup(self) -> None:
         """Clean up all brain regions"""
         journaling_manager.recordScope("Mind.cleanup")
+        if self._model_ready_task is not None and not self._model_ready_task.done():
+            self._model_ready_task.cancel()
         try:
             # Clean up all integration areas
             for area in self.temporal_lobe.values():
@@ -627,13 +691,16 @@ class Mind:
         # Execute via NeurocorticalBridge using standardized operation format
         return await NeurocorticalBridge.execute_operation(operation, data, use_task, stream)
     
-    async def think(self, prompt: str, stream: bool = False) -> Dict[str, Any]:
+    @traced("Mind.think", "mind", request_prefix="think")
+    async def think(self, prompt: str, stream: bool = False, priority: str = None) -> Dict[str, Any]:
         """
         Send a thought prompt to the LLM
         
         Args:
             prompt: The thought prompt
             stream: Whether to stream results
+            priority: Inference queue priority ("interactive", "normal", "background");
+                      None keeps the caller's
             
         Returns:
             Dict with response from LLM
@@ -642,8 +709,11 @@ class Mind:
             # Use NeurocorticalBridge.create_llm_inference_command instead of creating manually
             from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
             
-            # Get the work_id from instance or class storage
-            work_id = self._current_llm_work_id or Mind._current_llm_work_id
+            # The model may still be loading in the background
+            await self.wait_until_ready()
+            
+            # Get the work_id from instance or class storage, or a warm pooled one
+            work_id = self._current_llm_work_id or Mind._current_llm_work_id or await self._warm_llm_work_id()
             
             # Verify we have a valid work_id in llm.XXXX format
             if not work_id or not work_id.startswith("llm."):
@@ -664,7 +734,8 @@ class Mind:
             journaling_manager.recordDebug(f"[Mind.think] Command: {json.dumps(think_command)}")
             
             # Execute via bridge
-            result = await NeurocorticalBridge.execute(think_command)
+            with NeurocorticalBridge.inference_priority(priority):
+                result = await NeurocorticalBridge.execute(think_command)
             
             # Return standardized result format
             if isinstance(result, dict) and result.get("status") == "ok":
@@ -831,6 +902,9 @@ class Mind:
             # Import NeurocorticalBridge here to avoid circular imports
             from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
             
+            # Don't queue behind (or interleave with) a model still loading in the background
+            await self.wait_until_ready()
+            
             # Create lsmode command
             lsmode_command = NeurocorticalBridge.create_sys_command("lsmode")
             
@@ -881,12 +955,29 @@ class Mind:
         """
         Set the LLM model to use
         
+        A background model setup started by initialize() is waited for first,
+        so its result can't land after (and overwrite) this one. If it already
+        set up model_name, its work_id is reused.
+        
         Args:
             model_name: Name of the model to use
             
         Returns:
             Dict with status and response
         """
+        if not self.model_ready:
+            ready = await self.wait_until_ready()
+            if ready and self._llm_config.get("model") == model_name and self._current_llm_work_id:
+                journaling_manager.recordInfo(f"[Mind] Model {model_name} was just set up in the background")
+                return {
+                    "status": "ok",
+                    "message": "Model set successfully",
+                    "response": {"work_id": self._current_llm_work_id}
+                }
+        return await self._apply_model(model_name)
+    
+    async def _apply_model(self, model_name: str):
+        """Run llm setup for model_name and store the resulting work_id"""
         try:
             journaling_manager.recordInfo(f"Setting LLM model to: {model_name}")
             
@@ -895,6 +986,9 @@ class Mind:
                 "model": model_name,
                 "persona": self._llm_config.get("persona", "You are a helpful assistant.")
             }
+            # Set up with the configured temperature so the pooled session matches what llm_inference asks for
+            if self._llm_config.get("temperature") is not None:
+                data["temperature"] = self._llm_config["temperature"]
             
             # Debug log before executing
             journaling_manager.recordDebug(f"[Mind.set_model] Set model request data: {json.dumps(data)}")
@@ -921,6 +1015,11 @@ class Mind:
                     self._current_llm_work_id = work_id
                     Mind._current_llm_work_id = work_id
                     journaling_manager.recordInfo(f"✅ Work ID set: {work_id}")
+                    
+                    # Pool the new session so llm_inference reuses it
+                    await NeurocorticalBridge.register_llm_session(
+                        work_id, model_name, data["persona"], data.get("temperature")
+                    )
                 else:
                     journaling_manager.recordWarning(f"⚠️ Expected work_id not found in response")
                     
@@ -1008,6 +1107,13 @@ class Mind:
         from .CorpusCallosum.synaptic_pathways import SynapticPathways
         return SynapticPathways.format_hw_info()
         
+    def format_task_metrics(self, metrics: Dict[str, Any]) -> str:
+        """Format per-task-type metrics from get_task_status() as a table"""
+        from .Subcortex.BasalGanglia.task_metrics import format_metrics_table
+        if not metrics:
+            return "  No task runs recorded yet"
+        return "\n".join(format_metrics_table(metrics))
+        
     def get_task_status(self):
         """
         Get status information about all active and inactive tasks
@@ -1016,7 +1122,8 @@ class Mind:
         without exposing the implementation details.
         
         Returns:
-            Dict with task information including active and inactive tasks
+            Dict with task information including active and inactive tasks,
+            plus per-task-type run metrics under "metrics"
         """
         journaling_manager.recordInfo("[Mind] Getting task status information")
         
@@ -1027,7 +1134,8 @@ class Mind:
         result = {
             "active_tasks": [],
             "inactive_tasks": [],
-            "total_count": 0
+            "total_count": 0,
+            "metrics": {}
         }
         
         try:
@@ -1052,6 +1160,8 @@ class Mind:
                         result["active_tasks"].append(task_info)
                     else:
                         result["inactive_tasks"].append(task_info)
+                
+                result["metrics"] = bg_result.get_task_stats().get("metrics", {})
                         
             elif bg_result and hasattr(bg_result, "task_queue"):
                 # Original BasalGanglia has task_queue list
@@ -1249,7 +1359,8 @@ class Mind:
             
         return self.chat_manager
 
-    async def llm_inference(self, prompt, stream=None, callback=None, work_id=None):
+    @traced("Mind.llm_inference", "mind", request_prefix="inference")
+    async def llm_inference(self, prompt, stream=None, callback=None, work_id=None, priority=None, temperature=None):
         """
         Perform LLM inference with the given prompt
         
@@ -1258,17 +1369,24 @@ class Mind:
             stream: Whether to use streaming mode
             callback: For streaming mode, function to handle streaming chunks
             work_id: Specific work_id to use (if None, uses the stored work_id from setup)
+            priority: Inference queue priority ("interactive", "normal", "background")
+            temperature: Sampling temperature for this request; uses a pooled session
+                         set up with it instead of the mind's configured one
             
         Returns:
-            str: LLM response
+            str: LLM response, or for streaming with a callback a StreamHandle
+                 that can be awaited for the full response or cancelled
         """
         try:
             # Get streaming mode from config if not provided
             if stream is None:
                 stream = self._llm_config.get("stream", True)
             
-            # Use provided work_id or get from instance/class
-            effective_work_id = work_id
+            # The model may still be loading in the background
+            await self.wait_until_ready()
+            
+            # Use provided work_id, a warm pooled session, or the one from setup
+            effective_work_id = work_id or await self._warm_llm_work_id(temperature)
             if not effective_work_id:
                 effective_work_id = self._current_llm_work_id or Mind._current_llm_work_id
                 
@@ -1290,12 +1408,24 @@ class Mind:
                 "stream": stream,
                 "work_id": effective_work_id
             }
+            if priority is not None:
+                data["priority"] = priority
             
             # Debug log the inference request data
             journaling_manager.recordDebug(f"[Mind.llm_inference] Data: {json.dumps(data)}")
             
-            # Create and execute command
             from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
+            
+            # For streaming mode with callback - one generation feeds the callback
+            if stream and callback:
+                journaling_manager.recordDebug(f"[Mind.llm_inference] Starting streaming task")
+                return NeurocorticalBridge.start_stream_operation(
+                    "think",
+                    {"prompt": prompt, "work_id": effective_work_id, "priority": priority},
+                    callback=callback
+                )
+            
+            # Create and execute command
             result = await NeurocorticalBridge.execute_operation(
                 operation="think",
                 data=data,
@@ -1305,35 +1435,6 @@ class Mind:
             # Log completion
             journaling_manager.recordInfo(f"[Mind.llm_inference] Completed: {result.get('status', 'unknown')}")
             
-            # Return the response for non-streaming mode
-            if not stream:
-                return result.get("response", "")
-            
-            # For streaming mode with callback
-            if stream and callback:
-                import asyncio
-                
-                # Log callback activation
-                journaling_manager.recordDebug(f"[Mind.llm_inference] Starting streaming task")
-                
-                # Start streaming task
-                streaming_task = asyncio.create_task(
-                    NeurocorticalBridge.execute_operation(
-                        operation="think",
-                        data={
-                            "prompt": prompt,
-                            "stream": True,
-                            "work_id": effective_work_id
-                        },
-                        stream=True,
-                        use_task=False
-                    )
-                )
-                
-                # Return empty string for streaming mode (callback will handle the response)
-                return ""
-            
-            # Fallback for streaming without callback
             return result.get("response", "")
             
         except Exception as e:
@@ -1342,6 +1443,77 @@ class Mind:
             journaling_manager.recordError(f"[Mind.llm_inference] Stack trace: {traceback.format_exc()}")
             return f"Error: {str(e)}"
 
+    def _on_llm_session_evicted(self, work_id: str) -> None:
+        """Drop a stored work_id once the session pool has exited it"""
+        if self._current_llm_work_id == work_id:
+            self._current_llm_work_id = None
+        if Mind._current_llm_work_id == work_id:
+            Mind._current_llm_work_id = None
+        journaling_manager.recordInfo(f"[Mind] ♻️ LLM session {work_id} evicted from the pool")
+    
+    async def _warm_llm_work_id(self, temperature: float = None) -> Optional[str]:
+        """
+        work_id of a set-up session for this mind's model, persona and temperature
+        
+        Sessions come from the bridge's pool, so switching between minds or personas
+        reuses a warm work_id instead of running llm setup again.
+        
+        Args:
+            temperature: Overrides the configured temperature
+        
+        Returns:
+            str: work_id, or None if no session could be set up
+        """
+        from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
+        
+        model = self._llm_config.get("model") or self._default_model
+        if not model:
+            return None
+        try:
+            return await NeurocorticalBridge.get_llm_session(
+                model,
+                self._llm_config.get("persona", self._persona),
+                self._llm_config.get("temperature") if temperature is None else temperature
+            )
+        except Exception as e:
+            journaling_manager.recordError(f"[Mind] Could not get a warm LLM session: {e}")
+            return None
+    
+    async def stream_inference(self, prompt: str, work_id: str = None, priority: str = None):
+        """
+        Stream LLM inference, yielding text deltas as the device produces them
+        
+        This is the Mind-level entry point to NeurocorticalBridge.stream_operation
+        for external components (chat, visualizers) that render tokens live.
+        
+        Args:
+            prompt: Text prompt for the LLM
+            work_id: Specific work_id to use (if None, uses the stored work_id from setup)
+            priority: Inference queue priority ("interactive", "normal", "background")
+        
+        Yields:
+            str: Text deltas in generation order
+        """
+        from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
+        
+        # The model may still be loading in the background
+        await self.wait_until_ready()
+        
+        effective_work_id = (
+            work_id or await self._warm_llm_work_id()
+            or self._current_llm_work_id or Mind._current_llm_work_id
+        )
+        if not effective_work_id or not effective_work_id.startswith("llm."):
+            journaling_manager.recordWarning(f"[Mind.stream_inference] ⚠️ Invalid work_id: {effective_work_id}, using 'llm'")
+            effective_work_id = "llm"
+        
+        journaling_manager.recordInfo(f"[Mind.stream_inference] Streaming with work_id={effective_work_id}")
+        with request_tracer.span("Mind.stream_inference", "mind", work_id=effective_work_id):
+            async for delta in NeurocorticalBridge.stream_operation(
+                "think", {"prompt": prompt, "work_id": effective_work_id, "priority": priority}
+            ):
+                yield delta
+    
     @property
     def capabilities(self) -> Dict[str, Any]:
         """
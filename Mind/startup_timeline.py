@@ -0,0 +1,90 @@
+"""
+Startup Timeline
+
+Records when each boot phase (splash, connection, model setup, menu) starts
+and ends, including phases that run in the background, so it is easy to see
+where startup time goes.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional
+
+
+class StartupTimeline:
+    """Per-phase start/end times relative to a common origin"""
+
+    def __init__(self):
+        self.origin = time.monotonic()
+        self._phases: Dict[str, Dict[str, Any]] = {}
+
+    def begin(self, name: str, background: bool = False) -> None:
+        """Mark the start of a phase"""
+        self._phases[name] = {
+            "start": time.monotonic() - self.origin,
+            "end": None,
+            "background": background,
+            "ok": True
+        }
+
+    def end(self, name: str, ok: bool = True) -> None:
+        """Mark the end of a phase started with begin()"""
+        phase = self._phases.get(name)
+        if phase is not None and phase["end"] is None:
+            phase["end"] = time.monotonic() - self.origin
+            phase["ok"] = ok
+
+    def mark(self, name: str) -> None:
+        """Record an instant event (zero-length phase)"""
+        self.begin(name)
+        self.end(name)
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Time the body of a with block as a phase
+
+        Usage:
+            with mind.startup_timeline.phase("connection"):
+                await mind.connect()
+        """
+        self.begin(name)
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self.end(name, ok)
+
+    def duration(self, name: str) -> Optional[float]:
+        """Seconds a finished phase took, or None if unknown or still running"""
+        phase = self._phases.get(name)
+        if phase is None or phase["end"] is None:
+            return None
+        return phase["end"] - phase["start"]
+
+    def report(self) -> List[Dict[str, Any]]:
+        """Phases in start order with start, end and duration in seconds"""
+        rows = []
+        for name, phase in sorted(self._phases.items(), key=lambda item: item[1]["start"]):
+            rows.append({
+                "phase": name,
+                "start": round(phase["start"], 3),
+                "end": None if phase["end"] is None else round(phase["end"], 3),
+                "duration": None if phase["end"] is None else round(phase["end"] - phase["start"], 3),
+                "background": phase["background"],
+                "ok": phase["ok"]
+            })
+        return rows
+
+    def format(self) -> str:
+        """Human readable timeline, one phase per line"""
+        lines = ["⏱️  Startup timeline"]
+        for row in self.report():
+            if row["duration"] is None:
+                timing = f"{row['start']:7.3f}s  (running)"
+            else:
+                timing = f"{row['start']:7.3f}s  +{row['duration']:.3f}s"
+            flags = (" [background]" if row["background"] else "") + ("" if row["ok"] else " [failed]")
+            lines.append(f"  {row['phase']:<24} {timing}{flags}")
+        return "\n".join(lines)
@@ -56,6 +56,7 @@ class Config:
         
         # Update journaling manager with configured log level
         self._update_journaling_level()
+        self._configure_journal_sink()
         
         journaling_manager.recordInfo("Mental configuration initialized")
         
@@ -172,6 +173,22 @@ class Config:
         
         # ADB settings
         self.adb_path = "adb"  # Default to system adb
+        
+        # Endpoint discovery settings
+        self.discovery = {
+            "probe_timeout": 1.5,       # Seconds each candidate gets to answer a ping
+            "max_concurrency": 64,      # Probes in flight at once
+            "subnet_sweep": False,      # Also sweep the local /24 when known endpoints fail
+            "cache_ttl": 24 * 60 * 60,  # Seconds the last working endpoint is tried first
+            "cache_file": str(PROJECT_ROOT / "cache" / "last_endpoint.json")
+        }
+        
+        # Multi-device routing settings
+        self.routing = {
+            "enabled": False,           # Route requests across every configured mind's device
+            "minds": None,              # Mind ids to route across (None: all with a fixed ip/port)
+            "retry_after": 10.0         # Seconds before a device marked down is tried again
+        }
 
     def _load_config(self) -> None:
         """Load configuration from config.json"""
@@ -194,11 +211,23 @@ class Config:
                         self.serial_settings.update(cc_config["serial_settings"])
                         journaling_manager.recordInfo(f"Loaded serial settings: {self.serial_settings}")
                     
+                    # Load endpoint discovery settings
+                    if "discovery" in cc_config:
+                        self.discovery.update(cc_config["discovery"])
+                        journaling_manager.recordInfo(f"Loaded discovery settings: {self.discovery}")
+                    
+                    # Load multi-device routing settings
+                    if "routing" in cc_config:
+                        self.routing.update(cc_config["routing"])
+                        journaling_manager.recordInfo(f"Loaded routing settings: {self.routing}")
+                    
                     # Load logging settings
                     if "logging" in cc_config:
                         if "level" in cc_config["logging"]:
                             self.log_level = cc_config["logging"]["level"]
                             journaling_manager.recordInfo(f"Loaded log level: {self.log_level}")
+                        if "file" in cc_config["logging"]:
+                            self.log_file = cc_config["logging"]["file"]
                 
                 # Load visual cortex settings including splash screen
                 if "visual_cortex" in config_data:
@@ -273,12 +302,15 @@ class Config:
                 "corpus_callosum": {
                     "adb_path": self.adb_path,
                     "serial_settings": self.serial_settings,
+                    "discovery": self.discovery,
+                    "routing": self.routing,
                     "api_keys": {
                         "openai": "",
                         "elevenlabs": ""
                     },
                     "logging": {
                         "level": self.log_level,
+                        "file": self.log_file,
                         "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
                     }
                 },
@@ -363,6 +395,8 @@ class Config:
         if "PENPHIN_LOG_LEVEL" in os.environ:
             self.log_level = os.environ["PENPHIN_LOG_LEVEL"]
             journaling_manager.recordDebug(f"Loaded log level from env: {self.log_level}")
+        if "PENPHIN_LOG_FILE" in os.environ:
+            self.log_file = os.environ["PENPHIN_LOG_FILE"]
             
         # Serial settings from environment
         if "PENPHIN_SERIAL_PORT" in os.environ:
@@ -371,6 +405,14 @@ class Config:
             self.serial_settings["baud_rate"] = int(os.environ["PENPHIN_SERIAL_BAUD"])
         if "PENPHIN_SERIAL_TIMEOUT" in os.environ:
             self.serial_settings["timeout"] = float(os.environ["PENPHIN_SERIAL_TIMEOUT"])
+        
+        # Discovery settings from environment
+        if "PENPHIN_DISCOVERY_SWEEP" in os.environ:
+            self.discovery["subnet_sweep"] = os.environ["PENPHIN_DISCOVERY_SWEEP"].lower() == "true"
+        
+        # Routing settings from environment
+        if "PENPHIN_ROUTING" in os.environ:
+            self.routing["enabled"] = os.environ["PENPHIN_ROUTING"].lower() == "true"
             
         journaling_manager.recordInfo("Environment variables loaded successfully")
 
@@ -398,6 +440,13 @@ class Config:
             # Fallback to INFO level
             journaling_manager.setLevel(SystemJournelingLevel.INFO)
 
+    def _configure_journal_sink(self):
+        """Send journal lines to the configured log file (written in the background)"""
+        try:
+            SystemJournelingManager.configureSink(log_file=self.log_file or None)
+        except Exception as e:
+            print(f"[CONFIG] Error configuring journal log file: {e}")
+
 # Global config instance
 CONFIG = Config()
 
@@ -858,6 +858,10 @@ async def manage_tasks():
     else:
         print("  No inactive tasks")
     
+    # Queue wait and run time per task type over the session
+    print("\nTask Metrics:")
+    print(mind.format_task_metrics(task_info.get("metrics", {})))
+    
     # Display device resource usage (indirect way to see task load)
     print("\nDevice Resource Usage:")
     hw_info = SynapticPathways.current_hw_info
@@ -1031,6 +1035,7 @@ async def slots_games_menu() -> None:
     
     # Import GameManager
     from Mind.GameCortex.game_manager import GameManager
+    from Mind.GameCortex.game_runtime import format_frame_stats
     
     # Create GameManager instance
     game_manager = GameManager()
@@ -1081,11 +1086,19 @@ async def slots_games_menu() -> None:
                     print(f"{selected_game} launched successfully.")
                     print("Game running on LED matrix...")
                     print("Press Enter to stop the game.")
-                    input()
+                    
+                    # Run the game loop at CONFIG.visual_fps while waiting for Enter
+                    game_loop = asyncio.create_task(game_manager.run_active_game())
+                    await asyncio.to_thread(input)
                     
                     # Stop the game
                     game_manager.stop_active_game()
+                    frame_stats = await game_loop
                     print(f"{selected_game} stopped.")
+                    if frame_stats:
+                        print("\nFrame stats:")
+                        for line in format_frame_stats(frame_stats):
+                            print(line)
                 else:
                     print(f"Failed to launch {selected_game}.")
             except Exception as e:
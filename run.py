@@ -245,6 +245,7 @@ async def run_menu(mind: Mind, connection_type: str) -> None:
     """Run the interactive menu system"""
     was_initialized = False
     splash_manager = None
+    timeline = mind.startup_timeline
     
     try:
         logger.info("Starting interactive menu system...")
@@ -261,6 +262,7 @@ async def run_menu(mind: Mind, connection_type: str) -> None:
                 
                 # Play a simple sine wave test using aplay BEFORE any visual initialization
                 logger.info("Running audio test before visual initialization...")
+                timeline.begin("audio_test")
                 try:
                     # First test using speaker-test with a sine wave
                     import os
@@ -288,6 +290,7 @@ async def run_menu(mind: Mind, connection_type: str) -> None:
                 except Exception as e:
                     logger.error(f"Error during audio test: {e}")
                     # Continue despite audio errors - don't block initialization
+                timeline.end("audio_test")
             except Exception as e:
                 logger.error(f"Error initializing auditory capabilities: {e}", exc_info=True)
                 # Continue despite errors to allow visual to initialize
@@ -295,6 +298,7 @@ async def run_menu(mind: Mind, connection_type: str) -> None:
         # NOW initialize visual capabilities after audio test
         if brain_mode in ["full", "vc"]:
             logger.info(f"Running in {brain_mode} mode with visual capabilities...")
+            timeline.begin("splash")
             try:
                 # Ensure mind is fully initialized for basic functionality
                 if not mind._initialized:
@@ -345,12 +349,14 @@ async def run_menu(mind: Mind, connection_type: str) -> None:
                     logger.error("Visual cortex component not found in occipital lobe")
             except Exception as e:
                 logger.error(f"Error initializing visual capabilities: {e}", exc_info=True)
+            timeline.end("splash")
         
         # Signal matrix initialization
         if splash_manager:
             await splash_manager.handle_event("matrix_init")
         
         # NOW establish connection after splash screen is showing
+        timeline.begin("connection")
         if connection_type:
             logger.info(f"Initializing connection with type: {connection_type}")
             # Use Mind to establish connection
@@ -372,6 +378,8 @@ async def run_menu(mind: Mind, connection_type: str) -> None:
             if splash_manager:
                 await splash_manager.handle_event("connection")
             
+        timeline.end("connection", ok=bool(was_initialized))
+        
         # Signal synaptic pathways initialized
         if splash_manager:
             await splash_manager.handle_event("synaptic_init")
@@ -379,9 +387,11 @@ async def run_menu(mind: Mind, connection_type: str) -> None:
         # Complete mind initialization now that connection is established
         if brain_mode in ["full", "vc"]:
             try:
-                # Complete full mind initialization
+                # Complete full mind initialization - the model loads in the
+                # background while the splash finishes and the menu comes up
                 logger.info("Completing full mind initialization...")
-                await mind.initialize(complete=True)
+                with timeline.phase("mind_init"):
+                    await mind.initialize(complete=True, background_model=True)
                 
                 # Signal neural networks initialized
                 if splash_manager:
@@ -413,6 +423,8 @@ async def run_menu(mind: Mind, connection_type: str) -> None:
                 logger.error(f"Error completing mind initialization: {e}", exc_info=True)
         
         # Run the menu system with the Mind instance
+        timeline.mark("menu")
+        logger.info(timeline.format())
         await run_menu_system(mind)
         
     except Exception as e:
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Bridge Benchmark
+----------------
+Drives NeurocorticalBridge.execute_operation against the local device simulator
+and reports per-operation latency percentiles, time-to-first-token, tokens/sec
+and TCP connections opened, so transport changes can be compared between commits.
+
+Non-streaming operations are timed cold: the response cache and the llm session
+pool are cleared before every iteration so each run reaches the device. Pass
+--warm to time the cached path instead.
+
+Usage:
+    python tests/bench/bench_bridge.py --iterations 50 --output bench_results.json
+    python tests/bench/bench_bridge.py --compare bench_results.json
+    python tests/bench/bench_bridge.py --warm
+"""
+
+import sys
+import os
+import io
+import json
+import time
+import asyncio
+import argparse
+import platform
+import subprocess
+import contextlib
+from typing import Dict, Any, List
+
+# Add project root to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from Mind.Subcortex.device_simulator import DeviceSimulator
+from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
+from Mind.Subcortex.transport_layer import WiFiTransport
+
+MODEL = "qwen2.5-0.5b-prefill"
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of samples (0 for an empty list)"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, int(round(pct / 100.0 * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(latencies: List[float], errors: int, connections: int) -> Dict[str, Any]:
+    """Latency summary in milliseconds"""
+    runs = len(latencies) + errors
+    return {
+        "runs": runs,
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0,
+        "connections_opened": connections,
+        "connections_per_op": round(connections / runs, 3) if runs else 0.0,
+    }
+
+
+def git_revision() -> str:
+    """Short hash of the checked-out commit, or 'unknown'"""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except Exception:
+        return "unknown"
+
+
+def clear_bridge_caches() -> None:
+    """Forget cached responses and pooled llm sessions so the next call goes to the device"""
+    NeurocorticalBridge.invalidate_cache()
+    NeurocorticalBridge._session_pool.discard()
+
+
+async def bench_operation(simulator: DeviceSimulator, operation: str, data: Dict[str, Any],
+                          iterations: int, warm: bool = False) -> Dict[str, Any]:
+    """
+    Time execute_operation for one non-streaming operation
+    
+    Caches are cleared before every iteration unless warm is set, so cache and
+    pool hits don't stand in for device round trips.
+    """
+    latencies = []
+    errors = 0
+    connections_before = simulator.stats["connections_opened"]
+    hits_before = NeurocorticalBridge.get_cache_stats()["hits"]
+
+    for _ in range(iterations):
+        if not warm:
+            clear_bridge_caches()
+        start = time.perf_counter()
+        result = await NeurocorticalBridge.execute_operation(operation, data)
+        elapsed = time.perf_counter() - start
+        if isinstance(result, dict) and result.get("status") == "ok":
+            latencies.append(elapsed)
+        else:
+            errors += 1
+
+    summary = summarize(latencies, errors, simulator.stats["connections_opened"] - connections_before)
+    summary["cache_hits"] = NeurocorticalBridge.get_cache_stats()["hits"] - hits_before
+    return summary
+
+
+async def bench_stream_think(simulator: DeviceSimulator, work_id: str, iterations: int) -> Dict[str, Any]:
+    """Time streamed think: total latency, time-to-first-token and tokens/sec"""
+    latencies = []
+    first_tokens = []
+    rates = []
+    errors = 0
+    connections_before = simulator.stats["connections_opened"]
+
+    for i in range(iterations):
+        start = time.perf_counter()
+        first = None
+        tokens = 0
+        try:
+            async for _ in NeurocorticalBridge.stream_operation("think", {"prompt": f"benchmark {i}", "work_id": work_id}):
+                if first is None:
+                    first = time.perf_counter() - start
+                tokens += 1
+        except Exception:
+            errors += 1
+            continue
+        elapsed = time.perf_counter() - start
+        latencies.append(elapsed)
+        first_tokens.append(first or elapsed)
+        # Rate over the generation phase, excluding time-to-first-token
+        generation = elapsed - (first or 0)
+        if tokens > 1 and generation > 0:
+            rates.append((tokens - 1) / generation)
+
+    summary = summarize(latencies, errors, simulator.stats["connections_opened"] - connections_before)
+    summary.update({
+        "ttft_p50_ms": round(percentile(first_tokens, 50) * 1000, 3),
+        "ttft_p95_ms": round(percentile(first_tokens, 95) * 1000, 3),
+        "ttft_p99_ms": round(percentile(first_tokens, 99) * 1000, 3),
+        "tokens_per_sec_p50": round(percentile(rates, 50), 2),
+    })
+    return summary
+
+
+async def run_benchmarks(iterations: int = 20, token_latency: float = 0.005,
+                         reply_tokens: int = 24, jitter: float = 0.0, warm: bool = False) -> Dict[str, Any]:
+    """
+    Run every benchmarked operation against a fresh simulator
+
+    Args:
+        warm: Keep the response cache and session pool between iterations
+    
+    Returns:
+        Dict: Run metadata plus one summary per operation
+    """
+    async with DeviceSimulator(port=0, token_latency=token_latency, jitter=jitter,
+                               reply_tokens=reply_tokens, seed=0) as simulator:
+        NeurocorticalBridge._transport = WiFiTransport(ip="127.0.0.1", port=simulator.port)
+        NeurocorticalBridge._connection_type = "tcp"
+        NeurocorticalBridge._initialized = True
+
+        operations = {}
+        try:
+            operations["ping"] = await bench_operation(simulator, "ping", None, iterations, warm)
+            operations["hardware_info"] = await bench_operation(simulator, "hardware_info", None, iterations, warm)
+            operations["list_models"] = await bench_operation(simulator, "list_models", None, iterations, warm)
+            operations["set_model"] = await bench_operation(
+                simulator, "set_model", {"model": MODEL, "prompt": "You are a benchmark."}, iterations, warm
+            )
+
+            setup = await NeurocorticalBridge.execute_operation("set_model", {"model": MODEL})
+            work_id = setup.get("response", {}).get("work_id", "llm")
+            operations["think_stream"] = await bench_stream_think(simulator, work_id, iterations)
+        finally:
+            await NeurocorticalBridge.cleanup()
+
+    return {
+        "revision": git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "config": {
+            "iterations": iterations,
+            "token_latency": token_latency,
+            "reply_tokens": reply_tokens,
+            "jitter": jitter,
+            "warm": warm,
+        },
+        "operations": operations,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> str:
+    """Render a p50/p95 comparison table against an earlier results file"""
+    lines = [f"{'operation':<16}{'metric':<20}{'baseline':>12}{'current':>12}{'change':>10}"]
+    for operation, stats in current["operations"].items():
+        old = baseline.get("operations", {}).get(operation)
+        if not old:
+            continue
+        for metric in ("p50_ms", "p95_ms", "ttft_p50_ms", "tokens_per_sec_p50", "connections_per_op"):
+            if metric not in stats or metric not in old:
+                continue
+            change = (stats[metric] - old[metric]) / old[metric] * 100 if old[metric] else 0.0
+            lines.append(f"{operation:<16}{metric:<20}{old[metric]:>12}{stats[metric]:>12}{change:>9.1f}%")
+    return "\n".join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the bridge and transport against the device simulator")
+    parser.add_argument("--iterations", type=int, default=20, help="Runs per operation")
+    parser.add_argument("--token-latency", type=float, default=0.005, help="Simulated seconds per token")
+    parser.add_argument("--reply-tokens", type=int, default=24, help="Tokens per simulated reply")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Simulated per-token jitter in seconds")
+    parser.add_argument("--warm", action="store_true",
+                        help="Keep the response cache and session pool between iterations")
+    parser.add_argument("--output", default="bench_results.json", help="Where to write the JSON results")
+    parser.add_argument("--compare", default=None, help="Earlier results file to compare against")
+    parser.add_argument("--verbose", action="store_true", help="Keep the bridge's console output")
+    args = parser.parse_args(argv)
+
+    # The bridge prints every system command; keep it out of the report unless asked
+    quiet = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+    with quiet:
+        results = asyncio.run(run_benchmarks(args.iterations, args.token_latency, args.reply_tokens,
+                                             args.jitter, args.warm))
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"📊 Benchmark @ {results['revision']} ({args.iterations} iterations, {'warm' if args.warm else 'cold'})")
+    for operation, stats in results["operations"].items():
+        line = (f"  {operation:<14} p50 {stats['p50_ms']:>8.2f}ms  p95 {stats['p95_ms']:>8.2f}ms  "
+                f"p99 {stats['p99_ms']:>8.2f}ms  conns/op {stats['connections_per_op']:<5}")
+        if "ttft_p50_ms" in stats:
+            line += f"  ttft {stats['ttft_p50_ms']:.2f}ms  {stats['tokens_per_sec_p50']} tok/s"
+        if stats["errors"]:
+            line += f"  ❌ {stats['errors']} errors"
+        print(line)
+    print(f"💾 Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            print(compare(results, json.load(f)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Smoke test for the bridge benchmark harness
+A short run must produce a complete report for every operation
+"""
+
+import sys
+import os
+import json
+
+# Add this directory to path for the harness import
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from bench_bridge import percentile, main
+
+
+def test_percentile_nearest_rank():
+    samples = [float(i) for i in range(1, 101)]
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([], 50) == 0.0
+
+
+def test_short_run_reports_every_operation(tmp_path):
+    output = tmp_path / "bench.json"
+    assert main(["--iterations", "3", "--token-latency", "0.001", "--reply-tokens", "5", "--output", str(output)]) == 0
+
+    results = json.loads(output.read_text())
+    operations = results["operations"]
+    assert set(operations) == {"ping", "hardware_info", "list_models", "set_model", "think_stream"}
+    for stats in operations.values():
+        assert stats["errors"] == 0
+        assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"]
+        # Cold runs must reach the device every time
+        assert stats.get("cache_hits", 0) == 0
+    assert operations["think_stream"]["ttft_p50_ms"] <= operations["think_stream"]["p50_ms"]
+    # Every operation after the first should reuse the shared session
+    assert operations["think_stream"]["connections_opened"] == 0
+
+
+def test_warm_run_is_served_from_cache(tmp_path):
+    output = tmp_path / "bench.json"
+    assert main(["--iterations", "3", "--token-latency", "0.001", "--reply-tokens", "5",
+                 "--warm", "--output", str(output)]) == 0
+
+    operations = json.loads(output.read_text())["operations"]
+    # Only the first lookup of each cached query reaches the device
+    assert operations["hardware_info"]["cache_hits"] == 2
+    assert operations["list_models"]["cache_hits"] == 2
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent ADB reader in SynapticPathways._read_responses
+A fake `adb` on PATH stands in for `adb shell cat <port>`
+"""
+
+import sys
+import os
+import time
+import stat
+import threading
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Mind.CorpusCallosum import synaptic_pathways
+from Mind.CorpusCallosum.synaptic_pathways import SynapticPathways
+
+FAKE_ADB = """#!/bin/sh
+echo "$@" >> "{log}"
+printf '{{"request_id": "1", "data": "hel'
+sleep 0.1
+printf 'lo"}}\\n{{"request_id": "2", "data": "world"}}\\n'
+sleep 5
+"""
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake adb is a shell script")
+def test_adb_reader_uses_one_persistent_process(tmp_path, monkeypatch):
+    log = tmp_path / "adb_calls.log"
+    adb = tmp_path / "adb"
+    adb.write_text(FAKE_ADB.format(log=log))
+    adb.chmod(adb.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+    received = []
+    monkeypatch.setattr(SynapticPathways, "_connection_type", "adb")
+    monkeypatch.setattr(SynapticPathways, "_serial_port", "/dev/ttyS1")
+    monkeypatch.setattr(SynapticPathways, "_response_callback", received.append)
+
+    SynapticPathways._start_response_thread()
+    try:
+        deadline = time.time() + 3
+        while len(received) < 2 and time.time() < deadline:
+            time.sleep(0.02)
+    finally:
+        SynapticPathways._stop_response_thread()
+
+    assert received == ["hello", "world"]
+    # One long-lived `adb shell cat`, not one process per byte
+    assert log.read_text().splitlines() == ["shell cat /dev/ttyS1"]
+    assert SynapticPathways._adb_reader is None
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake adb is a shell script")
+def test_stop_while_the_reader_is_reopening_the_pipe(tmp_path, monkeypatch):
+    """A stop that lands while the pipe is being opened must still end the reader"""
+    log = tmp_path / "adb_calls.log"
+    adb = tmp_path / "adb"
+    adb.write_text(f'#!/bin/sh\necho "$@" >> "{log}"\nsleep 5\n')
+    adb.chmod(adb.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setattr(SynapticPathways, "_connection_type", "adb")
+    monkeypatch.setattr(SynapticPathways, "_serial_port", "/dev/ttyS1")
+
+    stopper = threading.Thread(target=SynapticPathways._stop_response_thread)
+    real_open = synaptic_pathways.open_adb_pipe
+
+    def open_during_stop(args):
+        if not stopper.is_alive():
+            stopper.start()
+            time.sleep(0.1)  # The stop request arrives before the pipe exists
+        return real_open(args)
+
+    monkeypatch.setattr(synaptic_pathways, "open_adb_pipe", open_during_stop)
+
+    SynapticPathways._start_response_thread()
+    stopper_started = time.time() + 3
+    while not stopper.is_alive() and time.time() < stopper_started:
+        time.sleep(0.01)
+    stopper.join(timeout=3)
+
+    # Without the lock the stop closes nothing and the reader blocks on a fresh `cat`
+    assert not stopper.is_alive()
+    assert not SynapticPathways._response_thread.is_alive()
+    assert SynapticPathways._adb_reader is None
+    assert len(log.read_text().splitlines()) == 1
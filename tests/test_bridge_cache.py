@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests for the bridge's response cache for idempotent sys operations
+"""
+
+import sys
+import os
+import asyncio
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Mind.Subcortex.device_simulator import DeviceSimulator
+from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
+from Mind.Subcortex.response_cache import ResponseCache
+from Mind.Subcortex.transport_layer import WiFiTransport
+
+
+def use_simulator(simulator):
+    NeurocorticalBridge._transport = WiFiTransport(ip="127.0.0.1", port=simulator.port)
+    NeurocorticalBridge._connection_type = "tcp"
+    NeurocorticalBridge._initialized = True
+
+
+def test_list_models_cached_until_set_model(monkeypatch):
+    monkeypatch.setattr(NeurocorticalBridge, "_response_cache", ResponseCache())
+
+    async def run():
+        async with DeviceSimulator(port=0) as simulator:
+            use_simulator(simulator)
+            try:
+                first = await NeurocorticalBridge.execute_operation("list_models")
+                second = await NeurocorticalBridge.execute_operation("list_models")
+                lsmode_after_repeat = simulator.stats["requests"]["lsmode"]
+
+                await NeurocorticalBridge.execute_operation("set_model", {"model": "qwen2.5-0.5b"})
+                await NeurocorticalBridge.execute_operation("list_models")
+                lsmode_after_setup = simulator.stats["requests"]["lsmode"]
+            finally:
+                await NeurocorticalBridge.cleanup()
+            return first, second, lsmode_after_repeat, lsmode_after_setup
+
+    first, second, after_repeat, after_setup = asyncio.run(run())
+    assert first["status"] == "ok"
+    assert second == first
+    assert after_repeat == 1
+    assert after_setup == 2
+
+    stats = NeurocorticalBridge.get_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+
+def test_hardware_info_expires_and_errors_are_not_cached(monkeypatch):
+    monkeypatch.setattr(NeurocorticalBridge, "_response_cache", ResponseCache())
+    monkeypatch.setitem(NeurocorticalBridge.CACHE_TTLS, "hardware_info", 0.05)
+
+    async def run():
+        async with DeviceSimulator(port=0) as simulator:
+            use_simulator(simulator)
+            try:
+                await NeurocorticalBridge.execute_operation("hardware_info")
+                await NeurocorticalBridge.execute_operation("hardware_info")
+                cached_count = simulator.stats["requests"]["hwinfo"]
+                await asyncio.sleep(0.1)
+                await NeurocorticalBridge.execute_operation("hardware_info")
+                expired_count = simulator.stats["requests"]["hwinfo"]
+            finally:
+                await NeurocorticalBridge.cleanup()
+        return cached_count, expired_count
+
+    cached_count, expired_count = asyncio.run(run())
+    assert cached_count == 1
+    assert expired_count == 2
+
+
+def test_stale_in_flight_response_is_dropped():
+    """A response requested before an invalidation must not be stored as fresh"""
+    cache = ResponseCache()
+    generation = cache.generation
+    cache.invalidate()
+    cache.put("list_models", {"status": "ok"}, ttl=30, generation=generation)
+    assert cache.get("list_models") is None
+
+    cache.put("list_models", {"status": "ok"}, ttl=30, generation=cache.generation)
+    value = cache.get("list_models")
+    value["status"] = "mutated"
+    assert cache.get("list_models") == {"status": "ok"}
+
+
+def test_concurrent_identical_queries_share_one_request(monkeypatch):
+    """Simultaneous hwinfo/lsmode callers coalesce onto a single device round-trip each"""
+    monkeypatch.setattr(NeurocorticalBridge, "_response_cache", ResponseCache())
+    monkeypatch.setattr(NeurocorticalBridge, "_coalesced_requests", 0)
+
+    async def run():
+        async with DeviceSimulator(port=0) as simulator:
+            use_simulator(simulator)
+            hw_command = NeurocorticalBridge.create_sys_command("hwinfo")
+            try:
+                results = await asyncio.gather(
+                    *(NeurocorticalBridge._send_to_hardware(dict(hw_command)) for _ in range(4)),
+                    NeurocorticalBridge.execute_operation("hardware_info"),
+                    *(NeurocorticalBridge.execute_operation("list_models") for _ in range(3)),
+                )
+            finally:
+                await NeurocorticalBridge.cleanup()
+            return results, dict(simulator.stats["requests"])
+
+    results, requests = asyncio.run(run())
+    assert requests["hwinfo"] == 1
+    assert requests["lsmode"] == 1
+    assert all(result["error"]["code"] == 0 for result in results[:4])
+    # Every caller gets its own copy
+    results[0]["data"]["mem"] = -1
+    assert results[1]["data"]["mem"] != -1
+    assert NeurocorticalBridge.get_cache_stats()["coalesced"] == 6
+    assert NeurocorticalBridge.get_cache_stats()["in_flight"] == 0
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Tests for NeurocorticalBridge.stream_operation
+Deltas must reach the caller while the device is still generating
+"""
+
+import sys
+import os
+import json
+import time
+import asyncio
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Mind.Subcortex.device_simulator import DeviceSimulator
+from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
+from Mind.Subcortex.transport_layer import WiFiTransport
+
+TOKENS = ["Hello", " from", " the", " penphin", "!"]
+TOKEN_DELAY = 0.1
+
+
+async def start_token_server(requests=None):
+    """Stream TOKENS as llm delta chunks, one every TOKEN_DELAY seconds"""
+    async def handle(reader, writer):
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            request = json.loads(line)
+            if requests is not None:
+                requests.append(request)
+            for index, token in enumerate(TOKENS):
+                await asyncio.sleep(TOKEN_DELAY)
+                chunk = {
+                    "request_id": request["request_id"],
+                    "work_id": request["work_id"],
+                    "object": "llm.utf-8.stream",
+                    "error": {"code": 0, "message": ""},
+                    "data": {"delta": token, "index": index, "finish": index == len(TOKENS) - 1},
+                }
+                writer.write((json.dumps(chunk) + "\n").encode())
+                await writer.drain()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+def use_transport(port):
+    """Point the bridge at a local transport without running discovery"""
+    transport = WiFiTransport(ip="127.0.0.1", port=port)
+    transport.connected = True
+    NeurocorticalBridge._transport = transport
+    NeurocorticalBridge._connection_type = "tcp"
+    NeurocorticalBridge._initialized = True
+    return transport
+
+
+def test_stream_operation_yields_before_generation_finishes():
+    """Time-to-first-token should be about one token, not the whole generation"""
+    async def run():
+        server, port = await start_token_server()
+        transport = use_transport(port)
+        start = time.time()
+        arrivals = []
+        deltas = []
+        try:
+            async for delta in NeurocorticalBridge.stream_operation("think", {"prompt": "hi", "work_id": "llm.1001"}):
+                arrivals.append(time.time() - start)
+                deltas.append(delta)
+        finally:
+            await transport.disconnect()
+            await NeurocorticalBridge.cleanup()
+            server.close()
+        return deltas, arrivals
+
+    deltas, arrivals = asyncio.run(run())
+    assert deltas == TOKENS
+    total = TOKEN_DELAY * len(TOKENS)
+    assert arrivals[0] < total / 2
+
+
+def test_handle_llm_stream_collects_full_response():
+    """The buffered helper still returns the joined reply and forwards deltas to the callback"""
+    async def run():
+        server, port = await start_token_server()
+        transport = use_transport(port)
+        seen = []
+        try:
+            command = NeurocorticalBridge.create_llm_inference_command("hi", stream=True, work_id="llm.1001")
+            result = await NeurocorticalBridge._handle_llm_stream(command, callback=seen.append)
+        finally:
+            await transport.disconnect()
+            await NeurocorticalBridge.cleanup()
+            server.close()
+        return result, seen
+
+    result, seen = asyncio.run(run())
+    assert result["status"] == "ok"
+    assert result["response"] == "".join(TOKENS)
+    assert seen == TOKENS
+
+
+def test_start_stream_operation_runs_one_generation():
+    """A callback-driven stream must hit the device once and respect a slow consumer"""
+    async def run():
+        requests = []
+        server, port = await start_token_server(requests)
+        transport = use_transport(port)
+        seen = []
+
+        async def slow_callback(delta):
+            seen.append(delta)
+            await asyncio.sleep(0.05)
+
+        try:
+            handle = NeurocorticalBridge.start_stream_operation(
+                "think", {"prompt": "hi", "work_id": "llm.1001"}, callback=slow_callback, max_pending=1
+            )
+            response = await handle
+        finally:
+            await transport.disconnect()
+            await NeurocorticalBridge.cleanup()
+            server.close()
+        return response, seen, requests
+
+    response, seen, requests = asyncio.run(run())
+    assert response == "".join(TOKENS)
+    assert seen == TOKENS
+    assert len(requests) == 1
+
+
+def test_stream_handle_can_be_cancelled():
+    """Cancelling the handle stops delivery and awaiting it raises CancelledError"""
+    async def run():
+        server, port = await start_token_server()
+        transport = use_transport(port)
+        seen = []
+        try:
+            handle = NeurocorticalBridge.start_stream_operation(
+                "think", {"prompt": "hi"}, callback=seen.append
+            )
+            await asyncio.sleep(TOKEN_DELAY * 1.5)
+            handle.cancel()
+            try:
+                await handle
+                cancelled = False
+            except asyncio.CancelledError:
+                cancelled = True
+        finally:
+            await transport.disconnect()
+            await NeurocorticalBridge.cleanup()
+            server.close()
+        return cancelled, seen
+
+    cancelled, seen = asyncio.run(run())
+    assert cancelled
+    assert 0 < len(seen) < len(TOKENS)
+
+
+def test_cancel_stops_generation_on_device():
+    """Cancelling resolves the handle at once and sends llm pause so the device is free"""
+    async def run():
+        async with DeviceSimulator(port=0, token_latency=0.02, reply_tokens=500) as simulator:
+            use_transport(simulator.port)
+            first_delta = asyncio.Event()
+            try:
+                handle = NeurocorticalBridge.start_stream_operation(
+                    "think", {"prompt": "hi"}, callback=lambda delta: first_delta.set()
+                )
+                await asyncio.wait_for(first_delta.wait(), 2)
+                start = time.monotonic()
+                handle.cancel()
+                try:
+                    await handle
+                except asyncio.CancelledError:
+                    pass
+                resolved_in = time.monotonic() - start
+                await asyncio.wait_for(asyncio.gather(*NeurocorticalBridge._stop_tasks), 2)
+                generations = dict(simulator._generations)
+                requests = dict(simulator.stats["requests"])
+            finally:
+                await NeurocorticalBridge.cleanup()
+        return handle, resolved_in, generations, requests
+
+    handle, resolved_in, generations, requests = asyncio.run(run())
+    assert handle.cancelled()
+    assert handle.text
+    assert resolved_in < 0.2
+    assert requests["pause"] == 1
+    assert generations == {}
+    assert NeurocorticalBridge.get_inference_stats()["devices"]["tcp:127.0.0.1"]["active"] == 0
+
+
+def test_cancel_streams_aborts_buffered_stream():
+    """_handle_llm_stream returns the partial reply when its stream is cancelled"""
+    async def run():
+        async with DeviceSimulator(port=0, token_latency=0.02, reply_tokens=500) as simulator:
+            use_transport(simulator.port)
+            seen = []
+            try:
+                command = NeurocorticalBridge.create_llm_inference_command("hi", stream=True)
+                pending = asyncio.create_task(NeurocorticalBridge._handle_llm_stream(command, callback=seen.append))
+                while len(seen) < 3:
+                    await asyncio.sleep(0.01)
+                cancelled = NeurocorticalBridge.cancel_streams()
+                result = await asyncio.wait_for(pending, 1)
+            finally:
+                await NeurocorticalBridge.cleanup()
+        return cancelled, result, seen
+
+    cancelled, result, seen = asyncio.run(run())
+    assert cancelled == 1
+    assert result["status"] == "cancelled"
+    assert result["response"] == "".join(result["chunks"])
+    assert result["chunks"] == seen[:len(result["chunks"])]
+    assert NeurocorticalBridge._active_streams == set()
+
+
+def test_stop_waits_for_its_own_reply_before_freeing_the_slot(monkeypatch):
+    """Leftover frames of the aborted stream are drained; the slot frees on the pause reply"""
+    sent = []
+
+    async def fake_transmit(cls, command, stream_callback=None, route=None):
+        sent.append(command["request_id"])
+        if len(sent) == 1:
+            # In-order transports hand back the old stream's closing chunk first
+            return {"request_id": "stream-1", "error": {"code": 0}, "data": {"delta": "", "finish": True}}
+        return {"request_id": command["request_id"], "error": {"code": 0, "message": ""}}
+
+    monkeypatch.setattr(NeurocorticalBridge, "_transmit_to_hardware", classmethod(fake_transmit))
+
+    async def run():
+        scheduler = NeurocorticalBridge._inference_scheduler
+        await scheduler.acquire("stop-test")
+        command = {"request_id": "stream-1", "work_id": "llm.1001", "action": "inference"}
+        await NeurocorticalBridge._stop_generation(command, "stop-test")
+        return scheduler.stats()["devices"]["stop-test"]["active"]
+
+    assert asyncio.run(run()) == 0
+    assert len(sent) == 2 and sent[0] == sent[1]
+
+
+def test_inference_after_cancel_gets_no_stale_chunks():
+    """The next inference on the freed slot only sees its own generation"""
+    async def run():
+        async with DeviceSimulator(port=0, token_latency=0.01, reply_tokens=200) as simulator:
+            use_transport(simulator.port)
+            first_delta = asyncio.Event()
+            try:
+                handle = NeurocorticalBridge.start_stream_operation(
+                    "think", {"prompt": "first"}, callback=lambda delta: first_delta.set()
+                )
+                await asyncio.wait_for(first_delta.wait(), 2)
+                handle.cancel()
+                try:
+                    await handle
+                except asyncio.CancelledError:
+                    pass
+                simulator.reply_tokens = 6
+                chunks = []
+                async for chunk in NeurocorticalBridge.stream_operation("think", {"prompt": "second"}):
+                    chunks.append(chunk)
+                await asyncio.wait_for(asyncio.gather(*NeurocorticalBridge._stop_tasks), 2)
+            finally:
+                await NeurocorticalBridge.cleanup()
+        return chunks
+
+    chunks = asyncio.run(run())
+    assert "".join(chunks).startswith("Simulated reply to: second")
+
+
+def test_stream_visualization_is_fed_every_delta(monkeypatch):
+    """think_with_stream_visualization pushes the growing reply to its display task"""
+    from Mind.CorpusCallosum.synaptic_pathways import SynapticPathways
+    from Mind.Subcortex.BasalGanglia.basal_ganglia_integration import BasalGangliaIntegration
+    from Mind.Subcortex.BasalGanglia.tasks.display_visual_task import DisplayVisualTask
+
+    shown = []
+
+    async def fake_stream(cls, operation, data=None, max_pending=0):
+        for token in TOKENS:
+            await asyncio.sleep(0.12)
+            yield token
+
+    monkeypatch.setattr(NeurocorticalBridge, "stream_operation", classmethod(fake_stream))
+    monkeypatch.setattr(NeurocorticalBridge, "_basal_ganglia", None)
+    monkeypatch.setattr(NeurocorticalBridge, "_transport", None)
+    monkeypatch.setattr(BasalGangliaIntegration, "_create_core_tasks", lambda self: None)
+    monkeypatch.setattr(DisplayVisualTask, "_display_stream", lambda self, content: shown.append(content))
+
+    async def run():
+        try:
+            result = await SynapticPathways.think_with_stream_visualization(
+                "Tell me about the penphin", highlight_keywords=True
+            )
+            await asyncio.sleep(0.3)
+            bg = NeurocorticalBridge.get_basal_ganglia()
+            return result, bg.basal_ganglia.scheduler.stats()
+        finally:
+            await NeurocorticalBridge.cleanup()
+
+    result, stats = asyncio.run(run())
+    assert result == "".join(TOKENS)
+    # Initial blank frame, then the reply as it grew, ending with all of it
+    assert shown[0] == "" and len(shown) >= 3
+    assert shown[-1] == "Hello from the [HIGHLIGHT]penphin[/HIGHLIGHT]!"
+    assert stats["queued"] == 0 and stats["running"] == 0
+
+
+def test_cancelling_the_caller_stops_the_stream():
+    """Cancelling _handle_llm_stream's task propagates and takes the stream down with it"""
+    async def run():
+        async with DeviceSimulator(port=0, token_latency=0.02, reply_tokens=500) as simulator:
+            use_transport(simulator.port)
+            seen = []
+            try:
+                command = NeurocorticalBridge.create_llm_inference_command("hi", stream=True)
+                pending = asyncio.create_task(NeurocorticalBridge._handle_llm_stream(command, callback=seen.append))
+                while len(seen) < 3:
+                    await asyncio.sleep(0.01)
+                pending.cancel()
+                try:
+                    await pending
+                except asyncio.CancelledError:
+                    pass
+                for _ in range(100):
+                    if not NeurocorticalBridge._active_streams:
+                        break
+                    await asyncio.sleep(0.01)
+                return pending.cancelled(), set(NeurocorticalBridge._active_streams)
+            finally:
+                await NeurocorticalBridge.cleanup()
+
+    cancelled, active = asyncio.run(run())
+    assert cancelled
+    assert active == set()
+
+
+def test_stream_visualization_failure_returns_text(monkeypatch):
+    """A failed stream still hands back a string, as the annotation promises"""
+    from Mind.CorpusCallosum.synaptic_pathways import SynapticPathways
+    from Mind.Subcortex.BasalGanglia.basal_ganglia_integration import BasalGangliaIntegration
+    from Mind.Subcortex.BasalGanglia.tasks.display_visual_task import DisplayVisualTask
+
+    async def failing_stream(cls, operation, data=None, max_pending=0):
+        yield "Hel"
+        raise ConnectionError("device went away")
+
+    monkeypatch.setattr(NeurocorticalBridge, "stream_operation", classmethod(failing_stream))
+    monkeypatch.setattr(NeurocorticalBridge, "_basal_ganglia", None)
+    monkeypatch.setattr(NeurocorticalBridge, "_transport", None)
+    monkeypatch.setattr(BasalGangliaIntegration, "_create_core_tasks", lambda self: None)
+    monkeypatch.setattr(DisplayVisualTask, "_display_stream", lambda self, content: None)
+
+    async def run():
+        try:
+            return await SynapticPathways.think_with_stream_visualization("hi")
+        finally:
+            await NeurocorticalBridge.cleanup()
+
+    result = asyncio.run(run())
+    assert isinstance(result, str)
+    assert "device went away" in result
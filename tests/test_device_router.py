@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Tests for routing bridge requests across several devices
+"""
+
+import sys
+import os
+import asyncio
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import CONFIG
+from Mind.Subcortex.device_router import DeviceRouter
+from Mind.Subcortex.device_simulator import DeviceSimulator
+from Mind.Subcortex.inference_scheduler import InferenceScheduler
+from Mind.Subcortex.llm_session_pool import LLMSessionPool
+from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
+from Mind.Subcortex.response_cache import ResponseCache
+from Mind.Subcortex.transport_layer import WiFiTransport
+
+MODEL = "qwen2.5-0.5b"
+
+
+def use_router(monkeypatch, *simulators):
+    router = DeviceRouter(on_device_lost=NeurocorticalBridge._forget_lost_sessions)
+    for name, simulator in zip("ab", simulators):
+        router.add_device(name, WiFiTransport(ip="127.0.0.1", port=simulator.port, discover=False))
+    monkeypatch.setattr(NeurocorticalBridge, "_router", router)
+    monkeypatch.setattr(NeurocorticalBridge, "_inference_scheduler", InferenceScheduler(max_concurrency=1))
+    monkeypatch.setattr(NeurocorticalBridge, "_session_pool", LLMSessionPool(max_sessions=3))
+    NeurocorticalBridge._initialized = True
+    return router
+
+
+async def think(prompt):
+    text = ""
+    async for delta in NeurocorticalBridge.stream_operation("think", {"prompt": prompt}):
+        text += delta
+    return text
+
+
+def test_stateless_inference_goes_to_least_busy_device(monkeypatch):
+    async def run():
+        async with DeviceSimulator(port=0, token_latency=0.005, reply_tokens=8) as a, \
+                DeviceSimulator(port=0, token_latency=0.005, reply_tokens=8) as b:
+            router = use_router(monkeypatch, a, b)
+            try:
+                replies = await asyncio.gather(*(think(f"prompt {n}") for n in range(4)))
+                stats = router.stats()
+            finally:
+                await NeurocorticalBridge.cleanup()
+            return replies, a.stats["requests"]["inference"], b.stats["requests"]["inference"], stats
+
+    replies, on_a, on_b, stats = asyncio.run(run())
+    assert all(replies)
+    assert (on_a, on_b) == (2, 2)
+    assert all(device["outstanding"] == 0 for device in stats["devices"].values())
+
+
+def test_sessions_and_work_ids_stay_on_their_device(monkeypatch):
+    async def run():
+        async with DeviceSimulator(port=0, token_latency=0.005) as a, \
+                DeviceSimulator(port=0, token_latency=0.005) as b:
+            router = use_router(monkeypatch, a, b)
+            try:
+                with NeurocorticalBridge.routing_session("chat-1"):
+                    for n in range(3):
+                        await think(f"turn {n}")
+                penphin, dolphin = await asyncio.gather(
+                    NeurocorticalBridge.get_llm_session(MODEL, "penphin"),
+                    NeurocorticalBridge.get_llm_session(MODEL, "dolphin"),
+                )
+                for work_id in (penphin, dolphin, penphin):
+                    await NeurocorticalBridge._send_to_hardware(
+                        NeurocorticalBridge.create_llm_inference_command("hi", work_id=work_id)
+                    )
+                stats = router.stats()
+            finally:
+                await NeurocorticalBridge.cleanup()
+            return penphin, dolphin, a.stats["requests"]["inference"], b.stats["requests"]["inference"], stats
+
+    penphin, dolphin, on_a, on_b, stats = asyncio.run(run())
+    # Both devices hand out llm.1001; the router keeps them apart
+    assert {penphin, dolphin} == {"llm.1001@a", "llm.1001@b"}
+    pinned = stats["sessions"]["chat-1"]
+    penphin_device = penphin.rsplit("@", 1)[1]
+    expected = {"a": 0, "b": 0}
+    expected[pinned] += 3
+    expected[penphin_device] += 2
+    expected["b" if penphin_device == "a" else "a"] += 1
+    assert (on_a, on_b) == (expected["a"], expected["b"])
+
+
+def test_fails_over_when_a_device_drops(monkeypatch):
+    async def run():
+        async with DeviceSimulator(port=0, token_latency=0.005) as a, \
+                DeviceSimulator(port=0, token_latency=0.005) as b:
+            router = use_router(monkeypatch, a, b)
+            try:
+                with NeurocorticalBridge.routing_session("chat-1"):
+                    await think("hello")
+                    pinned = router.stats()["sessions"]["chat-1"]
+                    work_id = await NeurocorticalBridge.get_llm_session(MODEL, "penphin")
+
+                    # The pinned device goes away
+                    dropped = a if pinned == "a" else b
+                    await dropped.stop()
+                    await router.devices[pinned].transport.disconnect()
+
+                    reply = await think("still there?")
+                stats = router.stats()
+                pooled = NeurocorticalBridge.get_session_pool_stats()["work_ids"]
+            finally:
+                await NeurocorticalBridge.cleanup()
+            return pinned, work_id, reply, stats, pooled
+
+    pinned, work_id, reply, stats, pooled = asyncio.run(run())
+    other = "b" if pinned == "a" else "a"
+    assert work_id.endswith(f"@{pinned}")
+    assert reply
+    assert stats["failovers"] == 1
+    assert stats["sessions"]["chat-1"] == other
+    assert not stats["devices"][pinned]["healthy"]
+    assert work_id not in pooled
+
+
+class FlakyTransport:
+    """Stays connected but answers with a canned reply or raises"""
+
+    def __init__(self, reply=None, error=None):
+        self.connected = True
+        self.reply = reply
+        self.error = error
+        self.sent = 0
+
+    async def connect(self):
+        return True
+
+    async def transmit(self, command):
+        self.sent += 1
+        if self.error is not None:
+            raise self.error
+        return self.reply
+
+
+def test_timeouts_and_rejected_commands_keep_the_device_up():
+    rejected = {"error": {"code": -1, "message": "Invalid command: Expecting value"}}
+    timed_out = {"error": {"code": -1, "message": "Timeout waiting for response"}}
+
+    async def run():
+        router = DeviceRouter()
+        a = router.add_device("a", FlakyTransport(reply=rejected))
+        b = router.add_device("b", FlakyTransport(error=asyncio.TimeoutError()))
+        c = router.add_device("c", FlakyTransport(reply=timed_out))
+        replies = [await router.transmit(device, {"action": "ping"}) for device in (a, b, c)]
+        # send() returns the error instead of retrying it on another device
+        sent = await router.send({"work_id": "sys", "action": "ping"})
+        return router, replies, sent
+
+    router, replies, sent = asyncio.run(run())
+    assert replies[0] is rejected and replies[2] is timed_out
+    assert "Timeout" in replies[1]["error"]["message"]
+    assert sent["error"]["code"] == -1
+    stats = router.stats()
+    assert all(device["healthy"] for device in stats["devices"].values())
+    assert stats["failovers"] == 0
+    assert sum(device.transport.sent for device in router.devices.values()) == 4
+
+
+def test_lost_connection_marks_the_device_down():
+    async def run():
+        router = DeviceRouter()
+        device = router.add_device("a", FlakyTransport(error=ConnectionResetError("reset by peer")))
+        return await router.transmit(device, {"action": "ping"}), router.stats()
+
+    reply, stats = asyncio.run(run())
+    assert "reset by peer" in reply["error"]["message"]
+    assert not stats["devices"]["a"]["healthy"]
+
+
+def test_routing_config_flag_starts_the_router(monkeypatch):
+    calls = []
+
+    async def initialize_router(cls, mind_ids=None, connection_type=None):
+        calls.append((mind_ids, connection_type))
+        return True
+
+    async def initialize_transport(cls, transport_type=None):
+        calls.append(transport_type)
+        return False
+
+    monkeypatch.setattr(NeurocorticalBridge, "initialize_router", classmethod(initialize_router))
+    monkeypatch.setattr(NeurocorticalBridge, "_initialize_transport", classmethod(initialize_transport))
+    monkeypatch.setattr(NeurocorticalBridge, "_initialized", False)
+    monkeypatch.setitem(CONFIG.routing, "minds", ["penphin", "dolphin"])
+
+    monkeypatch.setitem(CONFIG.routing, "enabled", False)
+    assert asyncio.run(NeurocorticalBridge.initialize_system("tcp")) is False
+    assert calls == ["tcp"]
+    calls.clear()
+
+    monkeypatch.setitem(CONFIG.routing, "enabled", True)
+    assert asyncio.run(NeurocorticalBridge.initialize_system("tcp")) is True
+    assert calls == [(["penphin", "dolphin"], "tcp")]
+
+
+def test_cached_answers_stay_with_their_device(monkeypatch):
+    """A cached or coalesced reply from one device is never handed to a session on another"""
+    monkeypatch.setattr(NeurocorticalBridge, "_response_cache", ResponseCache())
+
+    async def hardware_info(session):
+        with NeurocorticalBridge.routing_session(session):
+            return await NeurocorticalBridge.execute_operation("hardware_info")
+
+    async def run():
+        async with DeviceSimulator(port=0) as a, DeviceSimulator(port=0) as b:
+            use_router(monkeypatch, a, b)
+            NeurocorticalBridge.pin_session("on-a", "a")
+            NeurocorticalBridge.pin_session("on-b", "b")
+            try:
+                await asyncio.gather(hardware_info("on-a"), hardware_info("on-b"))
+                await hardware_info("on-a")
+                await hardware_info("on-b")
+                per_session = a.stats["requests"]["hwinfo"], b.stats["requests"]["hwinfo"]
+                # Outside a session the router picks the device per request, so nothing is cached
+                await NeurocorticalBridge.execute_operation("hardware_info")
+                await NeurocorticalBridge.execute_operation("hardware_info")
+                unrouted = a.stats["requests"]["hwinfo"] + b.stats["requests"]["hwinfo"] - sum(per_session)
+            finally:
+                await NeurocorticalBridge.cleanup()
+            return per_session, unrouted
+
+    per_session, unrouted = asyncio.run(run())
+    assert per_session == (1, 1)
+    assert unrouted == 2
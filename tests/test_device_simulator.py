@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for the local AX630C device simulator
+The simulator must speak the device protocol well enough to drive the real transports
+"""
+
+import sys
+import os
+import json
+import asyncio
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Mind.Subcortex.device_simulator import DeviceSimulator
+from Mind.Subcortex.transport_layer import WiFiTransport
+
+
+async def raw_request(port, command):
+    """Send one command on a fresh connection and return the first reply line"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write((json.dumps(command) + "\n").encode())
+    await writer.drain()
+    line = await reader.readline()
+    writer.close()
+    return json.loads(line)
+
+
+def test_sys_actions_over_wifi_transport():
+    """ping, hwinfo and lsmode answer in the device's response envelope"""
+    async def run():
+        async with DeviceSimulator(port=0, token_latency=0) as simulator:
+            transport = WiFiTransport(ip="127.0.0.1", port=simulator.port)
+            try:
+                assert await transport.connect()
+                hwinfo = await transport.transmit({"request_id": "hw", "work_id": "sys", "action": "hwinfo"})
+                lsmode = await transport.transmit({"request_id": "ls", "work_id": "sys", "action": "lsmode"})
+                unknown = await transport.transmit({"request_id": "x", "work_id": "sys", "action": "dance"})
+            finally:
+                await transport.disconnect()
+            return hwinfo, lsmode, unknown
+
+    hwinfo, lsmode, unknown = asyncio.run(run())
+    assert hwinfo["request_id"] == "hw"
+    assert hwinfo["error"]["code"] == 0
+    assert {"cpu_loadavg", "mem", "temperature", "eth_info"} <= set(hwinfo["data"])
+    assert any(model["type"] == "llm" for model in lsmode["data"])
+    assert unknown["error"]["code"] == -3
+
+
+def test_setup_then_stream_inference():
+    """setup allocates a work_id and streamed inference emits deltas ending with finish"""
+    async def run():
+        async with DeviceSimulator(port=0, token_latency=0.001, reply_tokens=6) as simulator:
+            transport = WiFiTransport(ip="127.0.0.1", port=simulator.port)
+            chunks = []
+
+            async def on_chunk(chunk):
+                chunks.append(chunk["data"])
+
+            try:
+                assert await transport.connect()
+                setup = await transport.transmit({
+                    "request_id": "setup", "work_id": "llm", "action": "setup",
+                    "model": "qwen2.5-0.5b-prefill", "response_format": "llm.utf-8.stream",
+                })
+                bad_setup = await transport.transmit({
+                    "request_id": "bad", "work_id": "llm", "action": "setup", "model": "no-such-model",
+                })
+                await transport.stream({
+                    "request_id": "inf", "work_id": setup["work_id"], "action": "inference",
+                    "object": "llm.utf-8.stream", "data": {"delta": "hello", "index": 0, "finish": True},
+                }, on_chunk)
+            finally:
+                await transport.disconnect()
+            return setup, bad_setup, chunks
+
+    setup, bad_setup, chunks = asyncio.run(run())
+    assert setup["work_id"].startswith("llm.")
+    assert bad_setup["error"]["code"] == -5
+    assert len(chunks) == 6
+    assert [chunk["finish"] for chunk in chunks] == [False] * 5 + [True]
+
+
+def test_concurrent_connections():
+    """Independent clients are served in parallel, not one after another"""
+    async def run():
+        async with DeviceSimulator(port=0, token_latency=0.02, reply_tokens=5) as simulator:
+            command = {"request_id": "c", "work_id": "llm", "action": "inference", "data": "hi"}
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            replies = await asyncio.gather(*(raw_request(simulator.port, command) for _ in range(5)))
+            elapsed = loop.time() - start
+            return replies, elapsed, simulator.stats["connections_opened"]
+
+    replies, elapsed, connections = asyncio.run(run())
+    assert all(reply["data"].startswith("Simulated") for reply in replies)
+    assert connections == 5
+    # Five serial generations would take ~0.5s
+    assert elapsed < 0.35
+
+
+def test_dropped_connection_surfaces_as_error():
+    """A dropped connection turns into the transport's error dict instead of hanging"""
+    async def run():
+        async with DeviceSimulator(port=0, drop_rate=1.0, seed=1) as simulator:
+            transport = WiFiTransport(ip="127.0.0.1", port=simulator.port)
+            transport.connected = True
+            try:
+                result = await transport.transmit({"request_id": "d", "work_id": "sys", "action": "hwinfo"})
+            finally:
+                await transport.disconnect()
+            return result, simulator.stats["connections_dropped"]
+
+    result, dropped = asyncio.run(run())
+    assert result["error"]["code"] == -1
+    assert dropped == 1
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent endpoint discovery
+"""
+
+import sys
+import os
+import time
+import socket
+import asyncio
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import CONFIG
+from Mind.Subcortex.device_simulator import DeviceSimulator
+from Mind.Subcortex.endpoint_discovery import EndpointCache, race_endpoints, subnet_candidates
+from Mind.Subcortex.transport_layer import WiFiTransport
+
+
+def unused_port():
+    """A local port with nothing listening on it"""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def start_silent_server():
+    """Accepts connections but never answers - the worst case for a sequential prober"""
+    async def handle(reader, writer):
+        await reader.read()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+def test_race_returns_first_live_endpoint():
+    """A live device wins without waiting out the silent and refused candidates"""
+    async def run():
+        silent, silent_port = await start_silent_server()
+        async with DeviceSimulator(port=0) as simulator:
+            candidates = [
+                ("127.0.0.1", silent_port),
+                ("127.0.0.1", silent_port),  # Duplicates are probed once
+                ("127.0.0.1", unused_port()),
+                ("127.0.0.1", simulator.port),
+            ]
+            start = time.monotonic()
+            winner = await race_endpoints(candidates, timeout=2.0)
+            elapsed = time.monotonic() - start
+        silent.close()
+        return winner, elapsed, simulator.port
+
+    winner, elapsed, live_port = asyncio.run(run())
+    assert winner == ("127.0.0.1", live_port)
+    assert elapsed < 1.0
+
+
+def test_race_with_no_live_endpoint():
+    assert asyncio.run(race_endpoints([("127.0.0.1", unused_port())], timeout=0.5)) is None
+    assert asyncio.run(race_endpoints([])) is None
+
+
+def test_endpoint_cache_ttl(tmp_path):
+    cache = EndpointCache(path=str(tmp_path / "endpoint.json"), ttl=60)
+    assert cache.load() is None
+    cache.save("10.0.0.135", 10001)
+    assert cache.load() == ("10.0.0.135", 10001)
+
+    expired = EndpointCache(path=str(tmp_path / "endpoint.json"), ttl=-1)
+    assert expired.load() is None
+
+
+def test_subnet_candidates_nearest_first():
+    candidates = subnet_candidates("192.168.1.100", 10001)
+    assert ("192.168.1.100", 10001) not in candidates
+    assert candidates[:2] in ([("192.168.1.99", 10001), ("192.168.1.101", 10001)],
+                              [("192.168.1.101", 10001), ("192.168.1.99", 10001)])
+    assert len(candidates) == 253
+    assert subnet_candidates(None, 10001) == []
+
+
+def configured_transport(monkeypatch, tmp_path, port, candidates=()):
+    """A transport whose endpoint comes from the mind config, as at startup"""
+    import Mind.mind_config as mind_config
+    monkeypatch.setattr(mind_config, "get_default_mind_id", lambda: "penphin")
+    monkeypatch.setattr(mind_config, "get_mind_by_id",
+                        lambda mind_id: {"connection": {"ip": "127.0.0.1", "port": port}})
+    monkeypatch.setitem(CONFIG.discovery, "probe_timeout", 0.3)
+    transport = WiFiTransport()
+    transport._endpoint_cache = EndpointCache(path=str(tmp_path / "endpoint.json"))
+    transport._candidate_endpoints = lambda: list(candidates)
+    return transport
+
+
+async def connect_and_close(transport):
+    try:
+        return await transport.connect()
+    finally:
+        await transport.disconnect()
+
+
+def test_connect_falls_back_to_remembered_endpoint(tmp_path, monkeypatch):
+    """A dead configured endpoint gives way to the last working one"""
+    async def run():
+        async with DeviceSimulator(port=0) as simulator:
+            transport = configured_transport(monkeypatch, tmp_path, unused_port())
+            transport._endpoint_cache.save("127.0.0.1", simulator.port)
+            return await connect_and_close(transport), transport.port, simulator.port
+
+    connected, port, live_port = asyncio.run(run())
+    assert connected
+    assert port == live_port
+
+
+def test_configured_endpoint_wins_over_other_live_devices(tmp_path, monkeypatch):
+    """Another mind's device answering too must not take over"""
+    async def run():
+        async with DeviceSimulator(port=0) as own, DeviceSimulator(port=0) as other:
+            transport = configured_transport(monkeypatch, tmp_path, own.port,
+                                             candidates=[("127.0.0.1", other.port)])
+            transport._endpoint_cache.save("127.0.0.1", other.port)
+            connected = await connect_and_close(transport)
+            return connected, transport.port, own.port, transport._endpoint_cache.load()
+
+    connected, port, own_port, cached = asyncio.run(run())
+    assert connected
+    assert port == own_port
+    # A successful direct connect is remembered
+    assert cached == ("127.0.0.1", own_port)
+
+
+def test_silent_configured_endpoint_then_races_the_candidates(tmp_path, monkeypatch):
+    """A configured endpoint that never answers costs one probe timeout, not a full ping timeout"""
+    async def run():
+        server, silent_port = await start_silent_server()
+        try:
+            async with DeviceSimulator(port=0) as simulator:
+                transport = configured_transport(monkeypatch, tmp_path, silent_port,
+                                                 candidates=[("127.0.0.1", simulator.port)])
+                start = time.monotonic()
+                connected = await connect_and_close(transport)
+                return connected, time.monotonic() - start, transport.port, simulator.port
+        finally:
+            server.close()
+
+    connected, elapsed, port, live_port = asyncio.run(run())
+    assert connected
+    assert port == live_port
+    assert elapsed < 2.0
+
+
+def test_explicit_endpoint_is_never_replaced(tmp_path):
+    async def run():
+        async with DeviceSimulator(port=0) as simulator:
+            dead_port = unused_port()
+            transport = WiFiTransport(ip="127.0.0.1", port=dead_port)
+            transport._endpoint_cache = EndpointCache(path=str(tmp_path / "endpoint.json"))
+            transport._endpoint_cache.save("127.0.0.1", simulator.port)
+            connected = await connect_and_close(transport)
+            return connected, transport.port, dead_port, transport._endpoint_cache.load(), simulator.port
+
+    connected, port, dead_port, cached, live_port = asyncio.run(run())
+    assert not connected
+    assert port == dead_port
+    assert cached == ("127.0.0.1", live_port)
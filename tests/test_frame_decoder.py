@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared NDJSON frame decoder
+"""
+
+import sys
+import os
+import json
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Mind.Subcortex.frame_decoder import NDJSONFrameDecoder, FrameTooLargeError
+
+
+def test_frames_split_across_reads():
+    """Partial lines wait for their newline; several frames in one read all come out"""
+    decoder = NDJSONFrameDecoder()
+    assert decoder.feed(b'{"request_id": "1", "da') == []
+    assert decoder.feed(b'ta": "a"}\n{"request_id": "2"}\n{"request') == [
+        {"request_id": "1", "data": "a"},
+        {"request_id": "2"},
+    ]
+    assert decoder.pending == len(b'{"request')
+    assert decoder.feed(b'_id": "3"}\r\n\n') == [{"request_id": "3"}]
+    assert decoder.pending == 0
+
+
+def test_multibyte_character_split_between_reads():
+    """A UTF-8 character cut in half by a read boundary still decodes"""
+    encoded = (json.dumps({"data": {"delta": "🐧"}}, ensure_ascii=False) + "\n").encode()
+    cut = encoded.index("🐧".encode()) + 2
+    decoder = NDJSONFrameDecoder()
+    assert decoder.feed(encoded[:cut]) == []
+    assert decoder.feed(encoded[cut:]) == [{"data": {"delta": "🐧"}}]
+
+
+def test_invalid_lines_are_reported_and_skipped():
+    seen = []
+    decoder = NDJSONFrameDecoder(on_invalid=seen.append)
+    assert decoder.feed(b"root@m5stack:~# echo\n{\"ok\": true}\n") == [{"ok": True}]
+    assert seen == [b"root@m5stack:~# echo"]
+    assert decoder.invalid_frames == 1
+
+
+def test_long_stream_compacts_instead_of_copying_per_line():
+    """Thousands of frames through a small buffer stay correct with few compactions"""
+    decoder = NDJSONFrameDecoder(initial_size=1024)
+    line = (json.dumps({"data": {"delta": "token", "finish": False}}) + "\n").encode()
+    stream = line * 5000
+    frames = []
+    # Odd read size so frames straddle reads
+    for offset in range(0, len(stream), 700):
+        frames.extend(decoder.feed(stream[offset:offset + 700]))
+    assert len(frames) == 5000
+    assert decoder.compactions < len(frames) / 10
+
+
+def test_writable_commit_fill_in_place():
+    decoder = NDJSONFrameDecoder(initial_size=16)
+    payload = b'{"work_id": "llm.1001", "data": "hello"}\n'
+    view = decoder.writable(len(payload))
+    view[:len(payload)] = payload
+    del view
+    assert decoder.commit(len(payload)) == [{"work_id": "llm.1001", "data": "hello"}]
+
+
+def test_oversized_frame_is_discarded():
+    decoder = NDJSONFrameDecoder(initial_size=64, max_frame_size=128)
+    with pytest.raises(FrameTooLargeError):
+        decoder.feed(b"x" * 200)
+    assert decoder.pending == 0
+    assert decoder.feed(b'{"ok": 1}\n') == [{"ok": 1}]
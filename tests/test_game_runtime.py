@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Tests for the fixed-timestep GameCortex runtime
+"""
+
+import sys
+import os
+import asyncio
+import threading
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Mind.GameCortex.base_module import BaseModule
+from Mind.GameCortex.game_runtime import GameRuntime, format_frame_stats
+
+
+class FakeClock:
+    """Clock that only moves when the runtime sleeps or a game burns time"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.now += seconds
+
+
+class CountingGame(BaseModule):
+    def __init__(self, clock, update_cost=0.0, draw_cost=0.0):
+        super().__init__(None, None)
+        self.clock = clock
+        self.update_cost = update_cost
+        self.draw_cost = draw_cost
+        self.steps = []
+        self.draws = 0
+        self.events = []
+
+    def update(self, dt):
+        self.steps.append(dt)
+        self.clock.now += self.update_cost
+
+    def draw(self):
+        self.draws += 1
+        self.clock.now += self.draw_cost
+
+    def handle_input(self, event):
+        self.events.append((event, len(self.steps)))
+        if event == "quit":
+            self.running = False
+
+
+def test_fixed_step_updates_and_one_draw_per_frame():
+    clock = FakeClock()
+    game = CountingGame(clock)
+    game.initialize()
+    presented = []
+    runtime = GameRuntime(game, present=lambda: presented.append(clock.now), fps=20,
+                          clock=clock, sleep=clock.sleep)
+
+    stats = asyncio.run(runtime.run(max_frames=10))
+
+    assert set(game.steps) == {0.05}
+    # The first frame draws the initial state; every later frame is one step
+    assert len(game.steps) == 9
+    assert game.draws == len(presented) == 10
+    assert stats["dropped_frames"] == 0 and stats["dropped_updates"] == 0
+    assert abs(stats["actual_fps"] - 20) < 2.5
+
+
+def test_slow_frames_skip_draws_but_keep_game_time():
+    clock = FakeClock()
+    # Drawing takes three frames' worth of time, so the loop falls behind
+    game = CountingGame(clock, draw_cost=0.15)
+    game.initialize()
+    runtime = GameRuntime(game, present=None, fps=20, max_skipped_draws=2,
+                          clock=clock, sleep=clock.sleep)
+
+    stats = asyncio.run(runtime.run(max_frames=30))
+
+    assert stats["dropped_frames"] > 0
+    assert game.draws < 30
+    # Never more than max_skipped_draws late frames in a row without a draw
+    assert stats["draws"] >= 30 // 3
+    # Game time still tracks wall time
+    simulated = len(game.steps) * 0.05
+    elapsed = clock.now - 100.0
+    assert abs(simulated - elapsed) <= 0.05 * (1 + runtime.max_updates_per_frame)
+    assert stats["draw"]["mean_ms"] == 150.0
+
+
+def test_catch_up_is_capped_and_overflow_counted():
+    clock = FakeClock()
+    game = CountingGame(clock)
+    game.initialize()
+    stalls = [1.0]
+
+    def present():
+        # The first push to the panel blocks for a whole second
+        if stalls:
+            clock.now += stalls.pop()
+
+    runtime = GameRuntime(game, present=present, fps=10, max_updates_per_frame=3,
+                          clock=clock, sleep=clock.sleep)
+
+    stats = asyncio.run(runtime.run(max_frames=3))
+
+    # Ten steps were due after the stall: three run, the rest are dropped
+    assert game.steps[:3] == [0.1, 0.1, 0.1]
+    assert stats["dropped_updates"] == 7
+    assert stats["present"]["max_ms"] == 1000.0
+
+
+def test_input_from_another_thread_is_dispatched_before_updates():
+    clock = FakeClock()
+    game = CountingGame(clock)
+    game.initialize()
+    runtime = GameRuntime(game, present=None, fps=30, clock=clock, sleep=clock.sleep)
+
+    worker = threading.Thread(target=runtime.post_input, args=("jump",))
+    worker.start()
+    worker.join()
+    runtime.post_input("quit")
+
+    stats = asyncio.run(runtime.run(max_frames=100))
+
+    assert [event for event, _ in game.events] == ["jump", "quit"]
+    assert all(steps_before == 0 for _, steps_before in game.events)
+    # The game stopping itself ends the loop
+    assert stats["frames"] == 1 and stats["input_events"] == 2
+
+
+def test_async_present_and_stats_formatting():
+    clock = FakeClock()
+    game = CountingGame(clock)
+    game.initialize()
+    pushed = []
+
+    async def present():
+        clock.now += 0.002
+        pushed.append(True)
+
+    runtime = GameRuntime(game, present=present, fps=30, clock=clock, sleep=clock.sleep)
+    stats = asyncio.run(runtime.run(max_frames=5))
+
+    assert len(pushed) == 5
+    assert stats["present"]["mean_ms"] == 2.0
+    lines = format_frame_stats(stats)
+    assert lines[0].startswith("  CountingGame:")
+    assert any(line.strip().startswith("present") for line in lines)
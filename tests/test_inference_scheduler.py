@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for the bridge's priority inference scheduler
+"""
+
+import sys
+import os
+import asyncio
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Mind.Subcortex.device_simulator import DeviceSimulator
+from Mind.Subcortex.inference_scheduler import InferencePriority, InferenceQueueFull, InferenceScheduler
+from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
+from Mind.Subcortex.transport_layer import WiFiTransport
+
+
+def test_interactive_jumps_queued_background():
+    async def run():
+        scheduler = InferenceScheduler(max_concurrency=1)
+        order = []
+
+        async def job(name, priority):
+            async with scheduler.slot("dev", priority):
+                order.append(name)
+                await asyncio.sleep(0.01)
+
+        await scheduler.acquire("dev", "background")  # The device is busy
+        jobs = [asyncio.create_task(job("bg-1", "background"))]
+        await asyncio.sleep(0)
+        jobs.append(asyncio.create_task(job("normal", "normal")))
+        await asyncio.sleep(0)
+        jobs.append(asyncio.create_task(job("chat", "interactive")))
+        await asyncio.sleep(0)
+        assert scheduler.queued("dev") == 3
+
+        scheduler.release("dev")
+        await asyncio.gather(*jobs)
+        return order, scheduler.stats()
+
+    order, stats = asyncio.run(run())
+    assert order == ["chat", "normal", "bg-1"]
+    assert stats["priorities"]["interactive"]["served"] == 1
+    assert stats["priorities"]["background"]["max_wait"] > 0
+    assert stats["devices"]["dev"]["active"] == 0
+
+
+def test_full_queue_rejects_and_cancelled_waiters_leave():
+    async def run():
+        scheduler = InferenceScheduler(max_concurrency=1, queue_limits={InferencePriority.BACKGROUND: 1})
+        await scheduler.acquire("dev", "interactive")
+
+        waiting = asyncio.create_task(scheduler.acquire("dev", "background"))
+        await asyncio.sleep(0)
+        with pytest.raises(InferenceQueueFull):
+            await scheduler.acquire("dev", "background")
+
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+        assert scheduler.queued("dev") == 0
+
+        # The freed queue space and slot are usable again
+        scheduler.release("dev")
+        await asyncio.wait_for(scheduler.acquire("dev", "background"), 1)
+        scheduler.release("dev")
+        return scheduler.stats()
+
+    stats = asyncio.run(run())
+    assert stats["priorities"]["background"]["rejected"] == 1
+    assert stats["devices"]["dev"] == {
+        "active": 0, "limit": 1, "queued": {"interactive": 0, "normal": 0, "background": 0}
+    }
+
+
+def test_bridge_serializes_inference_by_priority(monkeypatch):
+    """Chat sent while visualizer prompts stream goes next, not behind the backlog"""
+    monkeypatch.setattr(NeurocorticalBridge, "_inference_scheduler", InferenceScheduler(max_concurrency=1))
+
+    async def run():
+        async with DeviceSimulator(port=0, token_latency=0.005, reply_tokens=8) as simulator:
+            NeurocorticalBridge._transport = WiFiTransport(ip="127.0.0.1", port=simulator.port)
+            NeurocorticalBridge._connection_type = "tcp"
+            NeurocorticalBridge._initialized = True
+            finished = []
+
+            async def stream(name, priority):
+                async for _ in NeurocorticalBridge.stream_operation(
+                    "think", {"prompt": name, "priority": priority}
+                ):
+                    pass
+                finished.append(name)
+
+            try:
+                background = [asyncio.create_task(stream(f"bg-{n}", "background")) for n in range(3)]
+                await asyncio.sleep(0.01)
+                await stream("chat", "interactive")
+                await asyncio.gather(*background)
+            finally:
+                await NeurocorticalBridge.cleanup()
+            return finished
+
+    finished = asyncio.run(run())
+    assert finished == ["bg-0", "chat", "bg-1", "bg-2"]
+    stats = NeurocorticalBridge.get_inference_stats()
+    assert stats["priorities"]["interactive"]["served"] == 1
+    assert stats["priorities"]["background"]["served"] == 3
+    assert stats["priorities"]["interactive"]["max_wait"] < stats["priorities"]["background"]["max_wait"]
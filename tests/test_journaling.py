@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for lazy journaling and the buffered journal sink
+"""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Mind.FrontalLobe.PrefrontalCortex import system_journeling_manager
+from Mind.FrontalLobe.PrefrontalCortex.system_journeling_manager import (
+    JournalSink,
+    SystemJournelingLevel,
+    SystemJournelingManager
+)
+
+
+def test_disabled_levels_never_format(monkeypatch):
+    sink = JournalSink(console=False)
+    monkeypatch.setattr(system_journeling_manager, "_sink", sink)
+    journal = SystemJournelingManager(SystemJournelingLevel.ERROR)
+    calls = []
+
+    def expensive():
+        calls.append(True)
+        return "built"
+
+    class Unprintable:
+        def __str__(self):
+            raise AssertionError("formatted while disabled")
+
+    journal.recordDebug(expensive)
+    journal.recordInfo("value %s", Unprintable())
+    assert calls == []
+    assert not journal.isEnabledFor(SystemJournelingLevel.INFO)
+
+    journal.setLevel(SystemJournelingLevel.DEBUG)
+    journal.recordDebug(expensive)
+    journal.recordInfo("%d chunks from %s", 3, "llm.1001")
+    sink.flush()
+    assert calls == [True]
+    assert sink.written == 3  # level change, the callable and the %-formatted line
+
+
+def test_sink_writes_batches_and_drops_oldest(tmp_path):
+    log_file = tmp_path / "logs" / "penphin.log"
+    sink = JournalSink(capacity=3, log_file=str(log_file), console=False)
+    with sink._write_lock:  # Hold the writer so lines pile up in the buffer
+        for n in range(5):
+            sink.emit(f"line {n}")
+    sink.flush()
+
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert lines[0].endswith("2 journal lines dropped (writer fell behind)")
+    assert [line.split(" ", 2)[2] for line in lines[1:]] == ["line 2", "line 3", "line 4"]
+    assert sink.written == 4
+
+
+def test_console_lines_are_written_in_order_with_print(capsys, tmp_path):
+    sink = JournalSink(log_file=str(tmp_path / "penphin.log"), console=True)
+    with sink._write_lock:  # The file writer can't run, the console must not wait for it
+        print("prompt>")
+        sink.emit("journal line")
+        print("after")
+        assert capsys.readouterr().out == "prompt>\njournal line\nafter\n"
+    sink.flush()
+    assert (tmp_path / "penphin.log").read_text(encoding="utf-8").endswith("journal line\n")
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Tests for the bridge's pool of warm llm work_ids
+"""
+
+import sys
+import os
+import time
+import asyncio
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Mind.Subcortex.device_simulator import DeviceSimulator
+from Mind.Subcortex.llm_session_pool import LLMSessionPool
+from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
+from Mind.Subcortex.transport_layer import WiFiTransport
+
+MODEL = "qwen2.5-0.5b"
+
+
+def use_simulator(simulator):
+    NeurocorticalBridge._transport = WiFiTransport(ip="127.0.0.1", port=simulator.port)
+    NeurocorticalBridge._connection_type = "tcp"
+    NeurocorticalBridge._initialized = True
+
+
+def test_warm_session_skips_setup(monkeypatch):
+    monkeypatch.setattr(NeurocorticalBridge, "_session_pool", LLMSessionPool(max_sessions=3))
+
+    async def run():
+        async with DeviceSimulator(port=0, setup_latency=0.2) as simulator:
+            use_simulator(simulator)
+            try:
+                start = time.monotonic()
+                cold = await NeurocorticalBridge.get_llm_session(MODEL, "You are Penphin.", 0.7)
+                cold_time = time.monotonic() - start
+
+                start = time.monotonic()
+                concurrent = await asyncio.gather(
+                    *(NeurocorticalBridge.get_llm_session(MODEL, "You are Penphin.", 0.7) for _ in range(3))
+                )
+                warm_time = time.monotonic() - start
+                other = await NeurocorticalBridge.get_llm_session(MODEL, "You are Dolphin.", 0.5)
+            finally:
+                await NeurocorticalBridge.cleanup()
+            return cold, cold_time, concurrent, warm_time, other, simulator.stats["requests"]["setup"]
+
+    cold, cold_time, concurrent, warm_time, other, setups = asyncio.run(run())
+    assert cold.startswith("llm.")
+    assert concurrent == [cold] * 3
+    assert other not in (None, cold)
+    assert setups == 2
+    assert warm_time < cold_time / 4
+    assert NeurocorticalBridge.get_session_pool_stats()["hits"] == 3
+
+
+def test_least_recently_used_session_is_exited(monkeypatch):
+    monkeypatch.setattr(NeurocorticalBridge, "_session_pool", LLMSessionPool(max_sessions=2))
+
+    async def run():
+        async with DeviceSimulator(port=0) as simulator:
+            use_simulator(simulator)
+            try:
+                penphin = await NeurocorticalBridge.get_llm_session(MODEL, "penphin")
+                dolphin = await NeurocorticalBridge.get_llm_session(MODEL, "dolphin")
+                await NeurocorticalBridge.get_llm_session(MODEL, "penphin")  # dolphin is now least recent
+                penguin = await NeurocorticalBridge.get_llm_session(MODEL, "penguin")
+                on_device = set(simulator._llm_units)
+            finally:
+                await NeurocorticalBridge.cleanup()
+            return penphin, dolphin, penguin, on_device, simulator.stats["requests"]["exit"]
+
+    penphin, dolphin, penguin, on_device, exits = asyncio.run(run())
+    assert exits == 1
+    assert on_device == {penphin, penguin}
+    stats = NeurocorticalBridge.get_session_pool_stats()
+    assert stats["work_ids"] == [penphin, penguin]
+    assert stats["evictions"] == 1
+
+
+def test_failed_setup_is_not_pooled():
+    async def run():
+        pool = LLMSessionPool()
+        calls = []
+
+        async def failing_setup(key):
+            calls.append(key)
+            return None
+
+        first = await pool.acquire(pool.make_key("missing-model"), failing_setup)
+        second = await pool.acquire(pool.make_key("missing-model"), failing_setup)
+        return first, second, calls, len(pool)
+
+    first, second, calls, size = asyncio.run(run())
+    assert first is None and second is None
+    assert len(calls) == 2
+    assert size == 0
+
+
+def test_leased_session_is_not_exited_under_an_inference():
+    async def run():
+        pool = LLMSessionPool(max_sessions=2)
+        exited = []
+
+        async def teardown(work_id):
+            exited.append(work_id)
+
+        await pool.add(pool.make_key(MODEL, "penphin"), "llm.1", teardown)
+        await pool.add(pool.make_key(MODEL, "dolphin"), "llm.2", teardown)
+        pool.retain("llm.1")  # least recent, but an inference is using it
+        await pool.add(pool.make_key(MODEL, "penguin"), "llm.3", teardown)
+        idle_evicted = list(exited)
+
+        # Everything older is busy now: llm.1 leaves the pool but stays up until released
+        pool.retain("llm.3")
+        await pool.add(pool.make_key(MODEL, "narwhal"), "llm.4", teardown)
+        deferred = (list(exited), pool.stats()["deferred_exits"])
+        pool.release("llm.1")
+        await asyncio.sleep(0)
+        return idle_evicted, deferred, exited, pool.stats()
+
+    idle_evicted, deferred, exited, stats = asyncio.run(run())
+    assert idle_evicted == ["llm.2"]
+    assert deferred == (["llm.2"], ["llm.1"])
+    assert exited == ["llm.2", "llm.1"]
+    assert stats["work_ids"] == ["llm.3", "llm.4"]
+    assert stats["leased"] == {"llm.3": 1}
+    assert stats["deferred_exits"] == []
+
+
+def test_eviction_listeners_hear_about_exited_work_ids():
+    class Holder:
+        def __init__(self):
+            self.work_id = "llm.1"
+
+        def on_evicted(self, work_id):
+            if self.work_id == work_id:
+                self.work_id = None
+
+    async def run():
+        pool = LLMSessionPool(max_sessions=1)
+        heard = []
+        holder = Holder()
+        gone = Holder()
+        pool.add_eviction_listener(heard.append)
+        pool.add_eviction_listener(holder.on_evicted)
+        pool.add_eviction_listener(gone.on_evicted)
+        del gone  # bound methods are held weakly
+
+        await pool.add(pool.make_key(MODEL, "penphin"), "llm.1")
+        await pool.add(pool.make_key(MODEL, "dolphin"), "llm.2")
+        return heard, holder.work_id, len(pool._listeners)
+
+    heard, work_id, listeners = asyncio.run(run())
+    assert heard == ["llm.1"]
+    assert work_id is None
+    assert listeners == 2
+
+
+def test_set_model_sends_the_temperature_it_is_pooled_under(monkeypatch):
+    """set_model's work_id is only reusable for the temperature its setup actually used"""
+    monkeypatch.setattr(NeurocorticalBridge, "_session_pool", LLMSessionPool(max_sessions=3))
+    sent = []
+
+    async def fake_send(cls, command, stream_callback=None, priority=None):
+        sent.append(command)
+        return {"request_id": command["request_id"], "work_id": "llm.1001", "error": {"code": 0, "message": ""}}
+
+    monkeypatch.setattr(NeurocorticalBridge, "_send_to_hardware", classmethod(fake_send))
+
+    async def run():
+        data = {"model": MODEL, "persona": "You are Penphin.", "temperature": 0.3}
+        result = await NeurocorticalBridge.execute_operation("set_model", data)
+        work_id = result["response"]["work_id"]
+        await NeurocorticalBridge.register_llm_session(work_id, MODEL, data["persona"], data["temperature"])
+        return await NeurocorticalBridge.get_llm_session(MODEL, "You are Penphin.", 0.3)
+
+    assert asyncio.run(run()) == "llm.1001"
+    assert len(sent) == 1
+    assert sent[0]["data"]["temperature"] == 0.3
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent multi-perspective thinking
+"""
+
+import sys
+import os
+import time
+import asyncio
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Mind.BicameralMind.perspective_thinking_manager import PerspectiveThinkingManager
+from Mind.Subcortex.device_router import DeviceRouter
+from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
+
+
+class FakeMind:
+    """Answers after a delay chosen by the prompt's perspective"""
+
+    def __init__(self, delays, mind_id=None):
+        self.delays = delays
+        self.mind_id = mind_id
+        self.prompts = []
+        self.temperatures = []
+        self.devices = []
+        self.cancelled = []
+
+    async def llm_inference(self, prompt, stream=None, temperature=None):
+        self.prompts.append(prompt)
+        self.temperatures.append(temperature)
+        self.devices.append(NeurocorticalBridge._session_device())
+        if "error" in self.delays:
+            return "Error: device went away"
+        delay = next(delay for key, delay in self.delays.items() if key in prompt)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(prompt)
+            raise
+        return f"answer after {delay}"
+
+
+DELAYS = {"logically": 0.05, "creatively": 0.1, "emotional": 0.15, "intuitive": 0.2}
+
+
+def test_parallel_latency_is_the_slowest_perspective():
+    async def run():
+        mind = FakeMind(DELAYS)
+        start = time.monotonic()
+        result = await PerspectiveThinkingManager().process_thought("penguins", minds=[mind])
+        return result, time.monotonic() - start, mind
+
+    result, elapsed, mind = asyncio.run(run())
+    assert len(mind.prompts) == 4
+    assert elapsed < sum(DELAYS.values()) * 0.75
+    assert result.index("Logical") < result.index("Creative") < result.index("Emotional") < result.index("Intuitive")
+
+
+def test_time_budget_integrates_finished_perspectives():
+    async def run():
+        minds = [FakeMind({**DELAYS, "emotional": 5, "intuitive": 5}), FakeMind(DELAYS)]
+        partials = []
+        start = time.monotonic()
+        result = await PerspectiveThinkingManager().process_thought(
+            "dolphins", time_budget=0.3, minds=minds, on_partial=partials.append
+        )
+        return result, time.monotonic() - start, partials, minds
+
+    result, elapsed, partials, minds = asyncio.run(run())
+    # Perspectives go round-robin: logical/emotional on the first mind, creative/intuitive on the second
+    assert "Logical perspective" in result and "Creative perspective" in result
+    assert "Intuitive perspective" in result
+    assert "Emotional" not in result
+    assert elapsed < 1.0
+    assert minds[0].cancelled and "emotional" in minds[0].cancelled[0]
+    assert len(partials) == 3
+    assert partials[0].startswith("Logical perspective") and "Creative" not in partials[0]
+    assert partials[-1] == result
+
+
+def test_minds_get_each_perspectives_temperature():
+    mind = FakeMind(DELAYS)
+    asyncio.run(PerspectiveThinkingManager().process_thought("otters", minds=[mind]))
+    assert mind.temperatures == [0.3, 0.8, 0.6, 0.7]
+
+
+def test_error_answers_are_left_out_of_the_integration():
+    failing = FakeMind({**DELAYS, "error": 0})
+    result = asyncio.run(PerspectiveThinkingManager().process_thought("seals", minds=[FakeMind(DELAYS), failing]))
+
+    # The failing mind took the creative and intuitive perspectives
+    assert "Logical perspective" in result and "Emotional perspective" in result
+    assert "Creative" not in result and "Intuitive" not in result
+    assert "Error" not in result
+
+
+def test_each_mind_runs_on_its_own_routed_device(monkeypatch):
+    router = DeviceRouter()
+    router.add_device("penphin", object())
+    router.add_device("dolphin", object())
+    monkeypatch.setattr(NeurocorticalBridge, "_router", router)
+
+    minds = [FakeMind(DELAYS, mind_id="dolphin"), FakeMind(DELAYS, mind_id="penphin"), FakeMind(DELAYS)]
+    asyncio.run(PerspectiveThinkingManager().process_thought("whales", minds=minds))
+
+    assert minds[0].devices == ["dolphin", "dolphin"]
+    assert minds[1].devices == ["penphin"]
+    # A mind without a device of its own still gets one device for all its perspectives
+    assert len(minds[2].devices) == 1 and minds[2].devices[0] in router.devices
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for request-scoped tracing spans
+"""
+
+import sys
+import os
+import json
+import asyncio
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Mind.Subcortex import request_tracer as tracing
+from Mind.Subcortex.device_simulator import DeviceSimulator
+from Mind.Subcortex.inference_scheduler import InferenceScheduler
+from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
+from Mind.Subcortex.request_tracer import RequestTracer
+from Mind.Subcortex.transport_layer import WiFiTransport
+
+
+def test_concurrent_requests_get_their_own_spans(tmp_path):
+    tracer = RequestTracer(capacity=100)
+
+    async def turn(name):
+        with tracer.request(prefix=name) as request_id:
+            with tracer.span("outer", "mind"):
+                # Spawned tasks inherit the request
+                await asyncio.create_task(inner())
+            return request_id
+
+    async def inner():
+        with tracer.span("inner", "bridge") as args:
+            args["chunks"] = 2
+            await asyncio.sleep(0.01)
+        tracer.instant("first_byte", "transport")
+
+    async def run():
+        return await asyncio.gather(turn("a"), turn("b"))
+
+    first, second = asyncio.run(run())
+    assert first != second
+    for request_id in (first, second):
+        assert [event["name"] for event in tracer.spans(request_id)] == ["inner", "first_byte", "outer"]
+        assert list(tracer.breakdown(request_id)) == ["outer", "inner"]
+
+    path = tmp_path / "trace.json"
+    document = tracer.export_chrome_trace(str(path))
+    assert json.loads(path.read_text()) == json.loads(json.dumps(document))
+    names = {event["args"]["name"] for event in document["traceEvents"] if event["name"] == "thread_name"}
+    assert names == {first, second}
+    inner = next(event for event in document["traceEvents"] if event["name"] == "inner")
+    assert inner["ph"] == "X" and inner["dur"] >= 10000 and inner["args"]["chunks"] == 2
+
+
+def test_ring_buffer_keeps_newest_spans():
+    tracer = RequestTracer(capacity=3)
+    for n in range(5):
+        with tracer.span(f"span-{n}"):
+            pass
+    assert [event["name"] for event in tracer.spans()] == ["span-2", "span-3", "span-4"]
+    assert tracer.spans()[0]["request_id"] == tracing.BACKGROUND
+
+
+def test_stream_turn_records_bridge_and_transport_spans(monkeypatch):
+    tracer = RequestTracer()
+    monkeypatch.setattr(tracing, "request_tracer", tracer)
+    monkeypatch.setattr("Mind.Subcortex.neurocortical_bridge.request_tracer", tracer)
+    monkeypatch.setattr("Mind.Subcortex.transport_layer.request_tracer", tracer)
+    monkeypatch.setattr(NeurocorticalBridge, "_inference_scheduler", InferenceScheduler(max_concurrency=1))
+
+    async def run():
+        async with DeviceSimulator(port=0, token_latency=0.005, reply_tokens=6) as simulator:
+            NeurocorticalBridge._transport = WiFiTransport(ip="127.0.0.1", port=simulator.port)
+            NeurocorticalBridge._connection_type = "tcp"
+            NeurocorticalBridge._initialized = True
+            try:
+                with tracer.request("turn-1"):
+                    async for _ in NeurocorticalBridge.stream_operation("think", {"prompt": "hello"}):
+                        pass
+            finally:
+                await NeurocorticalBridge.cleanup()
+
+    asyncio.run(run())
+    names = [event["name"] for event in tracer.spans("turn-1")]
+    for expected in ("NeurocorticalBridge._send_to_hardware", "InferenceScheduler.acquire",
+                     "transport.send", "transport.first_byte", "transport.last_byte"):
+        assert expected in names
+    assert names.index("transport.first_byte") < names.index("transport.last_byte")
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the event-driven serial reader
+Uses pyserial's loop:// URL so no hardware is needed
+"""
+
+import sys
+import os
+import json
+import time
+import asyncio
+import threading
+
+import serial
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import CONFIG
+from Mind.Subcortex.transport_layer import SerialIOEngine, SerialTransport
+
+
+def test_engine_delivers_frames_to_event_loop():
+    """Frames split across writes arrive on the loop thread; shell echo goes to on_line"""
+    async def run():
+        port = serial.serial_for_url("loop://", timeout=1)
+        frames = []
+        lines = []
+        got_two = asyncio.Event()
+        loop_thread = None
+
+        def on_frame(frame):
+            nonlocal loop_thread
+            loop_thread = threading.current_thread()
+            frames.append(frame)
+            if len(frames) == 2:
+                got_two.set()
+
+        engine = SerialIOEngine(port, on_frame, loop=asyncio.get_running_loop(), on_line=lines.append)
+        engine.start()
+        try:
+            port.write(b"root@m5stack:~# \n{\"data\": \"pen")
+            await asyncio.sleep(0.05)
+            port.write("🐧\"}\n{\"data\": \"phin\"}\n".encode())
+            await asyncio.wait_for(got_two.wait(), 2)
+        finally:
+            engine.stop()
+            port.close()
+        return frames, lines, loop_thread
+
+    frames, lines, loop_thread = asyncio.run(run())
+    assert frames == [{"data": "pen🐧"}, {"data": "phin"}]
+    assert lines == [b"root@m5stack:~# "]
+    assert loop_thread is threading.main_thread()
+
+
+def test_transmit_returns_without_polling_delay(monkeypatch):
+    """A reply written immediately must come back well under the old 100ms poll interval"""
+    # SerialTransport reads the tunnel port from CONFIG.llm_service, which config.py doesn't define
+    monkeypatch.setattr(CONFIG, "llm_service", {"port": 10001}, raising=False)
+
+    async def run():
+        transport = SerialTransport()
+        transport._serial_connection = serial.serial_for_url("loop://", timeout=1)
+        transport.connected = True
+        transport._tunnel_active = True
+
+        # loop:// echoes the tunnel command back; answer it with a JSON line right away
+        class EchoReply:
+            def __init__(self, conn):
+                self._conn = conn
+
+            def __getattr__(self, name):
+                return getattr(self._conn, name)
+
+            def write(self, data):
+                self._conn.write(data)
+                self._conn.write((json.dumps({"request_id": "1", "error": {"code": 0, "message": ""}}) + "\n").encode())
+                return len(data)
+
+        transport._serial_connection = EchoReply(transport._serial_connection)
+        try:
+            start = time.perf_counter()
+            response = await transport.transmit({"request_id": "1", "work_id": "sys", "action": "ping"})
+            elapsed = time.perf_counter() - start
+        finally:
+            transport._tunnel_active = False
+            await transport.disconnect()
+        return response, elapsed
+
+    response, elapsed = asyncio.run(run())
+    assert response["error"]["code"] == 0
+    assert elapsed < 0.1
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Tests for the startup phase timeline
+"""
+
+import sys
+import os
+import time
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Mind.startup_timeline import StartupTimeline
+
+
+def test_phases_are_ordered_and_timed():
+    timeline = StartupTimeline()
+    timeline.begin("model_setup", background=True)
+    with timeline.phase("splash"):
+        time.sleep(0.02)
+    timeline.mark("menu")
+
+    rows = timeline.report()
+    assert [row["phase"] for row in rows] == ["model_setup", "splash", "menu"]
+    assert rows[0]["duration"] is None and rows[0]["background"]
+    assert rows[1]["duration"] >= 0.02
+    assert rows[2]["duration"] == 0
+    assert "(running)" in timeline.format()
+
+    timeline.end("model_setup")
+    assert timeline.duration("model_setup") >= timeline.duration("splash")
+
+
+def test_failed_phase_is_flagged():
+    timeline = StartupTimeline()
+    with pytest.raises(ConnectionError):
+        with timeline.phase("connection"):
+            raise ConnectionError("no device")
+    assert timeline.report()[0]["ok"] is False
+    assert "[failed]" in timeline.format()
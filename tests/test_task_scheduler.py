@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Tests for the event-driven BasalGanglia task scheduler
+"""
+
+import sys
+import os
+import time
+import asyncio
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Mind.Subcortex.BasalGanglia.basal_ganglia_integration import BasalGangliaIntegration
+from Mind.Subcortex.BasalGanglia.task_base import NeuralTask
+from Mind.Subcortex.BasalGanglia.task_metrics import LatencyHistogram, RateCounter, TaskMetrics
+from Mind.Subcortex.BasalGanglia.task_manager import BasalGanglia
+from Mind.Subcortex.BasalGanglia.task_scheduler import TaskScheduler
+from Mind.Subcortex.BasalGanglia.task_types import TaskResource, TaskType
+from Mind.Subcortex.BasalGanglia.tasks.think_task import ThinkTask
+from Mind.Subcortex.inference_scheduler import InferencePriority, current_priority
+
+
+class RecordingTask(NeuralTask):
+    def __init__(self, name, priority=1, interval=None, log=None, duration=0.0, error=None, resources=None):
+        super().__init__(name, priority)
+        self.interval = interval
+        self.resources = resources
+        self.active = True
+        self.log = log if log is not None else []
+        self.duration = duration
+        self.error = error
+
+    async def execute(self):
+        self.log.append((self.name, time.monotonic()))
+        await asyncio.sleep(self.duration)
+        if self.error is not None:
+            raise self.error
+        return self.name
+
+    def run(self):
+        pass
+
+
+def test_periodic_tasks_keep_their_interval_and_idle_sleeps():
+    async def run():
+        scheduler = TaskScheduler()
+        scheduler.start()
+        log = []
+        fast = RecordingTask("fast", interval=0.05, log=log)
+        scheduler.submit(fast)
+        scheduler.submit(RecordingTask("slow", interval=10.0, log=log))
+        await asyncio.sleep(0.28)
+        # A deactivated periodic task drops out at its next due time
+        fast.active = False
+        await asyncio.sleep(0.06)
+        stats = scheduler.stats()
+        scheduler.stop()
+        return log, stats
+
+    log, stats = asyncio.run(run())
+    names = [name for name, _ in log]
+    assert names.count("slow") == 1
+    assert 5 <= names.count("fast") <= 7
+    # Only woken for due tasks, never polled
+    assert stats["wakeups"] <= names.count("fast") + 3
+    assert 9.0 < stats["next_due_in"] <= 10.0
+
+
+def test_submission_wakes_scheduler_and_one_shots_complete():
+    async def run():
+        bg = BasalGanglia()
+        bg.start()
+        log = []
+        bg.register_task(RecordingTask("refresh", interval=60.0, log=log))
+        await asyncio.sleep(0.05)
+
+        # Idle until the next refresh, yet new work starts straight away
+        low = RecordingTask("low", priority=5, log=log)
+        high = RecordingTask("high", priority=1, log=log)
+        submitted = time.monotonic()
+        bg.register_task(low)
+        bg.register_task(high)
+        await asyncio.sleep(0.05)
+        bg.stop()
+        return log, submitted, low, high, bg
+
+    log, submitted, low, high, bg = asyncio.run(run())
+    assert [name for name, _ in log] == ["refresh", "high", "low"]
+    # Started on submission rather than at the next refresh a minute away
+    # (bound leaves room for a GC pause under a loaded test run)
+    assert log[1][1] - submitted < 0.5
+    assert low.has_completed() and high.result == "high"
+    assert [task.name for task in bg.task_queue] == ["refresh"]
+
+
+def test_handles_resolve_with_result_error_or_cancellation():
+    async def run():
+        scheduler = TaskScheduler()
+        scheduler.start()
+        finished = []
+
+        ok = scheduler.submit(RecordingTask("ok", duration=0.01))
+        ok.add_done_callback(lambda handle: finished.append(handle.task.name))
+        failing = scheduler.submit(RecordingTask("failing", error=ValueError("boom")))
+        slow_task = RecordingTask("slow", duration=10.0)
+        slow = scheduler.submit(slow_task)
+        refresh_task = RecordingTask("refresh", interval=0.02)
+        refresh = scheduler.submit(refresh_task)
+
+        assert await ok == "ok"
+        try:
+            await failing
+        except ValueError as e:
+            error = e
+        await asyncio.sleep(0.01)
+        assert slow.cancel()
+        await asyncio.sleep(0)
+        # A periodic task's handle resolves once it is deactivated
+        refresh_task.active = False
+        await asyncio.wait_for(refresh, 1.0)
+        scheduler.stop()
+        return finished, error, slow, slow_task, refresh, scheduler.stats()
+
+    finished, error, slow, slow_task, refresh, stats = asyncio.run(run())
+    assert finished == ["ok"]
+    assert str(error) == "boom"
+    assert slow.cancelled() and slow_task.has_completed()
+    assert refresh.result() == "refresh"
+    assert stats["queued"] == 0 and stats["running"] == 0
+
+
+def test_think_handles_clean_up_on_completion(monkeypatch):
+    async def fake_execute(self):
+        await asyncio.sleep(0.01)
+        return {"status": "ok", "response": f"echo {self.prompt}"}
+
+    monkeypatch.setattr(BasalGangliaIntegration, "_create_core_tasks", lambda self: None)
+    monkeypatch.setattr(ThinkTask, "execute", fake_execute)
+
+    async def run():
+        bg = BasalGangliaIntegration()
+        handles = [bg.think(f"prompt {n}") for n in range(3)]
+        pending = bg.get_task_count()
+        results = await asyncio.gather(*handles)
+        stats = bg.get_task_stats()
+        bg.shutdown()
+        return pending, results, stats, bg._task_history
+
+    pending, results, stats, history = asyncio.run(run())
+    assert pending == 3
+    assert [result["response"] for result in results] == ["echo prompt 0", "echo prompt 1", "echo prompt 2"]
+    assert stats["total"] == 0
+    assert [entry["status"] for entry in history] == ["ok"] * 3
+
+
+def test_bridge_shares_one_basal_ganglia_until_cleanup(monkeypatch):
+    from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
+
+    created = []
+    monkeypatch.setattr(BasalGangliaIntegration, "_create_core_tasks", lambda self: created.append(self))
+    monkeypatch.setattr(NeurocorticalBridge, "_basal_ganglia", None)
+    monkeypatch.setattr(NeurocorticalBridge, "_transport", None)
+
+    async def run():
+        first = NeurocorticalBridge.get_basal_ganglia()
+        second = NeurocorticalBridge.get_basal_ganglia()
+        return first, second
+
+    async def run_and_clean_up():
+        bg = NeurocorticalBridge.get_basal_ganglia()
+        running = bg.basal_ganglia.scheduler.running
+        await NeurocorticalBridge.cleanup()
+        return bg, running
+
+    first, second = asyncio.run(run())
+    assert first is second and len(created) == 1
+    # A new event loop gets a fresh task system instead of the dead one
+    bg, running = asyncio.run(run_and_clean_up())
+    assert bg is not first and len(created) == 2
+    assert running and not bg.basal_ganglia.scheduler.running
+    assert NeurocorticalBridge._basal_ganglia is None
+
+
+def test_tasks_wait_for_their_resources_and_waiters_age():
+    async def run():
+        scheduler = TaskScheduler(aging_interval=0.01)
+        scheduler.start()
+        log = []
+        display = {TaskResource.DISPLAY}
+        llm = {TaskResource.LLM}
+
+        # A streaming visualization owns the matrix until it is stopped
+        stream = RecordingTask("stream", priority=2, interval=0.01, log=log, resources=display)
+        scheduler.submit(stream)
+        await asyncio.sleep(0.005)
+        overlay = scheduler.submit(RecordingTask("overlay", priority=1, log=log, resources=display))
+        free = scheduler.submit(RecordingTask("free", priority=9, log=log))
+        await free
+        await asyncio.sleep(0.03)
+        blocked = scheduler.stats()
+        stream.active = False
+        await overlay
+
+        # The background task has waited long enough to overtake the later interactive one
+        holder = scheduler.submit(RecordingTask("holder", priority=5, log=log, duration=0.12, resources=llm))
+        await asyncio.sleep(0.005)
+        background = scheduler.submit(RecordingTask("background", priority=9, log=log, resources=llm))
+        await asyncio.sleep(0.1)
+        interactive = scheduler.submit(RecordingTask("interactive", priority=3, log=log, resources=llm))
+        await asyncio.gather(holder, background, interactive)
+        stats = scheduler.stats()
+        scheduler.stop()
+        return [name for name, _ in log], blocked, stats
+
+    names, blocked, stats = asyncio.run(run())
+    assert names.index("free") < names.index("overlay")
+    assert names.count("stream") >= 2
+    assert names.index("overlay") > max(i for i, name in enumerate(names) if name == "stream")
+    assert blocked["resources"] == {"display": "stream"} and blocked["waiting_for_resources"] == 1
+    assert names[-3:] == ["holder", "background", "interactive"]
+    assert stats["resources"] == {} and stats["resource_waits"] == 3
+
+
+def test_holders_inherit_waiter_priority_for_inference():
+    seen = []
+
+    class InferenceTask(RecordingTask):
+        async def execute(self):
+            await asyncio.sleep(self.duration)
+            seen.append((self.name, current_priority()))
+            return self.name
+
+    async def run():
+        scheduler = TaskScheduler(aging_interval=0)
+        scheduler.start()
+        llm = {TaskResource.LLM}
+        holder_task = InferenceTask("holder", priority=8, duration=0.05, resources=llm)
+        holder = scheduler.submit(holder_task)
+        later = scheduler.submit(InferenceTask("later", priority=9, resources=llm))
+        await asyncio.sleep(0.01)
+        before = scheduler.effective_priority(holder_task)
+        urgent = scheduler.submit(InferenceTask("urgent", priority=1, resources=llm))
+        await asyncio.sleep(0.01)
+        boosted = scheduler.effective_priority(holder_task)
+        await asyncio.gather(holder, later, urgent)
+        scheduler.stop()
+        return before, boosted
+
+    before, boosted = asyncio.run(run())
+    assert (before, boosted) == (8, 1)
+    assert seen == [
+        ("holder", InferencePriority.INTERACTIVE),
+        ("urgent", InferencePriority.INTERACTIVE),
+        ("later", InferencePriority.BACKGROUND),
+    ]
+
+
+def test_metrics_per_task_type():
+    async def run():
+        metrics = TaskMetrics()
+        scheduler = TaskScheduler(metrics=metrics)
+        scheduler.start()
+        tasks = [RecordingTask(f"think {n}", duration=0.03) for n in range(3)]
+        tasks.append(RecordingTask("think failing", error=RuntimeError("no model")))
+        for task in tasks:
+            task.task_type = TaskType.THINKING
+        handles = [scheduler.submit(task) for task in tasks]
+        handles.append(scheduler.submit(RecordingTask("untyped")))
+        await asyncio.gather(*handles, return_exceptions=True)
+        scheduler.stop()
+        return metrics.snapshot()
+
+    snapshot = asyncio.run(run())
+    assert list(snapshot) == ["THINKING", "untyped"]
+    thinking = snapshot["THINKING"]
+    # Think tasks share the llm token, so they ran one at a time and queued behind each other
+    assert (thinking["executions"], thinking["failures"], thinking["max_concurrency"]) == (4, 1, 1)
+    assert thinking["executions_per_minute"] == 4 and thinking["running"] == 0
+    assert thinking["queue_wait"]["count"] == 4 and thinking["queue_wait"]["max_ms"] >= 60
+    assert thinking["run_time"]["p95_ms"] == 50 and thinking["run_time"]["max_ms"] >= 30
+
+
+def test_histograms_and_rates_use_constant_memory():
+    histogram = LatencyHistogram()
+    for n in range(10000):
+        histogram.record(n / 1000)  # 0..10s
+    assert len(histogram.counts) == len(histogram.bounds_ms) + 1
+    assert histogram.percentile(0.5) == 5000 and histogram.percentile(0.95) == 10000
+    assert histogram.snapshot()["max_ms"] == 9999
+
+    rate = RateCounter(60)
+    for second in range(120):
+        rate.add(now=1000 + second)
+    assert rate.total(now=1119) == 60
+    assert rate.total(now=1200) == 0
+
+
+def test_every_submission_is_tracked_and_hung_ones_cancelled(monkeypatch):
+    from Mind.Subcortex.BasalGanglia.tasks.system_command_task import SystemCommandTask
+
+    async def hanging_execute(self):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(BasalGangliaIntegration, "_create_core_tasks", lambda self: None)
+    monkeypatch.setattr(SystemCommandTask, "execute", hanging_execute)
+
+    async def run():
+        bg = BasalGangliaIntegration()
+        bg._hung_task_timeout = 0.05
+        handle = bg.system_command("ping")
+        tracked = bg.get_task_count()
+        try:
+            await asyncio.wait_for(handle, 1)
+        except asyncio.CancelledError:
+            pass
+        stats = bg.get_task_stats()
+        bg.shutdown()
+        return tracked, handle.cancelled(), stats, bg._task_history
+
+    tracked, cancelled, stats, history = asyncio.run(run())
+    assert tracked == 1
+    assert cancelled
+    assert stats["total"] == 0
+    assert [entry["status"] for entry in history] == ["cancelled"]
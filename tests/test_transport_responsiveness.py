@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Regression test: transport I/O must not block the event loop
+A slow in-process stream runs while a ticker coroutine counts how often it gets scheduled
+"""
+
+import sys
+import os
+import json
+import time
+import asyncio
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Mind.Subcortex.transport_layer import ADBTransport, WiFiTransport
+
+CHUNK_COUNT = 10
+CHUNK_DELAY = 0.05
+
+
+async def start_slow_stream_server():
+    """Answer pings immediately and stream inference deltas slowly"""
+    async def handle(reader, writer):
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            request = json.loads(line)
+            if request.get("action") == "ping":
+                replies = [{"error": {"code": 0, "message": ""}}]
+            else:
+                replies = [
+                    {"data": {"delta": f"tok{i} ", "index": i, "finish": i == CHUNK_COUNT - 1}}
+                    for i in range(CHUNK_COUNT)
+                ]
+            for reply in replies:
+                reply["request_id"] = request.get("request_id")
+                reply["work_id"] = request.get("work_id")
+                reply.setdefault("error", {"code": 0, "message": ""})
+                writer.write((json.dumps(reply) + "\n").encode())
+                await writer.drain()
+                await asyncio.sleep(CHUNK_DELAY)
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+def test_event_loop_stays_responsive_during_stream():
+    """The ticker must keep running while connect() and stream() are waiting on the device"""
+    async def run():
+        server, port = await start_slow_stream_server()
+        transport = WiFiTransport(ip="127.0.0.1", port=port, discover=False)
+        ticks = 0
+        stop = asyncio.Event()
+
+        async def ticker():
+            nonlocal ticks
+            while not stop.is_set():
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        deltas = []
+
+        async def on_chunk(chunk):
+            deltas.append(chunk["data"]["delta"])
+
+        ticker_task = asyncio.create_task(ticker())
+        try:
+            assert await transport.connect()
+            result = await transport.stream(
+                {"request_id": "42", "work_id": "llm", "action": "inference", "data": "hi"},
+                on_chunk
+            )
+        finally:
+            stop.set()
+            await ticker_task
+            await transport.disconnect()
+            server.close()
+        return result, deltas, ticks
+
+    result, deltas, ticks = asyncio.run(run())
+    assert result["status"] == "ok"
+    assert len(deltas) == CHUNK_COUNT
+    # A blocking recv would starve the ticker; an async read lets it run every ~10ms
+    assert ticks >= (CHUNK_COUNT * CHUNK_DELAY / 0.01) / 2
+
+
+def test_adb_connect_runs_adb_off_the_event_loop(monkeypatch):
+    """is_available() and the forward commands shell out to adb; the loop must keep ticking"""
+    commands = []
+
+    def slow_adb(self, command):
+        commands.append(command[0])
+        time.sleep(0.05)
+        if command == ["devices"]:
+            return "List of devices attached\nemulator-5554\tdevice\n"
+        if command[:2] == ["forward", "--list"]:
+            return f"emulator-5554 tcp:{self.port} tcp:{self.port}\n"
+        return ""
+
+    monkeypatch.setattr(ADBTransport, "_run_adb_command", slow_adb)
+
+    async def run():
+        transport = ADBTransport({"port": 10001})
+        ticks = 0
+        stop = asyncio.Event()
+
+        async def ticker():
+            nonlocal ticks
+            while not stop.is_set():
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker_task = asyncio.create_task(ticker())
+        try:
+            connected = await transport.connect()
+        finally:
+            stop.set()
+            await ticker_task
+        return connected, ticks
+
+    connected, ticks = asyncio.run(run())
+    assert connected
+    assert commands == ["start-server", "devices", "forward", "forward", "forward"]
+    # Five 50ms adb calls; blocking the loop would leave the ticker at one tick
+    assert ticks >= 10
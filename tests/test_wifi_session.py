@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent multiplexed WiFiTransport session
+Runs a small in-process JSON-lines server instead of real hardware
+"""
+
+import sys
+import os
+import json
+import asyncio
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Mind.Subcortex.transport_layer import WiFiTransport
+
+
+async def start_echo_server(delays=None):
+    """Start a server that answers each request after an optional per-action delay"""
+    delays = delays or {}
+    stats = {"connections": 0}
+
+    async def handle(reader, writer):
+        stats["connections"] += 1
+
+        async def answer(request):
+            await asyncio.sleep(delays.get(request.get("action"), 0))
+            response = {
+                "request_id": request.get("request_id"),
+                "work_id": request.get("work_id"),
+                "error": {"code": 0, "message": ""},
+                "data": request.get("action"),
+            }
+            writer.write((json.dumps(response) + "\n").encode())
+            await writer.drain()
+
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            asyncio.create_task(answer(json.loads(line)))
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, port, stats
+
+
+def test_commands_share_one_connection():
+    """Sequential commands should reuse a single TCP connection"""
+    async def run():
+        server, port, stats = await start_echo_server()
+        transport = WiFiTransport(ip="127.0.0.1", port=port)
+        transport.connected = True
+        try:
+            for action in ("ping", "hwinfo", "lsmode"):
+                response = await transport.transmit({"request_id": "001", "work_id": "sys", "action": action})
+                assert response["data"] == action
+                assert response["request_id"] == "001"
+        finally:
+            await transport.disconnect()
+            server.close()
+        return stats["connections"]
+
+    assert asyncio.run(run()) == 1
+
+
+def test_concurrent_commands_are_demultiplexed():
+    """Out-of-order responses should reach the caller that sent the matching request"""
+    async def run():
+        server, port, stats = await start_echo_server({"hwinfo": 0.2, "lsmode": 0.1})
+        transport = WiFiTransport(ip="127.0.0.1", port=port)
+        transport.connected = True
+        try:
+            # Same caller request_id on purpose - the session must keep them apart
+            results = await asyncio.gather(*[
+                transport.transmit({"request_id": "001", "work_id": "sys", "action": action})
+                for action in ("hwinfo", "lsmode", "ping")
+            ])
+        finally:
+            await transport.disconnect()
+            server.close()
+        return results, stats["connections"]
+
+    results, connections = asyncio.run(run())
+    assert [r["data"] for r in results] == ["hwinfo", "lsmode", "ping"]
+    assert all(r["request_id"] == "001" for r in results)
+    assert connections == 1
+
+
+def test_cancelled_stream_tail_does_not_answer_next_request():
+    """Chunks still arriving for an abandoned stream must not resolve an unrelated request"""
+    from Mind.Subcortex.device_simulator import DeviceSimulator
+    from Mind.Subcortex.transport_layer import DeviceSession
+
+    async def run():
+        async with DeviceSimulator(port=0, token_latency=0.02, reply_tokens=20, setup_latency=0.2) as simulator:
+            session = DeviceSession("127.0.0.1", simulator.port)
+            try:
+                chunks = []
+
+                async def on_chunk(chunk):
+                    chunks.append(chunk)
+                    if len(chunks) == 2:
+                        raise asyncio.CancelledError()
+
+                # The device keeps generating after the caller gives up on the stream
+                stream = asyncio.create_task(session.stream(
+                    {"request_id": "a", "work_id": "llm", "action": "inference",
+                     "object": "llm.utf-8.stream", "data": {"delta": "hello", "index": 0, "finish": True}},
+                    on_chunk,
+                ))
+                try:
+                    await stream
+                except asyncio.CancelledError:
+                    pass
+
+                # Still waiting while the old stream's chunks keep arriving
+                response = await session.request(
+                    {"request_id": "b", "work_id": "llm", "action": "setup", "object": "llm.setup",
+                     "data": {"model": "qwen2.5-0.5b"}},
+                    timeout=5,
+                )
+            finally:
+                await session.close()
+        return response
+
+    response = asyncio.run(run())
+    assert response["request_id"] == "b"
+    assert response["error"]["code"] == 0
+    assert response["work_id"].startswith("llm.")
+
+
+def test_failed_ping_leaves_the_shared_session_alone():
+    """A ping that times out must not fail requests already running on the session"""
+    async def run():
+        server, port, stats = await start_echo_server({"ping": 0.5, "hwinfo": 0.2})
+        transport = WiFiTransport(ip="127.0.0.1", port=port, discover=False)
+        transport.connected = True
+        try:
+            pending = asyncio.create_task(
+                transport.transmit({"request_id": "002", "work_id": "sys", "action": "hwinfo"})
+            )
+            await asyncio.sleep(0.05)
+            ping = await transport._ping_endpoint("127.0.0.1", port, timeout=0.05)
+            response = await pending
+            connect_timeout = transport._get_session().connect_timeout
+        finally:
+            await transport.disconnect()
+            server.close()
+        return ping, response, connect_timeout
+
+    ping, response, connect_timeout = asyncio.run(run())
+    assert ping is None
+    assert response["data"] == "hwinfo"
+    assert connect_timeout == 10.0